@@ -1,7 +1,8 @@
-import csv
+import argparse
 import json
 import os
-import subprocess
+
+from mm_to_json.dataset_reader import PREFERRED, READERS, read_dataset
 
 MDB_PATH = "tmp/sample_data_champs_2025-aftermeet.mdb"
 OUTPUT_DIR = "backend/tests/fixtures"
@@ -25,29 +26,33 @@ TABLES = [
 ]
 
 
-def export_table(table):
-    cmd = ["mdb-export", MDB_PATH, table]
-    try:
-        output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL).decode("utf-8")
-        reader = csv.DictReader(output.splitlines())
-        rows = list(reader)
-        return rows
-    except Exception as e:
-        print(f"Warning: Could not export {table}: {e}")
-        return []
-
-
 def main():
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    parser = argparse.ArgumentParser(description="Export fixture tables from a sample MDB")
+    parser.add_argument("--mdb", default=MDB_PATH, help="Source MDB file")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument(
+        "--backend",
+        choices=[*READERS, PREFERRED],
+        help="Ingestion backend (default: MM_INGEST_BACKEND or preferred). "
+        "Fixtures are written in mdb-export's string format whichever backend reads them.",
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.output_dir):
+        os.makedirs(args.output_dir)
+
+    result = read_dataset(args.mdb, TABLES, args.backend, use_cache=False)
+    print(result.summary())
+    records = result.to_records()
+    by_name = {name.lower(): rows for name, rows in records.items()}
 
     for table in TABLES:
         print(f"Exporting {table}...")
-        data = export_table(table)
+        data = by_name.get(table.lower())
         if data:
-            with open(f"{OUTPUT_DIR}/{table}.json", "w") as f:
+            with open(f"{args.output_dir}/{table}.json", "w") as f:
                 json.dump(data, f, indent=2)
-            print(f"Saved {len(data)} rows to {OUTPUT_DIR}/{table}.json")
+            print(f"Saved {len(data)} rows to {args.output_dir}/{table}.json")
         else:
             print(f"Skipping empty/missing table {table}")
 
@@ -24,15 +24,19 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!meetmanager/v1/meet_manager.proto\x12\x0emeetmanager.v1\"\x11\n\x0fGetMeetsRequest\"7\n\x10GetMeetsResponse\x12#\n\x05meets\x18\x01 \x03(\x0b\x32\x14.meetmanager.v1.Meet\"\x1a\n\x18GetDashboardStatsRequest\"o\n\x19GetDashboardStatsResponse\x12\x12\n\nmeet_count\x18\x01 \x01(\x05\x12\x12\n\nteam_count\x18\x02 \x01(\x05\x12\x15\n\rathlete_count\x18\x03 \x01(\x05\x12\x13\n\x0b\x65vent_count\x18\x04 \x01(\x05\"\x11\n\x0fGetTeamsRequest\"7\n\x10GetTeamsResponse\x12#\n\x05teams\x18\x01 \x03(\x0b\x32\x14.meetmanager.v1.Team\"\x1c\n\x0eGetTeamRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\x0fGetTeamResponse\x12\"\n\x04team\x18\x01 \x01(\x0b\x32\x14.meetmanager.v1.Team\"6\n\x12GetAthletesRequest\x12\x14\n\x07team_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_team_id\"@\n\x13GetAthletesResponse\x12)\n\x08\x61thletes\x18\x01 \x03(\x0b\x32\x17.meetmanager.v1.Athlete\"\x1f\n\x11GetAthleteRequest\x12\n\n\x02id\x18\x01 \x01(\x05\">\n\x12GetAthleteResponse\x12(\n\x07\x61thlete\x18\x01 \x01(\x0b\x32\x17.meetmanager.v1.Athlete\"\x12\n\x10GetEventsRequest\":\n\x11GetEventsResponse\x12%\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x15.meetmanager.v1.Event\"\x15\n\x13ListDatasetsRequest\"A\n\x14ListDatasetsResponse\x12)\n\x08\x64\x61tasets\x18\x01 \x03(\x0b\x32\x17.meetmanager.v1.Dataset\"+\n\x17SetActiveDatasetRequest\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\"\x1a\n\x18SetActiveDatasetResponse\"C\n\x14UploadDatasetRequest\x12\x12\n\x08\x66ilename\x18\x01 \x01(\tH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"9\n\x15UploadDatasetResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\'\n\x13\x43learDatasetRequest\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\"\x16\n\x14\x43learDatasetResponse\"\x19\n\x17\x43learAllDatasetsRequest\"\x1a\n\x18\x43learAllDatasetsResponse\"\x12\n\x10GetRelaysRequest\":\n\x11GetRelaysResponse\x12%\n\x06relays\x18\x01 \x03(\x0b\x32\x15.meetmanager.v1.Relay\"\x12\n\x10GetScoresRequest\":\n\x11GetScoresResponse\x12%\n\x06scores\x18\x01 \x03(\x0b\x32\x15.meetmanager.v1.Score\"_\n\x11GetEntriesRequest\x12\x17\n\nathlete_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08\x65vent_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\r\n\x0b_athlete_idB\x0b\n\t_event_id\"<\n\x12GetEntriesResponse\x12&\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x15.meetmanager.v1.Entry\"\x14\n\x12GetSessionsRequest\"@\n\x13GetSessionsResponse\x12)\n\x08sessions\x18\x01 \x03(\x0b\x32\x17.meetmanager.v1.Session\"\x17\n\x15GetAdminConfigRequest\"E\n\x16GetAdminConfigResponse\x12\x11\n\tmeet_name\x18\x01 \x01(\t\x12\x18\n\x10meet_description\x18\x02 \x01(\t\"G\n\x18UpdateAdminConfigRequest\x12\x11\n\tmeet_name\x18\x01 \x01(\t\x12\x18\n\x10meet_description\x18\x02 \x01(\t\"H\n\x19UpdateAdminConfigResponse\x12\x11\n\tmeet_name\x18\x01 \x01(\t\x12\x18\n\x10meet_description\x18\x02 \x01(\t\"\x17\n\x15GetEventScoresRequest\"J\n\x16GetEventScoresResponse\x12\x30\n\x0c\x65vent_scores\x18\x01 \x03(\x0b\x32\x1a.meetmanager.v1.EventScore\"E\n\x07\x44\x61taset\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x11\n\tis_active\x18\x02 \x01(\x08\x12\x15\n\rlast_modified\x18\x03 \x01(\t\"\x91\x02\n\x05Relay\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08\x65vent_id\x18\x02 \x01(\x05\x12\x0f\n\x07team_id\x18\x03 \x01(\x05\x12\x11\n\tteam_name\x18\x04 \x01(\t\x12\x11\n\tleg1_name\x18\x05 \x01(\t\x12\x11\n\tleg2_name\x18\x06 \x01(\t\x12\x11\n\tleg3_name\x18\x07 \x01(\t\x12\x11\n\tleg4_name\x18\x08 \x01(\t\x12\x11\n\tseed_time\x18\t \x01(\t\x12\x12\n\nfinal_time\x18\n \x01(\t\x12\r\n\x05place\x18\x0b \x01(\x05\x12\x12\n\nevent_name\x18\x0c \x01(\t\x12\x14\n\x0crelay_letter\x18\r \x01(\t\x12\x0c\n\x04heat\x18\x0e \x01(\x05\x12\x0c\n\x04lane\x18\x0f \x01(\x05\"\x93\x01\n\x05Score\x12\x0f\n\x07team_id\x18\x01 \x01(\x05\x12\x11\n\tteam_name\x18\x02 \x01(\t\x12\x19\n\x11individual_points\x18\x03 \x01(\x02\x12\x14\n\x0crelay_points\x18\x04 \x01(\x02\x12\x14\n\x0ctotal_points\x18\x05 \x01(\x02\x12\x0c\n\x04rank\x18\x06 \x01(\x05\x12\x11\n\tmeet_name\x18\x07 \x01(\t\"Z\n\nEventScore\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\x05\x12\x12\n\nevent_name\x18\x02 \x01(\t\x12&\n\x07\x65ntries\x18\x03 \x03(\x0b\x32\x15.meetmanager.v1.Entry\"\xe9\x01\n\x05\x45ntry\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08\x65vent_id\x18\x02 \x01(\x05\x12\x12\n\nathlete_id\x18\x03 \x01(\x05\x12\x14\n\x0c\x61thlete_name\x18\x04 \x01(\t\x12\x0f\n\x07team_id\x18\x05 \x01(\x05\x12\x11\n\tteam_name\x18\x06 \x01(\t\x12\x11\n\tseed_time\x18\x07 \x01(\t\x12\x12\n\nfinal_time\x18\x08 \x01(\t\x12\r\n\x05place\x18\t \x01(\x05\x12\x12\n\nevent_name\x18\n \x01(\t\x12\x0c\n\x04heat\x18\x0b \x01(\x05\x12\x0c\n\x04lane\x18\x0c \x01(\x05\x12\x0e\n\x06points\x18\x0e \x01(\x02\"\xa3\x01\n\x07Session\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07meet_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x04 \x01(\t\x12\x14\n\x0cwarm_up_time\x18\x05 \x01(\t\x12\x12\n\nstart_time\x18\x06 \x01(\t\x12\x13\n\x0b\x65vent_count\x18\x07 \x01(\x05\x12\x13\n\x0bsession_num\x18\x08 \x01(\x05\x12\x0b\n\x03\x64\x61y\x18\t \x01(\x05\"h\n\x04Meet\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08location\x18\x03 \x01(\t\x12\x12\n\nstart_date\x18\x04 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\"o\n\x04Team\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x0b\n\x03lsc\x18\x04 \x01(\t\x12\x0c\n\x04\x63ity\x18\x05 \x01(\t\x12\r\n\x05state\x18\x06 \x01(\t\x12\x15\n\rathlete_count\x18\x07 \x01(\x05\"\xb9\x01\n\x07\x41thlete\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\x0e\n\x06gender\x18\x04 \x01(\t\x12\x0b\n\x03\x61ge\x18\x05 \x01(\x05\x12\x0f\n\x07team_id\x18\x06 \x01(\x05\x12\x11\n\tteam_name\x18\x07 \x01(\t\x12\x13\n\x0bschool_year\x18\x08 \x01(\t\x12\x0e\n\x06reg_no\x18\t \x01(\t\x12\x15\n\rdate_of_birth\x18\n \x01(\t\"\xb1\x01\n\x05\x45vent\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06gender\x18\x02 \x01(\t\x12\x10\n\x08\x64istance\x18\x03 \x01(\x05\x12\x0e\n\x06stroke\x18\x04 \x01(\t\x12\x0f\n\x07low_age\x18\x05 \x01(\x05\x12\x10\n\x08high_age\x18\x06 \x01(\x05\x12\x0f\n\x07session\x18\x07 \x01(\x05\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x13\n\x0b\x65ntry_count\x18\t \x01(\x05\x12\x11\n\tage_group\x18\n \x01(\t\"e\n\x15GenerateReportRequest\x12(\n\x04type\x18\x01 \x01(\x0e\x32\x1a.meetmanager.v1.ReportType\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0bteam_filter\x18\x03 \x01(\t\"\x8d\x01\n\x16GenerateReportResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0bpdf_content\x18\x03 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x04 \x01(\t\x12\x19\n\x0chtml_content\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x0f\n\r_html_content*\xf8\x01\n\nReportType\x12!\n\x1dREPORT_TYPE_PSYCH_UNSPECIFIED\x10\x00\x12\x17\n\x13REPORT_TYPE_ENTRIES\x10\x01\x12\x17\n\x13REPORT_TYPE_LINEUPS\x10\x02\x12\x17\n\x13REPORT_TYPE_RESULTS\x10\x03\x12\x1c\n\x18REPORT_TYPE_MEET_PROGRAM\x10\x04\x12!\n\x1dREPORT_TYPE_MEET_PROGRAM_HTML\x10\x05\x12\x1d\n\x19REPORT_TYPE_ENTRIES_HYTEK\x10\x06\x12\x1c\n\x18REPORT_TYPE_ENTRIES_CLUB\x10\x07\x32\xa9\x0e\n\x12MeetManagerService\x12M\n\x08GetMeets\x12\x1f.meetmanager.v1.GetMeetsRequest\x1a .meetmanager.v1.GetMeetsResponse\x12h\n\x11GetDashboardStats\x12(.meetmanager.v1.GetDashboardStatsRequest\x1a).meetmanager.v1.GetDashboardStatsResponse\x12M\n\x08GetTeams\x12\x1f.meetmanager.v1.GetTeamsRequest\x1a .meetmanager.v1.GetTeamsResponse\x12J\n\x07GetTeam\x12\x1e.meetmanager.v1.GetTeamRequest\x1a\x1f.meetmanager.v1.GetTeamResponse\x12V\n\x0bGetAthletes\x12\".meetmanager.v1.GetAthletesRequest\x1a#.meetmanager.v1.GetAthletesResponse\x12S\n\nGetAthlete\x12!.meetmanager.v1.GetAthleteRequest\x1a\".meetmanager.v1.GetAthleteResponse\x12P\n\tGetEvents\x12 .meetmanager.v1.GetEventsRequest\x1a!.meetmanager.v1.GetEventsResponse\x12Y\n\x0cListDatasets\x12#.meetmanager.v1.ListDatasetsRequest\x1a$.meetmanager.v1.ListDatasetsResponse\x12\x65\n\x10SetActiveDataset\x12\'.meetmanager.v1.SetActiveDatasetRequest\x1a(.meetmanager.v1.SetActiveDatasetResponse\x12^\n\rUploadDataset\x12$.meetmanager.v1.UploadDatasetRequest\x1a%.meetmanager.v1.UploadDatasetResponse(\x01\x12Y\n\x0c\x43learDataset\x12#.meetmanager.v1.ClearDatasetRequest\x1a$.meetmanager.v1.ClearDatasetResponse\x12\x65\n\x10\x43learAllDatasets\x12\'.meetmanager.v1.ClearAllDatasetsRequest\x1a(.meetmanager.v1.ClearAllDatasetsResponse\x12P\n\tGetRelays\x12 .meetmanager.v1.GetRelaysRequest\x1a!.meetmanager.v1.GetRelaysResponse\x12P\n\tGetScores\x12 .meetmanager.v1.GetScoresRequest\x1a!.meetmanager.v1.GetScoresResponse\x12S\n\nGetEntries\x12!.meetmanager.v1.GetEntriesRequest\x1a\".meetmanager.v1.GetEntriesResponse\x12V\n\x0bGetSessions\x12\".meetmanager.v1.GetSessionsRequest\x1a#.meetmanager.v1.GetSessionsResponse\x12_\n\x0eGetAdminConfig\x12%.meetmanager.v1.GetAdminConfigRequest\x1a&.meetmanager.v1.GetAdminConfigResponse\x12h\n\x11UpdateAdminConfig\x12(.meetmanager.v1.UpdateAdminConfigRequest\x1a).meetmanager.v1.UpdateAdminConfigResponse\x12_\n\x0eGetEventScores\x12%.meetmanager.v1.GetEventScoresRequest\x1a&.meetmanager.v1.GetEventScoresResponse\x12_\n\x0eGenerateReport\x12%.meetmanager.v1.GenerateReportRequest\x1a&.meetmanager.v1.GenerateReportResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!meetmanager/v1/meet_manager.proto\x12\x0emeetmanager.v1\"\x11\n\x0fGetMeetsRequest\"7\n\x10GetMeetsResponse\x12#\n\x05meets\x18\x01 \x03(\x0b\x32\x14.meetmanager.v1.Meet\"\x1a\n\x18GetDashboardStatsRequest\"o\n\x19GetDashboardStatsResponse\x12\x12\n\nmeet_count\x18\x01 \x01(\x05\x12\x12\n\nteam_count\x18\x02 \x01(\x05\x12\x15\n\rathlete_count\x18\x03 \x01(\x05\x12\x13\n\x0b\x65vent_count\x18\x04 \x01(\x05\"\x11\n\x0fGetTeamsRequest\"7\n\x10GetTeamsResponse\x12#\n\x05teams\x18\x01 \x03(\x0b\x32\x14.meetmanager.v1.Team\"\x1c\n\x0eGetTeamRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\x0fGetTeamResponse\x12\"\n\x04team\x18\x01 \x01(\x0b\x32\x14.meetmanager.v1.Team\"6\n\x12GetAthletesRequest\x12\x14\n\x07team_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_team_id\"@\n\x13GetAthletesResponse\x12)\n\x08\x61thletes\x18\x01 \x03(\x0b\x32\x17.meetmanager.v1.Athlete\"\x1f\n\x11GetAthleteRequest\x12\n\n\x02id\x18\x01 \x01(\x05\">\n\x12GetAthleteResponse\x12(\n\x07\x61thlete\x18\x01 \x01(\x0b\x32\x17.meetmanager.v1.Athlete\"\x12\n\x10GetEventsRequest\":\n\x11GetEventsResponse\x12%\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x15.meetmanager.v1.Event\"\x15\n\x13ListDatasetsRequest\"A\n\x14ListDatasetsResponse\x12)\n\x08\x64\x61tasets\x18\x01 \x03(\x0b\x32\x17.meetmanager.v1.Dataset\"+\n\x17SetActiveDatasetRequest\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\"\x1a\n\x18SetActiveDatasetResponse\"C\n\x14UploadDatasetRequest\x12\x12\n\x08\x66ilename\x18\x01 \x01(\tH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"9\n\x15UploadDatasetResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\'\n\x13\x43learDatasetRequest\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\"\x16\n\x14\x43learDatasetResponse\"\x19\n\x17\x43learAllDatasetsRequest\"\x1a\n\x18\x43learAllDatasetsResponse\"\x12\n\x10GetRelaysRequest\":\n\x11GetRelaysResponse\x12%\n\x06relays\x18\x01 \x03(\x0b\x32\x15.meetmanager.v1.Relay\"\x12\n\x10GetScoresRequest\":\n\x11GetScoresResponse\x12%\n\x06scores\x18\x01 \x03(\x0b\x32\x15.meetmanager.v1.Score\"_\n\x11GetEntriesRequest\x12\x17\n\nathlete_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08\x65vent_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\r\n\x0b_athlete_idB\x0b\n\t_event_id\"<\n\x12GetEntriesResponse\x12&\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x15.meetmanager.v1.Entry\"\x14\n\x12GetSessionsRequest\"@\n\x13GetSessionsResponse\x12)\n\x08sessions\x18\x01 \x03(\x0b\x32\x17.meetmanager.v1.Session\"\x17\n\x15GetAdminConfigRequest\"E\n\x16GetAdminConfigResponse\x12\x11\n\tmeet_name\x18\x01 \x01(\t\x12\x18\n\x10meet_description\x18\x02 \x01(\t\"G\n\x18UpdateAdminConfigRequest\x12\x11\n\tmeet_name\x18\x01 \x01(\t\x12\x18\n\x10meet_description\x18\x02 \x01(\t\"H\n\x19UpdateAdminConfigResponse\x12\x11\n\tmeet_name\x18\x01 \x01(\t\x12\x18\n\x10meet_description\x18\x02 \x01(\t\"\x17\n\x15GetEventScoresRequest\"J\n\x16GetEventScoresResponse\x12\x30\n\x0c\x65vent_scores\x18\x01 \x03(\x0b\x32\x1a.meetmanager.v1.EventScore\"E\n\x07\x44\x61taset\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x11\n\tis_active\x18\x02 \x01(\x08\x12\x15\n\rlast_modified\x18\x03 \x01(\t\"\x91\x02\n\x05Relay\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08\x65vent_id\x18\x02 \x01(\x05\x12\x0f\n\x07team_id\x18\x03 \x01(\x05\x12\x11\n\tteam_name\x18\x04 \x01(\t\x12\x11\n\tleg1_name\x18\x05 \x01(\t\x12\x11\n\tleg2_name\x18\x06 \x01(\t\x12\x11\n\tleg3_name\x18\x07 \x01(\t\x12\x11\n\tleg4_name\x18\x08 \x01(\t\x12\x11\n\tseed_time\x18\t \x01(\t\x12\x12\n\nfinal_time\x18\n \x01(\t\x12\r\n\x05place\x18\x0b \x01(\x05\x12\x12\n\nevent_name\x18\x0c \x01(\t\x12\x14\n\x0crelay_letter\x18\r \x01(\t\x12\x0c\n\x04heat\x18\x0e \x01(\x05\x12\x0c\n\x04lane\x18\x0f \x01(\x05\"\x93\x01\n\x05Score\x12\x0f\n\x07team_id\x18\x01 \x01(\x05\x12\x11\n\tteam_name\x18\x02 \x01(\t\x12\x19\n\x11individual_points\x18\x03 \x01(\x02\x12\x14\n\x0crelay_points\x18\x04 \x01(\x02\x12\x14\n\x0ctotal_points\x18\x05 \x01(\x02\x12\x0c\n\x04rank\x18\x06 \x01(\x05\x12\x11\n\tmeet_name\x18\x07 \x01(\t\"Z\n\nEventScore\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\x05\x12\x12\n\nevent_name\x18\x02 \x01(\t\x12&\n\x07\x65ntries\x18\x03 \x03(\x0b\x32\x15.meetmanager.v1.Entry\"\xe9\x01\n\x05\x45ntry\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08\x65vent_id\x18\x02 \x01(\x05\x12\x12\n\nathlete_id\x18\x03 \x01(\x05\x12\x14\n\x0c\x61thlete_name\x18\x04 \x01(\t\x12\x0f\n\x07team_id\x18\x05 \x01(\x05\x12\x11\n\tteam_name\x18\x06 \x01(\t\x12\x11\n\tseed_time\x18\x07 \x01(\t\x12\x12\n\nfinal_time\x18\x08 \x01(\t\x12\r\n\x05place\x18\t \x01(\x05\x12\x12\n\nevent_name\x18\n \x01(\t\x12\x0c\n\x04heat\x18\x0b \x01(\x05\x12\x0c\n\x04lane\x18\x0c \x01(\x05\x12\x0e\n\x06points\x18\x0e \x01(\x02\"\xa3\x01\n\x07Session\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07meet_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x04 \x01(\t\x12\x14\n\x0cwarm_up_time\x18\x05 \x01(\t\x12\x12\n\nstart_time\x18\x06 \x01(\t\x12\x13\n\x0b\x65vent_count\x18\x07 \x01(\x05\x12\x13\n\x0bsession_num\x18\x08 \x01(\x05\x12\x0b\n\x03\x64\x61y\x18\t \x01(\x05\"h\n\x04Meet\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08location\x18\x03 \x01(\t\x12\x12\n\nstart_date\x18\x04 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\"o\n\x04Team\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x0b\n\x03lsc\x18\x04 \x01(\t\x12\x0c\n\x04\x63ity\x18\x05 \x01(\t\x12\r\n\x05state\x18\x06 \x01(\t\x12\x15\n\rathlete_count\x18\x07 \x01(\x05\"\xb9\x01\n\x07\x41thlete\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\x0e\n\x06gender\x18\x04 \x01(\t\x12\x0b\n\x03\x61ge\x18\x05 \x01(\x05\x12\x0f\n\x07team_id\x18\x06 \x01(\x05\x12\x11\n\tteam_name\x18\x07 \x01(\t\x12\x13\n\x0bschool_year\x18\x08 \x01(\t\x12\x0e\n\x06reg_no\x18\t \x01(\t\x12\x15\n\rdate_of_birth\x18\n \x01(\t\"\xb1\x01\n\x05\x45vent\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06gender\x18\x02 \x01(\t\x12\x10\n\x08\x64istance\x18\x03 \x01(\x05\x12\x0e\n\x06stroke\x18\x04 \x01(\t\x12\x0f\n\x07low_age\x18\x05 \x01(\x05\x12\x10\n\x08high_age\x18\x06 \x01(\x05\x12\x0f\n\x07session\x18\x07 \x01(\x05\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x13\n\x0b\x65ntry_count\x18\t \x01(\x05\x12\x11\n\tage_group\x18\n \x01(\t\"e\n\x15GenerateReportRequest\x12(\n\x04type\x18\x01 \x01(\x0e\x32\x1a.meetmanager.v1.ReportType\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0bteam_filter\x18\x03 \x01(\t\"\x8d\x01\n\x16GenerateReportResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0bpdf_content\x18\x03 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x04 \x01(\t\x12\x19\n\x0chtml_content\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x0f\n\r_html_content\"a\n\x1aGenerateReportBatchRequest\x12\x36\n\x07reports\x18\x01 \x03(\x0b\x32%.meetmanager.v1.GenerateReportRequest\x12\x0b\n\x03zip\x18\x02 \x01(\x08\"\x82\x01\n\x1bGenerateReportBatchResponse\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x04 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x05 \x01(\t\x12\x0f\n\x07\x61rchive\x18\x06 \x01(\x08\"`\n\x13StreamReportRequest\x12\x35\n\x06report\x18\x01 \x01(\x0b\x32%.meetmanager.v1.GenerateReportRequest\x12\x12\n\nchunk_size\x18\x02 \x01(\x05\">\n\x14StreamReportMetadata\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x02 \x01(\t\"U\n\x13StreamReportTrailer\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0c\n\x04size\x18\x03 \x01(\x03\x12\x0e\n\x06sha256\x18\x04 \x01(\t\"\xa1\x01\n\x14StreamReportResponse\x12\x38\n\x08metadata\x18\x01 \x01(\x0b\x32$.meetmanager.v1.StreamReportMetadataH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x12\x36\n\x07trailer\x18\x03 \x01(\x0b\x32#.meetmanager.v1.StreamReportTrailerH\x00\x42\x06\n\x04part\"\x81\x01\n\x13SubmitReportRequest\x12\x35\n\x06report\x18\x01 \x01(\x0b\x32%.meetmanager.v1.GenerateReportRequest\x12\x33\n\x08priority\x18\x02 \x01(\x0e\x32!.meetmanager.v1.ReportJobPriority\"&\n\x14SubmitReportResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"%\n\x13GetReportJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\xc4\x01\n\tReportJob\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12-\n\x05state\x18\x02 \x01(\x0e\x32\x1e.meetmanager.v1.ReportJobState\x12\x16\n\x0equeue_position\x18\x03 \x01(\x05\x12\x18\n\x10\x65vents_processed\x18\x04 \x01(\x05\x12\x14\n\x0c\x65vents_total\x18\x05 \x01(\x05\x12\r\n\x05pages\x18\x06 \x01(\x05\x12\x10\n\x08\x66ilename\x18\x07 \x01(\t\x12\x0f\n\x07message\x18\x08 \x01(\t\">\n\x14GetReportJobResponse\x12&\n\x03job\x18\x01 \x01(\x0b\x32\x19.meetmanager.v1.ReportJob\"8\n\x12\x46\x65tchReportRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x12\n\nchunk_size\x18\x02 \x01(\x05\"\xa0\x01\n\x13\x46\x65tchReportResponse\x12\x38\n\x08metadata\x18\x01 \x01(\x0b\x32$.meetmanager.v1.StreamReportMetadataH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x12\x36\n\x07trailer\x18\x03 \x01(\x0b\x32#.meetmanager.v1.StreamReportTrailerH\x00\x42\x06\n\x04part*\xf8\x01\n\nReportType\x12!\n\x1dREPORT_TYPE_PSYCH_UNSPECIFIED\x10\x00\x12\x17\n\x13REPORT_TYPE_ENTRIES\x10\x01\x12\x17\n\x13REPORT_TYPE_LINEUPS\x10\x02\x12\x17\n\x13REPORT_TYPE_RESULTS\x10\x03\x12\x1c\n\x18REPORT_TYPE_MEET_PROGRAM\x10\x04\x12!\n\x1dREPORT_TYPE_MEET_PROGRAM_HTML\x10\x05\x12\x1d\n\x19REPORT_TYPE_ENTRIES_HYTEK\x10\x06\x12\x1c\n\x18REPORT_TYPE_ENTRIES_CLUB\x10\x07*z\n\x11ReportJobPriority\x12*\n&REPORT_JOB_PRIORITY_NORMAL_UNSPECIFIED\x10\x00\x12\x1b\n\x17REPORT_JOB_PRIORITY_LOW\x10\x01\x12\x1c\n\x18REPORT_JOB_PRIORITY_HIGH\x10\x02*\xa5\x01\n\x0eReportJobState\x12 \n\x1cREPORT_JOB_STATE_UNSPECIFIED\x10\x00\x12\x1b\n\x17REPORT_JOB_STATE_QUEUED\x10\x01\x12\x1c\n\x18REPORT_JOB_STATE_RUNNING\x10\x02\x12\x19\n\x15REPORT_JOB_STATE_DONE\x10\x03\x12\x1b\n\x17REPORT_JOB_STATE_FAILED\x10\x04\x32\x88\x12\n\x12MeetManagerService\x12M\n\x08GetMeets\x12\x1f.meetmanager.v1.GetMeetsRequest\x1a .meetmanager.v1.GetMeetsResponse\x12h\n\x11GetDashboardStats\x12(.meetmanager.v1.GetDashboardStatsRequest\x1a).meetmanager.v1.GetDashboardStatsResponse\x12M\n\x08GetTeams\x12\x1f.meetmanager.v1.GetTeamsRequest\x1a .meetmanager.v1.GetTeamsResponse\x12J\n\x07GetTeam\x12\x1e.meetmanager.v1.GetTeamRequest\x1a\x1f.meetmanager.v1.GetTeamResponse\x12V\n\x0bGetAthletes\x12\".meetmanager.v1.GetAthletesRequest\x1a#.meetmanager.v1.GetAthletesResponse\x12S\n\nGetAthlete\x12!.meetmanager.v1.GetAthleteRequest\x1a\".meetmanager.v1.GetAthleteResponse\x12P\n\tGetEvents\x12 .meetmanager.v1.GetEventsRequest\x1a!.meetmanager.v1.GetEventsResponse\x12Y\n\x0cListDatasets\x12#.meetmanager.v1.ListDatasetsRequest\x1a$.meetmanager.v1.ListDatasetsResponse\x12\x65\n\x10SetActiveDataset\x12\'.meetmanager.v1.SetActiveDatasetRequest\x1a(.meetmanager.v1.SetActiveDatasetResponse\x12^\n\rUploadDataset\x12$.meetmanager.v1.UploadDatasetRequest\x1a%.meetmanager.v1.UploadDatasetResponse(\x01\x12Y\n\x0c\x43learDataset\x12#.meetmanager.v1.ClearDatasetRequest\x1a$.meetmanager.v1.ClearDatasetResponse\x12\x65\n\x10\x43learAllDatasets\x12\'.meetmanager.v1.ClearAllDatasetsRequest\x1a(.meetmanager.v1.ClearAllDatasetsResponse\x12P\n\tGetRelays\x12 .meetmanager.v1.GetRelaysRequest\x1a!.meetmanager.v1.GetRelaysResponse\x12P\n\tGetScores\x12 .meetmanager.v1.GetScoresRequest\x1a!.meetmanager.v1.GetScoresResponse\x12S\n\nGetEntries\x12!.meetmanager.v1.GetEntriesRequest\x1a\".meetmanager.v1.GetEntriesResponse\x12V\n\x0bGetSessions\x12\".meetmanager.v1.GetSessionsRequest\x1a#.meetmanager.v1.GetSessionsResponse\x12_\n\x0eGetAdminConfig\x12%.meetmanager.v1.GetAdminConfigRequest\x1a&.meetmanager.v1.GetAdminConfigResponse\x12h\n\x11UpdateAdminConfig\x12(.meetmanager.v1.UpdateAdminConfigRequest\x1a).meetmanager.v1.UpdateAdminConfigResponse\x12_\n\x0eGetEventScores\x12%.meetmanager.v1.GetEventScoresRequest\x1a&.meetmanager.v1.GetEventScoresResponse\x12_\n\x0eGenerateReport\x12%.meetmanager.v1.GenerateReportRequest\x1a&.meetmanager.v1.GenerateReportResponse\x12p\n\x13GenerateReportBatch\x12*.meetmanager.v1.GenerateReportBatchRequest\x1a+.meetmanager.v1.GenerateReportBatchResponse0\x01\x12[\n\x0cStreamReport\x12#.meetmanager.v1.StreamReportRequest\x1a$.meetmanager.v1.StreamReportResponse0\x01\x12Y\n\x0cSubmitReport\x12#.meetmanager.v1.SubmitReportRequest\x1a$.meetmanager.v1.SubmitReportResponse\x12Y\n\x0cGetReportJob\x12#.meetmanager.v1.GetReportJobRequest\x1a$.meetmanager.v1.GetReportJobResponse\x12X\n\x0b\x46\x65tchReport\x12\".meetmanager.v1.FetchReportRequest\x1a#.meetmanager.v1.FetchReportResponse0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'meetmanager.v1.meet_manager_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_REPORTTYPE']._serialized_start=3718
-  _globals['_REPORTTYPE']._serialized_end=3966
+  _globals['_REPORTTYPE']._serialized_start=5058
+  _globals['_REPORTTYPE']._serialized_end=5306
+  _globals['_REPORTJOBPRIORITY']._serialized_start=5308
+  _globals['_REPORTJOBPRIORITY']._serialized_end=5430
+  _globals['_REPORTJOBSTATE']._serialized_start=5433
+  _globals['_REPORTJOBSTATE']._serialized_end=5598
   _globals['_GETMEETSREQUEST']._serialized_start=53
   _globals['_GETMEETSREQUEST']._serialized_end=70
   _globals['_GETMEETSRESPONSE']._serialized_start=72
@@ -133,6 +137,32 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GENERATEREPORTREQUEST']._serialized_end=3571
   _globals['_GENERATEREPORTRESPONSE']._serialized_start=3574
   _globals['_GENERATEREPORTRESPONSE']._serialized_end=3715
-  _globals['_MEETMANAGERSERVICE']._serialized_start=3969
-  _globals['_MEETMANAGERSERVICE']._serialized_end=5802
+  _globals['_GENERATEREPORTBATCHREQUEST']._serialized_start=3717
+  _globals['_GENERATEREPORTBATCHREQUEST']._serialized_end=3814
+  _globals['_GENERATEREPORTBATCHRESPONSE']._serialized_start=3817
+  _globals['_GENERATEREPORTBATCHRESPONSE']._serialized_end=3947
+  _globals['_STREAMREPORTREQUEST']._serialized_start=3949
+  _globals['_STREAMREPORTREQUEST']._serialized_end=4045
+  _globals['_STREAMREPORTMETADATA']._serialized_start=4047
+  _globals['_STREAMREPORTMETADATA']._serialized_end=4109
+  _globals['_STREAMREPORTTRAILER']._serialized_start=4111
+  _globals['_STREAMREPORTTRAILER']._serialized_end=4196
+  _globals['_STREAMREPORTRESPONSE']._serialized_start=4199
+  _globals['_STREAMREPORTRESPONSE']._serialized_end=4360
+  _globals['_SUBMITREPORTREQUEST']._serialized_start=4363
+  _globals['_SUBMITREPORTREQUEST']._serialized_end=4492
+  _globals['_SUBMITREPORTRESPONSE']._serialized_start=4494
+  _globals['_SUBMITREPORTRESPONSE']._serialized_end=4532
+  _globals['_GETREPORTJOBREQUEST']._serialized_start=4534
+  _globals['_GETREPORTJOBREQUEST']._serialized_end=4571
+  _globals['_REPORTJOB']._serialized_start=4574
+  _globals['_REPORTJOB']._serialized_end=4770
+  _globals['_GETREPORTJOBRESPONSE']._serialized_start=4772
+  _globals['_GETREPORTJOBRESPONSE']._serialized_end=4834
+  _globals['_FETCHREPORTREQUEST']._serialized_start=4836
+  _globals['_FETCHREPORTREQUEST']._serialized_end=4892
+  _globals['_FETCHREPORTRESPONSE']._serialized_start=4895
+  _globals['_FETCHREPORTRESPONSE']._serialized_end=5055
+  _globals['_MEETMANAGERSERVICE']._serialized_start=5601
+  _globals['_MEETMANAGERSERVICE']._serialized_end=7913
 # @@protoc_insertion_point(module_scope)
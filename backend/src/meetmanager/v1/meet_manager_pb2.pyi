@@ -17,6 +17,20 @@ class ReportType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     REPORT_TYPE_MEET_PROGRAM_HTML: _ClassVar[ReportType]
     REPORT_TYPE_ENTRIES_HYTEK: _ClassVar[ReportType]
     REPORT_TYPE_ENTRIES_CLUB: _ClassVar[ReportType]
+
+class ReportJobPriority(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    REPORT_JOB_PRIORITY_NORMAL_UNSPECIFIED: _ClassVar[ReportJobPriority]
+    REPORT_JOB_PRIORITY_LOW: _ClassVar[ReportJobPriority]
+    REPORT_JOB_PRIORITY_HIGH: _ClassVar[ReportJobPriority]
+
+class ReportJobState(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    REPORT_JOB_STATE_UNSPECIFIED: _ClassVar[ReportJobState]
+    REPORT_JOB_STATE_QUEUED: _ClassVar[ReportJobState]
+    REPORT_JOB_STATE_RUNNING: _ClassVar[ReportJobState]
+    REPORT_JOB_STATE_DONE: _ClassVar[ReportJobState]
+    REPORT_JOB_STATE_FAILED: _ClassVar[ReportJobState]
 REPORT_TYPE_PSYCH_UNSPECIFIED: ReportType
 REPORT_TYPE_ENTRIES: ReportType
 REPORT_TYPE_LINEUPS: ReportType
@@ -25,6 +39,14 @@ REPORT_TYPE_MEET_PROGRAM: ReportType
 REPORT_TYPE_MEET_PROGRAM_HTML: ReportType
 REPORT_TYPE_ENTRIES_HYTEK: ReportType
 REPORT_TYPE_ENTRIES_CLUB: ReportType
+REPORT_JOB_PRIORITY_NORMAL_UNSPECIFIED: ReportJobPriority
+REPORT_JOB_PRIORITY_LOW: ReportJobPriority
+REPORT_JOB_PRIORITY_HIGH: ReportJobPriority
+REPORT_JOB_STATE_UNSPECIFIED: ReportJobState
+REPORT_JOB_STATE_QUEUED: ReportJobState
+REPORT_JOB_STATE_RUNNING: ReportJobState
+REPORT_JOB_STATE_DONE: ReportJobState
+REPORT_JOB_STATE_FAILED: ReportJobState
 
 class GetMeetsRequest(_message.Message):
     __slots__ = ()
@@ -473,3 +495,129 @@ class GenerateReportResponse(_message.Message):
     filename: str
     html_content: str
     def __init__(self, success: bool = ..., message: _Optional[str] = ..., pdf_content: _Optional[bytes] = ..., filename: _Optional[str] = ..., html_content: _Optional[str] = ...) -> None: ...
+
+class GenerateReportBatchRequest(_message.Message):
+    __slots__ = ("reports", "zip")
+    REPORTS_FIELD_NUMBER: _ClassVar[int]
+    ZIP_FIELD_NUMBER: _ClassVar[int]
+    reports: _containers.RepeatedCompositeFieldContainer[GenerateReportRequest]
+    zip: bool
+    def __init__(self, reports: _Optional[_Iterable[_Union[GenerateReportRequest, _Mapping]]] = ..., zip: bool = ...) -> None: ...
+
+class GenerateReportBatchResponse(_message.Message):
+    __slots__ = ("index", "success", "message", "content", "filename", "archive")
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    ARCHIVE_FIELD_NUMBER: _ClassVar[int]
+    index: int
+    success: bool
+    message: str
+    content: bytes
+    filename: str
+    archive: bool
+    def __init__(self, index: _Optional[int] = ..., success: bool = ..., message: _Optional[str] = ..., content: _Optional[bytes] = ..., filename: _Optional[str] = ..., archive: bool = ...) -> None: ...
+
+class StreamReportRequest(_message.Message):
+    __slots__ = ("report", "chunk_size")
+    REPORT_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_SIZE_FIELD_NUMBER: _ClassVar[int]
+    report: GenerateReportRequest
+    chunk_size: int
+    def __init__(self, report: _Optional[_Union[GenerateReportRequest, _Mapping]] = ..., chunk_size: _Optional[int] = ...) -> None: ...
+
+class StreamReportMetadata(_message.Message):
+    __slots__ = ("filename", "content_type")
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    filename: str
+    content_type: str
+    def __init__(self, filename: _Optional[str] = ..., content_type: _Optional[str] = ...) -> None: ...
+
+class StreamReportTrailer(_message.Message):
+    __slots__ = ("success", "message", "size", "sha256")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    SHA256_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    message: str
+    size: int
+    sha256: str
+    def __init__(self, success: bool = ..., message: _Optional[str] = ..., size: _Optional[int] = ..., sha256: _Optional[str] = ...) -> None: ...
+
+class StreamReportResponse(_message.Message):
+    __slots__ = ("metadata", "chunk", "trailer")
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_FIELD_NUMBER: _ClassVar[int]
+    TRAILER_FIELD_NUMBER: _ClassVar[int]
+    metadata: StreamReportMetadata
+    chunk: bytes
+    trailer: StreamReportTrailer
+    def __init__(self, metadata: _Optional[_Union[StreamReportMetadata, _Mapping]] = ..., chunk: _Optional[bytes] = ..., trailer: _Optional[_Union[StreamReportTrailer, _Mapping]] = ...) -> None: ...
+
+class SubmitReportRequest(_message.Message):
+    __slots__ = ("report", "priority")
+    REPORT_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    report: GenerateReportRequest
+    priority: ReportJobPriority
+    def __init__(self, report: _Optional[_Union[GenerateReportRequest, _Mapping]] = ..., priority: _Optional[_Union[ReportJobPriority, str]] = ...) -> None: ...
+
+class SubmitReportResponse(_message.Message):
+    __slots__ = ("job_id",)
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    def __init__(self, job_id: _Optional[str] = ...) -> None: ...
+
+class GetReportJobRequest(_message.Message):
+    __slots__ = ("job_id",)
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    def __init__(self, job_id: _Optional[str] = ...) -> None: ...
+
+class ReportJob(_message.Message):
+    __slots__ = ("job_id", "state", "queue_position", "events_processed", "events_total", "pages", "filename", "message")
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_POSITION_FIELD_NUMBER: _ClassVar[int]
+    EVENTS_PROCESSED_FIELD_NUMBER: _ClassVar[int]
+    EVENTS_TOTAL_FIELD_NUMBER: _ClassVar[int]
+    PAGES_FIELD_NUMBER: _ClassVar[int]
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    state: ReportJobState
+    queue_position: int
+    events_processed: int
+    events_total: int
+    pages: int
+    filename: str
+    message: str
+    def __init__(self, job_id: _Optional[str] = ..., state: _Optional[_Union[ReportJobState, str]] = ..., queue_position: _Optional[int] = ..., events_processed: _Optional[int] = ..., events_total: _Optional[int] = ..., pages: _Optional[int] = ..., filename: _Optional[str] = ..., message: _Optional[str] = ...) -> None: ...
+
+class GetReportJobResponse(_message.Message):
+    __slots__ = ("job",)
+    JOB_FIELD_NUMBER: _ClassVar[int]
+    job: ReportJob
+    def __init__(self, job: _Optional[_Union[ReportJob, _Mapping]] = ...) -> None: ...
+
+class FetchReportRequest(_message.Message):
+    __slots__ = ("job_id", "chunk_size")
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_SIZE_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    chunk_size: int
+    def __init__(self, job_id: _Optional[str] = ..., chunk_size: _Optional[int] = ...) -> None: ...
+
+class FetchReportResponse(_message.Message):
+    __slots__ = ("metadata", "chunk", "trailer")
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_FIELD_NUMBER: _ClassVar[int]
+    TRAILER_FIELD_NUMBER: _ClassVar[int]
+    metadata: StreamReportMetadata
+    chunk: bytes
+    trailer: StreamReportTrailer
+    def __init__(self, metadata: _Optional[_Union[StreamReportMetadata, _Mapping]] = ..., chunk: _Optional[bytes] = ..., trailer: _Optional[_Union[StreamReportTrailer, _Mapping]] = ...) -> None: ...
@@ -136,6 +136,31 @@ class MeetManagerServiceStub(object):
                 request_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportRequest.SerializeToString,
                 response_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportResponse.FromString,
                 _registered_method=True)
+        self.GenerateReportBatch = channel.unary_stream(
+                '/meetmanager.v1.MeetManagerService/GenerateReportBatch',
+                request_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportBatchRequest.SerializeToString,
+                response_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportBatchResponse.FromString,
+                _registered_method=True)
+        self.StreamReport = channel.unary_stream(
+                '/meetmanager.v1.MeetManagerService/StreamReport',
+                request_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.StreamReportRequest.SerializeToString,
+                response_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.StreamReportResponse.FromString,
+                _registered_method=True)
+        self.SubmitReport = channel.unary_unary(
+                '/meetmanager.v1.MeetManagerService/SubmitReport',
+                request_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.SubmitReportRequest.SerializeToString,
+                response_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.SubmitReportResponse.FromString,
+                _registered_method=True)
+        self.GetReportJob = channel.unary_unary(
+                '/meetmanager.v1.MeetManagerService/GetReportJob',
+                request_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.GetReportJobRequest.SerializeToString,
+                response_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.GetReportJobResponse.FromString,
+                _registered_method=True)
+        self.FetchReport = channel.unary_stream(
+                '/meetmanager.v1.MeetManagerService/FetchReport',
+                request_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.FetchReportRequest.SerializeToString,
+                response_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.FetchReportResponse.FromString,
+                _registered_method=True)
 
 
 class MeetManagerServiceServicer(object):
@@ -297,6 +322,41 @@ class MeetManagerServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GenerateReportBatch(self, request, context):
+        """GenerateReportBatch generates a set of reports from one shared conversion, streaming each file as it is rendered.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamReport(self, request, context):
+        """StreamReport generates one report and streams it as metadata, fixed-size chunks and a closing checksum.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubmitReport(self, request, context):
+        """SubmitReport queues a report to be generated in the background and returns its job id at once.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetReportJob(self, request, context):
+        """GetReportJob retrieves the state and progress of a submitted report job.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def FetchReport(self, request, context):
+        """FetchReport streams the file of a finished report job as metadata, fixed-size chunks and a closing checksum.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MeetManagerServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -400,6 +460,31 @@ def add_MeetManagerServiceServicer_to_server(servicer, server):
                     request_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportRequest.FromString,
                     response_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportResponse.SerializeToString,
             ),
+            'GenerateReportBatch': grpc.unary_stream_rpc_method_handler(
+                    servicer.GenerateReportBatch,
+                    request_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportBatchRequest.FromString,
+                    response_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportBatchResponse.SerializeToString,
+            ),
+            'StreamReport': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamReport,
+                    request_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.StreamReportRequest.FromString,
+                    response_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.StreamReportResponse.SerializeToString,
+            ),
+            'SubmitReport': grpc.unary_unary_rpc_method_handler(
+                    servicer.SubmitReport,
+                    request_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.SubmitReportRequest.FromString,
+                    response_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.SubmitReportResponse.SerializeToString,
+            ),
+            'GetReportJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetReportJob,
+                    request_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.GetReportJobRequest.FromString,
+                    response_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.GetReportJobResponse.SerializeToString,
+            ),
+            'FetchReport': grpc.unary_stream_rpc_method_handler(
+                    servicer.FetchReport,
+                    request_deserializer=meetmanager_dot_v1_dot_meet__manager__pb2.FetchReportRequest.FromString,
+                    response_serializer=meetmanager_dot_v1_dot_meet__manager__pb2.FetchReportResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'meetmanager.v1.MeetManagerService', rpc_method_handlers)
@@ -952,3 +1037,138 @@ class MeetManagerService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GenerateReportBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/meetmanager.v1.MeetManagerService/GenerateReportBatch',
+            meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportBatchRequest.SerializeToString,
+            meetmanager_dot_v1_dot_meet__manager__pb2.GenerateReportBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamReport(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/meetmanager.v1.MeetManagerService/StreamReport',
+            meetmanager_dot_v1_dot_meet__manager__pb2.StreamReportRequest.SerializeToString,
+            meetmanager_dot_v1_dot_meet__manager__pb2.StreamReportResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SubmitReport(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/meetmanager.v1.MeetManagerService/SubmitReport',
+            meetmanager_dot_v1_dot_meet__manager__pb2.SubmitReportRequest.SerializeToString,
+            meetmanager_dot_v1_dot_meet__manager__pb2.SubmitReportResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetReportJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/meetmanager.v1.MeetManagerService/GetReportJob',
+            meetmanager_dot_v1_dot_meet__manager__pb2.GetReportJobRequest.SerializeToString,
+            meetmanager_dot_v1_dot_meet__manager__pb2.GetReportJobResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def FetchReport(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/meetmanager.v1.MeetManagerService/FetchReport',
+            meetmanager_dot_v1_dot_meet__manager__pb2.FetchReportRequest.SerializeToString,
+            meetmanager_dot_v1_dot_meet__manager__pb2.FetchReportResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,125 @@
+"""Convert many MDB files in one run.
+
+Files are spread over a pool of worker processes. Each worker reads with its
+own in-process Jackcess (started once, in the initializer) instead of a nested
+``jackcess_pool``, so a JVM starts once per worker rather than once per file,
+and each worker writes its own output so converted meets never travel back
+to the parent.
+"""
+
+import glob
+import logging
+import multiprocessing
+import os
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchResult:
+    path: str
+    output: str | None = None
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def expand_inputs(inputs: Iterable[str]) -> list[str]:
+    """Files, directories (their ``*.mdb``) and glob patterns -> sorted unique MDB paths."""
+    paths: list[str] = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(p for p in glob.glob(os.path.join(item, "*")) if p.lower().endswith(".mdb"))
+        elif glob.has_magic(item):
+            paths.extend(p for p in glob.glob(item, recursive=True) if os.path.isfile(p))
+        else:
+            paths.append(item)
+    return sorted(dict.fromkeys(os.path.abspath(p) for p in paths))
+
+
+def output_names(paths: list[str]) -> dict[str, str]:
+    """
+    Path -> name its outputs are written under, relative to the output directory
+    and without extension: the file's stem, or, when two inputs share a stem,
+    every input's path relative to their common directory. Raises ValueError if
+    names still clash (e.g. ``meet.mdb`` and ``meet.MDB`` side by side).
+    """
+    names = {p: os.path.splitext(os.path.basename(p))[0] for p in paths}
+    if len(paths) > 1 and max(Counter(n.lower() for n in names.values()).values()) > 1:
+        root = os.path.commonpath([os.path.dirname(p) for p in paths])
+        names = {p: os.path.splitext(os.path.relpath(p, root))[0] for p in paths}
+    # Case-insensitive, as on the default macOS and Windows file systems
+    clashes = [n for n, count in Counter(n.lower() for n in names.values()).items() if count > 1]
+    if clashes:
+        raise ValueError(f"Several inputs would write the same output: {', '.join(sorted(clashes))}")
+    return names
+
+
+def _init_worker():
+    # Read with this process's own JVM rather than starting a nested pool
+    from . import jackcess_pool
+
+    os.environ[jackcess_pool.WORKERS_ENV] = "0"
+    try:
+        from . import mdb_writer
+    except ImportError:
+        return
+    if mdb_writer.jvm_available():
+        mdb_writer.ensure_jvm_started()
+
+
+def _run_one(job: Callable[[str, Any], str], path: str, options: Any) -> BatchResult:
+    started = time.perf_counter()
+    try:
+        output = job(path, options)
+    except Exception as e:
+        logger.debug(f"Conversion of {path} failed", exc_info=True)
+        return BatchResult(path, seconds=time.perf_counter() - started, error=f"{type(e).__name__}: {e}")
+    return BatchResult(path, output=output, seconds=time.perf_counter() - started)
+
+
+def run_batch(
+    paths: list[str], job: Callable[[str, Any], str], options: Any = None, jobs: int | None = None
+) -> list[BatchResult]:
+    """Run ``job(path, options)`` (a picklable module-level function returning the
+    output path) for every file on up to ``jobs`` worker processes. Failures are
+    recorded per file rather than raised. Results come back in input order."""
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(paths) or 1))
+    results: dict[str, BatchResult] = {}
+    # spawn: workers must not inherit a JVM the parent may have started
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker
+    ) as executor:
+        futures = {executor.submit(_run_one, job, path, options): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # worker process died
+                result = BatchResult(path, error=f"{type(e).__name__}: {e}")
+            logger.info(f"{'FAILED' if result.error else 'ok'} {path} ({result.seconds:.2f}s)")
+            results[path] = result
+    return [results[path] for path in paths]
+
+
+def summary(results: list[BatchResult], wall_seconds: float | None = None) -> str:
+    """Per-file timings followed by the failures and totals."""
+    width = max((len(os.path.basename(r.path)) for r in results), default=4)
+    lines = [f"{'File':<{width}}  {'Seconds':>8}  Result"]
+    for r in results:
+        lines.append(f"{os.path.basename(r.path):<{width}}  {r.seconds:>8.2f}  {'FAILED' if r.error else r.output}")
+    failed = [r for r in results if r.error]
+    if failed:
+        lines.append("")
+        lines.append("Failures:")
+        lines.extend(f"  {r.path}: {r.error}" for r in failed)
+    total = f"{len(results) - len(failed)}/{len(results)} converted"
+    if wall_seconds is not None:
+        total += f" in {wall_seconds:.1f}s"
+    lines.append(total)
+    return "\n".join(lines)
@@ -0,0 +1,508 @@
+"""
+Pluggable MDB ingestion.
+
+Every way of turning an .mdb into tables goes through a ``DatasetReader``:
+
+- ``native``:   mmap page reader (jet_reader), no external tools
+- ``jackcess``: Jackcess via the warm worker pool (or an in-process JVM)
+- ``mdbtools``: ``mdb-tables`` / ``mdb-export`` subprocesses (string values)
+- ``cache``:    columnar pickles of a previous read, keyed by file content
+
+Each read reports per-table timings. By default ``read_dataset`` reads with
+the "preferred" backend: a cached read when there is one, else the first
+available backend in the fixed order of BACKEND_PREFERENCE (jackcess, native,
+mdbtools), falling back to the next one on failure. The order is fixed, not
+chosen from the timings, which are there for comparison (``summary()``);
+``parity_check`` diffs the backends on the same file. MM_INGEST_BACKEND names
+a single backend instead.
+"""
+
+import csv
+import hashlib
+import io
+import logging
+import os
+import pickle
+import shutil
+import stat
+import subprocess
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV = "MM_INGEST_BACKEND"
+CACHE_DIR_ENV = "MM_DATASET_CACHE_DIR"
+CACHE_MAX_MB_ENV = "MM_DATASET_CACHE_MAX_MB"
+DEFAULT_CACHE_MAX_MB = 256
+
+# Jackcess first: it is the reference the other backends are checked against
+# (parity_check). The native reader is for hosts without a JVM.
+BACKEND_PREFERENCE = ["jackcess", "native", "mdbtools"]
+# read_dataset's default: the cache, then BACKEND_PREFERENCE in order
+PREFERRED = "preferred"
+
+# mdb-export's default date format
+MDB_EXPORT_DATE_FORMAT = "%m/%d/%y %H:%M:%S"
+
+
+@dataclass
+class DatasetRead:
+    """Result of reading one MDB: DataFrames by physical table name, plus timings in seconds."""
+
+    backend: str
+    tables: dict[str, pd.DataFrame]
+    timings: dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+
+    def to_records(self) -> dict[str, list[dict[Any, Any]]]:
+        """
+        Table rows as lists of dicts of strings, formatted the way ``mdb-export``
+        prints them (empty string for NULL, 0/1 for booleans, MM/DD/YY dates).
+        This is the record format the gRPC server has always cached.
+        """
+        return {name: _export_strings(df).to_dict("records") for name, df in self.tables.items()}
+
+    def select(self, candidates: list[str] | None) -> "DatasetRead":
+        """The tables matching ``candidates`` (case-insensitive; None = all), with their timings."""
+        if candidates is None:
+            return self
+        wanted = {c.lower() for c in candidates}
+        tables = {name: df for name, df in self.tables.items() if _matches(name, wanted)}
+        timings = {name: t for name, t in self.timings.items() if name in tables}
+        return DatasetRead(backend=self.backend, tables=tables, timings=timings, total=self.total)
+
+    def summary(self) -> str:
+        lines = [f"{self.backend}: {len(self.tables)} tables in {self.total * 1000:.1f} ms"]
+        for name, seconds in sorted(self.timings.items(), key=lambda kv: -kv[1]):
+            rows = len(self.tables[name]) if name in self.tables else 0
+            lines.append(f"  {name:<20} {rows:>7} rows {seconds * 1000:>9.1f} ms")
+        return "\n".join(lines)
+
+
+def _export_strings(df: pd.DataFrame) -> pd.DataFrame:
+    out = {}
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_bool_dtype(s):
+            out[col] = s.astype(int).astype(str)
+        elif pd.api.types.is_integer_dtype(s):
+            out[col] = s.astype(str)
+        elif pd.api.types.is_datetime64_any_dtype(s):
+            out[col] = s.dt.strftime(MDB_EXPORT_DATE_FORMAT).fillna("")
+        elif pd.api.types.is_float_dtype(s):
+            out[col] = s.map(_format_float)
+        else:
+            out[col] = s.map(_format_object)
+    return pd.DataFrame(out, columns=df.columns)
+
+
+def _format_float(val) -> str:
+    if pd.isna(val):
+        return ""
+    return str(int(val)) if float(val).is_integer() else repr(float(val))
+
+
+def _format_object(val) -> str:
+    if val is None or (isinstance(val, float) and np.isnan(val)):
+        return ""
+    if isinstance(val, bool):
+        return "1" if val else "0"
+    if isinstance(val, float):
+        return _format_float(val)
+    if isinstance(val, pd.Timestamp) or hasattr(val, "strftime"):
+        return val.strftime(MDB_EXPORT_DATE_FORMAT)
+    return str(val)
+
+
+def _matches(name: str, wanted: set[str] | None) -> bool:
+    return wanted is None or name.lower() in wanted
+
+
+class DatasetReader(ABC):
+    """Reads the tables of an MDB file into DataFrames."""
+
+    name = "base"
+
+    @classmethod
+    @abstractmethod
+    def available(cls) -> bool:
+        """True if the backend can run in this environment."""
+
+    @abstractmethod
+    def _read(self, path: str, wanted: set[str] | None, timings: dict[str, float]) -> dict[str, pd.DataFrame]:
+        """Reads the tables matching ``wanted`` (lower-case names; None = all), recording timings."""
+
+    def read(self, path: str, candidates: list[str] | None = None) -> DatasetRead:
+        wanted = {c.lower() for c in candidates} if candidates is not None else None
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+        tables = self._read(path, wanted, timings)
+        total = time.perf_counter() - started
+        logger.info(f"Read {len(tables)} tables from {path} with {self.name} in {total * 1000:.1f} ms")
+        return DatasetRead(backend=self.name, tables=tables, timings=timings, total=total)
+
+
+class NativeReader(DatasetReader):
+    name = "native"
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    def _read(self, path, wanted, timings):
+        from .jet_reader import JetReader
+
+        tables = {}
+        with JetReader(path) as reader:
+            for table in reader.table_names():
+                if not _matches(table, wanted):
+                    continue
+                started = time.perf_counter()
+                try:
+                    tables[table] = reader.read_table(table)
+                except Exception as e:
+                    logger.error(f"Failed to parse table {table}: {e}")
+                    continue
+                timings[table] = time.perf_counter() - started
+        return tables
+
+
+class JackcessReader(DatasetReader):
+    """Jackcess through the warm worker pool, or in-process when the pool is disabled."""
+
+    name = "jackcess"
+
+    @classmethod
+    def available(cls) -> bool:
+        try:
+            from . import mdb_writer
+        except ImportError:
+            return False
+        return mdb_writer.jvm_available()
+
+    def _read(self, path, wanted, timings):
+        from . import jackcess_pool
+
+        candidates = sorted(wanted) if wanted is not None else None
+        if jackcess_pool.enabled():
+            result = jackcess_pool.get_pool().read_tables(path, candidates)
+        else:
+            result = jackcess_pool._read_tables_job(path, candidates)
+        timings.update(result.get("timings", {}))
+        return {name: pd.DataFrame(columns) for name, columns in result["tables"].items()}
+
+
+class MdbToolsReader(DatasetReader):
+    """``mdb-export`` per table; every value is a string, exactly as printed by mdbtools."""
+
+    name = "mdbtools"
+
+    @classmethod
+    def available(cls) -> bool:
+        return shutil.which("mdb-tables") is not None and shutil.which("mdb-export") is not None
+
+    def _read(self, path, wanted, timings):
+        tables_out = subprocess.check_output(["mdb-tables", "-1", path]).decode("utf-8")
+        tables = {}
+        for table in tables_out.strip().split():
+            if not _matches(table, wanted):
+                continue
+            started = time.perf_counter()
+            csv_out = subprocess.check_output(["mdb-export", path, table]).decode("utf-8")
+            reader = csv.DictReader(io.StringIO(csv_out))
+            rows = list(reader)
+            tables[table] = pd.DataFrame(rows, columns=list(reader.fieldnames or []), dtype=object)
+            timings[table] = time.perf_counter() - started
+        return tables
+
+
+class CachedColumnarReader(DatasetReader):
+    """
+    Columnar cache of earlier reads. Entries are keyed by a hash of the MDB
+    contents, so a re-uploaded or edited file never hits a stale entry.
+
+    Entries are pickles, so the directory must be private: it is created with
+    mode 0700, and one that is a symlink, owned by another user or open to
+    others is not used at all. The cache is bounded by total size
+    (MM_DATASET_CACHE_MAX_MB): after a write, least recently used entries are
+    removed until it fits.
+    """
+
+    name = "cache"
+
+    def __init__(self, cache_dir: str | None = None, max_bytes: int | None = None):
+        self.cache_dir = (
+            cache_dir or os.environ.get(CACHE_DIR_ENV) or os.path.join(tempfile.gettempdir(), "mm_to_json_cache")
+        )
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(CACHE_MAX_MB_ENV, DEFAULT_CACHE_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _entry(self, path: str) -> str:
+        return os.path.join(self.cache_dir, f"{self.file_hash(path)}.pkl")
+
+    def _private(self, create: bool = False) -> bool:
+        """True if the cache directory exists (or was created) and only this user can write to it."""
+        try:
+            if create:
+                os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            st = os.lstat(self.cache_dir)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Could not use dataset cache {self.cache_dir}: {e}")
+            return False
+        owner = os.getuid() if hasattr(os, "getuid") else st.st_uid
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != owner or st.st_mode & 0o077:
+            logger.warning(f"Not using dataset cache {self.cache_dir}: not a private directory (expected mode 0700)")
+            return False
+        return True
+
+    def lookup(self, path: str, candidates: list[str] | None = None) -> DatasetRead | None:
+        try:
+            return self.read(path, candidates)
+        except FileNotFoundError:
+            return None
+
+    def _read(self, path, wanted, timings):
+        entry = self._entry(path)
+        if not self._private() or not os.path.exists(entry):
+            raise FileNotFoundError(entry)
+        started = time.perf_counter()
+        with open(entry, "rb") as f:
+            cached: dict[str, pd.DataFrame] = pickle.load(f)
+        # mtime doubles as the last-used time for eviction
+        os.utime(entry)
+        tables = {name: df for name, df in cached.items() if _matches(name, wanted)}
+        for name in tables:
+            timings[name] = (time.perf_counter() - started) / max(1, len(tables))
+        return tables
+
+    def store(self, path: str, result: DatasetRead):
+        if not self._private(create=True):
+            return
+        try:
+            entry = self._entry(path)
+            tmp = f"{entry}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(result.tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.warning(f"Could not write dataset cache: {e}")
+            return
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in ``max_bytes``."""
+        with self._lock:
+            try:
+                entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith(".pkl")]
+            except OSError:
+                return
+            stats = []
+            for entry in entries:
+                try:
+                    stats.append((entry.stat().st_mtime_ns, entry.stat().st_size, entry.path))
+                except OSError:
+                    continue
+            total = sum(size for _, size, _ in stats)
+            for _, size, path in sorted(stats):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    continue
+
+
+READERS: dict[str, type[DatasetReader]] = {
+    "native": NativeReader,
+    "jackcess": JackcessReader,
+    "mdbtools": MdbToolsReader,
+    "cache": CachedColumnarReader,
+}
+
+
+def available_backends() -> list[str]:
+    """Live (non-cache) backends usable here, in order of preference."""
+    return [name for name in BACKEND_PREFERENCE if READERS[name].available()]
+
+
+def get_reader(name: str) -> DatasetReader:
+    if name not in READERS:
+        raise ValueError(f"Unknown ingestion backend: {name} (expected one of {', '.join(READERS)})")
+    return READERS[name]()
+
+
+def read_dataset(
+    path: str, candidates: list[str] | None = None, backend: str | None = None, use_cache: bool = True
+) -> DatasetRead:
+    """
+    Reads an MDB with ``backend`` (default: MM_INGEST_BACKEND, else PREFERRED).
+
+    PREFERRED serves a cached read of the same file when there is one, otherwise
+    tries each available backend in BACKEND_PREFERENCE order, falling back to
+    the next on failure, and caches the first successful read. A cached read
+    holds every table of the file, so it serves any later ``candidates``.
+    """
+    backend = backend or os.environ.get(BACKEND_ENV) or PREFERRED
+    if backend != PREFERRED:
+        return get_reader(backend).read(path, candidates)
+
+    cache = CachedColumnarReader() if use_cache else None
+    if cache is not None:
+        hit = cache.lookup(path, candidates)
+        if hit is not None:
+            return hit
+
+    errors = []
+    for name in available_backends():
+        try:
+            result = get_reader(name).read(path, None if cache is not None else candidates)
+        except Exception as e:
+            logger.warning(f"Ingestion backend {name} failed on {path}: {e}")
+            errors.append(f"{name}: {e}")
+            continue
+        if not result.tables:
+            errors.append(f"{name}: no tables")
+            continue
+        if cache is not None:
+            cache.store(path, result)
+            result = result.select(candidates)
+        return result
+    raise RuntimeError(f"No ingestion backend could read {path} ({'; '.join(errors) or 'none available'})")
+
+
+# --- Parity ---
+
+
+def _normalize(val) -> Any:
+    """Puts a value from any backend on common ground: None, float, Timestamp or str."""
+    if val is None or val is pd.NaT or (isinstance(val, float) and np.isnan(val)):
+        return None
+    if isinstance(val, (bool, np.bool_)):
+        return float(val)
+    if isinstance(val, (int, float, np.integer, np.floating)):
+        return float(val)
+    if isinstance(val, (pd.Timestamp, np.datetime64)) or hasattr(val, "strftime"):
+        return pd.Timestamp(val).floor("s")
+    if isinstance(val, str):
+        if val == "":
+            return None
+        try:
+            return float(val)
+        except ValueError:
+            pass
+        try:
+            return pd.Timestamp(pd.to_datetime(val, format=MDB_EXPORT_DATE_FORMAT))
+        except (ValueError, TypeError):
+            return val
+    return val
+
+
+def diff_tables(left: pd.DataFrame, right: pd.DataFrame, tolerance: float = 1e-6, limit: int = 5) -> list[str]:
+    """Lists differences between two backends' reads of one table (columns, rows, first bad cells)."""
+    problems = []
+    if list(left.columns) != list(right.columns):
+        missing = set(left.columns) ^ set(right.columns)
+        problems.append(f"columns differ: {sorted(missing) or 'order'}")
+    if len(left) != len(right):
+        problems.append(f"row count differs: {len(left)} != {len(right)}")
+        return problems
+    for col in left.columns:
+        if col not in right.columns:
+            continue
+        for i, (a, b) in enumerate(zip(left[col].tolist(), right[col].tolist(), strict=True)):
+            a, b = _normalize(a), _normalize(b)
+            if isinstance(a, float) and isinstance(b, float):
+                if abs(a - b) <= tolerance * max(1.0, abs(a)):
+                    continue
+            elif a == b or (isinstance(a, str) and isinstance(b, str) and a.rstrip() == b.rstrip()):
+                continue
+            problems.append(f"{col}[{i}]: {a!r} != {b!r}")
+            if len(problems) >= limit:
+                return problems
+            break
+    return problems
+
+
+def parity_check(
+    path: str, backends: list[str] | None = None, candidates: list[str] | None = None
+) -> tuple[dict[str, DatasetRead], dict[str, dict[str, list[str]]]]:
+    """
+    Reads ``path`` with every backend and diffs each against the first one.
+    Returns the reads and {backend: {table: [problems]}} (tables without problems omitted).
+    """
+    backends = backends or available_backends()
+    reads = {name: get_reader(name).read(path, candidates) for name in backends}
+    reference_name = backends[0]
+    reference = reads[reference_name].tables
+    report: dict[str, dict[str, list[str]]] = {}
+    for name in backends[1:]:
+        tables = reads[name].tables
+        problems: dict[str, list[str]] = {}
+        for table in sorted(set(reference) | set(tables)):
+            if table not in tables:
+                problems[table] = [f"missing from {name}"]
+            elif table not in reference:
+                problems[table] = [f"missing from {reference_name}"]
+            else:
+                diff = diff_tables(reference[table], tables[table])
+                if diff:
+                    problems[table] = diff
+        report[name] = problems
+    return reads, report
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Read an MDB through the ingestion backends")
+    parser.add_argument("mdb_file", help="Path to the .mdb file")
+    parser.add_argument("--backend", help=f"One of {', '.join(READERS)} or {PREFERRED} (default)")
+    parser.add_argument("--parity", action="store_true", help="Read with every available backend and diff them")
+    parser.add_argument("--tables", nargs="*", help="Only these tables")
+    args = parser.parse_args()
+
+    if args.parity:
+        backends = [args.backend] + [b for b in available_backends() if b != args.backend] if args.backend else None
+        reads, report = parity_check(args.mdb_file, backends, args.tables)
+        for result in reads.values():
+            print(result.summary())
+        failures = 0
+        for name, problems in report.items():
+            print(f"\n{name} vs {next(iter(reads))}: {'OK' if not problems else f'{len(problems)} table(s) differ'}")
+            for table, diffs in problems.items():
+                for d in diffs:
+                    print(f"  {table}: {d}")
+            failures += len(problems)
+        raise SystemExit(1 if failures else 0)
+
+    result = read_dataset(args.mdb_file, args.tables, args.backend)
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Number of warm Jackcess workers. 0 disables the pool and keeps the legacy
+# behaviour of starting the JVM inside the calling process.
+WORKERS_ENV = "MM_JACKCESS_WORKERS"
+DEFAULT_WORKERS = 2
+
+# --- Worker side ---
+# These run inside the pool processes. Each worker starts its JVM once in the
+# initializer and keeps it for its whole lifetime.
+
+
+def _init_worker():
+    from mm_to_json import mdb_writer
+
+    mdb_writer.ensure_jvm_started()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _read_tables_job(mdb_path: str, candidates: list[str] | None) -> dict[str, Any]:
+    """
+    Reads tables from an MDB and returns them in columnar form:
+    {"catalog": [names...], "tables": {physical_name: {column: [values...]}},
+     "timings": {physical_name: seconds}}.
+    When ``candidates`` is given only tables whose name matches one of them
+    (case-insensitively) are read.
+    """
+    from mm_to_json import mdb_writer
+    from mm_to_json.jackcess_reader import read_table_columns
+
+    db = mdb_writer.open_db(mdb_path)
+    try:
+        catalog = [str(t) for t in db.getTableNames()]
+        wanted = {c.lower() for c in candidates} if candidates is not None else None
+        tables: dict[str, dict[str, list[Any]]] = {}
+        timings: dict[str, float] = {}
+        for name in catalog:
+            if wanted is not None and name.lower() not in wanted:
+                continue
+            started = time.perf_counter()
+            try:
+                columns = read_table_columns(db, name)
+            except Exception as e:
+                logger.error(f"Failed to parse table {name}: {e}")
+                continue
+            timings[name] = time.perf_counter() - started
+            if columns is not None:
+                tables[name] = columns
+        return {"catalog": catalog, "tables": tables, "timings": timings}
+    finally:
+        db.close()
+
+
+def _restore_job(json_path: str, target_mdb: str) -> str:
+    from mm_to_json.mdb_restorer import restore_db
+
+    restore_db(json_path, target_mdb)
+    return target_mdb
+
+
+def _dump_job(mdb_path: str, output_json: str) -> str:
+    from mm_to_json.mdb_dumper import dump_db
+
+    dump_db(mdb_path, output_json)
+    return output_json
+
+
+# --- Caller side ---
+
+
+class JackcessPool:
+    """
+    A pool of long-lived worker processes, each holding a running JVM with the
+    Jackcess classpath loaded. MDB reads and writes are shipped to the workers,
+    so JVM startup is paid once per worker rather than per request, JPype calls
+    no longer contend for the caller's GIL, and several MDBs can be parsed in
+    parallel. A crashed worker (or JVM) breaks the executor; the pool is then
+    rebuilt transparently on the next submission.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, warm: bool = True):
+        self.max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        if warm:
+            self.warm()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: a forked child would inherit a half-initialised JVM if
+                # the parent ever started one.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+    def _reset(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _submit(self, fn, *args) -> Future:
+        try:
+            return self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            logger.warning("Jackcess worker pool was broken; restarting workers.")
+            self._reset()
+            return self._get_executor().submit(fn, *args)
+
+    def _run(self, fn, *args):
+        try:
+            return self._submit(fn, *args).result()
+        except BrokenProcessPool:
+            # The worker died mid-job (e.g. JVM crash). Retry once on a fresh pool.
+            logger.warning("Jackcess worker died during a job; retrying on a fresh pool.")
+            self._reset()
+            return self._submit(fn, *args).result()
+
+    def warm(self):
+        """Starts every worker (and its JVM) ahead of the first real request."""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_ping)
+
+    def submit_read(self, mdb_path: str, candidates: Iterable[str] | None = None) -> Future:
+        """Schedules a columnar read of an MDB; see ``read_tables``."""
+        return self._submit(_read_tables_job, os.path.abspath(mdb_path), list(candidates) if candidates else None)
+
+    def read_tables(self, mdb_path: str, candidates: Iterable[str] | None = None) -> dict[str, Any]:
+        """Reads an MDB in a worker and returns {"catalog": [...], "tables": {name: columns}}."""
+        return self._run(_read_tables_job, os.path.abspath(mdb_path), list(candidates) if candidates else None)
+
+    def restore_db(self, json_path: str, target_mdb: str) -> str:
+        return self._run(_restore_job, os.path.abspath(json_path), os.path.abspath(target_mdb))
+
+    def dump_db(self, mdb_path: str, output_json: str) -> str:
+        return self._run(_dump_job, os.path.abspath(mdb_path), os.path.abspath(output_json))
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+_pool: JackcessPool | None = None
+_pool_lock = threading.Lock()
+
+
+def configured_workers() -> int:
+    try:
+        return int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+def enabled() -> bool:
+    return configured_workers() > 0
+
+
+def get_pool() -> JackcessPool:
+    """Returns the process-wide pool, creating (and warming) it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = JackcessPool(max_workers=configured_workers())
+        return _pool
+
+
+def restore_db(json_path: str, target_mdb: str) -> str:
+    """Restores an MDB from a JSON dump in a pool worker, or in this process when the pool is disabled."""
+    if enabled():
+        return get_pool().restore_db(json_path, target_mdb)
+    return _restore_job(json_path, target_mdb)
+
+
+def dump_db(mdb_path: str, output_json: str) -> str:
+    """Dumps an MDB to JSON in a pool worker, or in this process when the pool is disabled."""
+    if enabled():
+        return get_pool().dump_db(mdb_path, output_json)
+    return _dump_job(mdb_path, output_json)
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
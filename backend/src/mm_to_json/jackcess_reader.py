@@ -0,0 +1,198 @@
+import base64
+import datetime
+import functools
+import logging
+import math
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Jackcess DataType names grouped by the Python type we materialize them as.
+# The converter for a column is picked once from its declared type, so the
+# per-cell loop never has to inspect the Java class of a value.
+_INT_TYPES = {"BYTE", "INT", "LONG", "BIG_INT", "COMPLEX_TYPE"}
+_FLOAT_TYPES = {"FLOAT", "DOUBLE"}
+_DECIMAL_TYPES = {"MONEY", "NUMERIC"}
+_DATE_TYPES = {"SHORT_DATE_TIME", "EXT_DATE_TIME"}
+_BINARY_TYPES = {"BINARY", "OLE", "UNSUPPORTED_FIXEDLEN", "UNSUPPORTED_VARLEN"}
+
+# Column types read as a whole-column long[] / double[]. BIG_INT stays out:
+# its full 64-bit range leaves no value free to mark a null.
+_LONG_COLUMNS = {"BYTE", "INT", "LONG", "COMPLEX_TYPE"}
+_DOUBLE_COLUMNS = _FLOAT_TYPES | _DECIMAL_TYPES
+_TEXT_COLUMNS = {"TEXT", "MEMO", "GUID"}
+
+# Markers for the text columns, which cross as a single joined string
+_TEXT_SEP = "\x00"
+_TEXT_NULL = "\x01"
+
+
+def _to_datetime(val):
+    # Jackcess 3.x hands back java.util.Date unless the database was opened
+    # with DateTimeType.LOCAL_DATE_TIME, in which case we get an ISO string form.
+    if hasattr(val, "getTime"):
+        return datetime.datetime.fromtimestamp(val.getTime() / 1000.0)
+    try:
+        return datetime.datetime.fromisoformat(str(val))
+    except ValueError:
+        return str(val)
+
+
+def _to_base64(val):
+    try:
+        return base64.b64encode(bytes(val)).decode("ascii")
+    except Exception:
+        return str(val)
+
+
+def _to_decimal(val):
+    # BigDecimal -> float; a single JNI call instead of a string round trip
+    return float(val.doubleValue())
+
+
+def converter_for(data_type: str) -> Callable[[Any], Any]:
+    """Returns the Java -> Python converter for a Jackcess DataType name."""
+    if data_type == "BOOLEAN":
+        return bool
+    if data_type in _INT_TYPES:
+        return int
+    if data_type in _FLOAT_TYPES:
+        return float
+    if data_type in _DECIMAL_TYPES:
+        return _to_decimal
+    if data_type in _DATE_TYPES:
+        return _to_datetime
+    if data_type in _BINARY_TYPES:
+        return _to_base64
+    return str
+
+
+@functools.cache
+def _handles() -> dict[str, Any]:
+    """
+    Java-side value extractors, composed once per JVM from JDK method handles.
+
+    Each one maps a column value (null included) to a primitive or a String, so
+    a whole column can be gathered by a Java stream without calling back into
+    Python; nulls become Long.MIN_VALUE, NaN or _TEXT_NULL.
+    """
+    import jpype
+    from java.lang import Boolean, Double, Long, Number, Object, String
+    from java.lang.invoke import MethodHandles, MethodType
+    from java.util import Date, Map, Objects
+
+    lookup = MethodHandles.publicLookup()
+    is_null = lookup.findStatic(Objects, "isNull", MethodType.methodType(jpype.JBoolean, Object))
+
+    def null_as(handle, rtype, null_value):
+        # (Object) -> rtype, with null_value for nulls
+        handle = MethodHandles.explicitCastArguments(handle, MethodType.methodType(rtype, Object))
+        constant = MethodHandles.dropArguments(MethodHandles.constant(rtype, null_value), 0, [Object.class_])
+        return MethodHandles.guardWithTest(is_null, constant, handle)
+
+    def virtual(cls, name, rtype):
+        return lookup.findVirtual(cls, name, MethodType.methodType(rtype))
+
+    return {
+        "get": lookup.findVirtual(Map, "get", MethodType.methodType(Object, Object)),
+        "long": null_as(virtual(Number, "longValue", jpype.JLong), jpype.JLong, Long.MIN_VALUE),
+        # explicitCastArguments turns the boolean into 0/1
+        "bool": null_as(virtual(Boolean, "booleanValue", jpype.JBoolean), jpype.JLong, Long.MIN_VALUE),
+        "double": null_as(virtual(Number, "doubleValue", jpype.JDouble), jpype.JDouble, Double.NaN),
+        "date": null_as(virtual(Date, "getTime", jpype.JLong), jpype.JLong, Long.MIN_VALUE),
+        "text": null_as(virtual(Object, "toString", String), String, String(_TEXT_NULL)),
+    }
+
+
+def _column_function(name: str, extract, interface):
+    """A Java ``interface`` instance applying ``extract`` to the ``name`` value of a row."""
+    import jpype
+    from java.lang import Object
+    from java.lang.invoke import MethodHandleProxies, MethodHandles, MethodType
+
+    get = MethodHandles.insertArguments(_handles()["get"], 1, [jpype.JString(name)])
+    handle = MethodHandles.filterArguments(extract, 0, [get]) if extract is not None else get
+    handle = MethodHandles.explicitCastArguments(handle, MethodType.methodType(handle.type().returnType(), Object))
+    return MethodHandleProxies.asInterfaceInstance(interface, handle)
+
+
+def _gather_column(rows, name: str, data_type: str) -> list[Any] | None:
+    """Gathers one column of ``rows`` (a java.util.List of Rows) in a single call into the JVM; None if it has no bulk path."""
+    import numpy as np
+    from java.util.function import Function, ToDoubleFunction, ToLongFunction
+    from java.util.stream import Collectors
+
+    handles = _handles()
+    if data_type in _LONG_COLUMNS or data_type == "BOOLEAN" or data_type in _DATE_TYPES:
+        kind = "bool" if data_type == "BOOLEAN" else "date" if data_type in _DATE_TYPES else "long"
+        values = np.asarray(rows.stream().mapToLong(_column_function(name, handles[kind], ToLongFunction)).toArray())
+        null = np.iinfo(np.int64).min
+        if kind == "bool":
+            return [None if v == null else bool(v) for v in values.tolist()]
+        if kind == "date":
+            return [None if v == null else datetime.datetime.fromtimestamp(v / 1000.0) for v in values.tolist()]
+        return [None if v == null else v for v in values.tolist()]
+    if data_type in _DOUBLE_COLUMNS:
+        function = _column_function(name, handles["double"], ToDoubleFunction)
+        values = np.asarray(rows.stream().mapToDouble(function).toArray())
+        return [None if math.isnan(v) else v for v in values.tolist()]
+    if data_type in _TEXT_COLUMNS:
+        joined = (
+            rows.stream().map(_column_function(name, handles["text"], Function)).collect(Collectors.joining(_TEXT_SEP))
+        )
+        parts = str(joined).split(_TEXT_SEP) if rows.size() else []
+        # A value containing the separator would shift the split
+        if len(parts) == rows.size():
+            return [None if v == _TEXT_NULL else v for v in parts]
+    return None
+
+
+def _read_column(rows, name: str, data_type: str) -> list[Any]:
+    try:
+        values = _gather_column(rows, name, data_type)
+    except Exception as e:
+        # e.g. LocalDateTime values from a database opened with DateTimeType.LOCAL_DATE_TIME
+        logger.debug(f"Reading column {name} cell by cell: {e}")
+        values = None
+    if values is not None:
+        return values
+
+    from java.util.function import Function
+
+    convert = converter_for(data_type)
+    out: list[Any] = []
+    for val in rows.stream().map(_column_function(name, None, Function)).toArray():
+        if val is None:
+            out.append(None)
+            continue
+        try:
+            out.append(convert(val))
+        except Exception:
+            out.append(str(val))
+    return out
+
+
+def read_table_columns(db, table_name: str) -> dict[str, list[Any]] | None:
+    """
+    Reads a Jackcess table into a column-oriented dict (column name -> values).
+
+    The rows are collected into a Java list in one call, then every column is
+    gathered on the Java side and crosses the JPype boundary once: numbers,
+    booleans and dates as a primitive array, text as one joined string. Only
+    binary and BIG_INT columns are still converted cell by cell.
+    """
+    from java.util.stream import Collectors, StreamSupport
+
+    t = db.getTable(table_name)
+    if t is None:
+        return None
+
+    rows = StreamSupport.stream(t.spliterator(), False).collect(Collectors.toList())
+    columns: dict[str, list[Any]] = {}
+    for col in t.getColumns():
+        name = str(col.getName())
+        columns[name] = _read_column(rows, name, str(col.getType()))
+
+    logger.debug(f"Read {rows.size()} rows from {table_name}")
+    return columns
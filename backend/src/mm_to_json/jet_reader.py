@@ -0,0 +1,695 @@
+"""
+Read-only Jet3/Jet4 (Access 97 - 2003 .mdb) page reader.
+
+Memory-maps the database file and decodes the data pages of the requested
+tables directly into NumPy/pandas columns: no JVM, no mdbtools subprocesses.
+Fixed-width columns are gathered for all rows of a table at once with NumPy
+fancy indexing; variable-width columns (text, memo, binary) are decoded per row.
+
+Layout references: the mdbtools HACKING notes and Jackcess' JetFormat.
+Only what Meet Manager databases use is supported; writes, indexes and
+encrypted ("encoded") databases are out of scope.
+"""
+
+import base64
+import datetime
+import logging
+import mmap
+import struct
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Page types (first byte of every page)
+PAGE_DATA = 0x01
+PAGE_TDEF = 0x02
+PAGE_USAGE_MAP = 0x05
+
+# Column types
+COL_BOOL = 0x01
+COL_BYTE = 0x02
+COL_INT = 0x03
+COL_LONG = 0x04
+COL_MONEY = 0x05
+COL_FLOAT = 0x06
+COL_DOUBLE = 0x07
+COL_DATETIME = 0x08
+COL_BINARY = 0x09
+COL_TEXT = 0x0A
+COL_OLE = 0x0B
+COL_MEMO = 0x0C
+COL_GUID = 0x0F
+COL_NUMERIC = 0x10
+COL_COMPLEX = 0x12
+
+# Row offset flags in the data page row table
+ROW_DELETED = 0x8000
+ROW_OVERFLOW = 0x4000
+ROW_OFFSET_MASK = 0x1FFF
+
+# Column flags
+COL_FLAG_FIXED = 0x01
+
+# MSysObjects
+CATALOG_TDEF_PAGE = 2
+OBJECT_TYPE_TABLE = 1
+SYSTEM_OBJECT_FLAGS = 0x80000002
+
+# Fixed-width column types -> NumPy dtype of their on-disk representation
+_FIXED_DTYPES: dict[int, np.dtype] = {
+    COL_BYTE: np.dtype("u1"),
+    COL_INT: np.dtype("<i2"),
+    COL_LONG: np.dtype("<i4"),
+    COL_COMPLEX: np.dtype("<i4"),
+    COL_MONEY: np.dtype("<i8"),
+    COL_FLOAT: np.dtype("<f4"),
+    COL_DOUBLE: np.dtype("<f8"),
+    COL_DATETIME: np.dtype("<f8"),
+}
+_INT_COLS = {COL_BYTE, COL_INT, COL_LONG, COL_COMPLEX}
+
+# Access stores dates as days since this epoch
+_ACCESS_EPOCH = np.datetime64("1899-12-30T00:00:00", "ms")
+_MS_PER_DAY = 86_400_000
+
+
+@dataclass(frozen=True)
+class JetFormat:
+    version: int
+    page_size: int
+    row_count_offset: int
+    tab_num_cols_offset: int
+    tab_num_ridxs_offset: int
+    tab_usage_map_offset: int
+    tab_cols_start_offset: int
+    tab_ridx_entry_size: int
+    tab_col_entry_size: int
+    col_num_offset: int
+    col_var_offset: int
+    col_flags_offset: int
+    col_fixed_offset: int
+    col_size_offset: int
+    row_header_size: int
+
+
+JET3 = JetFormat(
+    version=3,
+    page_size=2048,
+    row_count_offset=0x08,
+    tab_num_cols_offset=25,
+    tab_num_ridxs_offset=31,
+    tab_usage_map_offset=35,
+    tab_cols_start_offset=43,
+    tab_ridx_entry_size=8,
+    tab_col_entry_size=18,
+    col_num_offset=1,
+    col_var_offset=3,
+    col_flags_offset=13,
+    col_fixed_offset=14,
+    col_size_offset=16,
+    row_header_size=1,
+)
+
+JET4 = JetFormat(
+    version=4,
+    page_size=4096,
+    row_count_offset=0x0C,
+    tab_num_cols_offset=45,
+    tab_num_ridxs_offset=51,
+    tab_usage_map_offset=55,
+    tab_cols_start_offset=63,
+    tab_ridx_entry_size=12,
+    tab_col_entry_size=25,
+    col_num_offset=5,
+    col_var_offset=7,
+    col_flags_offset=15,
+    col_fixed_offset=21,
+    col_size_offset=23,
+    row_header_size=2,
+)
+
+
+@dataclass
+class JetColumn:
+    name: str
+    col_type: int
+    col_num: int
+    var_index: int
+    fixed_offset: int
+    size: int
+    flags: int
+    precision: int = 0
+    scale: int = 0
+
+    @property
+    def is_fixed(self) -> bool:
+        return bool(self.flags & COL_FLAG_FIXED)
+
+
+@dataclass
+class JetTable:
+    name: str
+    tdef_page: int
+    num_rows: int
+    usage_map: int
+    columns: list[JetColumn] = field(default_factory=list)
+
+    @property
+    def has_var_columns(self) -> bool:
+        return any(not c.is_fixed for c in self.columns)
+
+
+def decode_text(raw: bytes, jet_version: int) -> str:
+    """Decodes a TEXT/MEMO value (Jet3 code page bytes, Jet4 UCS-2 with optional compression)."""
+    if jet_version == 3:
+        return raw.decode("cp1252", errors="replace")
+    if len(raw) >= 2 and raw[0] == 0xFF and raw[1] == 0xFE:
+        body = raw[2:]
+        if b"\x00" not in body:
+            return body.decode("latin-1")
+        # 0x00 toggles between compressed (1 byte/char) and plain UCS-2 runs
+        out = []
+        compressed = True
+        i = 0
+        n = len(body)
+        while i < n:
+            if body[i] == 0:
+                compressed = not compressed
+                i += 1
+            elif compressed:
+                out.append(chr(body[i]))
+                i += 1
+            else:
+                out.append(body[i : i + 2].decode("utf-16-le", errors="replace"))
+                i += 2
+        return "".join(out)
+    return raw.decode("utf-16-le", errors="replace")
+
+
+class JetReader:
+    """
+    Memory-mapped reader for a single .mdb file.
+
+    Usage:
+        with JetReader(path) as reader:
+            df = reader.read_table("Athlete")
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._fh.close()
+            raise
+        version = self._mm[0x14]
+        # 0 = Jet3; 1 = Jet4; later ACE versions keep the Jet4 page layout
+        self.fmt = JET3 if version == 0 else JET4
+        self.num_pages = len(self._mm) // self.fmt.page_size
+        self._tables: dict[str, int] | None = None
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None  # type: ignore[assignment]
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Low level ---
+
+    def _u8(self, pos: int) -> int:
+        return self._mm[pos]
+
+    def _u16(self, pos: int) -> int:
+        return struct.unpack_from("<H", self._mm, pos)[0]
+
+    def _u32(self, pos: int) -> int:
+        return struct.unpack_from("<I", self._mm, pos)[0]
+
+    def _page_type(self, page: int) -> int:
+        return self._mm[page * self.fmt.page_size]
+
+    def _row_bounds(self, page: int) -> list[tuple[int, int, int]]:
+        """Returns (absolute_start, absolute_end_exclusive, raw_offset) for each row slot on a page."""
+        ps = self.fmt.page_size
+        base = page * ps
+        rco = base + self.fmt.row_count_offset
+        count = self._u16(rco)
+        raw_offsets = struct.unpack_from(f"<{count}H", self._mm, rco + 2)
+        bounds = []
+        prev = ps
+        for raw in raw_offsets:
+            start = raw & ROW_OFFSET_MASK
+            bounds.append((base + start, base + prev, raw))
+            prev = start
+        return bounds
+
+    def _find_row(self, pointer: int) -> tuple[int, int]:
+        """Resolves a row pointer (row number in the low byte, page in the upper 3 bytes)."""
+        page, row = pointer >> 8, pointer & 0xFF
+        start, end, _ = self._row_bounds(page)[row]
+        return start, end
+
+    def _read_tdef(self, page: int) -> bytes:
+        """Reads a table definition, following its continuation pages."""
+        ps = self.fmt.page_size
+        buf = bytearray(self._mm[page * ps : (page + 1) * ps])
+        next_pg = struct.unpack_from("<I", buf, 4)[0]
+        while next_pg:
+            chunk = self._mm[next_pg * ps : (next_pg + 1) * ps]
+            buf += chunk[8:]
+            next_pg = struct.unpack_from("<I", chunk, 4)[0]
+        return bytes(buf)
+
+    def _parse_table(self, name: str, page: int) -> JetTable:
+        fmt = self.fmt
+        if self._page_type(page) != PAGE_TDEF:
+            raise ValueError(f"Page {page} is not a table definition (table {name})")
+        tdef = self._read_tdef(page)
+        num_rows = struct.unpack_from("<I", tdef, 12 if fmt.version == 3 else 16)[0]
+        num_cols = struct.unpack_from("<H", tdef, fmt.tab_num_cols_offset)[0]
+        num_ridx = struct.unpack_from("<I", tdef, fmt.tab_num_ridxs_offset)[0]
+        usage_map = struct.unpack_from("<I", tdef, fmt.tab_usage_map_offset)[0]
+
+        pos = fmt.tab_cols_start_offset + num_ridx * fmt.tab_ridx_entry_size
+        raw_cols = []
+        for _ in range(num_cols):
+            entry = tdef[pos : pos + fmt.tab_col_entry_size]
+            raw_cols.append(entry)
+            pos += fmt.tab_col_entry_size
+
+        columns = []
+        for entry in raw_cols:
+            if fmt.version == 3:
+                name_len = tdef[pos]
+                col_name = tdef[pos + 1 : pos + 1 + name_len].decode("cp1252", errors="replace")
+                pos += 1 + name_len
+            else:
+                name_len = struct.unpack_from("<H", tdef, pos)[0]
+                col_name = tdef[pos + 2 : pos + 2 + name_len].decode("utf-16-le", errors="replace")
+                pos += 2 + name_len
+            columns.append(
+                JetColumn(
+                    name=col_name,
+                    col_type=entry[0],
+                    col_num=struct.unpack_from("<H", entry, fmt.col_num_offset)[0],
+                    var_index=struct.unpack_from("<H", entry, fmt.col_var_offset)[0],
+                    fixed_offset=struct.unpack_from("<H", entry, fmt.col_fixed_offset)[0],
+                    size=struct.unpack_from("<H", entry, fmt.col_size_offset)[0],
+                    flags=entry[fmt.col_flags_offset],
+                    precision=entry[11],
+                    scale=entry[12],
+                )
+            )
+        columns.sort(key=lambda c: c.col_num)
+        return JetTable(name=name, tdef_page=page, num_rows=num_rows, usage_map=usage_map, columns=columns)
+
+    def _usage_map_pages(self, pointer: int) -> list[int] | None:
+        """Decodes a table's owned-pages usage map; None if it cannot be read."""
+        if not pointer:
+            return None
+        try:
+            start, end = self._find_row(pointer)
+        except (IndexError, struct.error):
+            return None
+        data = self._mm[start:end]
+        if not data:
+            return None
+        pages = []
+        if data[0] == 0x00:
+            # Inline bitmap: first page number, then one bit per page
+            first = struct.unpack_from("<I", data, 1)[0]
+            bits = np.unpackbits(np.frombuffer(data[5:], dtype=np.uint8), bitorder="little")
+            pages = (np.flatnonzero(bits) + first).tolist()
+        elif data[0] == 0x01:
+            # Reference map: list of bitmap pages, each covering (page_size - 4) * 8 pages
+            ps = self.fmt.page_size
+            per_page = (ps - 4) * 8
+            for i in range((len(data) - 1) // 4):
+                map_pg = struct.unpack_from("<I", data, 1 + i * 4)[0]
+                if not map_pg:
+                    continue
+                bitmap = self._mm[map_pg * ps + 4 : (map_pg + 1) * ps]
+                bits = np.unpackbits(np.frombuffer(bitmap, dtype=np.uint8), bitorder="little")
+                pages.extend((np.flatnonzero(bits) + i * per_page).tolist())
+        else:
+            return None
+        return [p for p in pages if 0 < p < self.num_pages]
+
+    def _data_pages(self, table: JetTable) -> list[int]:
+        ps = self.fmt.page_size
+        pages = self._usage_map_pages(table.usage_map)
+        if pages is None:
+            # Fall back to a full scan for data pages pointing at this TDEF
+            pages = list(range(1, self.num_pages))
+        return [p for p in pages if self._page_type(p) == PAGE_DATA and self._u32(p * ps + 4) == table.tdef_page]
+
+    def _row_spans(self, table: JetTable) -> list[tuple[int, int]]:
+        """Returns (start, end) byte spans of every live row of a table, in storage order."""
+        spans: list[tuple[tuple[int, int], int, int]] = []
+        for page in self._data_pages(table):
+            for row, (start, end, raw) in enumerate(self._row_bounds(page)):
+                if raw & ROW_DELETED:
+                    continue
+                if raw & ROW_OVERFLOW:
+                    pointer = self._u32(start)
+                    t_start, t_end = self._find_row(pointer)
+                    spans.append(((pointer >> 8, pointer & 0xFF), t_start, t_end))
+                    continue
+                spans.append(((page, row), start, end))
+        # An overflowed row is reachable both through its pointer and directly
+        # on the page it moved to; keep a single copy.
+        seen: set[tuple[int, int]] = set()
+        result = []
+        for key, start, end in spans:
+            if key in seen:
+                continue
+            seen.add(key)
+            result.append((start, end))
+        return result
+
+    # --- Catalog ---
+
+    def table_names(self) -> list[str]:
+        """Names of the user tables in the database."""
+        return list(self._catalog().keys())
+
+    def _catalog(self) -> dict[str, int]:
+        if self._tables is None:
+            catalog = self._parse_table("MSysObjects", CATALOG_TDEF_PAGE)
+            cols = self._decode(catalog, ["Id", "Name", "Type", "Flags"])
+            tables = {}
+            for obj_id, name, obj_type, flags in zip(
+                cols["Id"], cols["Name"], cols["Type"], cols["Flags"], strict=True
+            ):
+                if name is None or pd.isna(obj_type) or int(obj_type) != OBJECT_TYPE_TABLE:
+                    continue
+                if not pd.isna(flags) and int(flags) & SYSTEM_OBJECT_FLAGS:
+                    continue
+                tables[name] = int(obj_id) & 0x00FFFFFF
+            self._tables = tables
+        return self._tables
+
+    def _resolve(self, name: str) -> tuple[str, int]:
+        catalog = self._catalog()
+        if name in catalog:
+            return name, catalog[name]
+        for candidate, page in catalog.items():
+            if candidate.lower() == name.lower():
+                return candidate, page
+        raise KeyError(f"Table {name} not found")
+
+    # --- Row decoding ---
+
+    def _decode(self, table: JetTable, only: list[str] | None = None) -> dict[str, Any]:
+        spans = self._row_spans(table)
+        n = len(spans)
+        wanted = [c for c in table.columns if only is None or c.name in only]
+        if n == 0:
+            return {c.name: np.array([], dtype=object) for c in wanted}
+
+        # Zero-copy view of the mapping; released before returning so the
+        # mmap can be closed.
+        buf = np.frombuffer(self._mm, dtype=np.uint8)
+        try:
+            out = self._decode_rows(buf, table, wanted, spans)
+        finally:
+            del buf
+        return {c.name: out[c.name] for c in wanted}
+
+    def _decode_rows(self, buf: np.ndarray, table: JetTable, wanted: list[JetColumn], spans) -> dict[str, Any]:
+        fmt = self.fmt
+        n = len(spans)
+        starts = np.fromiter((s for s, _ in spans), dtype=np.int64, count=n)
+        ends = np.fromiter((e for _, e in spans), dtype=np.int64, count=n)
+        if fmt.version == 3:
+            row_cols = buf[starts].astype(np.int64)
+        else:
+            row_cols = buf[starts].astype(np.int64) | (buf[starts + 1].astype(np.int64) << 8)
+        mask_sz = (row_cols + 7) // 8
+        mask_start = ends - mask_sz
+
+        def present(col: JetColumn) -> np.ndarray:
+            # Null mask bit set = value present (for BOOL columns: the value itself)
+            in_row = col.col_num < row_cols
+            pos = np.where(in_row, mask_start + col.col_num // 8, starts)
+            return in_row & ((buf[pos] >> (col.col_num % 8)) & 1).astype(bool)
+
+        out: dict[str, Any] = {}
+        fixed_base = starts + fmt.row_header_size
+        for col in wanted:
+            if col.col_type == COL_BOOL:
+                out[col.name] = present(col)
+            elif col.is_fixed:
+                out[col.name] = self._decode_fixed(buf, col, fixed_base, present(col))
+        var_cols = [c for c in wanted if not c.is_fixed and c.col_type != COL_BOOL]
+        if var_cols:
+            out.update(self._decode_var(table, var_cols, spans, row_cols, mask_sz))
+        return out
+
+    def _decode_fixed(self, buf: np.ndarray, col: JetColumn, fixed_base: np.ndarray, present: np.ndarray):
+        size = col.size
+        idx = fixed_base[:, None] + col.fixed_offset + np.arange(size)
+        idx = np.where(present[:, None], idx, 0)
+        raw = np.ascontiguousarray(buf[idx])
+
+        dtype = _FIXED_DTYPES.get(col.col_type)
+        if dtype is not None and dtype.itemsize == size:
+            values = raw.view(dtype).ravel()
+            if col.col_type in _INT_COLS:
+                if present.all():
+                    return values.astype(np.int64)
+                result = values.astype(np.float64)
+                result[~present] = np.nan
+                return result
+            if col.col_type == COL_MONEY:
+                result = values.astype(np.float64) / 10000.0
+            elif col.col_type == COL_DATETIME:
+                millis = np.round(values * _MS_PER_DAY)
+                millis = np.where(present & np.isfinite(millis), millis, 0).astype(np.int64)
+                dates = (_ACCESS_EPOCH + millis.astype("timedelta64[ms]")).astype("datetime64[ns]")
+                dates[~present] = np.datetime64("NaT")
+                return dates
+            else:
+                result = values.astype(np.float64)
+            result[~present] = np.nan
+            return result
+
+        objs = np.empty(len(present), dtype=object)
+        for i in np.flatnonzero(present):
+            data = raw[i].tobytes()
+            if col.col_type == COL_GUID:
+                objs[i] = "{" + str(uuid.UUID(bytes_le=data)).upper() + "}"
+            elif col.col_type == COL_NUMERIC:
+                objs[i] = self._numeric(data, col.scale)
+            else:
+                objs[i] = data
+        return objs
+
+    @staticmethod
+    def _numeric(data: bytes, scale: int) -> float:
+        # Sign byte, then four little-endian 32-bit words in most-significant-first order
+        words = b"".join(data[1 + i : 5 + i][::-1] for i in range(0, 16, 4))
+        value = int.from_bytes(words, "big") / (10**scale)
+        return -value if data[0] & 0x80 else value
+
+    def _var_offsets(self, start: int, end: int, mask_sz: int, has_var: bool) -> list[int]:
+        """Variable column offsets (relative to row start), with the end-of-data offset last."""
+        if not has_var:
+            return []
+        mm = self._mm
+        if self.fmt.version == 4:
+            count = self._u16(end - mask_sz - 2)
+            pos = end - mask_sz - 4 - 2 * count
+            packed = struct.unpack_from(f"<{count + 1}H", mm, pos)
+            return list(packed[::-1])
+
+        # Jet3: one byte per offset plus a jump table for rows longer than 256 bytes
+        row_end = end - 1
+        count = mm[row_end - mask_sz]
+        row_len = end - start
+        num_jumps = (row_len - 1) // 256
+        col_ptr = row_end - mask_sz - num_jumps - 1
+        if num_jumps and (col_ptr - start - count) // 256 < num_jumps:
+            num_jumps -= 1
+        jumps_used = 0
+        offsets = []
+        for i in range(count + 1):
+            while jumps_used < num_jumps and i == mm[row_end - mask_sz - jumps_used - 1]:
+                jumps_used += 1
+            offsets.append(mm[col_ptr - i] + jumps_used * 256)
+        return offsets
+
+    def _decode_var(self, table, var_cols, spans, row_cols, mask_sz) -> dict[str, np.ndarray]:
+        mm = self._mm
+        version = self.fmt.version
+        has_var = table.has_var_columns
+        out = {c.name: np.empty(len(spans), dtype=object) for c in var_cols}
+        for i, (start, end) in enumerate(spans):
+            rc = int(row_cols[i])
+            msz = int(mask_sz[i])
+            mask = mm[end - msz : end]
+            offsets = self._var_offsets(start, end, msz, has_var)
+            for col in var_cols:
+                if col.col_num >= rc or not (mask[col.col_num // 8] >> (col.col_num % 8)) & 1:
+                    continue
+                if col.var_index + 1 >= len(offsets):
+                    continue
+                lo, hi = offsets[col.var_index], offsets[col.var_index + 1]
+                raw = mm[start + lo : start + hi]
+                if col.col_type in (COL_MEMO, COL_OLE):
+                    raw = self._read_lval(raw)
+                if col.col_type in (COL_TEXT, COL_MEMO):
+                    out[col.name][i] = decode_text(raw, version)
+                else:
+                    out[col.name][i] = raw
+        return out
+
+    def _read_lval(self, raw: bytes) -> bytes:
+        """Resolves a MEMO/OLE field header to its data (inline, single page or page chain)."""
+        if len(raw) < 12:
+            return b""
+        header = struct.unpack_from("<I", raw, 0)[0]
+        length = header & 0x3FFFFFFF
+        if header & 0x80000000:
+            return raw[12 : 12 + length]
+        pointer = struct.unpack_from("<I", raw, 4)[0]
+        if header & 0x40000000:
+            start, end = self._find_row(pointer)
+            return self._mm[start:end][:length]
+        out = bytearray()
+        while pointer and len(out) < length:
+            start, end = self._find_row(pointer)
+            pointer = self._u32(start)
+            out += self._mm[start + 4 : end]
+        return bytes(out[:length])
+
+    # --- Public API ---
+
+    def table(self, name: str) -> JetTable:
+        physical, page = self._resolve(name)
+        return self._parse_table(physical, page)
+
+    def read_columns(self, name: str) -> dict[str, Any]:
+        """Reads a table into {column name: NumPy array} in column order."""
+        return self._decode(self.table(name))
+
+    def read_table(self, name: str) -> pd.DataFrame:
+        """Reads a table into a typed DataFrame (binary values base64-encoded, like the Jackcess path)."""
+        table = self.table(name)
+        columns = self._decode(table)
+        for col in table.columns:
+            if col.col_type in (COL_BINARY, COL_OLE):
+                columns[col.name] = np.array(
+                    [None if v is None else base64.b64encode(v).decode("ascii") for v in columns[col.name]],
+                    dtype=object,
+                )
+        return pd.DataFrame(columns)
+
+
+def read_tables(mdb_path: str, candidates: list[str] | None = None) -> dict[str, pd.DataFrame]:
+    """
+    Reads the user tables of an MDB (optionally only those matching ``candidates``,
+    case-insensitively) into DataFrames keyed by physical table name.
+    """
+    with JetReader(mdb_path) as reader:
+        names = reader.table_names()
+        if candidates is not None:
+            wanted = {c.lower() for c in candidates}
+            names = [n for n in names if n.lower() in wanted]
+        tables = {}
+        for name in names:
+            try:
+                tables[name] = reader.read_table(name)
+            except Exception as e:
+                logger.error(f"Failed to parse table {name}: {e}")
+        return tables
+
+
+def _as_comparable(val):
+    if val is None or (isinstance(val, float) and np.isnan(val)) or val is pd.NaT:
+        return None
+    if isinstance(val, (pd.Timestamp, datetime.datetime)):
+        return pd.Timestamp(val).floor("s")
+    if isinstance(val, (np.integer, np.floating)):
+        return float(val)
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        return float(val)
+    return val
+
+
+def compare_frames(left: pd.DataFrame, right: pd.DataFrame, tolerance: float = 1e-6) -> list[str]:
+    """Lists differences between two reads of the same table (columns, row count, cell values)."""
+    problems = []
+    if list(left.columns) != list(right.columns):
+        problems.append(f"columns differ: {list(left.columns)} != {list(right.columns)}")
+    if len(left) != len(right):
+        problems.append(f"row count differs: {len(left)} != {len(right)}")
+        return problems
+    for col in left.columns:
+        if col not in right.columns:
+            continue
+        for i, (a, b) in enumerate(zip(left[col].tolist(), right[col].tolist(), strict=True)):
+            a, b = _as_comparable(a), _as_comparable(b)
+            if isinstance(a, float) and isinstance(b, float):
+                if abs(a - b) <= tolerance * max(1.0, abs(a)):
+                    continue
+            elif a == b:
+                continue
+            problems.append(f"{col}[{i}]: {a!r} != {b!r}")
+            break
+    return problems
+
+
+def main():
+    import argparse
+
+    from .mm_to_json import TABLE_ALIASES
+
+    parser = argparse.ArgumentParser(description="Native MDB reader (mmap, no JVM)")
+    parser.add_argument("mdb_file", help="Path to the .mdb file")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Compare every Meet Manager table against a Jackcess read of the same file.",
+    )
+    args = parser.parse_args()
+
+    candidates = [name for names in TABLE_ALIASES.values() for name in names]
+    tables = read_tables(args.mdb_file, candidates)
+    for name, df in tables.items():
+        print(f"{name}: {len(df)} rows, {len(df.columns)} columns")
+
+    if args.verify:
+        from . import mdb_writer
+        from .jackcess_reader import read_table_columns
+
+        db = mdb_writer.open_db(args.mdb_file)
+        failures = 0
+        try:
+            for name, df in tables.items():
+                reference = pd.DataFrame(read_table_columns(db, name))
+                problems = compare_frames(reference, df)
+                status = "OK" if not problems else "MISMATCH"
+                print(f"[{status}] {name}")
+                for p in problems:
+                    print(f"    {p}")
+                failures += bool(problems)
+        finally:
+            db.close()
+        raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Incremental JSON output for the mm_to_json CLI.
+
+``write_json`` serializes a document whose dict values may be iterators (the
+converter's ``stream()`` model yields sessions and events lazily): iterators
+are written element by element as they are produced, so a whole meet never
+has to be held as one Python structure or one output string. Everything else
+is encoded in one call per value.
+
+Indented output is byte-for-byte what ``json.dump(doc, fp, indent=indent)``
+would write. Compact output (``indent=None``) uses orjson when it is installed,
+which also turns NaN into ``null`` and writes UTF-8 instead of ``\\u`` escapes.
+"""
+
+import datetime
+import json
+from collections.abc import Iterator
+from typing import IO, Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson: Any = None  # type: ignore[no-redef]
+
+
+def json_serial(obj):
+    """JSON serializer for objects not serializable by default json code"""
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    # Handle pandas types
+    if "Timestamp" in str(type(obj)):
+        return obj.isoformat()
+    # NumPy scalars from DataFrame columns
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+class _Encoder:
+    def __init__(self, indent, use_orjson):
+        self.indent = indent
+        self.use_orjson = use_orjson and indent is None and orjson is not None
+        self.key_sep = ":" if indent is None else ": "
+
+    def newline(self, depth):
+        return "" if self.indent is None else "\n" + " " * (self.indent * depth)
+
+    def encode(self, value, depth):
+        if self.use_orjson:
+            return orjson.dumps(value, default=json_serial, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        separators = (",", ":") if self.indent is None else None
+        text = json.dumps(value, indent=self.indent, separators=separators, default=json_serial)
+        if self.indent and depth:
+            text = text.replace("\n", self.newline(depth))
+        return text
+
+
+def _is_lazy(value):
+    """Iterators, and dicts holding one at any depth, are written piecewise."""
+    return isinstance(value, Iterator) or (isinstance(value, dict) and any(_is_lazy(v) for v in value.values()))
+
+
+def _write(fp: IO[str], value, depth, enc: _Encoder):
+    if isinstance(value, Iterator):
+        first = True
+        for item in value:
+            fp.write("[" if first else ",")
+            fp.write(enc.newline(depth + 1))
+            _write(fp, item, depth + 1, enc)
+            first = False
+        fp.write("[]" if first else enc.newline(depth) + "]")
+    elif _is_lazy(value):
+        for i, (key, item) in enumerate(value.items()):
+            fp.write("," if i else "{")
+            fp.write(enc.newline(depth + 1))
+            fp.write(json.dumps(str(key)) + enc.key_sep)
+            _write(fp, item, depth + 1, enc)
+        fp.write(enc.newline(depth) + "}")
+    else:
+        fp.write(enc.encode(value, depth))
+
+
+def write_json(doc, fp: IO[str], indent: int | None = 4, use_orjson: bool = True):
+    """Write ``doc`` to the text stream ``fp``, consuming any iterator values incrementally."""
+    _write(fp, doc, 0, _Encoder(indent, use_orjson))
+
+
+def dumps(value, indent: int | None = None, use_orjson: bool = True) -> str:
+    """One value as JSON text, with the same encoder choice as ``write_json``."""
+    return _Encoder(indent, use_orjson).encode(value, 0)
@@ -0,0 +1,106 @@
+import json
+import logging
+
+from mm_to_json import mdb_writer
+from mm_to_json.jackcess_reader import _DATE_TYPES, _DECIMAL_TYPES, converter_for
+
+logger = logging.getLogger(__name__)
+
+
+def _to_millis(val):
+    # mdb_restorer expects date values as epoch milliseconds
+    if hasattr(val, "getTime"):
+        return int(val.getTime())
+    if hasattr(val, "atZone"):
+        # LocalDateTime (EXT_DATE_TIME, or a database opened with DateTimeType.LOCAL_DATE_TIME)
+        from java.time import ZoneId
+
+        return int(val.atZone(ZoneId.systemDefault()).toInstant().toEpochMilli())
+    return str(val)
+
+
+def dump_converter(data_type: str):
+    """Java -> JSON converter for a Jackcess DataType name: dates as epoch milliseconds, decimals as exact strings."""
+    if data_type in _DATE_TYPES:
+        return _to_millis
+    if data_type in _DECIMAL_TYPES:
+        return str
+    return converter_for(data_type)
+
+
+def dump_db(mdb_path, output_json):
+    """
+    Dumps every table of an MDB file (schema, indexes and rows) to JSON.
+    The output is the format consumed by mdb_restorer.restore_db.
+    """
+    logger.info(f"Dumping {mdb_path} to {output_json}...")
+    db = mdb_writer.open_db(mdb_path)
+
+    dump_data: dict = {"tables": {}}
+
+    try:
+        for table_name_obj in db.getTableNames():
+            table_name = str(table_name_obj)
+            logger.info(f"Processing {table_name}...")
+            t = db.getTable(table_name)
+
+            # Schema
+            columns = []
+            converters = []
+            for col in t.getColumns():
+                dtype = str(col.getType())
+                columns.append(
+                    {
+                        "name": str(col.getName()),
+                        "type": dtype,
+                        "length": int(col.getLength()),
+                        "precision": int(col.getPrecision()),
+                        "scale": int(col.getScale()),
+                        "auto_number": bool(col.isAutoNumber()),
+                    }
+                )
+                converters.append(dump_converter(dtype))
+
+            # Indexes (names and uniqueness only)
+            indexes = []
+            for idx in t.getIndexes():
+                indexes.append(
+                    {
+                        "name": str(idx.getName()),
+                        "unique": bool(idx.isUnique()),
+                        "columns": [str(c.getName()) for c in idx.getColumns()],
+                    }
+                )
+
+            # Data
+            names = [c["name"] for c in columns]
+            rows = []
+            for row in t:
+                values = row.values().toArray()
+                if len(values) != len(names):
+                    values = [row.get(name) for name in names]
+                row_data = {}
+                for name, conv, val in zip(names, converters, values, strict=True):
+                    row_data[name] = None if val is None else conv(val)
+                rows.append(row_data)
+
+            dump_data["tables"][table_name] = {"columns": columns, "indexes": indexes, "rows": rows}
+
+    finally:
+        db.close()
+
+    with open(output_json, "w") as f:
+        json.dump(dump_data, f, indent=2)
+    logger.info("Dump complete.")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("mdb_path", help="Input MDB file")
+    parser.add_argument("json_out", help="Output JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    dump_db(args.mdb_path, args.json_out)
@@ -1,13 +1,16 @@
 import json
+import logging
 
 from mm_to_json import mdb_writer
 
+logger = logging.getLogger(__name__)
+
 
 def restore_db(json_path, target_mdb):
     """
     Restores an MDB file from a JSON dump.
     """
-    print(f"Restoring {target_mdb} from {json_path}...")
+    logger.info(f"Restoring {target_mdb} from {json_path}...")
 
     with open(json_path) as f:
         dump_data = json.load(f)
@@ -31,7 +34,7 @@ def restore_db(json_path, target_mdb):
     try:
         tables = dump_data.get("tables", {})
         for table_name, table_def in tables.items():
-            print(f"Creating table {table_name}...")
+            logger.info(f"Creating table {table_name}...")
 
             tb = TableBuilder(table_name)
 
@@ -44,7 +47,7 @@ def restore_db(json_path, target_mdb):
                 try:
                     dtype = getattr(DataType, dtype_str)
                 except AttributeError:
-                    print(f"Warning: Unknown type {dtype_str} for {col['name']}, defaulting to TEXT")
+                    logger.warning(f"Unknown type {dtype_str} for {col['name']}, defaulting to TEXT")
                     dtype = DataType.TEXT
 
                 cb = ColumnBuilder(col["name"])
@@ -91,7 +94,7 @@ def restore_db(json_path, target_mdb):
             # Insert Rows
             rows = table_def.get("rows", [])
             if rows:
-                print(f"  Inserting {len(rows)} rows...")
+                logger.info(f"  Inserting {len(rows)} rows...")
                 # Jackcess can add rows from map
                 from java.util import HashMap
 
@@ -108,12 +111,19 @@ def restore_db(json_path, target_mdb):
                             dtype = col_types.get(k, DataType.TEXT)
 
                             # Numeric types
-                            if dtype in (
+                            if dtype in (DataType.NUMERIC, DataType.MONEY):
+                                # Dumped as exact decimal strings
+                                from java.math import BigDecimal
+
+                                try:
+                                    row_map.put(k, BigDecimal(str(v)))
+                                except Exception:
+                                    row_map.put(k, v)  # Fallback
+
+                            elif dtype in (
                                 DataType.LONG,
                                 DataType.INT,
                                 DataType.BYTE,
-                                DataType.NUMERIC,
-                                DataType.MONEY,
                                 DataType.BIG_INT,
                             ):
                                 try:
@@ -152,7 +162,7 @@ def restore_db(json_path, target_mdb):
 
     finally:
         db.close()
-    print("Restore complete.")
+    logger.info("Restore complete.")
 
 
 def start_jvm():
@@ -167,4 +177,5 @@ if __name__ == "__main__":
     parser.add_argument("target_mdb", help="Output MDB path")
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     restore_db(args.json_path, args.target_mdb)
@@ -15,17 +15,10 @@ def get_classpath():
     return jars
 
 
-def ensure_jvm_started():
-    """Starts the JVM if not already started."""
-    if jpype.isJVMStarted():
-        return
-
-    logger.debug("Starting JVM...")
-
-    # Discover JVM path
-    jvm_path = None
+def _find_jvm_path():
+    """Returns the path of a usable libjvm (system default or bundled JRE), or None."""
     try:
-        jvm_path = jpype.getDefaultJVMPath()
+        return jpype.getDefaultJVMPath()
     except Exception:
         # Try local JRE
         base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -41,8 +34,28 @@ def ensure_jvm_started():
                 potential = os.path.join(local_jre, "lib", "server", "libjvm.so")
 
             if os.path.exists(potential):
-                jvm_path = potential
-                logger.debug(f"Using local JRE at {jvm_path}")
+                logger.debug(f"Using local JRE at {potential}")
+                return potential
+    return None
+
+
+def jvm_available():
+    """True if a JVM and the Jackcess jars are present (without starting the JVM)."""
+    if jpype.isJVMStarted():
+        return True
+    lib_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib")
+    return _find_jvm_path() is not None and os.path.isdir(lib_dir) and bool(get_classpath())
+
+
+def ensure_jvm_started():
+    """Starts the JVM if not already started."""
+    if jpype.isJVMStarted():
+        return
+
+    logger.debug("Starting JVM...")
+
+    # Discover JVM path
+    jvm_path = _find_jvm_path()
 
     if not jvm_path:
         raise RuntimeError("Java Runtime (JRE) not found. Please install Java or run download_libs.py.")
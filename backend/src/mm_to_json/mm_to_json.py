@@ -1,12 +1,18 @@
 import argparse
-import datetime
-import json
+import copy
+import hashlib
 import logging
 import os
+import sys
+import time
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from . import batch, dataset_reader, jackcess_pool, jackcess_reader, table_export, times
+from .json_writer import write_json
+
 logger = logging.getLogger(__name__)
 
 # from access_parser import AccessParser DEPRECATED
@@ -16,9 +22,195 @@ except ImportError as e:
     logger.debug(f"Failed to import mdb_writer: {e}")
     mdb_writer: Any = None  # type: ignore
 
+# Tables we care about for the API (export_raw / export_tables)
+RAW_TABLES = ["Meet", "Team", "Athlete", "Event", "Session", "Sessitem", "Entry", "Relay", "RelayNames", "Divisions"]
+
+# Logical table name -> physical names used by the two Meet Manager schemas
+TABLE_ALIASES = {
+    "Meet": ["Meet", "MEET"],
+    "Session": ["Session", "SESSIONS"],
+    "Sessitem": ["Sessitem", "SESSITEM"],
+    "Event": ["Event", "MTEVENT"],
+    "Entry": ["Entry", "ENTRY"],
+    "Relay": ["Relay", "RELAY"],
+    "RelayNames": ["RelayNames", "RELAYNAMES"],
+    "Athlete": ["Athlete", "ATHLETE"],
+    "Team": ["Team", "TEAM"],
+    "Divisions": ["Divisions", "DIVISIONS"],
+}
+
+
+# --- Whole-column helpers for the conversion engine ---
+# Each mirrors the per-row expression it replaces (noted in the docstring) so output is unchanged.
+
+
+def _raw_column(df, col, default=None):
+    """Values as ``row.get(col, default)`` sees them under ``df.iterrows()``.
+
+    iterrows upcasts every row to the frame's common dtype, so an all-numeric
+    table yields floats for its integer columns; keep that so raw keys and ids
+    serialize exactly as before.
+    """
+    if col not in df.columns:
+        return [default] * len(df)
+    dtypes = list(df.dtypes.unique())
+    if len(dtypes) == 1:
+        common = dtypes[0]
+    elif all(pd.api.types.is_numeric_dtype(d) and not pd.api.types.is_bool_dtype(d) for d in dtypes):
+        common = np.result_type(*dtypes)
+    else:
+        common = np.dtype(object)
+    return list(df[col].to_numpy(dtype=common))
+
+
+def _float_column(df, col):
+    """``float(row.get(col, 0.0) or 0.0)``: blanks and None become 0.0, NaN stays NaN."""
+    if col not in df.columns:
+        return np.zeros(len(df))
+    values = df[col]
+    if values.dtype == object:
+        raw = values.to_numpy()
+        none = np.array(None, dtype=object)
+        blank = np.equal(raw, none) | np.equal(raw, "") | np.equal(raw, False)
+        values = values.where(~blank, 0.0)
+        try:
+            return values.to_numpy(dtype=float)
+        except (ValueError, TypeError):
+            return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+    return values.to_numpy(dtype=float)
+
+
+def _int_column(df, col):
+    """``_safe_int(row.get(col))``: truncated to int, 0 when missing or unparseable."""
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=np.int64)
+    values = df[col]
+    if values.dtype == object:
+        values = values.map(lambda v: v.strip() if isinstance(v, str) else v)
+    numbers = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, copy=True)
+    numbers[~np.isfinite(numbers)] = 0
+    return np.trunc(numbers).astype(np.int64)
+
+
+def _text_column(df, col):
+    """``_get_val(row, col)`` for every row: stripped text, "" when missing."""
+    values = pd.Series(_raw_column(df, col), dtype=object)
+    text = values.astype(str).str.strip()
+    text[values.isna()] = ""
+    return text.tolist()
+
+
+# Lookup map source columns per schema
+LOOKUP_COLUMNS = {
+    "A": {
+        "athlete": ("Ath_no", "First_name", "Last_name", "Ath_age", "Schl_yr", "Team_no"),
+        "team": ("Team_no", "Team_abbr", "Team_short", "Team_lsc"),
+    },
+    "B": {
+        "athlete": ("Athlete", "First", "Last", "Age", "Class", "Team1"),
+        "team": ("Team", "TCode", "Short", "LSC"),
+    },
+}
+
+# Which lookup maps depend on which logical table (athletes carry their team name)
+LOOKUP_DEPENDENCIES = {"Team": ("team", "athlete"), "Athlete": ("athlete",), "Divisions": ("division",)}
+
+# Tables whose rows only feed the entries of the events they point at: (event column, athlete column)
+# per schema. A change to any other table (Athlete aside) rebuilds the whole meet model.
+ENTRY_TABLE_KEYS = {
+    "A": {"Entry": ("Event_ptr", "Ath_no"), "Relay": ("Event_ptr", None), "RelayNames": ("Event_ptr", "Ath_no")},
+    "B": {"Entry": ("MtEvent", "Athlete"), "Relay": ("MtEvent", None)},
+}
+
+
+def changed_rows(old, new):
+    """Rows of ``old`` and of ``new`` that have no identical row in the other table.
+
+    Edited rows show up on both sides, added rows only in ``new`` and removed
+    rows only in ``old``; repeated identical rows are matched by count.
+    Returns None when the columns differ and rows cannot be compared.
+    """
+    if list(old.columns) != list(new.columns):
+        return None
+    old_hash = pd.util.hash_pandas_object(old, index=False)
+    new_hash = pd.util.hash_pandas_object(new, index=False)
+    counts = old_hash.value_counts().sub(new_hash.value_counts(), fill_value=0)
+    differing = counts.index[counts != 0]
+    return old[old_hash.isin(differing).to_numpy()], new[new_hash.isin(differing).to_numpy()]
+
+
+class EventEntryColumns:
+    """Entry/Relay rows grouped by event pointer, with heat/lane/time columns computed once.
+
+    Replaces per-event boolean masks plus ``iterrows()``: the converter looks up
+    an event's row positions and reads pre-formatted values from the arrays.
+    """
+
+    def __init__(self, df, key, schema_type):
+        self.schema_type = schema_type
+        self.positions = {k: np.asarray(v) for k, v in df.groupby(key, sort=False, dropna=True).indices.items()}
+        n = len(df)
+
+        if schema_type == "B":
+            # Score is the only time; values over 200 are already hundredths of a second
+            score = _float_column(df, "Score")
+            hundredths = times.to_hundredths(np.where(score > 200, score / 100.0, score))
+            self.seed = times.format_times(hundredths, min_sec=False)
+            self.heat = {"B": _int_column(df, "HEAT")}
+            self.lane = {"B": _int_column(df, "LANE")}
+            self.athlete = _raw_column(df, "Athlete")
+            self.team = _raw_column(df, "Team")
+            self.relay_ltr = [str(v) for v in _raw_column(df, "RelayLtr", "A")]
+            return
+
+        seed = times.to_hundredths(_float_column(df, "ConvSeed_time"))
+        self.seed = times.format_times(seed, min_sec=False)
+        self.seed_min_sec = times.format_times(seed)
+
+        # Prelim ("P") vs final columns, picked per event by its round letter
+        self.heat = {"P": _int_column(df, "Pre_heat"), "F": _int_column(df, "Fin_heat")}
+        self.lane = {"P": _int_column(df, "Pre_lane"), "F": _int_column(df, "Fin_lane")}
+        self.time = {}
+        self.time_min_sec = {}
+        for rnd, prefix in (("P", "Pre"), ("F", "Fin")):
+            hundredths = times.to_hundredths(_float_column(df, f"{prefix}_Time"))
+            status = times.status_codes(df[f"{prefix}_Stat"]) if f"{prefix}_Stat" in df.columns else None
+            self.time[rnd] = times.format_times(hundredths, status, min_sec=False)
+            self.time_min_sec[rnd] = times.format_times(hundredths, status)
+
+        place_col = "Fin_place" if "Fin_place" in df.columns else "Place"
+        self.place = _int_column(df, place_col) if place_col in df.columns else np.zeros(n, dtype=np.int64)
+        self.athlete = _raw_column(df, "Ath_no")
+        self.team = _raw_column(df, "Team_no")
+        self.relay_ltr = _raw_column(df, "Team_ltr", "A")
+
+    def rows(self, event):
+        """Row positions for ``event`` (Schema A: only rows with a heat and lane in its round)."""
+        positions = self.positions.get(event.event_ptr)
+        if positions is None:
+            return []
+        if self.schema_type == "B":
+            return positions.tolist()
+        rnd = "P" if event.round_ltr == "P" else "F"
+        keep = (self.heat[rnd][positions] != 0) & (self.lane[rnd][positions] != 0)
+        return positions[keep].tolist()
+
+    def heat_lane_time(self, event, i):
+        """Heat, lane, seed and time of Schema A entry row ``i`` in the event's round."""
+        rnd = "P" if event.round_ltr == "P" else "F"
+        diving = event.stroke == "Diving"
+        return {
+            "heat": int(self.heat[rnd][i]),
+            "lane": int(self.lane[rnd][i]),
+            "seed": self.seed[i] if diving else self.seed_min_sec[i],
+            "time": self.time[rnd][i] if diving else self.time_min_sec[rnd][i],
+            "place": int(self.place[i]),
+        }
+
 
 class MmToJsonConverter:
-    def __init__(self, mdb_path=None, password=None, table_data=None):
+    def __init__(self, mdb_path=None, password=None, table_data=None, use_pool=None, backend=None):
+        self.db: Any = None
         if mdb_path:
             if not os.path.exists(mdb_path):
                 raise FileNotFoundError(f"MDB file not found: {mdb_path}")
@@ -29,21 +221,32 @@ class MmToJsonConverter:
 
             logger.info(f"Loading database: {mdb_path}")
 
-            # Initialize Jackcess
-            if mdb_writer:
+            if use_pool is None:
+                # Preferred available ingestion backend (or MM_INGEST_BACKEND / ``backend``)
+                table_data = self._read_via_backend(mdb_path, backend)
+            elif use_pool:
+                # Read in a warm Jackcess worker; the JVM never starts in this process
+                table_data = self._read_via_pool(mdb_path)
+            elif mdb_writer:
+                # Initialize Jackcess in-process
                 mdb_writer.ensure_jvm_started()
                 self.db = mdb_writer.open_db(mdb_path)
             else:
                 raise ImportError("mdb_writer (Jackcess) is required for opening MDB files directly.")
-        elif table_data is not None:
-            self.db = None
-        else:
+        elif table_data is None:
             raise ValueError("Either mdb_path or table_data must be provided.")
 
         self.tables = {}
         self.cache_athlete_map = None
         self.cache_team_map = None
         self.cache_division_map = None
+        self._entry_columns_cache: dict[str, tuple[Any, str, EventEntryColumns | None]] = {}
+        self._event_rows_cache: tuple[Any, dict[Any, int]] | None = None
+        self._relay_legs_cache: tuple[Any, dict[tuple, list]] | None = None
+        self._model_cache: tuple[tuple, list, dict[str, Any]] | None = None
+        self._convert_cache: tuple[tuple, list, dict[str, Any]] | None = None
+        self._hash_cache: tuple[tuple, list, str] | None = None
+        self._event_dicts: dict[Event, dict[str, Any]] = {}
         self.schema_type = "A"  # A = Original C++ assumption, B = Singers23/Newer
 
         if table_data is not None:
@@ -52,18 +255,7 @@ class MmToJsonConverter:
             self._load_from_db()
 
     def _load_from_data(self, table_data):
-        self.table_aliases = {
-            "Meet": ["Meet", "MEET"],
-            "Session": ["Session", "SESSIONS"],
-            "Sessitem": ["Sessitem", "SESSITEM"],
-            "Event": ["Event", "MTEVENT"],
-            "Entry": ["Entry", "ENTRY"],
-            "Relay": ["Relay", "RELAY"],
-            "RelayNames": ["RelayNames", "RELAYNAMES"],
-            "Athlete": ["Athlete", "ATHLETE"],
-            "Team": ["Team", "TEAM"],
-            "Divisions": ["Divisions", "DIVISIONS"],
-        }
+        self.table_aliases = TABLE_ALIASES
 
         # Determine schema type
         self.schema_type = "A"
@@ -83,7 +275,7 @@ class MmToJsonConverter:
                     if k.lower() == candidate.lower():
                         found_data = table_data[k]
                         break
-                if found_data:
+                if found_data is not None:
                     break
 
             if found_data is not None:
@@ -94,6 +286,18 @@ class MmToJsonConverter:
             else:
                 self.tables[logical] = pd.DataFrame()
 
+    def _read_via_backend(self, mdb_path, backend=None):
+        candidates = [name for names in TABLE_ALIASES.values() for name in names]
+        result = dataset_reader.read_dataset(mdb_path, candidates, backend)
+        logger.info(f"Read {len(result.tables)} tables from {mdb_path} with the {result.backend} backend")
+        return result.tables
+
+    def _read_via_pool(self, mdb_path):
+        candidates = [name for names in TABLE_ALIASES.values() for name in names]
+        result = jackcess_pool.get_pool().read_tables(mdb_path, candidates)
+        logger.info(f"Read {len(result['tables'])} tables from {mdb_path} via Jackcess worker pool")
+        return result["tables"]
+
     def _get_val(self, row, key, default=""):
         """Safely retrieve value from a row, handling pandas NaN/None."""
         val = row.get(key)
@@ -103,18 +307,7 @@ class MmToJsonConverter:
 
     def _load_from_db(self):
         # Pre-load required tables into Pandas DataFrames
-        self.table_aliases = {
-            "Meet": ["Meet", "MEET"],
-            "Session": ["Session", "SESSIONS"],
-            "Sessitem": ["Sessitem", "SESSITEM"],
-            "Event": ["Event", "MTEVENT"],
-            "Entry": ["Entry", "ENTRY"],
-            "Relay": ["Relay", "RELAY"],
-            "RelayNames": ["RelayNames", "RELAYNAMES"],
-            "Athlete": ["Athlete", "ATHLETE"],
-            "Team": ["Team", "TEAM"],
-            "Divisions": ["Divisions", "DIVISIONS"],
-        }
+        self.table_aliases = TABLE_ALIASES
 
         # Jackcess
         catalog_tables = [str(t) for t in self.db.getTableNames()]
@@ -129,20 +322,20 @@ class MmToJsonConverter:
 
             if found_name:
                 logger.debug(f"Parsing table {found_name}...")
-                rows = None
+                columns = None
                 try:
                     # Detect Schema Type based on Event table name
                     if logical == "Event" and found_name == "MTEVENT":
                         self.schema_type = "B"
                         logger.info("Detected Schema Type B (MTEVENT structure)")
 
-                    rows: Any = self._read_table_jackcess(found_name)  # type: ignore
+                    columns = self._read_table_jackcess(found_name)
                 except Exception as e:
                     logger.error(f"Failed to parse table {found_name}: {e}")
                     logger.error("SKIPPING TABLE due to parse error.")
-                    rows = None
+                    columns = None
 
-                df = pd.DataFrame(rows)
+                df = pd.DataFrame(columns)
 
                 if not df.empty:
                     df.columns = df.columns.astype(str)
@@ -155,47 +348,191 @@ class MmToJsonConverter:
                     logger.warning(f"Warning: Logical table {logical} not found (checked {physical_candidates}).")
                 self.tables[logical] = pd.DataFrame()
 
-    def _read_table_jackcess(self, table_name: str) -> list[dict[str, Any]] | None:
-        import base64
+    def _read_table_jackcess(self, table_name: str) -> dict[str, list[Any]] | None:
+        return jackcess_reader.read_table_columns(self.db, table_name)
+
+    def dataset_version(self) -> tuple:
+        """Identity of the loaded tables; changes whenever a table is replaced."""
+        return (self.schema_type, tuple((name, id(df)) for name, df in self.tables.items()))
+
+    def dataset_hash(self) -> str:
+        """Hash of the loaded tables' contents; unlike ``dataset_version()`` it is equal across reloads of the same data."""
+        version = self.dataset_version()
+        cached = self._hash_cache
+        if cached is not None and cached[0] == version:
+            return cached[2]
+        h = hashlib.sha1(str(self.schema_type).encode())
+        for name in sorted(self.tables):
+            df = self.tables[name]
+            h.update(f"\0{name}\0{list(df.columns)}\0".encode())
+            try:
+                rows = pd.util.hash_pandas_object(df, index=False)
+            except TypeError:
+                # Unhashable cell values (lists, dicts): hash their text instead
+                rows = pd.util.hash_pandas_object(df.astype(str), index=False)
+            h.update(rows.to_numpy().tobytes())
+        digest = h.hexdigest()
+        self._hash_cache = (version, list(self.tables.values()), digest)
+        return digest
+
+    def convert(self) -> dict[str, Any]:
+        """Meet -> sessions -> events -> entries of the dataset as JSON-ready dicts.
+
+        The ``to_dict()`` form of ``meet_model()``, built once per
+        ``dataset_version()``; treat the result as read-only.
+        """
+        version = self.dataset_version()
+        cached = self._convert_cache
+        if cached is not None and cached[0] == version:
+            return cached[2]
+        model = self.meet_model()
+        sessions = []
+        for session in model["sessions"]:
+            session_data = session.to_dict()
+            session_data["events"] = [self._event_dict(event) for event in session.events]
+            sessions.append(session_data)
+        data = dict(model, sessions=sessions)
+        # Holding the tables keeps their ids from being reused while cached
+        self._convert_cache = (version, list(self.tables.values()), data)
+        return data
+
+    def meet_model(self) -> dict[str, Any]:
+        """Meet info with ``sessions`` as ``Session`` objects holding their ``Event``/``Entry`` records.
+
+        What the report extractors read: slotted records rather than one dict
+        per entry, with entries already in heat/lane order. Built once per
+        ``dataset_version()`` and shared, so treat it as read-only.
+        """
+        version = self.dataset_version()
+        cached = self._model_cache
+        if cached is not None and cached[0] == version:
+            return cached[2]
+        meet_data, sessions = self._meet_sessions()
+        for session in sessions:
+            session.events = [
+                self._build_event(event, meet_data["meetType"]) for event in self._session_events(session)
+            ]
+        meet_data["sessions"] = sessions
+        self._model_cache = (version, list(self.tables.values()), meet_data)
+        self._event_dicts = {}
+        return meet_data
+
+    def _event_dict(self, event):
+        """``event.to_dict()``, kept until ``updated()`` rebuilds the event."""
+        data = self._event_dicts.get(event)
+        if data is None:
+            data = self._event_dicts[event] = event.to_dict()
+        return data
 
-        t = self.db.getTable(table_name)
-        if t is None:
-            return None
+    def snapshot(self) -> "MmToJsonConverter":
+        """A converter over the tables loaded now, unaffected by later ``replace_table()`` calls on this one.
 
-        columns = [str(c.getName()) for c in t.getColumns()]
+        DataFrames and cached results are shared, not copied, so taking one is cheap.
+        """
+        new = copy.copy(self)
+        new.tables = dict(self.tables)
+        new._entry_columns_cache = dict(self._entry_columns_cache)
+        new._event_dicts = dict(self._event_dicts)
+        return new
+
+    def updated(self, table_data) -> tuple["MmToJsonConverter", set | None]:
+        """A converter for a newer copy of the same meet, rebuilding only the events its changed rows touch.
+
+        This converter is left as it is, so readers holding it are never
+        disturbed; callers swap the returned one in. Tables whose rows are
+        unchanged keep their DataFrame (and everything cached from it). When
+        only entry tables (``ENTRY_TABLE_KEYS``) and athletes changed, the
+        events those rows point at, or that list a changed athlete, are
+        rebuilt as new ``Event`` records in a copy of the cached
+        ``meet_model()``; every other ``Event`` and its ``convert()`` output is
+        shared with this converter. Any other change leaves the model to be
+        rebuilt in full.
+
+        Returns the new converter and the rebuilt event pointers (None after a
+        full rebuild).
+        """
+        new = self.snapshot()
+        new._load_from_data(table_data)
+
+        changed: dict[str, tuple | None] = {}
+        for logical, df in new.tables.items():
+            old = self.tables.get(logical)
+            diff = None if old is None else changed_rows(old, df)
+            if diff is not None and diff[0].empty and diff[1].empty:
+                new.tables[logical] = old
+            else:
+                changed[logical] = diff
+        new.build_lookups(list(changed))
+
+        cached = self._model_cache
+        entry_tables = ENTRY_TABLE_KEYS[new.schema_type]
+        if (
+            cached is None
+            or new.schema_type != self.schema_type
+            or any(logical not in entry_tables and logical != "Athlete" for logical in changed)
+            or any(diff is None for diff in changed.values())
+        ):
+            new._model_cache = None
+            logger.info(f"Dataset update changed {sorted(changed)}; rebuilding the meet model")
+            return new, None
+
+        event_ptrs = new._changed_event_ptrs(changed)
+        sessions = []
+        rebuilt = 0
+        for session in cached[2]["sessions"]:
+            session = copy.copy(session)
+            events = []
+            for event in session.events:
+                if event.event_ptr in event_ptrs:
+                    new._event_dicts.pop(event, None)
+                    event = copy.copy(event)
+                    event.entries = []
+                    new.add_entries_to_event(event)
+                    event.entries.sort(key=_heat_lane)
+                    rebuilt += 1
+                events.append(event)
+            session.events = events
+            sessions.append(session)
+        model = dict(cached[2], sessions=sessions)
+        new._model_cache = (new.dataset_version(), list(new.tables.values()), model)
+        logger.info(f"Dataset update changed {sorted(changed)}; rebuilt {rebuilt} events")
+        return new, event_ptrs
+
+    def _changed_event_ptrs(self, changed):
+        """Event pointers whose entries depend on the changed rows (see ``update``)."""
+        entry_tables = ENTRY_TABLE_KEYS[self.schema_type]
+        event_ptrs = set()
+        for logical, (event_col, _) in entry_tables.items():
+            for rows in changed.get(logical, ()):
+                if event_col in rows.columns:
+                    event_ptrs.update(rows[event_col].dropna().tolist())
+
+        if "Athlete" in changed:
+            ath_col = LOOKUP_COLUMNS[self.schema_type]["athlete"][0]
+            athletes = set()
+            for rows in changed["Athlete"]:
+                if ath_col in rows.columns:
+                    athletes.update(rows[ath_col].dropna().tolist())
+            for logical, (event_col, ath_ref) in entry_tables.items():
+                df = self.tables.get(logical)
+                if ath_ref is None or df is None or ath_ref not in df.columns or event_col not in df.columns:
+                    continue
+                event_ptrs.update(df.loc[df[ath_ref].isin(athletes), event_col].dropna().tolist())
+        return event_ptrs
 
-        rows: list[dict[str, Any]] = []
-        for row in t:
-            row_data: dict[str, Any] = {}
-            for cname in columns:
-                val = row.get(cname)
-                if val is None:
-                    row_data[cname] = None
-                elif isinstance(val, (int, float, str, bool)):
-                    row_data[cname] = val
-                else:
-                    try:
-                        type_name = str(type(val))
-                        if "Date" in type_name:
-                            try:
-                                ts = val.getTime() / 1000.0
-                                row_data[cname] = datetime.datetime.fromtimestamp(ts)
-                            except Exception:
-                                row_data[cname] = str(val)
-                        elif "byte[]" in type_name or "jarray" in type_name:
-                            try:
-                                b = bytes(val)
-                                row_data[cname] = base64.b64encode(b).decode("ascii")
-                            except Exception:
-                                row_data[cname] = str(val)
-                        else:
-                            row_data[cname] = str(val)
-                    except Exception:
-                        row_data[cname] = str(val)
-            rows.append(row_data)
-        return rows
+    def stream(self) -> dict[str, Any]:
+        """The ``convert()`` model with ``sessions`` (and each session's ``events``) as generators.
 
-    def convert(self) -> dict[str, Any]:
+        Events get their entries only as they are consumed, so a writer that
+        serializes them one at a time (see ``json_writer``) never holds the
+        whole meet. Not cached.
+        """
+        meet_data, sessions = self._meet_sessions()
+        meet_type = meet_data["meetType"]
+        meet_data["sessions"] = (self._stream_session(session, meet_type) for session in sessions)
+        return meet_data
+
+    def _meet_sessions(self) -> tuple[dict[str, Any], list["Session"]]:
         meet = self.get_meet_info()
         sessions: list[Session] = self.get_session_info()
 
@@ -211,27 +548,25 @@ class MmToJsonConverter:
         if not sessions and not self.tables["Event"].empty:
             sessions.append(self.create_default_session())
 
-        meet_sessions_data = []
-
-        for session in sessions:
-            logger.debug(f"Processing session {session.sess_id} ({session.name})")
-            events = self.get_events_by_session(session)
-            logger.debug(f"Found {len(events)} events for session {session.sess_id}")
-            session_events_data = []
-
-            for event in events:
-                event.create_description(meet["meetType"])
-                self.add_entries_to_event(event)
-                session_events_data.append(event.to_dict())
+        return meet.copy(), sessions
 
-            session_data = session.to_dict()
-            session_data["events"] = session_events_data
-            meet_sessions_data.append(session_data)
+    def _session_events(self, session):
+        logger.debug(f"Processing session {session.sess_id} ({session.name})")
+        events = self.get_events_by_session(session)
+        logger.debug(f"Found {len(events)} events for session {session.sess_id}")
+        return events
 
-        meet_data = meet.copy()
-        meet_data["sessions"] = meet_sessions_data
+    def _stream_session(self, session, meet_type):
+        events = self._session_events(session)
+        session_data = session.to_dict()
+        session_data["events"] = (self._build_event(event, meet_type).to_dict() for event in events)
+        return session_data
 
-        return meet_data
+    def _build_event(self, event, meet_type):
+        event.create_description(meet_type)
+        self.add_entries_to_event(event)
+        event.entries.sort(key=_heat_lane)
+        return event
 
     def export_raw(self):
         """
@@ -239,21 +574,7 @@ class MmToJsonConverter:
         Used for the gRPC backend data source.
         """
         raw_data = {}
-        # List of tables we care about for the API
-        target_tables = [
-            "Meet",
-            "Team",
-            "Athlete",
-            "Event",
-            "Session",
-            "Sessitem",
-            "Entry",
-            "Relay",
-            "RelayNames",
-            "Divisions",
-        ]
-
-        for table_name in target_tables:
+        for table_name in RAW_TABLES:
             df = self.tables.get(table_name)
             if df is not None and not df.empty:
                 # Convert DataFrame to list of dicts
@@ -265,6 +586,14 @@ class MmToJsonConverter:
 
         return raw_data
 
+    def export_tables(self, out_dir, fmt="parquet", compression=None):
+        """Write the ``export_raw`` tables as one Parquet / Arrow IPC / NDJSON file each (see table_export)."""
+        tables = {}
+        for table_name in RAW_TABLES:
+            df = self.tables.get(table_name)
+            tables[table_name] = df if df is not None else pd.DataFrame()
+        return table_export.export_tables(tables, out_dir, fmt, compression)
+
     def create_default_session(self):
         """Creates a default session if none exist in the MDB."""
         return Session(sess_id=1, number=1, name="Session 1", day=1, start_time="08:00", is_default=True)
@@ -364,9 +693,10 @@ class MmToJsonConverter:
                 # Ensure types match (float/int)
                 target_sess = session.sess_id
                 # Convert column to numeric for safety
+                # (not stored on df_evt: reading must not change the table updated() diffs against)
                 try:
-                    df_evt["Session_Numeric"] = pd.to_numeric(df_evt["Session"], errors="coerce").fillna(0).astype(int)
-                    sess_items = df_evt[df_evt["Session_Numeric"] == target_sess]
+                    session_numeric = pd.to_numeric(df_evt["Session"], errors="coerce").fillna(0).astype(int)
+                    sess_items = df_evt[session_numeric == target_sess]
                 except Exception:
                     sess_items = df_evt[df_evt["Session"] == target_sess]
 
@@ -439,11 +769,23 @@ class MmToJsonConverter:
             if df.empty or "Event_ptr" not in df.columns:
                 return None
 
-            rows = df[df["Event_ptr"] == event_ptr]
-            if rows.empty:
+            pos = self._event_rows(df).get(event_ptr)
+            if pos is None:
                 return None
 
-            return self._create_event_from_row(rows.iloc[0], round_ltr)
+            return self._create_event_from_row(df.iloc[pos], round_ltr)
+
+    def _event_rows(self, df):
+        """Event_ptr -> first row position, rebuilt when the Event table is replaced."""
+        cached = self._event_rows_cache
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        index: dict[Any, int] = {}
+        for pos, ptr in enumerate(df["Event_ptr"].tolist()):
+            if not pd.isna(ptr):
+                index.setdefault(ptr, pos)
+        self._event_rows_cache = (df, index)
+        return index
 
     def _create_event_from_row(self, row, round_ltr):
         if self.schema_type == "B":
@@ -530,77 +872,63 @@ class MmToJsonConverter:
             return int(s[:2]), int(s[2:])
         return 0, 109  # Fallback
 
+    def _entry_columns(self, logical):
+        """``EventEntryColumns`` for the Entry/Relay table, rebuilt only when that DataFrame is replaced."""
+        df = self.tables.get(logical)
+        key = "MtEvent" if self.schema_type == "B" else "Event_ptr"
+        cached = self._entry_columns_cache.get(logical)
+        if cached is not None and cached[0] is df and cached[1] == self.schema_type:
+            return cached[2]
+
+        columns = None
+        if df is not None and not df.empty and key in df.columns:
+            columns = EventEntryColumns(df, key, self.schema_type)
+        self._entry_columns_cache[logical] = (df, self.schema_type, columns)
+        return columns
+
     def add_individual_entries(self, event):
-        df = self.tables["Entry"]
-        if df.empty:
+        cols = self._entry_columns("Entry")
+        if cols is None:
             return
 
         if self.schema_type == "B":
             # Schema B: Link via MtEvent -> event.event_ptr (MtEv)
-            if "MtEvent" in df.columns:
-                entries = df[df["MtEvent"] == event.event_ptr]
-                for _, row in entries.iterrows():
-                    # Attempt to get time
-                    score = float(row.get("Score", 0.0) or 0.0)
-                    # Heuristic for Score to Time string
-                    # If score > 100, assume centiseconds? e.g. 2425 -> 24.25
-                    # Or assume it is time.
-                    # Let's assume input is centiseconds if > 1000? Or just use raw logic
-                    time_str = "NT"
-                    if score > 0:
-                        if score > 200:  # heuristic threshold
-                            time_str = self.num_to_string(score / 100.0)
-                        else:
-                            time_str = self.num_to_string(score)
-
-                    ath_no = row.get("Athlete")
-                    athlete = self.get_athlete_by_number(ath_no)
-                    if athlete:
-                        event.add_entry(
-                            {
-                                "name": f"{athlete['first']} {athlete['last']}",
-                                "age": athlete["age"],
-                                "schoolYear": athlete["schoolYear"],
-                                "team": athlete["team"],
-                                "heat": self._safe_int(row.get("HEAT")),
-                                "lane": self._safe_int(row.get("LANE")),
-                                # Using Score as seed/time (unknown distinction in this schema)
-                                "seedTime": time_str,
-                                "psTime": "NT",
-                                "athleteId": ath_no,
-                                "teamId": athlete.get("teamId"),
-                            }
+            for i in cols.rows(event):
+                ath_no = cols.athlete[i]
+                athlete = self.get_athlete_by_number(ath_no)
+                if athlete:
+                    event.add_entry(
+                        Entry(
+                            athlete,
+                            heat=int(cols.heat["B"][i]),
+                            lane=int(cols.lane["B"][i]),
+                            # Using Score as seed/time (unknown distinction in this schema)
+                            seed_time=cols.seed[i],
+                            ps_time="NT",
+                            athlete_id=ath_no,
                         )
+                    )
         else:
-            # Schema A
-            if "Event_ptr" not in df.columns:
-                return
-
-            entries = df[df["Event_ptr"] == event.event_ptr]
-            if not entries.empty:
-                logger.debug(f"Found {len(entries)} entries for Event {event.event_no} (ptr {event.event_ptr})")
-            for _, row in entries.iterrows():
-                entry_info = self.get_heat_lane_time(event.round_ltr, event.stroke, row)
-                if entry_info["heat"] != 0 and entry_info["lane"] != 0:
-                    ath_no = row.get("Ath_no")
-                    athlete = self.get_athlete_by_number(ath_no)
-                    if athlete:
-                        event.add_entry(
-                            {
-                                "name": f"{athlete['first']} {athlete['last']}",
-                                "age": athlete["age"],
-                                "schoolYear": athlete["schoolYear"],
-                                "team": athlete["team"],
-                                "heat": entry_info["heat"],
-                                "lane": entry_info["lane"],
-                                "seedTime": entry_info["seed"],
-                                "psTime": entry_info["time"],
-                                "finalTime": entry_info["time"],
-                                "place": entry_info["place"],
-                                "athleteId": ath_no,
-                                "teamId": athlete.get("teamId"),
-                            }
+            rows = cols.rows(event)
+            if rows:
+                logger.debug(f"Found {len(rows)} entries for Event {event.event_no} (ptr {event.event_ptr})")
+            for i in rows:
+                ath_no = cols.athlete[i]
+                athlete = self.get_athlete_by_number(ath_no)
+                if athlete:
+                    entry_info = cols.heat_lane_time(event, i)
+                    event.add_entry(
+                        Entry(
+                            athlete,
+                            heat=entry_info["heat"],
+                            lane=entry_info["lane"],
+                            seed_time=entry_info["seed"],
+                            ps_time=entry_info["time"],
+                            final_time=entry_info["time"],
+                            place=entry_info["place"],
+                            athlete_id=ath_no,
                         )
+                    )
 
     def add_entries_to_event(self, event):
         if event.is_relay:
@@ -609,150 +937,85 @@ class MmToJsonConverter:
             self.add_individual_entries(event)
 
     def add_relay_entries(self, event):
-        df = self.tables["Relay"]
-        if df.empty:
+        cols = self._entry_columns("Relay")
+        if cols is None:
             return
 
         if self.schema_type == "B":
-            # Schema B Relay Logic
-            # Assuming RELAY table has Event_ptr equivalent (MtEvent?)
-            # debug_cols for RELAY wasn't run, but usually it matches ENTRY structure roughly
-            # Let's check columns if possible, or assume 'MtEvent' like ENTRY
-            if "MtEvent" in df.columns:
-                entries = df[df["MtEvent"] == event.event_ptr]
-                for _, row in entries.iterrows():
-                    # Relay entries might be different in Schema B
-                    # Just strict copy of what we have, improving as needed
-                    # For now, assume similar to Individual but with Team
-
-                    # Score/Time logic
-                    score = float(row.get("Score", 0.0) or 0.0)
-                    time_str = "NT"
-                    if score > 0:
-                        if score > 200:
-                            time_str = self.num_to_string(score / 100.0)
-                        else:
-                            time_str = self.num_to_string(score)
-
-                    team_no = row.get("Team")
-                    team_name = self.get_team_name(team_no)
-
-                    # Heat/Lane
-                    heat = self._safe_int(row.get("HEAT"))
-                    lane = self._safe_int(row.get("LANE"))
-
-                    event.add_entry(
-                        {
-                            "name": self.get_relay_names_schema_b(event.event_ptr, team_no),  # Need helper
-                            "team": team_name,
-                            "heat": heat,
-                            "lane": lane,
-                            "seedTime": time_str,
-                            "psTime": "NT",
-                            "isRelay": True,
-                            "relayLtr": str(row.get("RelayLtr", "A")),  # Guessing col name
-                        }
+            for i in cols.rows(event):
+                team_no = cols.team[i]
+                event.add_entry(
+                    RelayEntry(
+                        name=self.get_relay_names_schema_b(event.event_ptr, team_no),  # Need helper
+                        team=self.get_team_name(team_no),
+                        heat=int(cols.heat["B"][i]),
+                        lane=int(cols.lane["B"][i]),
+                        seed_time=cols.seed[i],
+                        ps_time="NT",
+                        relay_ltr=cols.relay_ltr[i],  # Guessing col name
                     )
+                )
         else:
-            # Schema A
-            if "Event_ptr" not in df.columns:
-                return
-
-            entries = df[df["Event_ptr"] == event.event_ptr]
-            for _, row in entries.iterrows():
-                entry_info = self.get_heat_lane_time(event.round_ltr, event.stroke, row)
-                if entry_info["heat"] != 0 and entry_info["lane"] != 0:
-                    team_no = row.get("Team_no")
-                    team_name = self.get_team_name(team_no)
-                    relay_ltr = row.get("Team_ltr", "A")
-
-                    # Get Relay Athletes
-                    relay_athletes = self.get_relay_athletes(event.event_ptr, team_no, relay_ltr, event.round_ltr)
-
-                    # Format names: "F. Last"
-                    swimmers_list = []
-                    for a in relay_athletes:
-                        initial = a["first"][0] if a["first"] else ""
-                        swimmers_list.append(f"{initial}. {a['last']}")
-
-                    names_str = ", ".join(swimmers_list)
-
-                    event.add_entry(
-                        {
-                            "name": names_str,
-                            "team": team_name,
-                            "heat": entry_info["heat"],
-                            "lane": entry_info["lane"],
-                            "seedTime": entry_info["seed"],
-                            "psTime": entry_info["time"],
-                            "finalTime": entry_info["time"],
-                            "place": entry_info["place"],
-                            "isRelay": True,
-                            "relayLtr": relay_ltr,
-                            "relaySwimmers": swimmers_list,
-                            "relayAthletes": relay_athletes,  # Full objects for extractor
-                        }
+            for i in cols.rows(event):
+                entry_info = cols.heat_lane_time(event, i)
+                team_no = cols.team[i]
+                team_name = self.get_team_name(team_no)
+                relay_ltr = cols.relay_ltr[i]
+
+                # Get Relay Athletes
+                relay_athletes = self.get_relay_athletes(event.event_ptr, team_no, relay_ltr, event.round_ltr)
+
+                event.add_entry(
+                    RelayEntry(
+                        name=", ".join(relay_swimmer_names(relay_athletes)),
+                        team=team_name,
+                        heat=entry_info["heat"],
+                        lane=entry_info["lane"],
+                        seed_time=entry_info["seed"],
+                        ps_time=entry_info["time"],
+                        final_time=entry_info["time"],
+                        place=entry_info["place"],
+                        relay_ltr=relay_ltr,
+                        athletes=relay_athletes,  # Full objects for extractor
                     )
+                )
 
     def get_relay_names_schema_b(self, event_ptr, team_no):
         # Stub for Schema B relay names if table differs
         # RELAYNAMES?
         return "Relay Team"
 
-    def get_heat_lane_time(self, round_ltr, stroke, row):
-        # Logic to pick Pre vs Fin columns
-        seed_time = float(row.get("ConvSeed_time", 0.0) or 0.0)
-
-        pre_heat = self._safe_int(row.get("Pre_heat"))
-        pre_lane = self._safe_int(row.get("Pre_lane"))
-        pre_time = float(row.get("Pre_Time", 0.0) or 0.0)
-        pre_stat = str(row.get("Pre_Stat", "") or "")
-
-        fin_heat = self._safe_int(row.get("Fin_heat"))
-        fin_lane = self._safe_int(row.get("Fin_lane"))
-        fin_time = float(row.get("Fin_Time", 0.0) or 0.0)
-        fin_stat = str(row.get("Fin_Stat", "") or "")
-
-        info = {}
-        info["seed"] = self.num_to_string(seed_time) if seed_time > 0 else "NT"
-        info["place"] = self._safe_int(row.get("Fin_place", row.get("Place", 0)))
-
-        if round_ltr == "P":
-            info["heat"] = pre_heat
-            info["lane"] = pre_lane
-            info["time"] = self.time_to_string(pre_time, pre_stat)
-        else:
-            info["heat"] = fin_heat
-            info["lane"] = fin_lane
-            info["time"] = self.time_to_string(fin_time, fin_stat)
-
-        if stroke != "Diving":
-            info["seed"] = self.time_to_min_sec(info["seed"])
-            info["time"] = self.time_to_min_sec(info["time"])
-
-        return info
-
     def get_relay_athletes(self, event_ptr, team_no, team_ltr, round_ltr):
-        df = self.tables["RelayNames"]
         athletes: list[dict[str, Any]] = []
-        if df.empty:
-            return athletes
-
-        # Filter
-        mask = (
-            (df["Event_ptr"] == event_ptr)
-            & (df["Team_no"] == team_no)
-            & (df["Team_ltr"] == team_ltr)
-            & (df["Event_round"] == round_ltr)
-        )
-        rows = df[mask]
-        for _, row in rows.iterrows():
-            ath_no = row.get("Ath_no")
+        for ath_no in self.relay_legs().get((event_ptr, team_no, team_ltr, round_ltr), ()):
             ath = self.get_athlete_by_number(ath_no)
             if ath:
                 athletes.append(ath)
         return athletes
 
+    def relay_legs(self):
+        """RelayNames grouped by (Event_ptr, Team_no, Team_ltr, Event_round) -> Ath_no list in table order.
+
+        Built in one pass and shared by every relay lookup; rebuilt when the
+        RelayNames table is replaced.
+        """
+        df = self.tables.get("RelayNames")
+        cached = self._relay_legs_cache
+        if cached is not None and cached[0] is df:
+            return cached[1]
+
+        legs: dict[tuple, list] = {}
+        key_cols = ["Event_ptr", "Team_no", "Team_ltr", "Event_round"]
+        if df is not None and not df.empty and all(c in df.columns for c in key_cols):
+            keys = zip(*(df[c].tolist() for c in key_cols), strict=True)
+            for key, ath_no in zip(keys, _raw_column(df, "Ath_no"), strict=True):
+                # NaN/None never matched the old equality mask
+                if any(pd.isna(k) for k in key):
+                    continue
+                legs.setdefault(key, []).append(ath_no)
+        self._relay_legs_cache = (df, legs)
+        return legs
+
     def get_stroke(self, stroke_id, is_relay):
         if not stroke_id:
             return ""
@@ -789,87 +1052,88 @@ class MmToJsonConverter:
     # --- Lookup Helpers ---
 
     def get_athlete_by_number(self, ath_no):
-        if self.cache_athlete_map is None:
-            self.cache_athlete_map = {}
-            df = self.tables["Athlete"]
-            if not df.empty:
-                for _, row in df.iterrows():
-                    if self.schema_type == "B":
-                        aid = row.get("Athlete")
-                        team_no = row.get("Team1")
-                        team_name = self.get_team_name(team_no)
-                        self.cache_athlete_map[aid] = {
-                            "first": self._get_val(row, "First"),
-                            "last": self._get_val(row, "Last"),
-                            "age": self._safe_int(row.get("Age")),
-                            "schoolYear": self._get_val(row, "Class"),
-                            "team": team_name,
-                        }
-                    else:
-                        aid = row.get("Ath_no")
-                        team_no = row.get("Team_no")
-                        team_name = self.get_team_name(team_no)
-                        self.cache_athlete_map[aid] = {
-                            "first": self._get_val(row, "First_name"),
-                            "last": self._get_val(row, "Last_name"),
-                            "age": self._safe_int(row.get("Ath_age")),
-                            "schoolYear": self._get_val(row, "Schl_yr"),
-                            "team": team_name,
-                        }
-        return self.cache_athlete_map.get(ath_no)
+        return self._lookup("athlete").get(ath_no)
 
     def get_team_name(self, team_no):
-        if self.cache_team_map is None:
-            self.cache_team_map = {}
-            df = self.tables["Team"]
-            if not df.empty:
-                for _, row in df.iterrows():
-                    if self.schema_type == "B":
-                        tid = row.get("Team")
-                        abbr = self._get_val(row, "TCode")
-                        short = self._get_val(row, "Short")
-                        lsc = self._get_val(row, "LSC")
-                        name = short if short else f"{abbr}-{lsc}".strip("-")
-                        self.cache_team_map[tid] = name
-                    else:
-                        tid = row.get("Team_no")
-                        abbr = self._get_val(row, "Team_abbr")
-                        short = self._get_val(row, "Team_short")
-                        lsc = self._get_val(row, "Team_lsc")
-                        name = short if short else f"{abbr}-{lsc}".strip("-")
-                        self.cache_team_map[tid] = name
-        return self.cache_team_map.get(team_no, "")
+        return self._lookup("team").get(team_no, "")
 
     def get_division_name(self, div_no):
-        if self.cache_division_map is None:
-            self.cache_division_map = {}
-            df = self.tables["Divisions"]
-            if not df.empty:
-                for _, row in df.iterrows():
-                    did = row.get("Div_no")
-                    name = str(row.get("Div_name", "")).strip()
-                    if name:
-                        self.cache_division_map[did] = name
-        return self.cache_division_map.get(div_no, "")
-
-    def num_to_string(self, num):
-        # replicate util.h numToString which prints "%.2f" for floats and "%d" for ints
-        # But C++ overloaded it. seedTime is float.
-        return f"{num:.2f}"
-
-    def time_to_string(self, time_val, status):
-        # logic from util.h
-        if status and status.upper() == "SCR":
-            return "SCR"
-        if status and status.upper() == "DNS":
-            return "DNS"
-        if status and status.upper() == "DNF":
-            return "DNF"
-        if status and status.upper() == "DQ":
-            return "DQ"
-        if time_val == 0.0:
-            return "NT"
-        return f"{time_val:.2f}"
+        return self._lookup("division").get(div_no, "")
+
+    def _lookup(self, name) -> dict[Any, Any]:
+        attr = f"cache_{name}_map"
+        if getattr(self, attr) is None:
+            self.build_lookups()
+        return getattr(self, attr)
+
+    def replace_table(self, logical, df):
+        """Swap in a new DataFrame for ``logical`` and rebuild only the lookups that depend on it."""
+        self.tables[logical] = df
+        self.build_lookups([logical])
+
+    def build_lookups(self, tables=None):
+        """Build the team, athlete and division lookup maps from whole columns.
+
+        With ``tables`` (logical names) only the maps depending on those tables
+        are rebuilt; otherwise every missing map is built.
+        """
+        if tables is None:
+            maps = {
+                name
+                for name, cache in (
+                    ("team", self.cache_team_map),
+                    ("athlete", self.cache_athlete_map),
+                    ("division", self.cache_division_map),
+                )
+                if cache is None
+            }
+        else:
+            maps = {m for t in tables for m in LOOKUP_DEPENDENCIES.get(t, ())}
+
+        # Athletes join the team map, so teams go first
+        if "team" in maps or ("athlete" in maps and self.cache_team_map is None):
+            self.cache_team_map = self._build_team_map()
+        if "athlete" in maps:
+            self.cache_athlete_map = self._build_athlete_map()
+        if "division" in maps:
+            self.cache_division_map = self._build_division_map()
+
+    def _build_team_map(self):
+        df = self.tables.get("Team")
+        if df is None or df.empty:
+            return {}
+        tid, abbr, short, lsc = LOOKUP_COLUMNS[self.schema_type]["team"]
+        names = [
+            s if s else f"{a}-{lc}".strip("-")
+            for a, s, lc in zip(_text_column(df, abbr), _text_column(df, short), _text_column(df, lsc), strict=True)
+        ]
+        return dict(zip(_raw_column(df, tid), names, strict=True))
+
+    def _build_athlete_map(self):
+        df = self.tables.get("Athlete")
+        if df is None or df.empty:
+            return {}
+        aid, first, last, age, year, team = LOOKUP_COLUMNS[self.schema_type]["athlete"]
+        team_map = self.cache_team_map or {}
+        columns = zip(
+            _text_column(df, first),
+            _text_column(df, last),
+            _int_column(df, age).tolist(),
+            _text_column(df, year),
+            [team_map.get(t, "") for t in _raw_column(df, team)],
+            strict=True,
+        )
+        return {
+            a: {"first": f, "last": la, "age": ag, "schoolYear": y, "team": t}
+            for a, (f, la, ag, y, t) in zip(_raw_column(df, aid), columns, strict=True)
+        }
+
+    def _build_division_map(self):
+        df = self.tables.get("Divisions")
+        if df is None or df.empty:
+            return {}
+        names = pd.Series(_raw_column(df, "Div_name", ""), dtype=object).astype(str).str.strip()
+        return {d: n for d, n in zip(_raw_column(df, "Div_no"), names, strict=True) if n}
 
     def _safe_int(self, val, default=0):
         try:
@@ -879,25 +1143,19 @@ class MmToJsonConverter:
         except (ValueError, TypeError):
             return default
 
-    def time_to_min_sec(self, time_str):
-        if not time_str or time_str in ["NT", "SCR", "DNS", "DNF", "DQ"]:
-            return time_str
-        try:
-            val = float(time_str)
-            seconds = int(val)
-            cents = int(round((val - seconds) * 100))
-            minutes = seconds // 60
-            rem_seconds = seconds % 60
-
-            if minutes > 0:
-                return f"{minutes}:{rem_seconds:02d}.{cents:02d}"
-            else:
-                return f"{rem_seconds:02d}.{cents:02d}"
-        except Exception:
-            return time_str
+
+def _heat_lane(entry):
+    return (entry.heat, entry.lane)
+
+
+def relay_swimmer_names(athletes):
+    """Relay leg athletes as "F. Last" strings."""
+    return [f"{a['first'][0] if a['first'] else ''}. {a['last']}" for a in athletes]
 
 
 class Session:
+    __slots__ = ("sess_id", "number", "name", "day", "start_time", "is_default", "events")
+
     def __init__(self, sess_id, number, name, day, start_time, is_default=False):
         self.sess_id = sess_id
         self.number = number
@@ -905,6 +1163,7 @@ class Session:
         self.day = day
         self.start_time = start_time
         self.is_default = is_default
+        self.events = []  # filled by meet_model()
 
     def to_dict(self):
         return {
@@ -915,7 +1174,125 @@ class Session:
         }
 
 
+class Entry:
+    """One swimmer in an individual event.
+
+    ``final_time``/``place`` are None when the schema has no results columns
+    (Schema B) and are then left out of ``to_dict()``.
+    """
+
+    __slots__ = (
+        "name",
+        "age",
+        "school_year",
+        "team",
+        "heat",
+        "lane",
+        "seed_time",
+        "ps_time",
+        "final_time",
+        "place",
+        "athlete_id",
+        "team_id",
+    )
+    is_relay = False
+
+    def __init__(self, athlete, heat, lane, seed_time, ps_time, athlete_id, final_time=None, place=None):
+        self.name = f"{athlete['first']} {athlete['last']}"
+        self.age = athlete["age"]
+        self.school_year = athlete["schoolYear"]
+        self.team = athlete["team"]
+        self.heat = heat
+        self.lane = lane
+        self.seed_time = seed_time
+        self.ps_time = ps_time
+        self.final_time = final_time
+        self.place = place
+        self.athlete_id = athlete_id
+        self.team_id = athlete.get("teamId")
+
+    def to_dict(self):
+        res = {
+            "name": self.name,
+            "age": self.age,
+            "schoolYear": self.school_year,
+            "team": self.team,
+            "heat": self.heat,
+            "lane": self.lane,
+            "seedTime": self.seed_time,
+            "psTime": self.ps_time,
+        }
+        if self.final_time is not None:
+            res["finalTime"] = self.final_time
+            res["place"] = self.place
+        res["athleteId"] = self.athlete_id
+        res["teamId"] = self.team_id
+        return res
+
+
+class RelayEntry:
+    """One relay team in a relay event.
+
+    ``athletes`` are the legs' shared athlete lookup records (None when the
+    schema has no leg data); ``final_time``/``place`` as for ``Entry``.
+    """
+
+    __slots__ = ("name", "team", "heat", "lane", "seed_time", "ps_time", "final_time", "place", "relay_ltr", "athletes")
+    is_relay = True
+    age = ""  # relays have no age; reports show it blank
+
+    def __init__(
+        self, name, team, heat, lane, seed_time, ps_time, relay_ltr, final_time=None, place=None, athletes=None
+    ):
+        self.name = name
+        self.team = team
+        self.heat = heat
+        self.lane = lane
+        self.seed_time = seed_time
+        self.ps_time = ps_time
+        self.final_time = final_time
+        self.place = place
+        self.relay_ltr = relay_ltr
+        self.athletes = athletes
+
+    def to_dict(self):
+        res = {
+            "name": self.name,
+            "team": self.team,
+            "heat": self.heat,
+            "lane": self.lane,
+            "seedTime": self.seed_time,
+            "psTime": self.ps_time,
+        }
+        if self.final_time is not None:
+            res["finalTime"] = self.final_time
+            res["place"] = self.place
+        res["isRelay"] = True
+        res["relayLtr"] = self.relay_ltr
+        if self.athletes is not None:
+            res["relaySwimmers"] = relay_swimmer_names(self.athletes)
+            res["relayAthletes"] = self.athletes
+        return res
+
+
 class Event:
+    __slots__ = (
+        "event_no",
+        "is_relay",
+        "gender",
+        "gender_desc",
+        "min_age",
+        "max_age",
+        "distance",
+        "stroke",
+        "division",
+        "round_ltr",
+        "event_ptr",
+        "num_lanes",
+        "entries",
+        "description",
+    )
+
     def __init__(
         self,
         event_no,
@@ -943,7 +1320,7 @@ class Event:
         self.round_ltr = round_ltr
         self.event_ptr = event_ptr
         self.num_lanes = num_lanes
-        self.entries = []
+        self.entries: list[Entry | RelayEntry] = []
         self.description = ""
 
     def create_description(self, meet_type):
@@ -982,12 +1359,12 @@ class Event:
         if self.division:
             self.description += f" ({self.division})"
 
-    def add_entry(self, entry_dict):
-        self.entries.append(entry_dict)
+    def add_entry(self, entry):
+        self.entries.append(entry)
 
     def to_dict(self):
         # Sort entries by heat, then lane
-        sorted_entries = sorted(self.entries, key=lambda x: (x["heat"], x["lane"]))
+        sorted_entries = [entry.to_dict() for entry in sorted(self.entries, key=_heat_lane)]
 
         res = {
             "eventNum": self.event_no,
@@ -999,22 +1376,71 @@ class Event:
         return res
 
 
-def json_serial(obj):
-    """JSON serializer for objects not serializable by default json code"""
-    if isinstance(obj, (datetime.datetime, datetime.date)):
-        return obj.isoformat()
-    if hasattr(obj, "isoformat"):
-        return obj.isoformat()
-    # Handle pandas types
-    if "Timestamp" in str(type(obj)):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
+def convert_file(mdb_path, args):
+    """Convert one MDB as the CLI options in ``args`` ask (JSON or a PDF report); returns the output path."""
+    from .report_generator import ReportGenerator
+
+    converter = MmToJsonConverter(mdb_path, args.password, backend=args.backend)
+    # batch.output_names: the stem, or the relative path when stems clash
+    names = getattr(args, "output_names", None) or {}
+    base_name = names.get(mdb_path) or os.path.splitext(os.path.basename(mdb_path))[0]
+    if os.path.dirname(base_name):
+        os.makedirs(os.path.join(args.output_dir, os.path.dirname(base_name)), exist_ok=True)
+
+    if args.report:
+        rg = ReportGenerator(converter, title=args.report_title)
+
+        # Determine output filename
+        out_path = os.path.join(args.output_dir, f"{base_name}_{args.report_type}.pdf")
+
+        if args.report_type == "psych":
+            rg.generate_psych_sheet(out_path)
+        elif args.report_type == "entries":
+            rg.generate_meet_entries(out_path, team_filter=args.team_filter)
+        elif args.report_type == "lineups" or args.report_type == "program":
+            rg.generate_meet_program(out_path)
+        elif args.report_type == "results":
+            rg.generate_meet_results(out_path)
+        elif args.report_type == "timers":
+            rg.generate_timer_sheets(out_path)
+        return out_path
+
+    if args.format != "json":
+        # Raw tables, one typed file each, under <output_dir>/<meet>/
+        out_dir = os.path.join(args.output_dir, base_name)
+        converter.export_tables(out_dir, args.format, args.compression)
+        return out_dir
+
+    # Sessions and events are converted while they are written
+    data = converter.export_raw() if args.raw else converter.stream()
+
+    # Determine output filename
+    out_path = os.path.join(args.output_dir, f"{base_name}.json")
+
+    with open(out_path, "w") as f:
+        write_json(data, f, indent=None if args.compact else 4)
+    return out_path
 
 
 def main():
     parser = argparse.ArgumentParser(description="mm_to_json (Python)")
-    parser.add_argument("mdb_file", help="Path to the .mdb file")
-    parser.add_argument("-d", "--output-dir", default="./", help="Directory for output (json) file")
+    parser.add_argument(
+        "mdb_file",
+        nargs="+",
+        help="Path to the .mdb file. Several files, directories of .mdb files or glob patterns convert as a batch.",
+    )
+    parser.add_argument(
+        "-d",
+        "--output-dir",
+        default="./",
+        help="Directory for output files. Batch inputs sharing a file name keep their relative directories under it.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Worker processes for batch conversion (default: number of CPUs).",
+    )
     parser.add_argument(
         "-p",
         "--password",
@@ -1025,6 +1451,21 @@ def main():
         action="store_true",
         help="Export raw tables instead of hierarchical session view.",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write compact JSON without indentation (uses orjson when installed).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", *table_export.FORMATS],
+        default="json",
+        help="Output format. parquet/arrow/ndjson write the raw tables as one file each into <output-dir>/<meet>/.",
+    )
+    parser.add_argument(
+        "--compression",
+        help="Compression for parquet/arrow output (default: zstd for parquet, none for arrow so it can be memory-mapped).",
+    )
     parser.add_argument("-w", "--watch", action="store_true", help="Watch the mdb_file (Not implemented)")
 
     parser.add_argument(
@@ -1046,47 +1487,38 @@ def main():
         "--team-filter",
         help="Filter entries by team name.",
     )
+    parser.add_argument(
+        "--backend",
+        choices=[*dataset_reader.READERS, dataset_reader.PREFERRED],
+        help="MDB ingestion backend (default: MM_INGEST_BACKEND or preferred: a cached read, else the first "
+        "available of jackcess, native, mdbtools, in that fixed order).",
+    )
 
     args = parser.parse_args()
 
-    from .report_generator import ReportGenerator
+    paths = batch.expand_inputs(args.mdb_file)
+    if not paths:
+        logger.error(f"No .mdb files matched {args.mdb_file}")
+        sys.exit(1)
+    try:
+        args.output_names = batch.output_names(paths)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    if len(paths) > 1:
+        started = time.perf_counter()
+        results = batch.run_batch(paths, convert_file, args, jobs=args.jobs)
+        print(batch.summary(results, time.perf_counter() - started))
+        if any(r.error for r in results):
+            sys.exit(1)
+        return
 
-    converter = MmToJsonConverter(args.mdb_file, args.password)
     try:
+        out_path = convert_file(paths[0], args)
         if args.report:
-            rg = ReportGenerator(converter, title=args.report_title)
-
-            # Determine output filename
-            base_name = os.path.splitext(os.path.basename(args.mdb_file))[0]
-            out_path = os.path.join(args.output_dir, f"{base_name}_{args.report_type}.pdf")
-
-            if args.report_type == "psych":
-                rg.generate_psych_sheet(out_path)
-            elif args.report_type == "entries":
-                rg.generate_meet_entries(out_path, team_filter=args.team_filter)
-            elif args.report_type == "lineups" or args.report_type == "program":
-                rg.generate_meet_program(out_path)
-            elif args.report_type == "results":
-                rg.generate_meet_results(out_path)
-            elif args.report_type == "timers":
-                rg.generate_timer_sheets(out_path)
-
             logger.info(f"Successfully generated report to {out_path}")
-            return
-
-        if args.raw:
-            data = converter.export_raw()
         else:
-            data = converter.convert()
-
-        # Determine output filename
-        base_name = os.path.splitext(os.path.basename(args.mdb_file))[0]
-        out_path = os.path.join(args.output_dir, f"{base_name}.json")
-
-        with open(out_path, "w") as f:
-            json.dump(data, f, indent=4, default=json_serial)
-
-        logger.info(f"Successfully converted to {out_path}")
+            logger.info(f"Successfully converted to {out_path}")
 
     except Exception as e:
         logger.error(f"Error during conversion: {e}")
@@ -1,3 +1,4 @@
+import dataclasses
 import logging
 
 from .reporting.extractor import ReportDataExtractor
@@ -68,3 +69,25 @@ class ReportGenerator:
     # Legacy method names if needed
     def generate_lineup_sheets(self, output_path):
         self.generate_meet_program(output_path)
+
+    def generate_batch(self, specs, zip_path=None, jobs=None, cache=None):
+        """Render several WeasyPrint reports from one conversion of the meet.
+
+        ``specs`` holds ReportSpec objects or ``(type, team_filter, title)``
+        tuples; a spec without a title uses this generator's title. Returns the
+        RenderedReport list in ``specs`` order, and also zips the successful ones
+        to ``zip_path`` when given. ``cache`` is an optional ReportCache.
+        """
+        from .reporting import report_batch
+
+        # New specs: the caller's may be reused with another generator
+        specs = [
+            dataclasses.replace(spec, title=spec.title or self.custom_title)
+            for spec in (s if isinstance(s, report_batch.ReportSpec) else report_batch.ReportSpec(*s) for s in specs)
+        ]
+        logger.info(f"Generating {len(specs)} reports")
+        reports = report_batch.generate_reports(self.converter, specs, jobs, cache)
+        if zip_path:
+            with open(zip_path, "wb") as f:
+                report_batch.write_zip(reports, f)
+        return reports
@@ -0,0 +1,284 @@
+"""
+Compare the PDF backends on every report type they can render.
+
+    python -m mm_to_json.reporting.benchmark [--sizes small,medium,large] [--mdb meet.mdb] [--repeat 3]
+
+Each (dataset, backend, report type) runs in a fresh spawned process, so peak
+RSS is that render's alone. The report data is extracted first and one
+untimed render warms the backend (templates, fonts, Chromium) as a running
+server would have it; then ``--repeat`` timed renders record the median wall
+and CPU time and the PDF's size and page count (a backend that drops
+content is fast for the wrong reason, so one whose page count differs from
+WeasyPrint's is never suggested). WeasyPrint lays out in-process here
+(MM_RENDER_WORKERS=0), so its numbers compare with ReportLab's. Chromium runs
+in helper processes: their CPU is reported separately, and peak RSS covers
+them once they have exited.
+
+The synthetic meets grow from ``small`` to ``large``; ``--mdb`` adds real
+ones. The output is a comparison table and, from the largest dataset, the
+MM_REPORT_BACKENDS setting that sends each report type to its fastest
+backend.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from . import render_pool
+from .report_batch import BACKENDS, BACKENDS_ENV, DEFAULT_BACKEND, REPORT_TYPES
+
+logger = logging.getLogger(__name__)
+
+# Synthetic meet sizes: (athletes, events)
+SIZES = {"small": (100, 10), "medium": (600, 40), "large": (2400, 120)}
+STROKES = "ABCDE"
+DISTANCES = (50, 100, 200)
+LANES = 8
+
+
+@dataclass
+class Measurement:
+    dataset: str
+    backend: str
+    report_type: str
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    helper_cpu_s: float = 0.0
+    peak_rss_mb: float = 0.0
+    size_kb: float = 0.0
+    pages: int = 0
+    error: str | None = None
+
+
+def synthetic_tables(athletes: int, events: int, teams: int = 8) -> dict[str, list[dict[str, Any]]]:
+    """A meet with ``athletes`` swimmers in ``teams`` teams, each entered in up to four of ``events`` events."""
+    rng = random.Random(athletes * 1009 + events)
+    sessions = max(1, events // 20)
+    tables: dict[str, list[dict[str, Any]]] = {
+        "Meet": [{"Meet_name1": "Benchmark Meet", "Meet_start": "2026-02-13", "Meet_end": "2026-02-14"}],
+        "Session": [
+            {"Sess_ptr": s, "Sess_no": s, "Sess_name": f"Session {s}", "Sess_day": 1 + s // 3, "Sess_starttime": 32400}
+            for s in range(1, sessions + 1)
+        ],
+        "Team": [
+            {"Team_no": t, "Team_abbr": f"T{t:02d}", "Team_name": f"Team {t}", "Team_lsc": "PC"}
+            for t in range(1, teams + 1)
+        ],
+        "Relay": [],
+        "RelayNames": [],
+    }
+    tables["Event"] = [
+        {
+            "Event_no": e,
+            "Event_ptr": e,
+            "Ind_rel": "I",
+            "Event_gender": "MF"[e % 2],
+            "Event_dist": DISTANCES[e % len(DISTANCES)],
+            "Event_stroke": STROKES[(e // 2) % len(STROKES)],
+            "Low_age": 8 + 2 * (e // 10 % 4),
+            "High_age": 9 + 2 * (e // 10 % 4),
+            "Num_finlanes": LANES,
+            "Event_rounds": 1,
+        }
+        for e in range(1, events + 1)
+    ]
+    tables["Sessitem"] = [
+        {"Sess_ptr": 1 + (e - 1) * sessions // events, "Event_ptr": e, "Sess_order": e, "Sess_rnd": "F"}
+        for e in range(1, events + 1)
+    ]
+    tables["Athlete"] = [
+        {
+            "Ath_no": a,
+            "First_name": f"First{a}",
+            "Last_name": f"Last{a}",
+            "Ath_Sex": "MF"[a % 2],
+            "Ath_age": rng.randint(8, 18),
+            "Team_no": 1 + a % teams,
+        }
+        for a in range(1, athletes + 1)
+    ]
+    by_event: dict[int, list[tuple[int, float]]] = {e["Event_ptr"]: [] for e in tables["Event"]}
+    for athlete in tables["Athlete"]:
+        own = [e for e in tables["Event"] if e["Event_gender"] == athlete["Ath_Sex"]]
+        for event in rng.sample(own, min(4, len(own))):
+            by_event[event["Event_ptr"]].append((athlete["Ath_no"], event["Event_dist"] * rng.uniform(0.55, 1.1)))
+    tables["Entry"] = []
+    for event_ptr, entries in by_event.items():
+        # Slowest heats first, fastest swimmers in the last heat
+        entries.sort(key=lambda item: -item[1])
+        finals = [seed * rng.uniform(0.97, 1.03) for _, seed in entries]
+        places = {i: place for place, i in enumerate(sorted(range(len(entries)), key=finals.__getitem__), 1)}
+        for i, (ath_no, seed) in enumerate(entries):
+            tables["Entry"].append(
+                {
+                    "Event_ptr": event_ptr,
+                    "Ath_no": ath_no,
+                    "Fin_heat": 1 + i // LANES,
+                    "Fin_lane": 1 + i % LANES,
+                    "ConvSeed_time": round(seed, 2),
+                    "Fin_Time": round(finals[i], 2),
+                    "Fin_place": places[i],
+                }
+            )
+    return tables
+
+
+def _load(dataset: str):
+    from ..mm_to_json import MmToJsonConverter
+
+    if dataset in SIZES:
+        return MmToJsonConverter(table_data=synthetic_tables(*SIZES[dataset]))
+    from ..dataset_reader import read_dataset
+
+    return MmToJsonConverter(table_data=read_dataset(dataset).tables)
+
+
+def _page_count(pdf: bytes) -> int:
+    """0 when unknown (no pypdfium2, or a PDF it cannot read)."""
+    from . import pdf_merge
+
+    if not pdf_merge.available():
+        return 0
+    try:
+        return pdf_merge.page_count(pdf)
+    except Exception:
+        return 0
+
+
+def _measure(dataset: str, backend: str, report_type: str, repeat: int) -> Measurement:
+    """Runs in the child process."""
+    import io
+
+    from . import browser_pool
+    from .extractor import ReportDataExtractor
+    from .report_batch import ReportSpec, extract, render_pdf
+
+    result = Measurement(dataset, backend, report_type)
+    try:
+        data = extract(ReportDataExtractor(_load(dataset)), ReportSpec(report_type), {})
+        walls, cpus = [], []
+        for i in range(repeat + 1):
+            output = io.BytesIO()
+            wall, cpu = time.perf_counter(), time.process_time()
+            # Renderers add page metadata to the dict they get
+            render_pdf(backend, dict(data), report_type, output)
+            if i:
+                walls.append(time.perf_counter() - wall)
+                cpus.append(time.process_time() - cpu)
+        result.wall_s = statistics.median(walls)
+        result.cpu_s = statistics.median(cpus)
+        result.size_kb = len(output.getvalue()) / 1024
+        result.pages = _page_count(output.getvalue())
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        # Reaps Chromium, so its usage shows up under RUSAGE_CHILDREN
+        browser_pool.shutdown_pool()
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    helpers = resource.getrusage(resource.RUSAGE_CHILDREN)
+    result.helper_cpu_s = helpers.ru_utime + helpers.ru_stime
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    result.peak_rss_mb = max(own.ru_maxrss, helpers.ru_maxrss) / scale
+    return result
+
+
+def _child_init():
+    os.environ[render_pool.WORKERS_ENV] = "0"
+
+
+def run(datasets: list[str], backends: list[str], report_types: list[str], repeat: int = 3) -> list[Measurement]:
+    """Measures every supported (dataset, backend, report type), one fresh process each."""
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for dataset in datasets:
+        for report_type in report_types:
+            for backend in backends:
+                if report_type not in BACKENDS[backend]:
+                    continue
+                with ctx.Pool(1, initializer=_child_init, maxtasksperchild=1) as pool:
+                    result = pool.apply(_measure, (dataset, backend, report_type, repeat))
+                logger.info(_row(result))
+                results.append(result)
+    return results
+
+
+def fastest(results: list[Measurement]) -> dict[str, str]:
+    """Report type -> backend with the lowest median wall time on the last (largest) dataset it rendered.
+
+    A backend whose PDF has a different page count than WeasyPrint's for the
+    same dataset and report type is not a candidate: it dropped (or added)
+    content.
+    """
+    reference = {(r.dataset, r.report_type): r.pages for r in results if r.backend == "weasyprint" and not r.error}
+    best: dict[str, Measurement] = {}
+    for result in results:
+        if result.error:
+            continue
+        pages = reference.get((result.dataset, result.report_type))
+        if pages is not None and result.pages != pages:
+            continue
+        current = best.get(result.report_type)
+        if current is None or current.dataset != result.dataset or result.wall_s < current.wall_s:
+            best[result.report_type] = result
+    return {report_type: result.backend for report_type, result in best.items()}
+
+
+HEADER = f"{'dataset':<12} {'type':<14} {'backend':<11} {'wall s':>8} {'cpu s':>8} {'helper cpu s':>12} {'peak MB':>8} {'KB':>8} {'pages':>6}"
+
+
+def _row(r: Measurement) -> str:
+    label = f"{os.path.basename(r.dataset):<12.12} {r.report_type:<14} {r.backend:<11}"
+    if r.error:
+        return f"{label} {r.error[:60]}"
+    return f"{label} {r.wall_s:>8.3f} {r.cpu_s:>8.3f} {r.helper_cpu_s:>12.3f} {r.peak_rss_mb:>8.1f} {r.size_kb:>8.1f} {r.pages:>6}"
+
+
+def table(results: list[Measurement]) -> str:
+    return "\n".join([HEADER, "-" * len(HEADER), *(_row(r) for r in results)])
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Benchmark the report PDF backends")
+    parser.add_argument("--sizes", default=",".join(SIZES), help=f"Synthetic meets to render ({', '.join(SIZES)})")
+    parser.add_argument("--mdb", action="append", default=[], help="Also render a real meet file (repeatable)")
+    parser.add_argument("--backends", default=",".join(BACKENDS), help="Backends to compare")
+    pdf_types = [t for t, (_, template) in REPORT_TYPES.items() if template is not None]
+    parser.add_argument("--types", default=",".join(pdf_types), help="Report types to render")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed renders per measurement (median is reported)")
+    parser.add_argument("--json", help="Also write the raw measurements to this file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    datasets = [s for s in args.sizes.split(",") if s] + args.mdb
+    for name in datasets:
+        if name not in SIZES and not os.path.exists(name):
+            parser.error(f"Unknown size or missing file: {name}")
+    backends = [b for b in args.backends.split(",") if b]
+    unknown = [b for b in backends if b not in BACKENDS]
+    if unknown:
+        parser.error(f"Unknown backend(s): {', '.join(unknown)}")
+
+    results = run(datasets, backends, [t for t in args.types.split(",") if t], max(1, args.repeat))
+    print(table(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+
+    choice = fastest(results)
+    if choice:
+        print(f"\nFastest backend per report type (default {DEFAULT_BACKEND}):")
+        print(f"{BACKENDS_ENV}={','.join(f'{t}={b}' for t, b in sorted(choice.items()))}")
+
+
+if __name__ == "__main__":
+    main()
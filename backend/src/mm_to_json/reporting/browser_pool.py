@@ -0,0 +1,260 @@
+"""
+Long-lived headless Chromium instances for PlaywrightRenderer.
+
+Launching Chromium takes hundreds of milliseconds to seconds, and used to be
+paid for every PDF. The pool starts Playwright and its browsers once, on an
+event loop of its own thread, and keeps each browser's context and page: a
+render only sets the page content and prints it. Renders from any thread
+(``render_pdf``) or event loop (``render_pdf_async``) wait in the pool's
+queue for the next free browser.
+
+A browser that crashes is relaunched: its health is checked before every
+render and, for idle browsers, every MM_BROWSER_HEALTH_INTERVAL seconds, and
+a render that fails because its browser died is retried once on the
+relaunched one. A render that exceeds the timeout also gets its browser
+relaunched, since its page is left in an unknown state.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from .env import env_number
+
+logger = logging.getLogger(__name__)
+
+# Number of Chromium instances
+SIZE_ENV = "MM_BROWSER_POOL_SIZE"
+DEFAULT_SIZE = 2
+# Seconds a single PDF may take (queue wait plus rendering)
+TIMEOUT_ENV = "MM_BROWSER_TIMEOUT"
+DEFAULT_TIMEOUT = 60.0
+# Seconds between health checks of idle browsers
+HEALTH_INTERVAL_ENV = "MM_BROWSER_HEALTH_INTERVAL"
+DEFAULT_HEALTH_INTERVAL = 30.0
+# A browser's context and page are replaced after this many renders, so they cannot grow without bound
+RECYCLE_AFTER = 200
+
+PDF_OPTIONS: dict[str, Any] = {
+    "format": "Letter",
+    "margin": {"top": "0.5in", "bottom": "0.5in", "left": "0.5in", "right": "0.5in"},
+    "print_background": True,
+}
+
+
+class BrowserTimeoutError(TimeoutError):
+    pass
+
+
+class _Browser:
+    """One Chromium whose context and page are reused for every render."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.browser: Any = None
+        self.context: Any = None
+        self.page: Any = None
+        self.renders = 0
+        self.crashed = False
+
+    def healthy(self) -> bool:
+        return (
+            self.browser is not None
+            and self.browser.is_connected()
+            and self.page is not None
+            and not self.page.is_closed()
+            and not self.crashed
+        )
+
+    async def start(self, playwright):
+        await self.close()
+        self.browser = await playwright.chromium.launch(headless=True)
+        await self._new_page()
+
+    async def _new_page(self):
+        if self.context is not None:
+            try:
+                await self.context.close()
+            except Exception:
+                logger.debug(f"Closing Chromium {self.index} context failed", exc_info=True)
+        self.context = await self.browser.new_context()
+        self.page = await self.context.new_page()
+        self.crashed = False
+        self.page.on("crash", lambda _: setattr(self, "crashed", True))
+        self.renders = 0
+
+    async def render(self, html: str) -> bytes:
+        if self.renders >= RECYCLE_AFTER:
+            await self._new_page()
+        self.renders += 1
+        # Wait for any dynamic content/fonts
+        await self.page.set_content(html, wait_until="networkidle")
+        return await self.page.pdf(**PDF_OPTIONS)
+
+    def detach(self):
+        """Forgets the running browser, so the next checkout relaunches it; returns it for closing."""
+        browser, self.browser, self.context, self.page = self.browser, None, None, None
+        return browser
+
+    async def close(self):
+        await _close(self.detach())
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+    ):
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.health_interval = health_interval
+        self._browsers = [_Browser(i) for i in range(self.size)]
+        self._playwright: Any = None
+        self._idle: asyncio.Queue[_Browser] | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="browser-pool", daemon=True)
+        self._thread.start()
+        # Browsers launch in the background; the first renders wait for them
+        self._ready = self._call(self._start())
+
+    def _call(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _spawn(self, coro):
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _start(self):
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self._idle = asyncio.Queue()
+        await asyncio.gather(*(self._launch(browser) for browser in self._browsers))
+        for browser in self._browsers:
+            self._idle.put_nowait(browser)
+        self._spawn(self._watch())
+
+    async def _launch(self, browser: _Browser):
+        try:
+            await browser.start(self._playwright)
+        except Exception as e:
+            # Retried when the browser is next checked out
+            logger.warning(f"Could not launch Chromium {browser.index}: {e}")
+
+    async def _watch(self):
+        assert self._idle is not None
+        while True:
+            await asyncio.sleep(self.health_interval)
+            for _ in range(self._idle.qsize()):
+                browser = self._idle.get_nowait()
+                if not browser.healthy():
+                    logger.warning(f"Chromium {browser.index} is down; relaunching.")
+                    await self._launch(browser)
+                self._idle.put_nowait(browser)
+
+    async def _checkout(self) -> _Browser:
+        assert self._idle is not None
+        browser = await self._idle.get()
+        if not browser.healthy():
+            logger.warning(f"Chromium {browser.index} is down; relaunching.")
+            try:
+                await browser.start(self._playwright)
+            except BaseException:
+                self._idle.put_nowait(browser)
+                raise
+        return browser
+
+    async def _render(self, html: str, retry: bool = True) -> bytes:
+        await asyncio.wrap_future(self._ready)
+        assert self._idle is not None
+        browser = await self._checkout()
+        try:
+            return await browser.render(html)
+        except asyncio.CancelledError:
+            # Timed out mid-render; the page cannot be trusted any more
+            self._spawn(_close(browser.detach()))
+            raise
+        except Exception:
+            if not retry or browser.healthy():
+                raise
+            logger.warning(f"Chromium {browser.index} died during a render; retrying on a relaunched one.")
+        finally:
+            self._idle.put_nowait(browser)
+        return await self._render(html, retry=False)
+
+    def warm(self, timeout: float | None = None):
+        """Waits until every browser has launched."""
+        self._ready.result(timeout or self.timeout)
+
+    def render_pdf(self, html: str, timeout: float | None = None) -> bytes:
+        """Prints ``html`` in the next free browser and returns the PDF bytes. Not for use on an event loop."""
+        timeout = timeout or self.timeout
+        future = self._call(self._render(html))
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise BrowserTimeoutError(f"Rendering took longer than {timeout}s") from None
+
+    async def render_pdf_async(self, html: str, timeout: float | None = None) -> bytes:
+        """``render_pdf`` for callers on an event loop (any loop, not only the pool's)."""
+        timeout = timeout or self.timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(self._call(self._render(html))), timeout)
+        except TimeoutError:
+            raise BrowserTimeoutError(f"Rendering took longer than {timeout}s") from None
+
+    async def _stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*(browser.close() for browser in self._browsers))
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    def shutdown(self):
+        try:
+            self._call(self._stop()).result(self.timeout)
+        except Exception:
+            logger.debug("Stopping the browser pool failed", exc_info=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+async def _close(browser):
+    if browser is not None:
+        try:
+            await browser.close()
+        except Exception:
+            logger.debug("Closing Chromium failed", exc_info=True)
+
+
+_pool: BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> BrowserPool:
+    """Returns the process-wide pool, creating it (and launching its browsers) on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(
+                size=env_number(SIZE_ENV, DEFAULT_SIZE, int),
+                timeout=env_number(TIMEOUT_ENV, DEFAULT_TIMEOUT, float),
+                health_interval=env_number(HEALTH_INTERVAL_ENV, DEFAULT_HEALTH_INTERVAL, float),
+            )
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
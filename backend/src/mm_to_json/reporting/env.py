@@ -0,0 +1,9 @@
+import os
+
+
+def env_number(name: str, default, cast):
+    """``cast`` of the environment variable ``name``; ``default`` when it is unset or malformed."""
+    try:
+        return cast(os.environ.get(name, default))
+    except ValueError:
+        return default
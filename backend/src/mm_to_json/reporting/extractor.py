@@ -1,12 +1,27 @@
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .. import times
+from ..mm_to_json import Entry, RelayEntry
 
 if TYPE_CHECKING:
     from ..mm_to_json import MmToJsonConverter
 
+T = TypeVar("T")
+
 
 class ReportDataExtractor:
-    def __init__(self, converter: "MmToJsonConverter"):
+    def __init__(self, converter: "MmToJsonConverter", on_progress: Callable[[int, int], None] | None = None):
         self.converter = converter
+        # Called with (done, total) as each event (each team, for entries) is processed
+        self.on_progress = on_progress
+
+    def _tracked(self, items: Iterable[T]) -> Iterator[T]:
+        items = list(items)
+        for i, item in enumerate(items):
+            yield item
+            if self.on_progress is not None:
+                self.on_progress(i + 1, len(items))
 
     def extract_meet_entries_data(
         self, team_filter: str | None = None, report_title: str | None = None
@@ -32,139 +47,18 @@ class ReportDataExtractor:
             full_code = f"{t_code}-{t_lsc}" if t_lsc else t_code
             team_map[t_id] = {"name": str(row.get("Team_name", "")).strip(), "code": full_code}
 
-        # 3. Build Athlete Map (ID -> {Name, Gender, Age, TeamID})
-        ath_map = {}
-        for _, row in df_ath.iterrows():
-            a_id = row.get("Ath_no")
-            t_id = row.get("Team_no")
-            last = str(row.get("Last_name", "")).strip()
-            first = str(row.get("First_name", "")).strip()
-            initial = str(row.get("Initial", "")).strip()  # Middle Initial
-            sex = str(row.get("Sex", "")).strip()
-            age = row.get("Ath_age")
-
-            # Filter by team if requested
-            t_info = team_map.get(t_id)
-            if team_filter:
-                # Check against code or name
-                if not t_info:
-                    continue
-                if team_filter.lower() not in [t_info["code"].lower(), t_info["name"].lower()]:
-                    continue
-
-            name_str = f"{last}, {first}"
-            if initial:
-                name_str += f" {initial}"
-
-            ath_map[a_id] = {
-                "id": a_id,
-                "name": name_str,
-                "sex": "Female" if sex == "F" else "Male" if sex == "M" else sex,
-                "age": age,
-                "team_id": t_id,
-                "team_code": t_info["code"] if t_info else "UNK",
-                "events": [],
-            }
-
-        # 4. Iterate Events and Entries to link to Athletes
-        # We can use the converter's convert() method to get the hierarchical events,
-        # then flatten back to athletes.
-        full_data = self.converter.convert()
-
-        # We need to map formatted entries back to athletes.
-        # But convert() loses some raw data (like athlete ID).
-        # Better to iterate raw ENTRY table?
-        # Creating a map of Event_ptr -> EventDesc/No
-
-        for sess in full_data.get("sessions", []):
-            for _evt in sess.get("events", []):
-                # We need the Event_ptr to link raw entries.
-                # convert() puts entries inside.
-                # Let's use the 'entries' list from convert() as it has seedTime formatted
-                # But it doesn't have athlete ID easily.
-                # Actually earlier I saw add_individual_entries does a look up by ID.
-                # Let's rely on the convert() output for now, but we need to match name/age/team to ath_map?
-                # That is risky.
-
-                # Robust approach:
-                # Use raw ENTRY table + self.converter.get_heat_lane_time logic.
-                pass
+        # 3. Flatten the converter's events/entries (descriptions and formatted times
+        # included) and group them back by athlete below.
+        model = self.converter.meet_model()
 
-        # Let's use the raw tables to be precise.
         df_entry = self.converter.tables.get("Entry", None)
         df_event = self.converter.tables.get("Event", None)
 
         if df_entry is None or df_event is None:
             return {"groups": []}
 
-        # Build Event Info Map
-        # Pointer -> {Num, Desc}
-        for _, row in df_event.iterrows():
-            row.get("Event_ptr")
-            num = str(row.get("Event_no"))
-            ltr = row.get("Event_ltr", "")
-            if ltr:
-                num += ltr
-
-            int(row.get("Event_dist", 0))
-            row.get("Event_stroke", "S")  # 'A'='Free'?? Need map
-            # MmToJsonConverter has stroke_map but it's internal logic
-            # Let's construct a description
-            # Actually, reusing converter.get_event_name is safer
-            # But that requires an object.
-
-            # Simple map
-            # This map might be wrong for this DB.
-            # Let's peek at MmToJson using view_code? No time.
-            # Let's rely on the converter's `convert()` output for Event definitions
-            # and map via `eventNum`?
-            # Data from `convert()` is: sessions -> events -> entries
-            pass
-
-        # HYBRID APPROACH
-        # Use `convert()` to get the nice event descriptions and processed entries.
-        # But we need to group by Athlete.
-        # The entries in `convert()` output have: name, age, team, seedTime, heat, lane.
-        # We can iterate these and group by (Team, Name, Age).
-
-        flat_entries = []
-
-        for sess in full_data.get("sessions", []):
-            for evt in sess.get("events", []):
-                evt_num = evt.get("eventNum")
-                evt_desc = evt.get("eventDesc")
-                is_relay = evt.get("isRelay", False)
-
-                for entry in evt.get("entries", []):
-                    # Filter by team if needed
-                    t_name = entry.get("team", "")
-                    # This is the team NAME from helper, might not match filter if filter is Code.
-                    # But if we pass team_filter to extract, we can check.
-
-                    # Group Key: Name + Age + Team
-                    key = (entry.get("name"), entry.get("age"), t_name)
-
-                    # Heat/Lane formatting
-                    heat = entry.get("heat", 0)
-                    lane = entry.get("lane", 0)
-                    hl = f"{heat}/{lane}" if heat and lane else ""
-
-                    entry_data = {
-                        "key": key,
-                        "team": t_name,
-                        "name": entry.get("name"),
-                        "age": entry.get("age"),
-                        "evt_num": evt_num,
-                        "evt_desc": evt_desc,
-                        "time": entry.get("seedTime", "NT"),
-                        "hl": hl,
-                        "is_relay": is_relay,
-                        "athleteId": entry.get("athleteId"),
-                    }
-                    if is_relay:
-                        entry_data["relayAthletes"] = entry.get("relayAthletes", [])
-
-                    flat_entries.append(entry_data)
+        # (event, entry) records; entries are grouped by (Name, Age, Team)
+        flat_entries = [(evt, entry) for sess in model["sessions"] for evt in sess.events for entry in evt.entries]
 
         # Map: Team -> AthleteKey -> Dict
         # Special key "RelayTeams" for list of relay entries
@@ -209,23 +103,24 @@ class ReportDataExtractor:
         grouped = {}
 
         # Split into Individuals and Relays for processing order
-        ind_entries = [e for e in flat_entries if not e["is_relay"]]
-        relay_entries = [e for e in flat_entries if e["is_relay"]]
+        ind_entries = [item for item in flat_entries if not item[0].is_relay]
+        relay_entries = [item for item in flat_entries if item[0].is_relay]
 
         # 1. Process Individual Entries first to establish athlete base
         for item in ind_entries:
-            t_name = item["team"]
+            entry = item[1]
+            t_name = entry.team
             if team_filter and team_filter.lower() not in t_name.lower():
                 continue
 
-            key = item["key"]  # (Name, Age, Team)
+            key = (entry.name, entry.age, t_name)
 
             if t_name not in grouped:
                 grouped[t_name] = {}
             if key not in grouped[t_name]:
                 grouped[t_name][key] = {
-                    "name": item["name"],
-                    "age": item["age"],
+                    "name": entry.name,
+                    "age": entry.age,
                     "team": t_name,
                     "ind_count": 0,
                     "rel_count": 0,
@@ -245,14 +140,13 @@ class ReportDataExtractor:
                 # We need to find the ID stored in the first event?
                 # The group key doesn't store ID. But events do.
                 if data["events"]:
-                    first_evt = data["events"][0]
-                    aid = first_evt.get("athleteId")
+                    aid = data["events"][0][1].athlete_id
                     if aid:
                         id_lookup[(t_name, aid)] = key
 
         # 3. Process Relay Entries using detailed athlete lists
         for item in relay_entries:
-            t_name = item["team"]
+            t_name = item[1].team
             if team_filter and team_filter.lower() not in t_name.lower():
                 continue
 
@@ -264,7 +158,7 @@ class ReportDataExtractor:
             grouped[t_name]["RelayTeams"].append(item)
 
             # Attribute to individuals using relayAthletes list
-            relay_athletes = item.get("relayAthletes", [])
+            relay_athletes = item[1].athletes or []
 
             for ath in relay_athletes:
                 aid = ath.get("id")
@@ -307,19 +201,14 @@ class ReportDataExtractor:
                     # Add to lookup
                     id_lookup[(t_name, aid)] = new_key
 
-                # Add event (clone)
-                import copy
-
-                evt_clone = copy.copy(item)
                 # Ensure we don't duplicate events if swimmer is in multiple relays?
                 # No, we want to list all relays they are in.
-
-                grp["events"].append(evt_clone)
+                grp["events"].append(item)
                 grp["rel_count"] += 1
 
         sorted_teams = sorted(grouped.keys())
         report_groups = []
-        for t_name in sorted_teams:
+        for t_name in self._tracked(sorted_teams):
             team_items: list[dict[str, Any]] = []
 
             # Sort Athletes by Name
@@ -364,21 +253,22 @@ class ReportDataExtractor:
                 # Sub-items (Events) for the grid
                 # Need to be sorted by Event Num
                 # Event Num is string "31", "3", etc. Need int sort.
-                def sort_key(e):
+                def sort_key(item):
                     try:
-                        return int("".join(filter(str.isdigit, str(e["evt_num"]))))
+                        return int("".join(filter(str.isdigit, str(item[0].event_no))))
                     except Exception:
                         return 0
 
                 sorted_events = sorted(ath["events"], key=sort_key)
 
                 sub_rows = []
-                for e in sorted_events:
-                    desc_text = e["evt_desc"]
-                    if e["is_relay"]:
+                for evt, entry in sorted_events:
+                    desc_text = evt.description
+                    if evt.is_relay:
                         desc_text += " (Relay)"
+                    hl = f"{entry.heat}/{entry.lane}" if entry.heat and entry.lane else ""
                     sub_rows.append(
-                        {"idx": f"#{e['evt_num']}", "desc": desc_text, "time": e["time"], "heat_lane": e["hl"]}
+                        {"idx": f"#{evt.event_no}", "desc": desc_text, "time": entry.seed_time, "heat_lane": hl}
                     )
 
                 team_items.append({"header": header_str, "sub_items": sub_rows})
@@ -397,51 +287,25 @@ class ReportDataExtractor:
                 for item in relay_teams_list:
                     flat_relays.append(item)
 
-                flat_relays.sort(key=lambda x: int("".join(filter(str.isdigit, str(x["evt_num"])))))
+                flat_relays.sort(key=lambda x: int("".join(filter(str.isdigit, str(x[0].event_no)))))
 
-                for _i, r in enumerate(flat_relays):
-                    # Match Relay Letter from Team Name or relayLtr
-                    rltr = r.get("relayLm", "")  # Try legacy first? No, relayLtr is better.
-                    if not rltr:
-                        rltr = r.get("relayLtr", "")
+                for evt, r in flat_relays:
+                    ltr_str = f" - '{r.relay_ltr}'" if r.relay_ltr else ""
 
-                    ltr_str = f" - '{rltr}'" if rltr else ""
+                    # First line content: "TeamName - 'A'        #4 Event..."
+                    line1_desc = f"{t_name}{ltr_str}        #{evt.event_no} {evt.description}"
 
-                    # Construct Description: "TeamName - 'Ltr'   #EvtNum EventDesc"
-                    # Need Team Name? It's t_name from loop variable
-                    # Use fixed width spacing or just string concatenation?
-                    # Renderer table handles wrapping.
-                    # Format: "TeamName - 'A'                       #4 Event..."
-                    # Use non-breaking spaces? Or just spaces?
-                    # Let's use spaces.
-                    # Actually, `t_name` is available.
-
-                    # First line content
-                    line1_desc = f"{t_name}{ltr_str}        #{r['evt_num']} {r['evt_desc']}"
-
-                    # H/L
-                    hl_text = ""
-                    if r.get("heat"):
-                        hl_text = f"{r['heat']}/{r['lane']}"
+                    # H/L, as for the individual events
+                    hl_text = f"{r.heat}/{r.lane}" if r.heat and r.lane else ""
 
                     # Names formatting (Last, First; Last, First)
                     formatted_lines = []
                     names_parts = []
 
-                    if "relayAthletes" in r:
-                        for ath in r["relayAthletes"]:
-                            fn = ath.get("first", "").strip()
-                            ln = ath.get("last", "").strip()
-                            names_parts.append(f"{ln}, {fn}")
-                    else:
-                        # Fallback
-                        names_list = [n.strip() for n in r["name"].split(",")]
-                        for n in names_list:
-                            parts = n.split(" ")
-                            if len(parts) >= 2:
-                                names_parts.append(f"{parts[-1]}, " + " ".join(parts[:-1]))
-                            else:
-                                names_parts.append(n)
+                    for ath in r.athletes or []:
+                        fn = ath.get("first", "").strip()
+                        ln = ath.get("last", "").strip()
+                        names_parts.append(f"{ln}, {fn}")
 
                     full_names_str = "; ".join(names_parts)
                     formatted_lines.append(full_names_str)
@@ -457,7 +321,7 @@ class ReportDataExtractor:
                         {
                             "idx": str(current_relay_seq),
                             "desc": line1_desc,
-                            "time": r.get("seedTime", r.get("time", "")),
+                            "time": r.seed_time,
                             "heat_lane": hl_text,
                         }
                     )
@@ -486,7 +350,7 @@ class ReportDataExtractor:
             report_groups.append({"header": f"Team Entries - {t_name}", "athletes": team_items})
 
         return {
-            "meet_name": full_data.get("meetName", ""),
+            "meet_name": model.get("meetName", ""),
             "sub_title": report_title or "Entries - All Events",
             "groups": report_groups,
         }
@@ -508,12 +372,12 @@ class ReportDataExtractor:
             dict: Structured data ready for the PDFRenderer.
         """
         # 1. Convert MDB data to hierarchical JSON structure
-        full_data = self.converter.convert()
+        model = self.converter.meet_model()
 
         # 2. Collect all events from across all sessions
         all_events = []
-        for sess in full_data.get("sessions", []):
-            for evt in sess.get("events", []):
+        for sess in model["sessions"]:
+            for evt in sess.events:
                 all_events.append(evt)
 
         # 3. Sort events numerically (handling alphanumeric event numbers like "1A")
@@ -521,7 +385,7 @@ class ReportDataExtractor:
             try:
                 import re
 
-                num_part = re.search(r"\d+", str(e.get("eventNum", "0")))
+                num_part = re.search(r"\d+", str(e.event_no))
                 val = int(num_part.group()) if num_part else 0
                 return val
             except Exception:
@@ -532,17 +396,16 @@ class ReportDataExtractor:
         report_groups = []
 
         # 4. Process each event into report groups
-        for evt in all_events:
-            evt_num = evt.get("eventNum")
-            evt_desc = evt.get("eventDesc")
-            is_relay = evt.get("isRelay", False)
-            entries = evt.get("entries", [])
+        for evt in self._tracked(all_events):
+            evt_num = evt.event_no
+            evt_desc = evt.description
+            entries = evt.entries
 
             # Apply team filter if requested
             if team_filter:
                 filtered_entries = []
                 for entry in entries:
-                    t_name = entry.get("team", "")
+                    t_name = entry.team
                     # Check against team name (we don't have code easily here without extra lookup)
                     if team_filter.lower() in t_name.lower():
                         filtered_entries.append(entry)
@@ -555,9 +418,9 @@ class ReportDataExtractor:
             header = f"Event {evt_num}  {evt_desc}"
 
             # 5. Group entries by heat number
-            heats: dict[int, list[dict[str, Any]]] = {}
+            heats: dict[int, list[Entry | RelayEntry]] = {}
             for entry in entries:
-                h = entry.get("heat", 0)
+                h = entry.heat
                 if h not in heats:
                     heats[h] = []
                 heats[h].append(entry)
@@ -568,29 +431,29 @@ class ReportDataExtractor:
             # 6. Process each heat
             for h in sorted_heats:
                 heat_header = f"Heat {h} of {sorted_heats[-1]} Finals"
-                heat_entries = sorted(heats[h], key=lambda x: x.get("lane", 0))
+                heat_entries = sorted(heats[h], key=lambda x: x.lane)
 
                 sub_items = []
                 # 7. Format each entry (Relay vs Individual)
                 for entry in heat_entries:
-                    lane = entry.get("lane", "")
-                    seed_time = entry.get("seedTime", "NT")
+                    lane = entry.lane
+                    seed_time = entry.seed_time
 
-                    if is_relay:
+                    if isinstance(entry, RelayEntry):
                         # Relay entries include a list of structured swimmers
-                        t_name = entry.get("team", "")
-                        r_ltr = entry.get("relayLtr", "")
+                        t_name = entry.team
+                        r_ltr = entry.relay_ltr
 
                         names = []
-                        if "relayAthletes" in entry:
+                        if entry.athletes is not None:
                             # Preferred: use full athlete objects for accurate Last, First formatting
-                            for ath in entry["relayAthletes"]:
+                            for ath in entry.athletes:
                                 fn = ath.get("first", "").strip()
                                 ln = ath.get("last", "").strip()
                                 names.append(f"{ln}, {fn}")
                         else:
                             # Fallback: parse from single string name
-                            names = [n.strip() for n in entry.get("name", "").split(",")]
+                            names = [n.strip() for n in entry.name.split(",")]
 
                         sub_items.append(
                             {
@@ -604,9 +467,9 @@ class ReportDataExtractor:
                         )
                     else:
                         # Individual entries include standard fields
-                        name = entry.get("name", "")
-                        age = entry.get("age", "")
-                        team = entry.get("team", "")
+                        name = entry.name
+                        age = entry.age
+                        team = entry.team
 
                         # Ensure consistently formatted name: "Last, First"
                         if "," not in name:
@@ -630,7 +493,7 @@ class ReportDataExtractor:
             report_groups.append({"header": header, "heats": heat_items})
 
         return {
-            "meet_name": full_data.get("meetName", ""),
+            "meet_name": model.get("meetName", ""),
             "sub_title": report_title or "Meet Program",
             "groups": report_groups,
         }
@@ -639,26 +502,26 @@ class ReportDataExtractor:
         self, team_filter: str | None = None, report_title: str | None = None
     ) -> dict[str, Any]:
         """Extracts data for Psych Sheet report."""
-        full_data = self.converter.convert()
+        model = self.converter.meet_model()
         all_events = []
-        for sess in full_data.get("sessions", []):
-            for evt in sess.get("events", []):
+        for sess in model["sessions"]:
+            for evt in sess.events:
                 all_events.append(evt)
 
         # Sort events
-        all_events.sort(key=lambda e: self._safe_int(e.get("eventNum", 0)))
+        all_events.sort(key=lambda e: self._safe_int(e.event_no))
 
         report_groups = []
-        for evt in all_events:
-            evt_num = evt.get("eventNum")
-            evt_desc = evt.get("eventDesc")
-            entries = evt.get("entries", [])
+        for evt in self._tracked(all_events):
+            evt_num = evt.event_no
+            evt_desc = evt.description
+            entries = evt.entries
 
             # Apply team filter if requested
             if team_filter:
                 filtered_entries = []
                 for entry in entries:
-                    t_name = entry.get("team", "")
+                    t_name = entry.team
                     if team_filter.lower() in t_name.lower():
                         filtered_entries.append(entry)
                 entries = filtered_entries
@@ -666,37 +529,25 @@ class ReportDataExtractor:
             if not entries:
                 continue
 
-            # Sort entries by seed time
-            def time_sort_key(ent):
-                t = ent.get("seedTime", "NT")
-                if t == "NT":
-                    return 999999.0
-                try:
-                    # format usually like "1:23.45" or "23.45"
-                    parts = t.split(":")
-                    if len(parts) == 2:
-                        return float(parts[0]) * 60 + float(parts[1])
-                    return float(parts[0])
-                except Exception:
-                    return 999999.0
-
-            sorted_entries = sorted(entries, key=time_sort_key)
+            # Sort entries by seed time, NT last
+            order = times.sort_keys([ent.seed_time for ent in entries]).argsort(kind="stable")
+            sorted_entries = [entries[i] for i in order]
 
             sub_items = []
             for entry in sorted_entries:
                 sub_items.append(
                     {
-                        "name": entry.get("name", ""),
-                        "team": entry.get("team", ""),
-                        "age": str(entry.get("age", "")),
-                        "time": entry.get("seedTime", "NT"),
+                        "name": entry.name,
+                        "team": entry.team,
+                        "age": str(entry.age),
+                        "time": entry.seed_time,
                     }
                 )
 
             report_groups.append({"header": f"Event {evt_num}  {evt_desc}", "items": [{"sub_items": sub_items}]})
 
         return {
-            "meet_name": full_data.get("meetName", ""),
+            "meet_name": model.get("meetName", ""),
             "sub_title": report_title or "Psych Sheet",
             "groups": report_groups,
         }
@@ -705,25 +556,25 @@ class ReportDataExtractor:
         self, team_filter: str | None = None, report_title: str | None = None
     ) -> dict[str, Any]:
         """Extracts data for Timer Sheets (Heat-based)."""
-        full_data = self.converter.convert()
+        model = self.converter.meet_model()
         all_events = []
-        for sess in full_data.get("sessions", []):
-            for evt in sess.get("events", []):
+        for sess in model["sessions"]:
+            for evt in sess.events:
                 all_events.append(evt)
 
-        all_events.sort(key=lambda e: self._safe_int(e.get("eventNum", 0)))
+        all_events.sort(key=lambda e: self._safe_int(e.event_no))
 
         report_groups = []
-        for evt in all_events:
-            evt_num = evt.get("eventNum")
-            evt_desc = evt.get("eventDesc")
-            entries = evt.get("entries", [])
+        for evt in self._tracked(all_events):
+            evt_num = evt.event_no
+            evt_desc = evt.description
+            entries = evt.entries
 
             # Apply team filter if requested
             if team_filter:
                 filtered_entries = []
                 for entry in entries:
-                    t_name = entry.get("team", "")
+                    t_name = entry.team
                     if team_filter.lower() in t_name.lower():
                         filtered_entries.append(entry)
                 entries = filtered_entries
@@ -732,23 +583,23 @@ class ReportDataExtractor:
                 continue
 
             # Group by heat
-            heats: dict[int, list[dict[str, Any]]] = {}
+            heats: dict[int, list[Entry | RelayEntry]] = {}
             for e in entries:
-                h = self._safe_int(e.get("heat", 0))
+                h = self._safe_int(e.heat)
                 if h not in heats:
                     heats[h] = []
                 heats[h].append(e)
 
             for h in sorted(heats.keys()):
-                heat_entries = sorted(heats[h], key=lambda x: self._safe_int(x.get("lane", 0)))
+                heat_entries = sorted(heats[h], key=lambda x: self._safe_int(x.lane))
                 sub_items = []
                 for entry in heat_entries:
                     sub_items.append(
                         {
-                            "lane": str(entry.get("lane", "")),
-                            "name": entry.get("name", ""),
-                            "team": entry.get("team", ""),
-                            "time": entry.get("seedTime", "NT"),
+                            "lane": str(entry.lane),
+                            "name": entry.name,
+                            "team": entry.team,
+                            "time": entry.seed_time,
                         }
                     )
                 report_groups.append(
@@ -759,32 +610,32 @@ class ReportDataExtractor:
                 )
 
         return {
-            "meet_name": full_data.get("meetName", ""),
+            "meet_name": model.get("meetName", ""),
             "sub_title": report_title or "Timer Sheets",
             "groups": report_groups,
         }
 
     def extract_results_data(self, team_filter: str | None = None, report_title: str | None = None) -> dict[str, Any]:
         """Extracts data for Meet Results report."""
-        full_data = self.converter.convert()
+        model = self.converter.meet_model()
         all_events = []
-        for sess in full_data.get("sessions", []):
-            for evt in sess.get("events", []):
+        for sess in model["sessions"]:
+            for evt in sess.events:
                 all_events.append(evt)
 
-        all_events.sort(key=lambda e: self._safe_int(e.get("eventNum", 0)))
+        all_events.sort(key=lambda e: self._safe_int(e.event_no))
 
         report_groups = []
-        for evt in all_events:
-            evt_num = evt.get("eventNum")
-            evt_desc = evt.get("eventDesc")
-            entries = evt.get("entries", [])
+        for evt in self._tracked(all_events):
+            evt_num = evt.event_no
+            evt_desc = evt.description
+            entries = evt.entries
 
             # Apply team filter if requested
             if team_filter:
                 filtered_entries = []
                 for entry in entries:
-                    t_name = entry.get("team", "")
+                    t_name = entry.team
                     if team_filter.lower() in t_name.lower():
                         filtered_entries.append(entry)
                 entries = filtered_entries
@@ -797,28 +648,27 @@ class ReportDataExtractor:
             finished = [
                 e
                 for e in entries
-                if (e.get("place") and self._safe_int(e.get("place", 0)) > 0)
-                or (e.get("finalTime") and e.get("finalTime") != "0.00" and e.get("finalTime") != "")
+                if (e.place and self._safe_int(e.place) > 0) or (e.final_time and e.final_time != "0.00")
             ]
-            sorted_entries = sorted(finished, key=lambda x: self._safe_int(x.get("place", 0)) or 999)
+            sorted_entries = sorted(finished, key=lambda x: self._safe_int(x.place) or 999)
 
             sub_items = []
             for entry in sorted_entries:
                 sub_items.append(
                     {
-                        "place": str(entry.get("place", "")),
-                        "name": entry.get("name", ""),
-                        "team": entry.get("team", ""),
-                        "age": str(entry.get("age", "")),
-                        "time": entry.get("finalTime", entry.get("seedTime", "")),
-                        "points": str(entry.get("points", "0")),
+                        "place": "" if entry.place is None else str(entry.place),
+                        "name": entry.name,
+                        "team": entry.team,
+                        "age": str(entry.age),
+                        "time": entry.seed_time if entry.final_time is None else entry.final_time,
+                        "points": "0",
                     }
                 )
 
             report_groups.append({"header": f"Event {evt_num}  {evt_desc}", "items": [{"sub_items": sub_items}]})
 
         return {
-            "meet_name": full_data.get("meetName", ""),
+            "meet_name": model.get("meetName", ""),
             "sub_title": report_title or "Meet Results",
             "groups": report_groups,
         }
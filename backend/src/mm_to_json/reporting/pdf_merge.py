@@ -0,0 +1,65 @@
+"""
+Merge separately rendered PDFs into one document with continuous page numbers.
+
+Used by the chunked meet program: each chunk is laid out on its own with its
+page footer turned off, and ``merge_pdfs`` stamps "Page N" where the footer of
+report_style.css would have put it (8pt Helvetica, right-aligned in the
+bottom margin). Needs pypdfium2, which comes with pdfplumber.
+"""
+
+import ctypes
+import io
+
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:
+    pdfium = None
+
+# Matches the @page rule in templates/report_style.css
+PAGE_MARGIN_PT = 36.0
+FOOTER_BASELINE_PT = 15.0
+FOOTER_FONT = b"Helvetica"
+FOOTER_FONT_SIZE = 8.0
+
+
+def available() -> bool:
+    return pdfium is not None
+
+
+def _stamp(doc, page, font, text: str):
+    width, _ = page.get_size()
+    obj = pdfium_c.FPDFPageObj_CreateTextObj(doc.raw, font, ctypes.c_float(FOOTER_FONT_SIZE))
+    buf = ctypes.create_string_buffer((text + "\0").encode("utf-16-le"))
+    pdfium_c.FPDFText_SetText(obj, ctypes.cast(buf, ctypes.POINTER(pdfium_c.FPDF_WCHAR)))
+    left, bottom, right, top = (ctypes.c_float() for _ in range(4))
+    pdfium_c.FPDFPageObj_GetBounds(obj, left, bottom, right, top)
+    x = width - PAGE_MARGIN_PT - (right.value - left.value)
+    pdfium_c.FPDFPageObj_Transform(obj, 1, 0, 0, 1, x, FOOTER_BASELINE_PT)
+    pdfium_c.FPDFPage_InsertObject(page.raw, obj)
+    pdfium_c.FPDFPage_GenerateContent(page.raw)
+
+
+def page_count(pdf: bytes) -> int:
+    if pdfium is None:
+        raise ImportError("pypdfium2 is required to count PDF pages (pip install pypdfium2)")
+    return len(pdfium.PdfDocument(pdf))
+
+
+def merge_pdfs(chunks: list[bytes], page_label: str | None = "Page {n}") -> bytes:
+    """Concatenate ``chunks`` in order; with ``page_label``, stamp each page with its number in the merged document."""
+    if pdfium is None:
+        raise ImportError("pypdfium2 is required to merge PDF chunks (pip install pypdfium2)")
+    merged = pdfium.PdfDocument.new()
+    for chunk in chunks:
+        merged.import_pages(pdfium.PdfDocument(chunk))
+    if page_label:
+        font = pdfium_c.FPDFText_LoadStandardFont(merged.raw, FOOTER_FONT)
+        try:
+            for i in range(len(merged)):
+                _stamp(merged, merged[i], font, page_label.format(n=i + 1))
+        finally:
+            pdfium_c.FPDFFont_Close(font)
+    out = io.BytesIO()
+    merged.save(out)
+    return out.getvalue()
@@ -0,0 +1,85 @@
+"""
+Process-wide template state shared by the HTML report renderers.
+
+One Jinja environment holds the compiled templates (backed by an on-disk
+bytecode cache, so a restarted server skips compilation too), the report
+stylesheet is read once, and WeasyPrint's font configuration is built once.
+Each is refreshed when its file changes: Jinja's ``auto_reload`` checks the
+template mtimes, and the stylesheet is re-read when its mtime or size moves.
+"""
+
+import datetime
+import logging
+import os
+import tempfile
+import threading
+from typing import Any
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+STYLESHEET = "report_style.css"
+BYTECODE_CACHE_ENV = "MM_TEMPLATE_CACHE_DIR"
+
+
+class RenderAssets:
+    def __init__(self, template_dir: str = TEMPLATE_DIR, bytecode_dir: str | None = None):
+        self.template_dir = template_dir
+        bytecode_dir = (
+            bytecode_dir
+            or os.environ.get(BYTECODE_CACHE_ENV)
+            or os.path.join(tempfile.gettempdir(), "mm_template_cache")
+        )
+        try:
+            os.makedirs(bytecode_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+        except OSError as e:
+            logger.warning(f"Template bytecode cache disabled: {e}")
+            bytecode_cache = None
+        self.env = Environment(loader=FileSystemLoader(template_dir), auto_reload=True, bytecode_cache=bytecode_cache)
+        self._lock = threading.Lock()
+        self._css: tuple[tuple[int, int], str] | None = None
+        self._font_config: Any = None
+
+    def css_text(self) -> str:
+        path = os.path.join(self.template_dir, STYLESHEET)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._css
+        if cached is None or cached[0] != stamp:
+            with open(path) as f:
+                cached = (stamp, f.read())
+            self._css = cached
+        return cached[1]
+
+    def font_config(self):
+        """WeasyPrint's FontConfiguration, built on first use; None where WeasyPrint has none."""
+        with self._lock:
+            if self._font_config is None:
+                try:
+                    from weasyprint.text.fonts import FontConfiguration
+                except ImportError:
+                    return None
+                self._font_config = FontConfiguration()
+            return self._font_config
+
+    def add_page_metadata(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Adds the stylesheet and generation time every report template expects."""
+        data["css_content"] = self.css_text()
+        data["generation_time"] = datetime.datetime.now().strftime("%I:%M %p %m/%d/%Y")
+        return data
+
+
+_assets: RenderAssets | None = None
+_assets_lock = threading.Lock()
+
+
+def get_assets() -> RenderAssets:
+    """Returns the process-wide assets, creating them on first use."""
+    global _assets
+    with _assets_lock:
+        if _assets is None:
+            _assets = RenderAssets()
+        return _assets
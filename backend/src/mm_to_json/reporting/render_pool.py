@@ -0,0 +1,220 @@
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from .env import env_number
+
+logger = logging.getLogger(__name__)
+
+# Number of WeasyPrint worker processes. 0 disables the pool and renders on the
+# calling thread, as before.
+WORKERS_ENV = "MM_RENDER_WORKERS"
+DEFAULT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+# Jobs allowed to wait for a free worker; further submissions block (up to the timeout)
+QUEUE_ENV = "MM_RENDER_QUEUE"
+DEFAULT_QUEUE = 16
+# Seconds a single PDF may take, queue wait and layout together
+TIMEOUT_ENV = "MM_RENDER_TIMEOUT"
+DEFAULT_TIMEOUT = 120.0
+
+
+class RenderQueueFullError(RuntimeError):
+    pass
+
+
+class RenderTimeoutError(TimeoutError):
+    pass
+
+
+# --- Worker side ---
+# Each worker imports WeasyPrint and sets up fonts once, in the initializer,
+# and keeps them for its whole lifetime.
+
+_font_config = None
+
+
+def _init_worker(started=None):
+    global _font_config
+    if started is not None:
+        # Lets the pool kill this process when a job hangs
+        started.put(os.getpid())
+    import weasyprint  # noqa: F401
+
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:
+        return
+    _font_config = FontConfiguration()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _render_pdf_job(html: str) -> bytes:
+    from weasyprint import HTML
+
+    if _font_config is None:
+        return HTML(string=html).write_pdf()
+    return HTML(string=html).write_pdf(font_config=_font_config)
+
+
+# --- Caller side ---
+
+
+class RenderPool:
+    """
+    WeasyPrint layout in long-lived worker processes.
+
+    Layout is CPU-bound Python, so renders on gRPC worker threads serialize on
+    the GIL; here templates are still filled in by the caller, and only the
+    HTML -> PDF step is shipped to a worker. ``timeout`` covers a whole job:
+    the wait for a slot, layout and the one retry after a crashed worker all
+    share its deadline. At most ``max_workers + max_queue`` jobs are in
+    flight; a submission that gets no slot before the deadline raises
+    RenderQueueFullError. A job still running at the deadline raises
+    RenderTimeoutError and the workers are killed (a hung layout would
+    otherwise hold its process forever); like a crashed worker, that breaks
+    the executor, which is rebuilt on the next submission.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_QUEUE,
+        timeout: float = DEFAULT_TIMEOUT,
+        warm: bool = True,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_workers + max(0, max_queue))
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        # PIDs of the current executor's workers, sent by each one as it starts
+        self._started: Any = None
+        if warm:
+            self.warm()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: the server forks from a process full of gRPC threads
+                ctx = multiprocessing.get_context("spawn")
+                self._started = ctx.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=ctx,
+                    initializer=_init_worker,
+                    initargs=(self._started,),
+                )
+            return self._executor
+
+    def _reset(self, kill: bool = False):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            started, self._started = self._started, None
+        if executor is None:
+            return
+        pids = []
+        while kill and not started.empty():
+            pids.append(started.get())
+        executor.shutdown(wait=False, cancel_futures=True)
+        # ProcessPoolExecutor cannot cancel a running job; the only way to stop one is its process
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass  # already gone
+
+    def _submit(self, fn, *args, deadline: float) -> Future:
+        if not self._slots.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            raise RenderQueueFullError(f"Render queue is full ({self.max_workers} workers busy)")
+        try:
+            try:
+                future = self._get_executor().submit(fn, *args)
+            except BrokenProcessPool:
+                logger.warning("Render worker pool was broken; restarting workers.")
+                self._reset()
+                future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _result(self, future: Future, deadline: float, timeout: float):
+        try:
+            return future.result(max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            logger.warning(f"Render job exceeded {timeout}s; restarting workers.")
+            future.cancel()
+            self._reset(kill=True)
+            raise RenderTimeoutError(f"Rendering took longer than {timeout}s") from None
+
+    def warm(self):
+        """Starts every worker ahead of the first real request."""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_ping)
+
+    def render_pdf(self, html: str, timeout: float | None = None) -> bytes:
+        """Lays out ``html`` in a worker and returns the PDF bytes."""
+        return self._call(_render_pdf_job, html, timeout=timeout)
+
+    def _call(self, fn, *args, timeout: float | None = None):
+        """``fn(*args)`` in a worker, queue wait included, within ``timeout`` (default: the pool's)."""
+        timeout = timeout or self.timeout
+        deadline = time.monotonic() + timeout
+        try:
+            return self._result(self._submit(fn, *args, deadline=deadline), deadline, timeout)
+        except BrokenProcessPool:
+            # The worker died mid-job (or was killed for another job's timeout). Retry once, same deadline.
+            logger.warning("Render worker died during a job; retrying on a fresh pool.")
+            self._reset()
+            return self._result(self._submit(fn, *args, deadline=deadline), deadline, timeout)
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = self._started = None
+
+
+_pool: RenderPool | None = None
+_pool_lock = threading.Lock()
+
+
+def configured_workers() -> int:
+    return env_number(WORKERS_ENV, DEFAULT_WORKERS, int)
+
+
+def enabled() -> bool:
+    return configured_workers() > 0
+
+
+def get_pool() -> RenderPool:
+    """Returns the process-wide pool, creating (and warming) it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = RenderPool(
+                max_workers=configured_workers(),
+                max_queue=env_number(QUEUE_ENV, DEFAULT_QUEUE, int),
+                timeout=env_number(TIMEOUT_ENV, DEFAULT_TIMEOUT, float),
+            )
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
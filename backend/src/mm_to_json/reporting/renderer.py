@@ -1,4 +1,5 @@
 import datetime
+from typing import IO
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -21,7 +22,7 @@ from .config import ReportConfig
 
 
 class PDFRenderer:
-    def __init__(self, output_path: str, config: ReportConfig):
+    def __init__(self, output_path: str | IO[bytes], config: ReportConfig):
         self.output_path = output_path
         self.config = config
         self.styles = getSampleStyleSheet()
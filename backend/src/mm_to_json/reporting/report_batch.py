@@ -0,0 +1,397 @@
+"""Generate a set of reports from one shared conversion.
+
+Every report in a batch reads the same converter, so the meet model is built
+once (``meet_model()``), and reports that need the same data (same extractor,
+team filter and title, e.g. ``entries`` and ``entries_club``) share a single
+extraction. Renders run on a thread pool while the remaining reports are
+still being extracted, with the PDF layout itself in the ``render_pool``
+worker processes (unless MM_RENDER_WORKERS=0); ``iter_reports`` yields each
+report as soon as it is done. With a ``ReportCache``, reports whose data, parameters and
+templates are unchanged are served from it without extracting or rendering.
+PDFs come from WeasyPrint unless MM_REPORT_BACKENDS sends a report type to
+ReportLab or Playwright.
+"""
+
+import datetime
+import functools
+import hashlib
+import io
+import logging
+import os
+import queue
+import re
+import threading
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import IO, Any, cast
+
+from . import render_pool
+from .extractor import ReportDataExtractor
+from .report_cache import ReportCache
+from .weasy_renderer import WeasyRenderer
+
+logger = logging.getLogger(__name__)
+
+# Report type -> (extractor method, template); no template means HTML only (meet program)
+REPORT_TYPES = {
+    "psych": ("extract_psych_sheet_data", "psych_sheet.html"),
+    # Default entries uses HY-TEK style
+    "entries": ("extract_meet_entries_data", "entries_hytek.html"),
+    "lineups": ("extract_timer_sheets_data", "lineups.html"),
+    "results": ("extract_results_data", "results.html"),
+    "program": ("extract_meet_program_data", "meet_program.html"),
+    "program_html": ("extract_meet_program_data", None),
+    "entries_hytek": ("extract_meet_entries_data", "entries_hytek.html"),
+    "entries_club": ("extract_meet_entries_data", "entries_club.html"),
+}
+# PDF backend -> report types it can render
+BACKENDS = {
+    "weasyprint": {t for t, (_, template) in REPORT_TYPES.items() if template is not None},
+    # report_definitions has layouts for these; its entries and program layouts
+    # have no rows for the extracted data, so those stay with the HTML backends
+    "reportlab": {"psych", "lineups", "results"},
+    "playwright": {"program"},
+}
+DEFAULT_BACKEND = "weasyprint"
+# Backend per report type, e.g. "program=playwright,psych=reportlab" (as suggested by
+# ``python -m mm_to_json.reporting.benchmark``); unlisted types use DEFAULT_BACKEND
+BACKENDS_ENV = "MM_REPORT_BACKENDS"
+REPORTLAB_CONFIGS = {
+    "psych": "PSYCH_SHEET_CONFIG",
+    "lineups": "TIMER_SHEETS_CONFIG",
+    "results": "RESULTS_REPORT_CONFIG",
+}
+DEFAULT_JOBS = 4
+STREAM_CHUNK_SIZE = 256 * 1024
+CONTENT_TYPES = {".pdf": "application/pdf", ".html": "text/html; charset=utf-8"}
+
+
+@dataclass
+class ReportSpec:
+    type: str
+    team_filter: str | None = None
+    title: str | None = None
+
+
+@dataclass
+class RenderedReport:
+    spec: ReportSpec
+    filename: str
+    content: bytes = b""
+    html: str | None = None  # set for HTML-only reports; content is then the encoded HTML
+    error: str | None = None
+
+
+def report_filename(spec: ReportSpec, when: datetime.datetime | None = None) -> str:
+    """``report_<type>[_<team>]_<timestamp>.pdf`` (``.html`` for HTML-only reports)."""
+    stamp = (when or datetime.datetime.now()).strftime("%Y%m%d_%H%M%S")
+    team = re.sub(r"[^A-Za-z0-9]+", "-", spec.team_filter).strip("-") if spec.team_filter else ""
+    ext = ".html" if REPORT_TYPES.get(spec.type, ("", ""))[1] is None else ".pdf"
+    return f"report_{spec.type}{'_' + team if team else ''}_{stamp}{ext}"
+
+
+def extract(extractor: ReportDataExtractor, spec: ReportSpec, extracted: dict) -> dict[str, Any]:
+    """The report data for ``spec``; ``extracted`` memoizes it per extractor method, team filter and title."""
+    if spec.type not in REPORT_TYPES:
+        raise ValueError(f"Unknown report type: {spec.type} (expected one of {', '.join(REPORT_TYPES)})")
+    method = REPORT_TYPES[spec.type][0]
+    key = (method, spec.team_filter or None, spec.title or None)
+    if key not in extracted:
+        extracted[key] = getattr(extractor, method)(team_filter=spec.team_filter, report_title=spec.title)
+    return extracted[key]
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_backends(value: str) -> dict[str, str]:
+    choices = {}
+    for item in value.split(","):
+        report_type, _, backend = (part.strip() for part in item.partition("="))
+        if not report_type:
+            continue
+        if report_type not in BACKENDS.get(backend, ()):
+            logger.warning(
+                f"{BACKENDS_ENV}: {backend or '(none)'} cannot render {report_type}; using {DEFAULT_BACKEND}"
+            )
+            continue
+        choices[report_type] = backend
+    return choices
+
+
+def backend_for(report_type: str) -> str:
+    """The PDF backend configured for ``report_type`` in MM_REPORT_BACKENDS."""
+    return _parse_backends(os.environ.get(BACKENDS_ENV, "")).get(report_type, DEFAULT_BACKEND)
+
+
+def cache_key(cache: ReportCache, converter, spec: ReportSpec) -> str:
+    return cache.key(converter.dataset_hash(), spec.type, spec.team_filter, spec.title, backend_for(spec.type))
+
+
+def render_pdf(
+    backend: str,
+    data: dict[str, Any],
+    report_type: str,
+    output: str | IO[bytes],
+    on_pages: Callable[[int], None] | None = None,
+):
+    """Renders a PDF report type with the given backend.
+
+    ReportLab lays out with its report_definitions config, whose title it
+    keeps (its layouts are chosen by title); ``on_pages`` is only called by
+    WeasyPrint.
+    """
+    if report_type not in BACKENDS.get(backend, ()):
+        raise ValueError(f"Backend {backend} cannot render {report_type}")
+    if backend == "reportlab":
+        from . import report_definitions
+        from .renderer import PDFRenderer
+
+        PDFRenderer(output, getattr(report_definitions, REPORTLAB_CONFIGS[report_type])).render(data)
+    elif backend == "playwright":
+        from .playwright_renderer import PlaywrightRenderer
+
+        PlaywrightRenderer(output).render_meet_program(data)
+    else:
+        renderer = WeasyRenderer(output, render_pool.get_pool() if render_pool.enabled() else None, on_pages)
+        if report_type == "program":
+            renderer.render_meet_program(data)
+        else:
+            renderer.render_entries(data, cast(str, REPORT_TYPES[report_type][1]))
+
+
+def render_to(
+    data: dict[str, Any], spec: ReportSpec, output: IO[bytes], on_pages: Callable[[int], None] | None = None
+) -> str | None:
+    """Writes the report to ``output``; returns the HTML of HTML-only reports."""
+    if REPORT_TYPES[spec.type][1] is None:
+        html = WeasyRenderer(output).render_to_html(data)
+        output.write(html.encode())
+        return html
+    render_pdf(backend_for(spec.type), data, spec.type, output, on_pages)
+    return None
+
+
+def _render(data: dict[str, Any], spec: ReportSpec, filename: str) -> RenderedReport:
+    output = io.BytesIO()
+    html = render_to(data, spec, output)
+    return RenderedReport(spec, filename, output.getvalue(), html=html)
+
+
+def iter_reports(
+    converter, specs: list[ReportSpec], jobs: int | None = None, cache: ReportCache | None = None
+) -> Iterator[tuple[int, RenderedReport]]:
+    """Yield ``(index, report)`` for every spec, in completion order.
+
+    A report that fails to extract or render is yielded with ``error`` set
+    rather than stopping the batch.
+    """
+    extractor = ReportDataExtractor(converter)
+    extracted: dict[tuple, dict[str, Any]] = {}
+    when = datetime.datetime.now()
+    jobs = max(1, min(jobs or DEFAULT_JOBS, len(specs) or 1))
+    with ThreadPoolExecutor(jobs) as pool:
+        futures = {}
+        keys: dict[int, str] = {}
+        for i, spec in enumerate(specs):
+            filename = report_filename(spec, when)
+            if cache is not None and spec.type in REPORT_TYPES:
+                keys[i] = cache_key(cache, converter, spec)
+                content = cache.get(keys[i])
+                if content is not None:
+                    html = content.decode() if REPORT_TYPES[spec.type][1] is None else None
+                    yield i, RenderedReport(spec, filename, content, html=html)
+                    continue
+            try:
+                data = extract(extractor, spec, extracted)
+            except Exception as e:
+                logger.debug(f"Extracting {spec} failed", exc_info=True)
+                yield i, RenderedReport(spec, filename, error=f"{type(e).__name__}: {e}")
+                continue
+            # Renderers add page metadata to the dict they get, so each gets its own copy
+            futures[pool.submit(_render, dict(data), spec, filename)] = (i, spec, filename)
+
+        for future in as_completed(futures):
+            i, spec, filename = futures[future]
+            try:
+                report = future.result()
+            except Exception as e:
+                logger.debug(f"Rendering {spec} failed", exc_info=True)
+                report = RenderedReport(spec, filename, error=f"{type(e).__name__}: {e}")
+            if cache is not None and report.error is None:
+                cache.put(keys[i], report.content)
+            logger.info(f"{'FAILED' if report.error else 'ok'} {filename}")
+            yield i, report
+
+
+def generate_reports(
+    converter, specs: list[ReportSpec], jobs: int | None = None, cache: ReportCache | None = None
+) -> list[RenderedReport]:
+    """Every report of the batch, in ``specs`` order."""
+    reports: list[RenderedReport | None] = [None] * len(specs)
+    for i, report in iter_reports(converter, specs, jobs, cache):
+        reports[i] = report
+    return [r for r in reports if r is not None]
+
+
+def write_zip(reports: Iterable[RenderedReport], fp: IO[bytes]):
+    """Zip every successful report into ``fp``; repeated file names get a ``-2``, ``-3``... suffix."""
+    names: set[str] = set()
+    with zipfile.ZipFile(fp, "w") as zf:
+        for report in reports:
+            if report.error:
+                continue
+            stem, ext = os.path.splitext(report.filename)
+            name, n = report.filename, 1
+            while name in names:
+                n += 1
+                name = f"{stem}-{n}{ext}"
+            names.add(name)
+            # PDF streams are already compressed
+            compression = zipfile.ZIP_DEFLATED if report.html is not None else zipfile.ZIP_STORED
+            zf.writestr(name, report.content, compress_type=compression)
+
+
+def chunked(content: bytes, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    for start in range(0, len(content), chunk_size):
+        yield content[start : start + chunk_size]
+
+
+class StreamCancelledError(Exception):
+    pass
+
+
+_END = object()
+
+
+class ChunkWriter:
+    """Binary sink handing fixed-size chunks to one consumer, at most one chunk ahead of it.
+
+    The renderer writes from its own thread and blocks while the consumer is
+    behind; after ``cancel`` every write raises StreamCancelledError.
+    """
+
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._position = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+        self._cancelled = threading.Event()
+
+    def _put(self, item):
+        while True:
+            if self._cancelled.is_set():
+                raise StreamCancelledError()
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self.chunk_size:
+            self._put(bytes(self._buffer[: self.chunk_size]))
+            del self._buffer[: self.chunk_size]
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def finish(self):
+        """Sends what is left and ends the stream."""
+        try:
+            if self._buffer:
+                self._put(bytes(self._buffer))
+                self._buffer.clear()
+            self._put(_END)
+        except StreamCancelledError:
+            pass
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            item = self._queue.get()
+            if item is _END:
+                return
+            yield item
+
+
+class ReportStream:
+    """One report as a stream of byte chunks, produced while it renders.
+
+    Iterate it for the chunks; afterwards ``error``, ``size`` and ``sha256``
+    describe the whole content. A report in ``cache`` is replayed from it, and
+    a rendered one is written to it chunk by chunk as it streams.
+    """
+
+    def __init__(
+        self, converter, spec: ReportSpec, chunk_size: int = STREAM_CHUNK_SIZE, cache: ReportCache | None = None
+    ):
+        self.converter = converter
+        self.spec = spec
+        self.chunk_size = max(1, chunk_size)
+        self.cache = cache
+        self.filename = report_filename(spec)
+        self.content_type = CONTENT_TYPES[os.path.splitext(self.filename)[1]]
+        self.error: str | None = None
+        self.size = 0
+        self._digest = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def _produce(self, writer: ChunkWriter):
+        try:
+            data = extract(ReportDataExtractor(self.converter), self.spec, {})
+            render_to(data, self.spec, cast(IO[bytes], writer))
+        except StreamCancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Rendering {self.spec} failed", exc_info=True)
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            writer.finish()
+
+    def _chunks(self) -> Iterator[bytes]:
+        key = None
+        if self.cache is not None and self.spec.type in REPORT_TYPES:
+            key = cache_key(self.cache, self.converter, self.spec)
+            content = self.cache.get(key)
+            if content is not None:
+                yield from chunked(content, self.chunk_size)
+                return
+
+        entry = self.cache.open(key) if self.cache is not None and key is not None else None
+        writer = ChunkWriter(self.chunk_size)
+        producer = threading.Thread(target=self._produce, args=(writer,), name="report-stream", daemon=True)
+        producer.start()
+        complete = False
+        try:
+            for chunk in writer:
+                if entry is not None:
+                    entry.write(chunk)
+                yield chunk
+            complete = True
+        finally:
+            # A consumer that stops early (client gone) stops the renderer at its next write
+            writer.cancel()
+            producer.join()
+            if entry is not None:
+                if complete and self.error is None:
+                    entry.commit()
+                else:
+                    entry.discard()
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks():
+            self.size += len(chunk)
+            self._digest.update(chunk)
+            yield chunk
@@ -0,0 +1,168 @@
+"""
+Disk cache of rendered reports.
+
+An entry is keyed by everything that affects a report's bytes: the content
+hash of the dataset (``MmToJsonConverter.dataset_hash()``), the report type,
+team filter, title and renderer backend, and a hash of the templates and CSS.
+A re-upload of identical data, or the same report asked for by another coach,
+is served from disk without extracting or rendering anything; any change to
+the data or to a template yields a new key, so stale entries are never read,
+only evicted.
+
+The cache is bounded by total size (MM_REPORT_CACHE_MAX_MB, default 256):
+after a write, least recently used entries are removed until it fits.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import IO
+
+from .render_assets import TEMPLATE_DIR
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "MM_REPORT_CACHE_DIR"
+MAX_MB_ENV = "MM_REPORT_CACHE_MAX_MB"
+DEFAULT_MAX_MB = 256
+
+# template dir -> (file stats, hash)
+_template_hashes: dict[str, tuple[tuple, str]] = {}
+
+
+def template_hash(template_dir: str = TEMPLATE_DIR) -> str:
+    """Hash of every template and stylesheet; recomputed only when a file's size or mtime changes."""
+    stats = tuple(
+        (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in sorted(os.scandir(template_dir), key=lambda e: e.name)
+        if entry.is_file()
+    )
+    cached = _template_hashes.get(template_dir)
+    if cached is None or cached[0] != stats:
+        h = hashlib.sha1()
+        for name, _, _ in stats:
+            h.update(name.encode() + b"\0")
+            with open(os.path.join(template_dir, name), "rb") as f:
+                h.update(f.read())
+        cached = (stats, h.hexdigest())
+        _template_hashes[template_dir] = cached
+    return cached[1]
+
+
+class ReportCache:
+    def __init__(self, cache_dir: str | None = None, max_bytes: int | None = None):
+        self.cache_dir = (
+            cache_dir or os.environ.get(CACHE_DIR_ENV) or os.path.join(tempfile.gettempdir(), "mm_report_cache")
+        )
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(MAX_MB_ENV, DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        dataset_hash: str, report_type: str, team_filter: str | None, title: str | None, backend: str | None = None
+    ) -> str:
+        parts = [dataset_hash, report_type, team_filter or "", title or "", backend or "", template_hash()]
+        return hashlib.sha1(json.dumps(parts).encode()).hexdigest()
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.bin")
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entry(key)
+        try:
+            with open(entry, "rb") as f:
+                content = f.read()
+            # mtime doubles as the last-used time for eviction
+            os.utime(entry)
+        except OSError:
+            return None
+        return content
+
+    def open(self, key: str) -> "CacheEntryWriter":
+        """A writer for an entry whose content arrives in pieces; it appears only once committed."""
+        return CacheEntryWriter(self, key)
+
+    def put(self, key: str, content: bytes):
+        writer = self.open(key)
+        writer.write(content)
+        writer.commit()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in ``max_bytes``."""
+        with self._lock:
+            try:
+                entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith(".bin")]
+            except OSError:
+                return
+            stats = []
+            for entry in entries:
+                try:
+                    stats.append((entry.stat().st_mtime_ns, entry.stat().st_size, entry.path))
+                except OSError:
+                    continue
+            total = sum(size for _, size, _ in stats)
+            for _, size, path in sorted(stats):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    continue
+
+
+class CacheEntryWriter:
+    """Writes a cache entry to a temp file; ``commit`` moves it into place, ``discard`` drops it."""
+
+    def __init__(self, cache: ReportCache, key: str):
+        self.cache = cache
+        self.entry = cache._entry(key)
+        self.tmp = f"{self.entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self.size = 0
+        self._file: IO[bytes] | None = None
+        try:
+            os.makedirs(cache.cache_dir, exist_ok=True)
+            self._file = open(self.tmp, "wb")
+        except OSError as e:
+            logger.warning(f"Could not write report cache: {e}")
+
+    def write(self, data: bytes):
+        if self._file is None:
+            return
+        self.size += len(data)
+        if self.size > self.cache.max_bytes:
+            # Too big to ever fit; stop writing
+            self.discard()
+            return
+        try:
+            self._file.write(data)
+        except OSError as e:
+            logger.warning(f"Could not write report cache: {e}")
+            self.discard()
+
+    def commit(self):
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+            self._file = None
+            os.replace(self.tmp, self.entry)
+        except OSError as e:
+            logger.warning(f"Could not write report cache: {e}")
+            self.discard()
+            return
+        self.cache.evict()
+
+    def discard(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            os.remove(self.tmp)
+        except OSError:
+            pass
@@ -0,0 +1,187 @@
+"""
+Reports generated in the background.
+
+GenerateReport renders while the client waits, and a big meet can outlast the
+client's deadline, wasting the work when it gives up. A job is submitted
+instead (``ReportJobQueue.submit`` returns at once), its state and progress
+(events extracted, pages laid out) are polled, and the finished file is
+fetched afterwards.
+
+Jobs wait in a priority queue, high before normal before low and first come
+first served within a priority. At most MM_REPORT_JOB_WORKERS run at once,
+and with MM_REPORT_JOB_QUEUE jobs waiting further submissions are refused
+with ReportJobQueueFullError. Finished jobs and their files are kept for
+MM_REPORT_JOB_TTL seconds.
+"""
+
+import heapq
+import io
+import itertools
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from .env import env_number
+from .extractor import ReportDataExtractor
+from .report_batch import CONTENT_TYPES, REPORT_TYPES, ReportSpec, cache_key, extract, render_to, report_filename
+from .report_cache import ReportCache
+
+logger = logging.getLogger(__name__)
+
+# Jobs running at once
+WORKERS_ENV = "MM_REPORT_JOB_WORKERS"
+DEFAULT_WORKERS = 2
+# Jobs allowed to wait for a worker
+QUEUE_ENV = "MM_REPORT_JOB_QUEUE"
+DEFAULT_QUEUE = 32
+# Seconds a finished job, with its file, stays fetchable
+TTL_ENV = "MM_REPORT_JOB_TTL"
+DEFAULT_TTL = 900.0
+
+# Priority -> run order (lowest first)
+PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class ReportJobQueueFullError(RuntimeError):
+    pass
+
+
+@dataclass
+class ReportJob:
+    id: str
+    spec: ReportSpec
+    priority: str
+    filename: str
+    # The dataset as it was at submission (MmToJsonConverter.snapshot()); dropped once the job finishes
+    snapshot: Any = field(default=None, repr=False)
+    state: str = QUEUED
+    events_processed: int = 0
+    events_total: int = 0
+    pages: int = 0
+    content: bytes = field(default=b"", repr=False)
+    error: str | None = None
+    finished: float | None = None
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[os.path.splitext(self.filename)[1]]
+
+
+class ReportJobQueue:
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_queue: int | None = None,
+        ttl: float | None = None,
+        cache: ReportCache | None = None,
+    ):
+        self.workers = max(1, workers if workers is not None else env_number(WORKERS_ENV, DEFAULT_WORKERS, int))
+        self.max_queue = max_queue if max_queue is not None else env_number(QUEUE_ENV, DEFAULT_QUEUE, int)
+        self.ttl = ttl if ttl is not None else env_number(TTL_ENV, DEFAULT_TTL, float)
+        self.cache = cache
+        self._jobs: dict[str, ReportJob] = {}
+        # (run order, submission order, job id)
+        self._queue: list[tuple[int, int, str]] = []
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+
+    def submit(self, converter, spec: ReportSpec, priority: str = "normal") -> ReportJob:
+        """Queues ``spec`` for rendering from ``converter``; raises ReportJobQueueFullError if the queue is full.
+
+        The job renders, and is cached under, a snapshot of ``converter`` taken
+        now, whatever is loaded by the time it runs.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority} (expected one of {', '.join(PRIORITIES)})")
+        with self._cond:
+            self._prune()
+            if len(self._queue) >= self.max_queue:
+                raise ReportJobQueueFullError(f"Report queue is full ({len(self._queue)} jobs waiting)")
+            job = ReportJob(uuid.uuid4().hex, spec, priority, report_filename(spec), converter.snapshot())
+            self._jobs[job.id] = job
+            heapq.heappush(self._queue, (PRIORITIES[priority], next(self._order), job.id))
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"report-job-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return job
+
+    def get(self, job_id: str) -> ReportJob | None:
+        with self._cond:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def position(self, job: ReportJob) -> int:
+        """Number of queued jobs that will start before ``job``; 0 once it has started."""
+        with self._cond:
+            ahead = [entry for entry in self._queue if entry[2] == job.id]
+            return sum(1 for entry in self._queue if entry < ahead[0]) if ahead else 0
+
+    def shutdown(self):
+        """Stops the workers once their current jobs finish; queued jobs are not run."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _prune(self):
+        cutoff = time.monotonic() - self.ttl
+        for job_id in [j.id for j in self._jobs.values() if j.finished is not None and j.finished < cutoff]:
+            del self._jobs[job_id]
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                job = self._jobs[heapq.heappop(self._queue)[2]]
+                job.state = RUNNING
+            try:
+                content, error = self._generate(job), None
+            except Exception as e:
+                logger.debug(f"Report job {job.id} ({job.spec}) failed", exc_info=True)
+                content, error = b"", f"{type(e).__name__}: {e}"
+            with self._cond:
+                job.content, job.error = content, error
+                job.state = FAILED if error else DONE
+                job.finished = time.monotonic()
+                job.snapshot = None
+            logger.info(f"{'FAILED' if error else 'ok'} job {job.id} {job.filename}")
+
+    def _generate(self, job: ReportJob) -> bytes:
+        spec = job.spec
+        key = None
+        if self.cache is not None and spec.type in REPORT_TYPES:
+            key = cache_key(self.cache, job.snapshot, spec)
+            content = self.cache.get(key)
+            if content is not None:
+                return content
+
+        def on_progress(done: int, total: int):
+            job.events_processed, job.events_total = done, total
+
+        def on_pages(pages: int):
+            # Chunks of one program finish on separate threads
+            with self._cond:
+                job.pages += pages
+
+        data = extract(ReportDataExtractor(job.snapshot, on_progress), spec, {})
+        output = io.BytesIO()
+        render_to(data, spec, output, on_pages)
+        content = output.getvalue()
+        if self.cache is not None and key is not None:
+            self.cache.put(key, content)
+        return content
@@ -1,17 +1,52 @@
-import datetime
 import os
 import sys
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any
 
-from jinja2 import Environment, FileSystemLoader
 from weasyprint import HTML
 
+from . import pdf_merge
+from .render_assets import get_assets
+from .render_pool import RenderPool
+
+# Programs with more entry rows than this are split across the pool's workers
+CHUNK_MIN_ROWS = 1500
+# Chunks are laid out without the page footer; pdf_merge stamps the merged numbers instead
+CHUNK_CSS = "@page { @bottom-right { content: none; } }"
+
+
+def split_groups(groups: list[dict[str, Any]], chunks: int) -> list[list[dict[str, Any]]]:
+    """Split event groups into at most ``chunks`` consecutive runs of about equally many rows."""
+    weights = [1 + sum(1 + len(heat.get("sub_items", [])) for heat in group.get("heats", [])) for group in groups]
+    target = sum(weights) / max(1, chunks)
+    runs: list[list[dict[str, Any]]] = [[]]
+    filled = 0
+    for group, weight in zip(groups, weights, strict=True):
+        if runs[-1] and filled >= target * len(runs) and len(runs) < chunks:
+            runs.append([])
+        runs[-1].append(group)
+        filled += weight
+    return runs
+
 
 class WeasyRenderer:
-    def __init__(self, output_path: str):
-        self.output_path = output_path
-        self.template_dir = os.path.join(os.path.dirname(__file__), "templates")
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
+    def __init__(
+        self,
+        output: str | IO[bytes],
+        pool: RenderPool | None = None,
+        on_pages: Callable[[int], None] | None = None,
+    ):
+        # A file path, or a binary stream (e.g. BytesIO) that receives the PDF without touching disk
+        self.output = output
+        # With a pool, PDF layout runs in its worker processes instead of this thread
+        self.pool = pool
+        # Called with the number of pages each finished layout (or program chunk) produced
+        self.on_pages = on_pages
+        # Templates, stylesheet and fonts are shared by every renderer in the process
+        self.assets = get_assets()
+        self.template_dir = self.assets.template_dir
+        self.env = self.assets.env
 
         # Ensure macOS libraries are found if running locally
         if os.name == "posix" and "darwin" in sys.platform:
@@ -20,49 +55,90 @@ class WeasyRenderer:
                     "DYLD_FALLBACK_LIBRARY_PATH", ""
                 )
 
-    def render_meet_program(self, data: dict[str, Any]):
+    def _emit(self, pdf: bytes):
+        if isinstance(self.output, str):
+            with open(self.output, "wb") as f:
+                f.write(pdf)
+        else:
+            self.output.write(pdf)
+
+    def _laid_out(self, pages: int):
+        if self.on_pages is not None:
+            self.on_pages(pages)
+
+    def _pool_pdf(self, pool: RenderPool, html: str) -> bytes:
+        pdf = pool.render_pdf(html)
+        if self.on_pages is not None and pdf_merge.available():
+            self._laid_out(pdf_merge.page_count(pdf))
+        return pdf
+
+    def _write_pdf(self, html: str):
+        if self.pool is not None:
+            self._emit(self._pool_pdf(self.pool, html))
+            return
+        # HTML.write_pdf is render() + write_pdf(); split here to learn the page count
+        font_config = self.assets.font_config()
+        if font_config is None:
+            document = HTML(string=html).render()
+        else:
+            document = HTML(string=html).render(font_config=font_config)
+        self._laid_out(len(document.pages))
+        # write_pdf takes a path or a file object
+        document.write_pdf(self.output)
+
+    def _program_chunks(self, data: dict[str, Any], chunks: int | None) -> int:
+        if self.pool is None or not pdf_merge.available():
+            return 1
+        if chunks is None:
+            rows = sum(len(heat.get("sub_items", [])) for group in data["groups"] for heat in group.get("heats", []))
+            chunks = self.pool.max_workers if rows > CHUNK_MIN_ROWS else 1
+        return max(1, min(chunks, len(data["groups"])))
+
+    def render_meet_program(self, data: dict[str, Any], chunks: int | None = None):
+        """Render the meet program PDF.
+
+        With a pool, a large program (or any program, given ``chunks`` > 1) is
+        split at event boundaries and the chunks are laid out in parallel, then
+        merged with continuous page numbers; each chunk starts on a new page.
+        """
         template = self.env.get_template("meet_program.html")
+        self.assets.add_page_metadata(data)
 
-        # Load CSS
-        css_path = os.path.join(self.template_dir, "report_style.css")
-        with open(css_path) as f:
-            css_content = f.read()
-
-        # Add metadata
-        data["css_content"] = css_content
-        data["generation_time"] = datetime.datetime.now().strftime("%I:%M %p %m/%d/%Y")
+        chunks = self._program_chunks(data, chunks)
+        if chunks > 1 and self.pool is not None:
+            return self._render_program_chunks(template, data, chunks, self.pool)
 
         # Render HTML
         html_out = template.render(**data)
 
         # Convert to PDF
-        HTML(string=html_out).write_pdf(self.output_path)
+        self._write_pdf(html_out)
 
         return html_out
 
+    def _render_program_chunks(self, template, data: dict[str, Any], chunks: int, pool: RenderPool) -> str:
+        # The meet header only opens the first chunk
+        htmls = [
+            template.render(
+                **dict(data, groups=groups, continuation=i > 0, css_content=data["css_content"] + CHUNK_CSS)
+            )
+            for i, groups in enumerate(split_groups(data["groups"], chunks))
+        ]
+        with ThreadPoolExecutor(len(htmls)) as executor:
+            pdfs = list(executor.map(lambda html: self._pool_pdf(pool, html), htmls))
+        self._emit(pdf_merge.merge_pdfs(pdfs))
+        return "\n".join(htmls)
+
     def render_entries(self, data: dict[str, Any], template_name: str):
         template = self.env.get_template(template_name)
-
-        css_path = os.path.join(self.template_dir, "report_style.css")
-        with open(css_path) as f:
-            css_content = f.read()
-
-        data["css_content"] = css_content
-        data["generation_time"] = datetime.datetime.now().strftime("%I:%M %p %m/%d/%Y")
+        self.assets.add_page_metadata(data)
 
         html_out = template.render(**data)
-        HTML(string=html_out).write_pdf(self.output_path)
+        self._write_pdf(html_out)
         return html_out
 
     def render_to_html(self, data: dict[str, Any]) -> str:
         """Returns the raw HTML for Web UI integration."""
         template = self.env.get_template("meet_program.html")
-
-        css_path = os.path.join(self.template_dir, "report_style.css")
-        with open(css_path) as f:
-            css_content = f.read()
-
-        data["css_content"] = css_content
-        data["generation_time"] = datetime.datetime.now().strftime("%I:%M %p %m/%d/%Y")
-
+        self.assets.add_page_metadata(data)
         return template.render(**data)
@@ -0,0 +1,420 @@
+"""Canonical, typed view of a Meet Manager dataset.
+
+Meet Manager databases come in two layouts. Schema A (``Event``, ``Entry``,
+``Athlete``...) keys rows by ``*_no``/``*_ptr`` columns; Schema B (``MTEVENT``,
+``ENTRY``, ``ATHLETE``...) uses ``MtEvent``/``Athlete``/``Team`` and a numeric
+stroke code. Depending on the ingestion backend every value may also arrive as
+an mdb-export string, a native Python value or a typed pandas column.
+
+``normalize()`` maps any of those onto one set of DataFrames with snake_case
+columns, integer keys (0 when missing), float times (NaN when missing), parsed
+dates and upper-case enum codes, so callers never need table or column
+fallbacks or per-row string parsing.
+"""
+
+import datetime
+import logging
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+INT = "int"
+FLOAT = "float"
+TEXT = "text"
+CODE = "code"
+DATE = "date"
+CLOCK = "clock"
+
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%d-%b-%y")
+
+# Schema B stores strokes as numbers; Schema A (and everything downstream) uses letters
+STROKE_CODES = {"1": "A", "2": "B", "3": "C", "4": "D", "5": "E"}
+
+
+@dataclass(frozen=True)
+class Column:
+    kind: str
+    sources: tuple[str, ...]
+    default: Any = None
+
+
+def _col(kind, *sources, default=None):
+    return Column(kind, sources, default)
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    physical: tuple[str, ...]
+    columns: dict[str, Column]
+    derive: Callable[[pd.DataFrame, pd.DataFrame], None] | None = None
+
+
+def _parse_lo_hi(value):
+    # Schema B packs the age range into one number: 8 -> 0-8, 78 -> 7-8, 910 -> 9-10, 1112 -> 11-12
+    if value <= 0:
+        return 0, 109
+    if value < 10:
+        return 0, value
+    s = str(value)
+    if len(s) == 2:
+        return int(s[0]), int(s[1])
+    if len(s) == 3:
+        return int(s[0]), int(s[1:])
+    if len(s) == 4:
+        return int(s[:2]), int(s[2:])
+    return 0, 109
+
+
+def _derive_event(out, raw):
+    out["stroke"] = out["stroke"].replace(STROKE_CODES)
+    out["is_relay"] = out["ind_rel"] == "R"
+    if "lo_hi" in out and out["lo_hi"].any():
+        packed = out["lo_hi"] > 0
+        ages = [_parse_lo_hi(v) for v in out.loc[packed, "lo_hi"]]
+        out.loc[packed, "low_age"] = [lo for lo, _ in ages]
+        out.loc[packed, "high_age"] = [hi for _, hi in ages]
+    out.drop(columns=["lo_hi"], inplace=True)
+
+
+def _derive_times(out, raw):
+    # Schema B keeps a single ``Score`` column; values over 200 are hundredths of a second
+    if "score" in out:
+        score = out.pop("score")
+        scaled = score.where(score <= 200, score / 100.0)
+        out["seed_time"] = out["seed_time"].fillna(scaled.where(scaled > 0))
+
+
+def _derive_team(out, raw):
+    fallback = (out["abbr"] + "-" + out["lsc"]).str.strip("-")
+    out["name"] = out["name"].where(out["name"] != "", out["short"].where(out["short"] != "", fallback))
+
+
+TABLES: dict[str, TableSpec] = {
+    "meet": TableSpec(
+        ("Meet", "MEET"),
+        {
+            "name": _col(TEXT, "Meet_name1", "Meet_name", "MName", "Meet"),
+            "location": _col(TEXT, "Meet_location", "Location"),
+            "start": _col(DATE, "Meet_start", "Start", "Start_date"),
+            "end": _col(DATE, "Meet_end", "End", "End_date"),
+            "meet_class": _col(INT, "Meet_class"),
+            "num_lanes": _col(INT, "Meet_numlanes"),
+        },
+    ),
+    "team": TableSpec(
+        ("Team", "TEAM"),
+        {
+            "team_no": _col(INT, "Team_no", "Team"),
+            "name": _col(TEXT, "Team_name"),
+            "short": _col(TEXT, "Team_short", "Short"),
+            "abbr": _col(TEXT, "Team_abbr", "TCode"),
+            "lsc": _col(TEXT, "Team_lsc", "LSC"),
+            "city": _col(TEXT, "Team_city"),
+            "state": _col(TEXT, "Team_statenew"),
+        },
+        _derive_team,
+    ),
+    "athlete": TableSpec(
+        ("Athlete", "ATHLETE"),
+        {
+            "ath_no": _col(INT, "Ath_no", "Athlete"),
+            "first_name": _col(TEXT, "First_name", "First"),
+            "last_name": _col(TEXT, "Last_name", "Last"),
+            "sex": _col(CODE, "Ath_Sex", "Sex"),
+            "age": _col(INT, "Ath_age", "Age"),
+            "birth_date": _col(DATE, "Birth_date", "Ath_birthdate"),
+            "team_no": _col(INT, "Team_no", "Team1"),
+            "school_year": _col(TEXT, "Schl_yr", "School_yr", "Class"),
+            "reg_no": _col(TEXT, "Reg_no"),
+            "div_no": _col(INT, "Div_no"),
+        },
+    ),
+    "event": TableSpec(
+        ("Event", "MTEVENT"),
+        {
+            "event_no": _col(INT, "Event_no", "MtEvent"),
+            "event_ptr": _col(INT, "Event_ptr", "MtEvent", "Event_no"),
+            "ind_rel": _col(CODE, "Ind_rel", "I_R", default="I"),
+            "sex": _col(CODE, "Event_sex", "Sex"),
+            "gender": _col(CODE, "Event_gender", "Sex"),
+            "distance": _col(INT, "Event_dist", "Distance"),
+            "stroke": _col(CODE, "Event_stroke", "Stroke"),
+            "low_age": _col(INT, "Low_age"),
+            "high_age": _col(INT, "High_Age", "High_age"),
+            "lo_hi": _col(INT, "Lo_Hi"),
+            "sess_no": _col(INT, "Sess_no", "Session"),
+            "div_no": _col(INT, "Div_no"),
+            "division": _col(TEXT, "Division"),
+            "rounds": _col(INT, "Event_rounds", default=1),
+            "num_prelanes": _col(INT, "Num_prelanes"),
+            "num_finlanes": _col(INT, "Num_finlanes"),
+        },
+        _derive_event,
+    ),
+    "entry": TableSpec(
+        ("Entry", "ENTRY"),
+        {
+            "entry_no": _col(INT, "Entry_no"),
+            "event_ptr": _col(INT, "Event_ptr", "MtEvent"),
+            "ath_no": _col(INT, "Ath_no", "Athlete"),
+            "seed_time": _col(FLOAT, "ActualSeed_time", "ConvSeed_time", "Seed_Time"),
+            "score": _col(FLOAT, "Score"),
+            "pre_time": _col(FLOAT, "Pre_Time"),
+            "pre_heat": _col(INT, "Pre_heat"),
+            "pre_lane": _col(INT, "Pre_lane"),
+            "pre_place": _col(INT, "Pre_place"),
+            "pre_stat": _col(CODE, "Pre_stat"),
+            "final_time": _col(FLOAT, "Fin_Time"),
+            "heat": _col(INT, "Fin_heat", "Pre_heat", "HEAT"),
+            "lane": _col(INT, "Fin_lane", "Pre_lane", "LANE"),
+            "place": _col(INT, "Fin_place", "Place"),
+            "fin_stat": _col(CODE, "Fin_stat"),
+            "ev_score": _col(FLOAT, "Ev_score"),
+            "div_no": _col(INT, "Div_no"),
+        },
+        _derive_times,
+    ),
+    "relay": TableSpec(
+        ("Relay", "RELAY"),
+        {
+            "relay_no": _col(INT, "Relay_no"),
+            "event_ptr": _col(INT, "Event_ptr", "MtEvent"),
+            "team_no": _col(INT, "Team_no", "Team_ptr", "Team"),
+            "team_ltr": _col(CODE, "Team_ltr", "RelayLtr"),
+            "sex": _col(CODE, "Rel_sex"),
+            "seed_time": _col(FLOAT, "ActualSeed_time", "ConvSeed_time", "Seed_Time"),
+            "score": _col(FLOAT, "Score"),
+            "pre_time": _col(FLOAT, "Pre_Time"),
+            "pre_heat": _col(INT, "Pre_heat"),
+            "pre_lane": _col(INT, "Pre_lane"),
+            "pre_place": _col(INT, "Pre_place"),
+            "pre_stat": _col(CODE, "Pre_stat"),
+            "final_time": _col(FLOAT, "Fin_Time"),
+            "heat": _col(INT, "Fin_heat", "HEAT"),
+            "lane": _col(INT, "Fin_lane", "LANE"),
+            "place": _col(INT, "Fin_place", "Place"),
+            "fin_stat": _col(CODE, "Fin_stat"),
+            "ev_score": _col(FLOAT, "Ev_score"),
+            "div_no": _col(INT, "Div_no"),
+        },
+        _derive_times,
+    ),
+    "relay_names": TableSpec(
+        ("RelayNames", "RELAYNAMES"),
+        {
+            "relay_no": _col(INT, "Relay_no"),
+            "event_ptr": _col(INT, "Event_ptr", "MtEvent"),
+            "team_no": _col(INT, "Team_no", "Team"),
+            "team_ltr": _col(CODE, "Team_ltr", "RelayLtr"),
+            "event_round": _col(CODE, "Event_round"),
+            "ath_no": _col(INT, "Ath_no", "Athlete"),
+            "pos_no": _col(INT, "Pos_no"),
+        },
+    ),
+    "session": TableSpec(
+        ("Session", "SESSIONS"),
+        {
+            "sess_no": _col(INT, "Sess_no", "SESSION"),
+            "sess_ptr": _col(INT, "Sess_ptr", "SESSION"),
+            "name": _col(TEXT, "Sess_name"),
+            "day": _col(INT, "Sess_day", "DAY", default=1),
+            "date": _col(DATE, "Sess_date"),
+            "start_time": _col(CLOCK, "Sess_starttime", "STARTTIME", default=0),
+            "warmup_time": _col(CLOCK, "Sess_warmup", default=0),
+            "event_count": _col(INT, "Event_cnt"),
+        },
+    ),
+    "session_item": TableSpec(
+        ("Sessitem", "SESSITEM"),
+        {
+            "sess_ptr": _col(INT, "Sess_ptr"),
+            "event_ptr": _col(INT, "Event_ptr"),
+            "order": _col(INT, "Sess_order"),
+            "round": _col(CODE, "Sess_rnd", default="F"),
+        },
+    ),
+    "scoring": TableSpec(
+        ("Scoring", "SCORING"),
+        {
+            "div_no": _col(INT, "score_divno"),
+            "sex": _col(CODE, "score_sex", default="M"),
+            "place": _col(INT, "score_place"),
+            "ind_score": _col(FLOAT, "ind_score", default=0.0),
+            "rel_score": _col(FLOAT, "rel_score", default=0.0),
+        },
+    ),
+    "division": TableSpec(
+        ("Divisions", "DIVISIONS"),
+        {
+            "div_no": _col(INT, "Div_no"),
+            "name": _col(TEXT, "Div_name"),
+        },
+    ),
+}
+
+# Every physical table name either schema may use, for callers that fetch raw tables one by one
+SOURCE_TABLES = [name for spec in TABLES.values() for name in spec.physical]
+
+
+def _is_blank(series):
+    if series.dtype == object:
+        return series.isna() | (series.astype(str).str.strip() == "")
+    return series.isna()
+
+
+def _numeric(series):
+    if series.dtype == bool:
+        return series.astype(float)
+    if series.dtype == object:
+        series = series.map(lambda v: v.strip() if isinstance(v, str) else v)
+    return pd.to_numeric(series, errors="coerce").astype(float)
+
+
+def _text(series):
+    def clean(v):
+        if v is None or (isinstance(v, float) and np.isnan(v)) or v is pd.NaT:
+            return ""
+        if isinstance(v, float) and v.is_integer():
+            return str(int(v))
+        return str(v).strip()
+
+    return series.map(clean).astype(object)
+
+
+def _dates(series):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return pd.to_datetime(series)
+    result = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+    is_str = series.map(lambda v: isinstance(v, str))
+    native = series[~is_str & series.notna()]
+    if not native.empty:
+        result[native.index] = pd.to_datetime(native, errors="coerce")
+    text = series[is_str].str.strip().str.split(r"[ T]", n=1, regex=True).str[0]
+    for fmt in DATE_FORMATS:
+        pending = text[result[text.index].isna()]
+        if pending.empty:
+            break
+        result[pending.index] = pd.to_datetime(pending, format=fmt, errors="coerce")
+    return result
+
+
+def _clock(series):
+    # Seconds after midnight; Schema B sometimes stores "HH:MM" text instead
+    seconds = _numeric(series)
+    if series.dtype == object:
+        hhmm = series[seconds.isna()].dropna().astype(str).str.extract(r"^\s*(\d{1,2}):(\d{2})")
+        parsed = hhmm.dropna().astype(int)
+        seconds[parsed.index] = parsed[0] * 3600 + parsed[1] * 60
+    return seconds
+
+
+def _convert(series, column):
+    if column.kind == INT:
+        return _numeric(series).fillna(column.default or 0).astype(np.int64)
+    if column.kind in (FLOAT, CLOCK):
+        values = _numeric(series) if column.kind == FLOAT else _clock(series)
+        return values if column.default is None else values.fillna(column.default)
+    if column.kind == DATE:
+        return _dates(series)
+    values = _text(series)
+    if column.kind == CODE:
+        values = values.str.upper()
+    if column.default is not None:
+        values = values.where(values != "", column.default)
+    return values
+
+
+def _empty(column, index):
+    if column.kind == INT:
+        return pd.Series(column.default or 0, index=index, dtype=np.int64)
+    if column.kind in (FLOAT, CLOCK):
+        value = np.nan if column.default is None else column.default
+        return pd.Series(value, index=index, dtype=float)
+    if column.kind == DATE:
+        return pd.Series(pd.NaT, index=index, dtype="datetime64[ns]")
+    return pd.Series(column.default or "", index=index, dtype=object)
+
+
+def normalize_table(raw, spec: TableSpec) -> pd.DataFrame:
+    """Map one physical table (records or DataFrame, either schema) onto its canonical columns."""
+    df = raw if isinstance(raw, pd.DataFrame) else pd.DataFrame(list(raw))
+    df = df.reset_index(drop=True)
+    lookup = {str(c).lower(): c for c in df.columns}
+
+    out = pd.DataFrame(index=df.index)
+    for name, column in spec.columns.items():
+        # Coalesce every source column present, first non-blank wins
+        merged = None
+        for source in column.sources:
+            actual = lookup.get(source.lower())
+            if actual is None:
+                continue
+            series = df[actual]
+            merged = series if merged is None else merged.where(~_is_blank(merged), series)
+        out[name] = _empty(column, df.index) if merged is None else _convert(merged, column)
+
+    if spec.derive is not None:
+        spec.derive(out, df)
+    return out
+
+
+def _find(tables: Mapping[str, Any], physical):
+    # First non-empty match wins, so an empty Schema A table does not hide its Schema B twin
+    wanted = [c.lower() for c in physical]
+    found = [tables[k] for c in wanted for k in tables if str(k).lower() == c]
+    for raw in found:
+        if raw is not None and len(raw):
+            return raw
+    return found[0] if found else None
+
+
+@dataclass
+class CanonicalMeet:
+    """Normalized tables for one dataset, keyed by canonical table name (see ``TABLES``)."""
+
+    schema_type: str = "A"
+    tables: dict[str, pd.DataFrame] = field(default_factory=dict)
+    _records: dict[str, list[dict[Any, Any]]] = field(default_factory=dict, repr=False)
+
+    def __getitem__(self, name) -> pd.DataFrame:
+        return self.tables[name]
+
+    def records(self, name) -> list[dict[Any, Any]]:
+        """Rows of a canonical table as plain dicts, built once per table."""
+        if name not in self._records:
+            df = self.tables[name]
+            rows = df.astype(object).where(df.notna(), None).to_dict("records")
+            self._records[name] = rows
+        return self._records[name]
+
+    def lookup(self, name, key) -> dict[Any, dict[Any, Any]]:
+        """Map ``key`` -> row dict for a canonical table (last row wins on duplicates)."""
+        return {row[key]: row for row in self.records(name)}
+
+    def meet_start(self) -> datetime.datetime | None:
+        meet = self.tables["meet"]
+        if meet.empty or pd.isna(meet["start"].iloc[0]):
+            return None
+        return meet["start"].iloc[0].to_pydatetime()
+
+
+def normalize(tables: Mapping[str, Any]) -> CanonicalMeet:
+    """Build a ``CanonicalMeet`` from raw tables keyed by physical name (either schema)."""
+    mtevent = _find(tables, ("MTEVENT",))
+    schema_type = "B" if mtevent is not None and len(mtevent) else "A"
+    result = CanonicalMeet(schema_type=schema_type)
+    for name, spec in TABLES.items():
+        raw = _find(tables, spec.physical)
+        if raw is None:
+            raw = []
+        try:
+            result.tables[name] = normalize_table(raw, spec)
+        except Exception as e:
+            logger.warning(f"Could not normalize {name} table: {e}")
+            result.tables[name] = normalize_table([], spec)
+    return result
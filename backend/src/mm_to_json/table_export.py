@@ -0,0 +1,136 @@
+"""Per-table export of raw Meet Manager tables as Parquet, Arrow IPC or NDJSON.
+
+One file per table (``<dir>/<Table>.<ext>``), so a reader can load only the
+tables it needs:
+
+- ``parquet``: typed columns, zstd-compressed by default; the compact choice
+  for archiving and analytics.
+- ``arrow``: Arrow IPC file format, uncompressed by default so it can be
+  memory-mapped and read without copying (pass a compression to trade that
+  for size).
+- ``ndjson``: one JSON object per row, written in chunks so a table is never
+  rendered as one string; for tools that need text.
+
+Parquet and Arrow need pyarrow; NDJSON does not.
+"""
+
+import json
+import logging
+import os
+
+import pandas as pd
+
+from .json_writer import dumps
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow", "ndjson": ".ndjson"}
+DEFAULT_COMPRESSION = {"parquet": "zstd", "arrow": None}
+NDJSON_CHUNK_ROWS = 10_000
+
+
+def _require_pyarrow(fmt: str):
+    if pa is None:
+        raise ImportError(f"pyarrow is required for {fmt} export/import (pip install 'meetmanager-backend[export]')")
+
+
+def _arrow_table(df: pd.DataFrame):
+    """DataFrame -> pyarrow Table, keeping native column types.
+
+    Object columns that mix types (e.g. numbers and text in one mdb column)
+    cannot become one Arrow type and are stored as text instead.
+    """
+    arrays = {}
+    for col in df.columns:
+        try:
+            arrays[str(col)] = pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logger.debug(f"Column {col} has mixed types; exporting it as text")
+            text = [None if pd.isna(v) else str(v) for v in df[col].tolist()]
+            arrays[str(col)] = pa.array(text, type=pa.string())
+    return pa.table(arrays)
+
+
+def _write_ndjson(df: pd.DataFrame, path: str):
+    with open(path, "w") as f:
+        for start in range(0, len(df), NDJSON_CHUNK_ROWS):
+            chunk = df.iloc[start : start + NDJSON_CHUNK_ROWS]
+            # NaN/NaT -> null
+            records = chunk.astype(object).where(chunk.notna(), None).to_dict("records")
+            f.writelines(dumps(record) + "\n" for record in records)
+
+
+def write_table(df: pd.DataFrame, path: str, fmt: str, compression: str | None = None):
+    if fmt == "ndjson":
+        _write_ndjson(df, path)
+        return
+    _require_pyarrow(fmt)
+    table = _arrow_table(df)
+    compression = compression or DEFAULT_COMPRESSION[fmt]
+    if fmt == "parquet":
+        pq.write_table(table, path, compression=compression or "none")
+    elif fmt == "arrow":
+        options = pa_ipc.IpcWriteOptions(compression=compression)
+        with pa.OSFile(path, "wb") as sink, pa_ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {', '.join(FORMATS)})")
+
+
+def export_tables(
+    tables: dict[str, pd.DataFrame], out_dir: str, fmt: str = "parquet", compression: str | None = None
+) -> dict[str, str]:
+    """Write every table to ``out_dir/<name><ext>``; returns {name: path}."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {', '.join(FORMATS)})")
+    os.makedirs(out_dir, exist_ok=True)
+    written = {}
+    for name, df in tables.items():
+        path = os.path.join(out_dir, f"{name}{FORMATS[fmt]}")
+        write_table(df, path, fmt, compression)
+        written[name] = path
+    return written
+
+
+def read_table(path: str) -> pd.DataFrame:
+    """Read one exported table; the format comes from the file extension."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == FORMATS["ndjson"]:
+        if os.path.getsize(path) == 0:
+            return pd.DataFrame()
+        with open(path) as f:
+            return pd.DataFrame.from_records([json.loads(line) for line in f if line.strip()])
+    if ext == FORMATS["parquet"]:
+        _require_pyarrow("parquet")
+        return pq.read_table(path).to_pandas()
+    if ext == FORMATS["arrow"]:
+        _require_pyarrow("arrow")
+        # Memory-mapped: uncompressed buffers are used in place rather than read
+        with pa.memory_map(path) as source:
+            return pa_ipc.open_file(source).read_all().to_pandas()
+    raise ValueError(f"Not an exported table: {path}")
+
+
+def is_export_dir(path: str) -> bool:
+    return os.path.isdir(path) and any(
+        os.path.splitext(name)[1].lower() in FORMATS.values() for name in os.listdir(path)
+    )
+
+
+def read_tables(directory: str, names: list[str] | None = None) -> dict[str, pd.DataFrame]:
+    """Every exported table in ``directory`` (or only ``names``) as DataFrames keyed by table name."""
+    wanted = {n.lower() for n in names} if names is not None else None
+    tables = {}
+    for entry in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(entry)
+        if ext.lower() not in FORMATS.values() or (wanted is not None and name.lower() not in wanted):
+            continue
+        tables[name] = read_table(os.path.join(directory, entry))
+    return tables
@@ -0,0 +1,101 @@
+"""Swim times as integer hundredths of a second, converted a column at a time.
+
+Meet Manager stores times as float seconds (Schema B sometimes as hundredths)
+and the reports show them as ``"31.24"`` / ``"1:05.30"`` or a status code.
+Holding them as int64 hundredths keeps formatting, parsing and sorting exact,
+and the functions here work on whole arrays so callers never format a value
+just to parse it back. ``0`` means "no time" and formats as ``NT``.
+"""
+
+import numpy as np
+import pandas as pd
+
+NO_TIME = "NT"
+# Result codes that replace a time
+STATUS_CODES = ("DQ", "DNF", "DNS", "SCR")
+
+_TIME_PATTERN = r"^(?:(\d+):)?(\d+(?:\.\d*)?)$"
+
+
+def _numbers(values):
+    """Array-like of numbers, numeric strings, None or blanks -> float array (NaN when unusable)."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "fiu":
+        return values.astype(float)
+    return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=float)
+
+
+def to_hundredths(seconds):
+    """Float seconds -> int64 hundredths; missing, NaN and non-positive times become 0 (NT)."""
+    out = np.rint(_numbers(seconds) * 100)
+    out[~(out > 0)] = 0
+    return out.astype(np.int64)
+
+
+def status_codes(values):
+    """Upper-cased status column, with anything that is not a known code as ``""``."""
+    codes = np.array([str(v or "").strip().upper() for v in values], dtype=object)
+    codes[~np.isin(codes, STATUS_CODES)] = ""
+    return codes
+
+
+def format_times(hundredths, statuses=None, min_sec=True):
+    """Hundredths -> display strings.
+
+    ``min_sec`` gives ``"1:05.30"`` / ``"05.30"`` as the reports show swim
+    times; without it the value is plain seconds (``"65.30"``), as used for
+    diving scores. ``0`` is ``NT`` and a status code replaces the time.
+    """
+    values = np.asarray(hundredths, dtype=np.int64)
+    seconds, cents = np.divmod(values, 100)
+    cents_str = np.char.add(".", np.char.zfill(cents.astype(str), 2))
+    if min_sec:
+        minutes, rem = np.divmod(seconds, 60)
+        tail = np.char.add(np.char.zfill(rem.astype(str), 2), cents_str)
+        text = np.where(minutes > 0, np.char.add(np.char.add(minutes.astype(str), ":"), tail), tail)
+    else:
+        text = np.char.add(seconds.astype(str), cents_str)
+
+    out = text.astype(object)
+    out[values <= 0] = NO_TIME
+    if statuses is not None:
+        codes = np.asarray(statuses, dtype=object)
+        for code in STATUS_CODES:
+            out[codes == code] = code
+    return out
+
+
+def parse_times(strings):
+    """Display strings (``"1:05.30"``, ``"65.3"``, ``"NT"``, ``"DQ"``...) -> hundredths, 0 when not a time."""
+    text = pd.Series(strings, dtype=object).astype(str).str.strip()
+    parts = text.str.extract(_TIME_PATTERN)
+    minutes = pd.to_numeric(parts[0], errors="coerce").fillna(0).to_numpy(dtype=float)
+    seconds = pd.to_numeric(parts[1], errors="coerce").to_numpy(dtype=float)
+    return to_hundredths(minutes * 60 + seconds)
+
+
+def sort_keys(strings):
+    """Hundredths for ordering display strings fastest first, with NT and status codes last."""
+    keys = parse_times(strings)
+    keys[keys == 0] = np.iinfo(np.int64).max
+    return keys
+
+
+def format_clock(seconds):
+    """Seconds after midnight -> ``"9:30 AM"``; ``""`` when not a number."""
+    values = _numbers(seconds)
+    valid = np.isfinite(values)
+    total = np.trunc(np.where(valid, values, 0)).astype(np.int64)
+    hours = total // 3600
+    minutes = (total % 3600) // 60
+    period = np.where(hours >= 12, " PM", " AM")
+    hours = np.where(hours > 12, hours - 12, hours)
+    hours = np.where(hours == 0, 12, hours)
+    text = np.char.add(np.char.add(np.char.add(hours.astype(str), ":"), np.char.zfill(minutes.astype(str), 2)), period)
+    out = text.astype(object)
+    out[~valid] = ""
+    return out
+
+
+def format_time(seconds, status="", min_sec=True):
+    """Single-value form of ``format_times`` for float seconds."""
+    return format_times(to_hundredths([seconds]), status_codes([status]), min_sec)[0]
@@ -1,15 +1,15 @@
-import csv
 import datetime
+import hashlib
 import io
 import json
 import logging
 import os
-import subprocess
 import tempfile
 from concurrent import futures
 from typing import Any
 
 import grpc
+import pandas as pd
 
 # Import generated classes
 try:
@@ -22,20 +22,63 @@ except ImportError:
 
     pb2 = typing.cast(Any, None)
     pb2_grpc = typing.cast(Any, None)
+from mm_to_json import table_export, times
+from mm_to_json.dataset_reader import read_dataset
 from mm_to_json.mm_to_json import MmToJsonConverter
-from mm_to_json.reporting.extractor import ReportDataExtractor
-from mm_to_json.reporting.weasy_renderer import WeasyRenderer
+from mm_to_json.reporting import report_batch, report_jobs
+from mm_to_json.reporting.report_cache import ReportCache
+from mm_to_json.schema import SOURCE_TABLES, CanonicalMeet, normalize
 
 # Defines where the source JSON data lives
 DATA_DIR = "../data"
 SOURCE_FILE = "Sample_Data.json"
 CONFIG_FILE = "config.json"
 
+# ReportType -> report_batch.REPORT_TYPES key
+REPORT_TYPE_NAMES = (
+    {
+        pb2.REPORT_TYPE_PSYCH_UNSPECIFIED: "psych",
+        pb2.REPORT_TYPE_ENTRIES: "entries",
+        pb2.REPORT_TYPE_LINEUPS: "lineups",
+        pb2.REPORT_TYPE_RESULTS: "results",
+        pb2.REPORT_TYPE_MEET_PROGRAM: "program",
+        pb2.REPORT_TYPE_MEET_PROGRAM_HTML: "program_html",
+        pb2.REPORT_TYPE_ENTRIES_HYTEK: "entries_hytek",
+        pb2.REPORT_TYPE_ENTRIES_CLUB: "entries_club",
+    }
+    if pb2 is not None
+    else {}
+)
+# ReportJobPriority -> report_jobs.PRIORITIES key
+REPORT_JOB_PRIORITY_NAMES = (
+    {
+        pb2.REPORT_JOB_PRIORITY_NORMAL_UNSPECIFIED: "normal",
+        pb2.REPORT_JOB_PRIORITY_LOW: "low",
+        pb2.REPORT_JOB_PRIORITY_HIGH: "high",
+    }
+    if pb2 is not None
+    else {}
+)
+# report_jobs state -> ReportJobState
+REPORT_JOB_STATES = (
+    {
+        report_jobs.QUEUED: pb2.REPORT_JOB_STATE_QUEUED,
+        report_jobs.RUNNING: pb2.REPORT_JOB_STATE_RUNNING,
+        report_jobs.DONE: pb2.REPORT_JOB_STATE_DONE,
+        report_jobs.FAILED: pb2.REPORT_JOB_STATE_FAILED,
+    }
+    if pb2 is not None
+    else {}
+)
+
 
 class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
     def __init__(self):
         self._data_cache: Any = None
-        self._scoring_map: dict[str, dict[str, dict[int, dict[str, float]]]] | None = None
+        self._scoring_map: dict[int, dict[str, dict[int, dict[str, float]]]] | None = None
+        self._canonical_meet: CanonicalMeet | None = None
+        self._canonical_source: Any = None
+        self._report_converter: tuple[Any, str | None, MmToJsonConverter] | None = None
         self.current_file = SOURCE_FILE
         self._load_data()
         self._load_config()
@@ -70,15 +113,18 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
         if self.current_file.endswith(".mdb"):
             print(f"Loading MDB dataset from {self.current_file}...")
             self._data_cache = self._load_mdb(path)
+        elif table_export.is_export_dir(path):
+            # Tables exported by `mm_to_json --format parquet|arrow|ndjson`, kept as
+            # typed DataFrames: normalize() and the converter read them directly
+            self._data_cache = table_export.read_tables(path)
+            print(f"Loaded exported tables from {self.current_file}. Keys: {list(self._data_cache.keys())}")
         else:
             with open(path) as f:
                 self._data_cache = json.load(f)
             print(f"Loaded dataset from {SOURCE_FILE}. Keys: {list(self._data_cache.keys())}")
 
     def _load_mdb(self, path):
-        """Parsing MDB using mdb-export commands."""
-        cache = {}
-
+        """Parses an MDB with the preferred available ingestion backend (see mm_to_json.dataset_reader)."""
         # Copy to temp file to avoid "Resource deadlock avoided" on mounted volumes
         with tempfile.NamedTemporaryFile(suffix=".mdb", delete=False) as tmp:
             tmp_path = tmp.name
@@ -92,20 +138,10 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
                         break
                     dst.write(chunk)
 
-            # Get tables
-            tables_out = subprocess.check_output(["mdb-tables", "-1", tmp_path]).decode("utf-8")
-            tables = tables_out.strip().split()
-
-            for table in tables:
-                # Export as CSV
-                csv_out = subprocess.check_output(["mdb-export", tmp_path, table]).decode("utf-8")
-                # Parse CSV
-                reader = csv.DictReader(io.StringIO(csv_out))
-                rows = list(reader)
-                cache[table] = rows
-                # Also store as mixed case if needed or rely on fuzzy matching in getters
-
-            print(f"Loaded {len(tables)} tables from MDB.")
+            result = read_dataset(tmp_path)
+            print(result.summary())
+            cache = result.to_records()
+            print(f"Loaded {len(cache)} tables from MDB.")
             return cache
         except Exception as e:
             print(f"Error loading MDB: {e}")
@@ -157,207 +193,201 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
             return []
         return self._data_cache.get(table_name, [])
 
+    def _canonical(self) -> CanonicalMeet:
+        """Typed, schema-independent view of the active dataset (see mm_to_json.schema).
+
+        Rebuilt only when another dataset is loaded (``_data_cache`` is replaced).
+        """
+        meet = getattr(self, "_canonical_meet", None)
+        if meet is None or self._canonical_source is not self._data_cache:
+            meet = normalize({name: self._get_table(name) for name in SOURCE_TABLES})
+            self._canonical_meet = meet
+            # Holding the dataset keeps its identity from being reused
+            self._canonical_source = self._data_cache
+            self._scoring_map = None
+        return meet
+
+    def _converter(self) -> MmToJsonConverter:
+        """One converter per loaded dataset, so report requests share its tables and convert() result.
+
+        A reload of the same file (e.g. a re-upload during the meet) derives a
+        new converter from the previous one, rebuilding only the events whose
+        rows changed. The previous converter is never modified: requests
+        already rendering from it keep a consistent dataset, and the new one
+        is swapped in with a single assignment.
+        """
+        cached = getattr(self, "_report_converter", None)
+        current_file = getattr(self, "current_file", None)
+        data = self._data_cache
+        if cached is None or cached[0] is not data:
+            if cached is not None and cached[1] == current_file:
+                converter, _ = cached[2].updated(data)
+            else:
+                converter = MmToJsonConverter(table_data=data)
+            cached = (data, current_file, converter)
+            self._report_converter = cached
+        return cached[2]
+
     def GetDashboardStats(self, request, context):
         request = request or pb2.GetDashboardStatsRequest()
-        teams = self._get_table("Team")
-        athletes = self._get_table("Athlete")
-        events = self._get_table("Event")
-        meets = self._get_table("Meet")
+        meet = self._canonical()
 
         return pb2.GetDashboardStatsResponse(
-            meet_count=len(meets), team_count=len(teams), athlete_count=len(athletes), event_count=len(events)
+            meet_count=len(meet["meet"]),
+            team_count=len(meet["team"]),
+            athlete_count=len(meet["athlete"]),
+            event_count=len(meet["event"]),
         )
 
     def GetMeets(self, request, context):
         request = request or pb2.GetMeetsRequest()
-        data = self._get_table("Meet")
         meets = []
-        for item in data:
-            name = item.get("Meet_name") or item.get("MName") or "Unknown Meet"
-            loc = item.get("Location") or item.get("Meet_location") or ""
-            start = self._format_date(item.get("Start") or item.get("Start_date") or "")
-            end = self._format_date(item.get("End") or item.get("End_date") or "")
-
-            meets.append(pb2.Meet(id="1", name=name, location=loc, start_date=start, end_date=end, status="active"))
+        for item in self._canonical().records("meet"):
+            meets.append(
+                pb2.Meet(
+                    id="1",
+                    name=item["name"] or "Unknown Meet",
+                    location=item["location"],
+                    start_date=self._format_date(item["start"]),
+                    end_date=self._format_date(item["end"]),
+                    status="active",
+                )
+            )
         return pb2.GetMeetsResponse(meets=meets)
 
+    def _athlete_counts(self, meet):
+        return meet["athlete"]["team_no"].value_counts().to_dict()
+
+    def _team_message(self, item, athlete_counts):
+        return pb2.Team(
+            id=item["team_no"],
+            name=item["name"],
+            code=item["abbr"],
+            lsc=item["lsc"],
+            city=item["city"],
+            state=item["state"],
+            athlete_count=athlete_counts.get(item["team_no"], 0),
+        )
+
     def GetTeams(self, request, context):
         request = request or pb2.GetTeamsRequest()
-        data = self._get_table("Team")
-        athletes = self._get_table("Athlete")
-
-        # Count athletes per team
-        ath_counts: dict[int, int] = {}
-        for ath in athletes:
-            t_id = int(ath.get("Team_no", 0))
-            ath_counts[t_id] = ath_counts.get(t_id, 0) + 1
-
-        teams = []
-        for item in data:
-            t_id = int(item.get("Team_no", 0))
-            teams.append(
-                pb2.Team(
-                    id=t_id,
-                    name=item.get("Team_name", "Unknown"),
-                    code=item.get("Team_abbr", ""),
-                    lsc=item.get("Team_lsc", ""),
-                    city=item.get("Team_city", ""),
-                    state=item.get("Team_statenew", ""),
-                    athlete_count=ath_counts.get(t_id, 0),
-                )
-            )
+        meet = self._canonical()
+        athlete_counts = self._athlete_counts(meet)
+        teams = [self._team_message(item, athlete_counts) for item in meet.records("team")]
         return pb2.GetTeamsResponse(teams=teams)
 
     def GetTeam(self, request, context):
         request = request or pb2.GetTeamRequest()
         team_id = request.id
-        data = self._get_table("Team")
-        athlete_data = self._get_table("Athlete")
-        athlete_counts: dict[int, int] = {}
-        for a in athlete_data:
-            t_no = self._safe_int(a.get("Team_no") or a.get("team_no"))
-            if t_no:
-                athlete_counts[t_no] = athlete_counts.get(t_no, 0) + 1
-
-        for item in data:
-            if int(item.get("Team_no", 0)) == team_id:
-                return pb2.GetTeamResponse(
-                    team=pb2.Team(
-                        id=int(item.get("Team_no", 0)),
-                        name=item.get("Team_name", "Unknown"),
-                        code=item.get("Team_abbr", ""),
-                        lsc=item.get("Team_lsc", ""),
-                        city=item.get("Team_city", ""),
-                        state=item.get("Team_statenew", ""),
-                        athlete_count=athlete_counts.get(team_id, 0),
-                    )
-                )
+        meet = self._canonical()
+
+        item = meet.lookup("team", "team_no").get(team_id)
+        if item is not None:
+            return pb2.GetTeamResponse(team=self._team_message(item, self._athlete_counts(meet)))
 
         context.set_code(grpc.StatusCode.NOT_FOUND)
         context.set_details(f"Team {team_id} not found")
         return pb2.GetTeamResponse()
 
+    def _athlete_message(self, item, team_names):
+        return pb2.Athlete(
+            id=item["ath_no"],
+            first_name=item["first_name"],
+            last_name=item["last_name"],
+            gender=item["sex"],
+            age=item["age"],
+            team_id=item["team_no"],
+            team_name=team_names.get(item["team_no"], "Unknown"),
+            school_year=item["school_year"],
+            reg_no=item["reg_no"],
+            date_of_birth=self._format_date(item["birth_date"]),
+        )
+
+    def _team_names(self, meet):
+        return dict(zip(meet["team"]["team_no"], meet["team"]["name"], strict=True))
+
     def GetAthletes(self, request, context):
         request = request or pb2.GetAthletesRequest()
-        data = self._get_table("Athlete")
-        teams_map = {int(t.get("Team_no", 0)): t.get("Team_name") for t in self._get_table("Team")}
+        meet = self._canonical()
+        team_names = self._team_names(meet)
 
         athletes = []
-        for item in data:
-            t_id = int(item.get("Team_no", 0))
-            if request and request.team_id and str(t_id) != request.team_id:
+        for item in meet.records("athlete"):
+            if request and request.team_id and str(item["team_no"]) != request.team_id:
                 continue
-
-            dob_raw = item.get("Ath_birthdate") or item.get("Birth_date") or ""
-            dob = dob_raw.split(" ")[0] if dob_raw else ""
-
-            athletes.append(
-                pb2.Athlete(
-                    id=int(item.get("Ath_no", 0)),
-                    first_name=item.get("First_name", ""),
-                    last_name=item.get("Last_name", ""),
-                    gender=item.get("Ath_Sex", ""),
-                    age=int(item.get("Ath_age", 0)),
-                    team_id=t_id,
-                    team_name=teams_map.get(t_id, "Unknown"),
-                    school_year=item.get("School_yr", ""),
-                    reg_no=item.get("Reg_no", ""),
-                    date_of_birth=dob,
-                )
-            )
+            athletes.append(self._athlete_message(item, team_names))
         return pb2.GetAthletesResponse(athletes=athletes)
 
     def GetAthlete(self, request, context):
         request = request or pb2.GetAthleteRequest()
         ath_id = request.id
-        data = self._get_table("Athlete")
-        teams_map = {int(t.get("Team_no", 0)): t.get("Team_name") for t in self._get_table("Team")}
-
-        for item in data:
-            if int(item.get("Ath_no", 0)) == ath_id:
-                t_id = int(item.get("Team_no", 0))
-                return pb2.GetAthleteResponse(
-                    athlete=pb2.Athlete(
-                        id=int(item.get("Ath_no", 0)),
-                        first_name=item.get("First_name", ""),
-                        last_name=item.get("Last_name", ""),
-                        gender=item.get("Ath_Sex", ""),
-                        age=int(item.get("Ath_age", 0)),
-                        team_id=t_id,
-                        team_name=teams_map.get(t_id, "Unknown"),
-                        school_year=item.get("School_yr", ""),
-                        reg_no=item.get("Reg_no", ""),
-                    )
-                )
+        meet = self._canonical()
+
+        item = meet.lookup("athlete", "ath_no").get(ath_id)
+        if item is not None:
+            return pb2.GetAthleteResponse(athlete=self._athlete_message(item, self._team_names(meet)))
 
         context.set_code(grpc.StatusCode.NOT_FOUND)
         context.set_details(f"Athlete {ath_id} not found")
         return pb2.GetAthleteResponse()
 
+    def _event_names(self, meet, relay_suffix=False):
+        """Display name per event_ptr, e.g. "Girls 9-10 100 IM"."""
+        stroke_map = {"A": "Free", "B": "Back", "C": "Breast", "D": "Fly", "E": "IM"}
+        gender_map = {"B": "Boys", "G": "Girls", "X": "Mixed", "M": "Men", "W": "Women", "F": "Women"}
+
+        names = {}
+        for e in meet.records("event"):
+            if not e["event_ptr"]:
+                continue
+            stroke = stroke_map.get(e["stroke"], e["stroke"])
+            if relay_suffix and e["is_relay"]:
+                stroke = "Medley Relay" if e["stroke"] == "E" else f"{stroke} Relay"
+            gender = gender_map.get(e["sex"], e["sex"])
+            age_group = self._format_age(e["low_age"], e["high_age"])
+            names[e["event_ptr"]] = f"{gender} {age_group} {e['distance'] or ''} {stroke}"
+        return names
+
     def GetEvents(self, request, context):
         request = request or pb2.GetEventsRequest()
-        data = self._get_table("Event")
+        meet = self._canonical()
         events = []
         stroke_map = {"A": "Freestyle", "B": "Backstroke", "C": "Breaststroke", "D": "Butterfly", "E": "IM"}
         gender_map = {"B": "Boys", "G": "Girls", "X": "Mixed", "M": "Men", "F": "Women", "W": "Women"}
 
-        entry_counts: dict[str, int] = {}
-        entries = self._get_table("Entry") or self._get_table("ENTRY")
-        for e in entries:
-            evt_ptr = e.get("Event_ptr")
-            if evt_ptr:
-                entry_counts[evt_ptr] = entry_counts.get(evt_ptr, 0) + 1
-
-        relays = self._get_table("Relay") or self._get_table("RELAY")
-        for r in relays:
-            evt_ptr = r.get("Event_ptr")
-            if evt_ptr:
-                entry_counts[evt_ptr] = entry_counts.get(evt_ptr, 0) + 1
+        entry_counts = pd.concat([meet["entry"]["event_ptr"], meet["relay"]["event_ptr"]]).value_counts().to_dict()
 
         # Build session mapping from Sessitem (Linking Event_ptr to Session No)
-        sess_map = {}
-        sessitem_table = self._get_table("Sessitem") or self._get_table("SESSITEM")
-        session_table = self._get_table("Session") or self._get_table("SESSIONS")
-
-        # ptr_to_no: Sess_ptr -> Sess_no
-        ptr_to_no = {s.get("Sess_ptr"): self._safe_int(s.get("Sess_no", 1)) for s in session_table if s.get("Sess_ptr")}
-
-        for si in sessitem_table:
-            e_ptr = si.get("Event_ptr")
-            s_ptr = si.get("Sess_ptr")
-            if e_ptr and s_ptr:
-                sess_map[e_ptr] = ptr_to_no.get(s_ptr, 1)
+        sessions = meet["session"]
+        ptr_to_no = dict(zip(sessions["sess_ptr"], sessions["sess_no"], strict=True))
+        sess_map = {
+            si["event_ptr"]: ptr_to_no.get(si["sess_ptr"], 1)
+            for si in meet.records("session_item")
+            if si["event_ptr"] and si["sess_ptr"]
+        }
 
-        for item in data:
-            raw_stroke = item.get("Event_stroke", "").upper().strip()
+        for item in meet.records("event"):
+            raw_stroke = item["stroke"]
             stroke_desc = stroke_map.get(raw_stroke, raw_stroke)
-
-            is_relay = item.get("Ind_rel", "").upper().strip() == "R"
-            if raw_stroke == "E" and is_relay:
+            if raw_stroke == "E" and item["is_relay"]:
                 stroke_desc = "Medley Relay"
-            elif is_relay and stroke_desc != raw_stroke:
+            elif item["is_relay"] and stroke_desc != raw_stroke:
                 stroke_desc += " Relay"
 
-            raw_gender = item.get("Event_sex", "").upper().strip()
-            gender_desc = gender_map.get(raw_gender, raw_gender)
-
             # Map Session: Use Sessitem map if Event.Sess_no is missing
-            e_ptr = item.get("Event_ptr") or item.get("Event_no")
-            sess_no = self._safe_int(item.get("Sess_no"))
-            if not sess_no and e_ptr:
-                sess_no = sess_map.get(e_ptr, 1)
+            sess_no = item["sess_no"] or sess_map.get(item["event_ptr"], 1)
 
             events.append(
                 pb2.Event(
-                    id=int(item.get("Event_no", 0)),
-                    gender=gender_desc,
-                    distance=int(item.get("Event_dist", 0)),
+                    id=item["event_no"],
+                    gender=gender_map.get(item["sex"], item["sex"]),
+                    distance=item["distance"],
                     stroke=stroke_desc,
-                    low_age=int(item.get("Low_age", 0)),
-                    high_age=int(item.get("High_Age", 0)),
+                    low_age=item["low_age"],
+                    high_age=item["high_age"],
                     session=max(1, sess_no),
-                    entry_count=entry_counts.get(item.get("Event_no") or item.get("Event_ptr"), 0),
-                    age_group=self._format_age(item.get("Low_age"), item.get("High_Age")),
+                    entry_count=entry_counts.get(item["event_ptr"], 0) if item["event_ptr"] else 0,
+                    age_group=self._format_age(item["low_age"], item["high_age"]),
                 )
             )
         return pb2.GetEventsResponse(events=events)
@@ -369,8 +399,8 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
         try:
             files = os.listdir(data_dir)
             for filename in files:
-                if filename.endswith(".json") or filename.endswith(".mdb"):
-                    full_path = os.path.join(data_dir, filename)
+                full_path = os.path.join(data_dir, filename)
+                if filename.endswith(".json") or filename.endswith(".mdb") or table_export.is_export_dir(full_path):
                     try:
                         mod_time = os.path.getmtime(full_path)
                     except OSError:
@@ -459,6 +489,10 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
         return pb2.ClearAllDatasetsResponse()
 
     def _format_date(self, date_str):
+        if date_str is None or date_str is pd.NaT:
+            return ""
+        if isinstance(date_str, datetime.date):
+            return date_str.strftime("%Y-%m-%d")
         if not date_str:
             return ""
         try:
@@ -476,134 +510,91 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
         except Exception:
             return str(date_str)
 
+    def _format_number(self, value):
+        """Times and scores as Meet Manager shows them: "31.24", "60", "" when missing."""
+        if value is None or value != value:
+            return ""
+        return str(int(value)) if float(value).is_integer() else str(value)
+
+    def _format_seed(self, value):
+        if value is None or value != value or value == 0:
+            return "NT"
+        return self._format_number(value)
+
     def GetRelays(self, request, context):
         request = request or pb2.GetRelaysRequest()
-        relays_data = self._get_table("Relay")
-        if not relays_data:
-            relays_data = self._get_table("RELAY")
-
-        relay_names_data = self._get_table("RelayNames")
-        relay_legs_map: dict[tuple[Any, Any, Any], list[Any]] = {}
-        for rn in relay_names_data:
-            key = (rn.get("Event_ptr"), rn.get("Team_no"), rn.get("Relay_no"))
-            if key not in relay_legs_map:
-                relay_legs_map[key] = []
-            relay_legs_map[key].append(rn)
-
-        teams = {t.get("Team_no"): t.get("Team_name") for t in self._get_table("Team")}
-        athletes = {a.get("Ath_no"): a for a in self._get_table("Athlete")}
-
-        events_map = {}
-        stroke_map = {"A": "Free", "B": "Back", "C": "Breast", "D": "Fly", "E": "IM"}
-        gender_map = {"B": "Boys", "G": "Girls", "X": "Mixed", "M": "Men", "W": "Women", "F": "Women"}
-
-        for e in self._get_table("Event"):
-            e_no = e.get("Event_no") or e.get("Event_ptr")
-            if e_no:
-                g = gender_map.get(e.get("Event_sex", "").strip(), e.get("Event_sex", ""))
-                d = e.get("Event_dist", "")
-                s = stroke_map.get(e.get("Event_stroke", "").strip(), e.get("Event_stroke", ""))
-                age_group = self._format_age(e.get("Low_age"), e.get("High_Age"))
-                name = f"{g} {age_group} {d} {s}"
-                events_map[e_no] = name
+        meet = self._canonical()
 
-        result = []
-        for idx, item in enumerate(relays_data):
-            t_id = item.get("Team_ptr", 0)
-            if not t_id or t_id == "0":
-                t_id = item.get("Team_no", 0)
+        relay_legs_map: dict[tuple[int, int, int], list[dict[str, Any]]] = {}
+        for rn in meet.records("relay_names"):
+            key = (rn["event_ptr"], rn["team_no"], rn["relay_no"])
+            relay_legs_map.setdefault(key, []).append(rn)
 
-            event_ptr = item.get("Event_ptr")
-            relay_no = item.get("Relay_no")
+        teams = self._team_names(meet)
+        athletes = meet.lookup("athlete", "ath_no")
+        events_map = self._event_names(meet)
 
-            legs = relay_legs_map.get((event_ptr, t_id, relay_no), [])
-            legs.sort(key=lambda x: int(x.get("Pos_no", 0) if str(x.get("Pos_no")).strip().isdigit() else 99))
+        result = []
+        for idx, item in enumerate(meet.records("relay")):
+            t_id = item["team_no"]
+            event_ptr = item["event_ptr"]
 
+            legs = relay_legs_map.get((event_ptr, t_id, item["relay_no"]), [])
             leg_names = ["", "", "", ""]
-            for leg in legs:
-                try:
-                    pos = int(leg.get("Pos_no", 0))
-                    if 1 <= pos <= 4:
-                        ath_id = leg.get("Ath_no")
-                        ath = athletes.get(ath_id)
-                        if ath:
-                            leg_names[pos - 1] = f"{ath.get('First_name', '')} {ath.get('Last_name', '')}"
-                except ValueError:
-                    continue
-
-            seed = item.get("ActualSeed_time") or item.get("ConvSeed_time") or item.get("Seed_Time") or "NT"
-            try:
-                if float(seed) == 0:
-                    seed = "NT"
-            except (ValueError, TypeError):
-                pass
+            for leg in sorted(legs, key=lambda x: x["pos_no"]):
+                pos = leg["pos_no"]
+                ath = athletes.get(leg["ath_no"])
+                if 1 <= pos <= 4 and ath:
+                    leg_names[pos - 1] = f"{ath['first_name']} {ath['last_name']}"
 
             result.append(
                 pb2.Relay(
                     id=idx,
-                    event_id=self._safe_int(item.get("Event_ptr")),
-                    team_id=self._safe_int(t_id),
+                    event_id=event_ptr,
+                    team_id=t_id,
                     team_name=teams.get(t_id, "Unknown"),
                     leg1_name=leg_names[0],
                     leg2_name=leg_names[1],
                     leg3_name=leg_names[2],
                     leg4_name=leg_names[3],
-                    seed_time=str(seed),
-                    final_time=str(item.get("Fin_Time", "")),
-                    place=self._safe_int(item.get("Fin_place", item.get("Place"))),
+                    seed_time=self._format_seed(item["seed_time"]),
+                    final_time=self._format_number(item["final_time"]),
+                    place=item["place"],
                     event_name=events_map.get(event_ptr, f"Event {event_ptr}"),
-                    relay_letter=item.get("Team_ltr", ""),
-                    heat=self._safe_int(item.get("Fin_heat")),
-                    lane=self._safe_int(item.get("Fin_lane")),
+                    relay_letter=item["team_ltr"],
+                    heat=item["heat"],
+                    lane=item["lane"],
                 )
             )
         return pb2.GetRelaysResponse(relays=result)
 
     def GetScores(self, request, context):
         request = request or pb2.GetScoresRequest()
-        teams = {
-            t.get("Team_no"): {"name": t.get("Team_name"), "id": t.get("Team_no")} for t in self._get_table("Team")
-        }
+        meet = self._canonical()
+        teams = self._team_names(meet)
         scores = {t_id: {"ind": 0.0, "rel": 0.0} for t_id in teams}
 
-        entries_data = self._get_table("Entry") or self._get_table("ENTRY")
-        athletes = {a.get("Ath_no"): a for a in self._get_table("Athlete")}
-        events_sex_map = {
-            e.get("Event_no") or e.get("Event_ptr"): e.get("Event_sex", "M") for e in self._get_table("Event")
-        }
+        athletes = meet.lookup("athlete", "ath_no")
+        events_sex_map = dict(zip(meet["event"]["event_ptr"], meet["event"]["sex"], strict=True))
+
+        for e in meet.records("entry"):
+            ath = athletes.get(e["ath_no"])
+            if ath and ath["team_no"] in scores:
+                sex = events_sex_map.get(e["event_ptr"], ath["sex"])
+                scores[ath["team_no"]]["ind"] += self._calculate_points(e, sex, False)
 
-        if entries_data:
-            for e in entries_data:
-                ath_id = e.get("Ath_no")
-                ath = athletes.get(ath_id)
-                if ath:
-                    t_id = ath.get("Team_no")
-                    if t_id in scores:
-                        e_id = e.get("Event_ptr")
-                        sex = events_sex_map.get(e_id, ath.get("Ath_Sex", "M"))
-                        val = self._calculate_points(e, sex, False)
-                        scores[t_id]["ind"] += val
-
-        relays_data = self._get_table("Relay") or self._get_table("RELAY")
-        if relays_data:
-            for r in relays_data:
-                t_id = r.get("Team_no")
-                if not t_id or t_id == "0":
-                    t_id = r.get("Team_ptr")
-
-                if t_id in scores:
-                    e_id = r.get("Event_ptr")
-                    sex = events_sex_map.get(e_id, r.get("Rel_sex", "X"))
-                    val = self._calculate_points(r, sex, True)
-                    scores[t_id]["rel"] += val
+        for relay in meet.records("relay"):
+            if relay["team_no"] in scores:
+                sex = events_sex_map.get(relay["event_ptr"], relay["sex"] or "X")
+                scores[relay["team_no"]]["rel"] += self._calculate_points(relay, sex, True)
 
         result = []
         for t_id, s in scores.items():
             total = s["ind"] + s["rel"]
             result.append(
                 pb2.Score(
-                    team_id=self._safe_int(t_id),
-                    team_name=teams[t_id]["name"],
+                    team_id=t_id,
+                    team_name=teams[t_id],
                     individual_points=s["ind"],
                     relay_points=s["rel"],
                     total_points=total,
@@ -621,63 +612,40 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
 
     def GetEntries(self, request, context):
         request = request or pb2.GetEntriesRequest()
-        entries_data = self._get_table("Entry")
-        if not entries_data:
-            entries_data = self._get_table("ENTRY")
-
-        athletes = {a.get("Ath_no"): a for a in self._get_table("Athlete")}
-        teams = {t.get("Team_no"): t.get("Team_name") for t in self._get_table("Team")}
-        events_map = {}
-        stroke_map = {"A": "Free", "B": "Back", "C": "Breast", "D": "Fly", "E": "IM"}
-        gender_map = {"B": "Boys", "G": "Girls", "X": "Mixed", "M": "Men", "W": "Women", "F": "Women"}
-
-        for e in self._get_table("Event"):
-            e_no = e.get("Event_no") or e.get("Event_ptr")
-            if e_no:
-                g = gender_map.get(e.get("Event_sex", "").strip(), e.get("Event_sex", ""))
-                d = e.get("Event_dist", "")
-                s = stroke_map.get(e.get("Event_stroke", "").strip(), e.get("Event_stroke", ""))
-                age_group = self._format_age(e.get("Low_age"), e.get("High_Age"))
-                name = f"{g} {age_group} {d} {s}"
-                events_map[e_no] = name
+        meet = self._canonical()
+        athletes = meet.lookup("athlete", "ath_no")
+        teams = self._team_names(meet)
+        events_map = self._event_names(meet)
 
         result = []
-        for idx, item in enumerate(entries_data):
-            ath_id = item.get("Ath_no", 0)
+        for idx, item in enumerate(meet.records("entry")):
+            ath_id = item["ath_no"]
             if request and request.athlete_id and str(ath_id) != request.athlete_id:
                 continue
 
-            athlete = athletes.get(ath_id, {})
-            t_id = athlete.get("Team_no", 0)
-            event_id = item.get("Event_ptr")
+            event_id = item["event_ptr"]
             if request and request.event_id and str(event_id) != request.event_id:
                 continue
 
-            seed = item.get("ActualSeed_time") or item.get("ConvSeed_time") or item.get("Seed_Time") or "NT"
-            try:
-                if float(seed) == 0:
-                    seed = "NT"
-            except (ValueError, TypeError):
-                pass
-
-            entry_id_val = item.get("Entry_no")
-            final_id = int(entry_id_val) if entry_id_val else idx
+            athlete = athletes.get(ath_id)
+            t_id = athlete["team_no"] if athlete else 0
+            name = f"{athlete['first_name']} {athlete['last_name']}" if athlete else " "
 
             result.append(
                 pb2.Entry(
-                    id=final_id,
-                    event_id=self._safe_int(event_id),
-                    athlete_id=self._safe_int(ath_id),
-                    athlete_name=f"{athlete.get('First_name', '')} {athlete.get('Last_name', '')}",
-                    team_id=self._safe_int(t_id),
+                    id=item["entry_no"] or idx,
+                    event_id=event_id,
+                    athlete_id=ath_id,
+                    athlete_name=name,
+                    team_id=t_id,
                     team_name=teams.get(t_id, "Unknown"),
-                    seed_time=str(seed),
-                    final_time=str(item.get("Fin_Time", "")),
-                    place=self._safe_int(item.get("Fin_place", item.get("Place"))),
+                    seed_time=self._format_seed(item["seed_time"]),
+                    final_time=self._format_number(item["final_time"]),
+                    place=item["place"],
                     event_name=events_map.get(event_id, f"Event {event_id}"),
-                    heat=self._safe_int(item.get("Fin_heat", item.get("Pre_heat", 0))),
-                    lane=self._safe_int(item.get("Fin_lane", item.get("Pre_lane", 0))),
-                    points=self._safe_float(item.get("Ev_score", 0.0)),
+                    heat=item["heat"],
+                    lane=item["lane"],
+                    points=item["ev_score"] or 0.0,
                 )
             )
         return pb2.GetEntriesResponse(entries=result)
@@ -686,22 +654,10 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
         if hasattr(self, "_scoring_map") and self._scoring_map is not None:
             return self._scoring_map
 
-        scoring_data = self._get_table("Scoring") or self._get_table("SCORING")
         self._scoring_map = {}
-        for row in scoring_data:
-            div = row.get("score_divno", "0")
-            sex = row.get("score_sex", "M").upper()
-            place = self._safe_int(row.get("score_place", 0))
-
-            if div not in self._scoring_map:
-                self._scoring_map[div] = {}
-            if sex not in self._scoring_map[div]:
-                self._scoring_map[div][sex] = {}
-
-            self._scoring_map[div][sex][place] = {
-                "ind": self._safe_float(row.get("ind_score", 0)),
-                "rel": self._safe_float(row.get("rel_score", 0)),
-            }
+        for row in self._canonical().records("scoring"):
+            div_scores = self._scoring_map.setdefault(row["div_no"], {})
+            div_scores.setdefault(row["sex"], {})[row["place"]] = {"ind": row["ind_score"], "rel": row["rel_score"]}
         return self._scoring_map
 
     def _format_age(self, low, high):
@@ -717,20 +673,20 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
         return f"{low}-{high}"
 
     def _calculate_points(self, item, sex, is_relay):
-        score = self._safe_float(item.get("Ev_score", 0))
+        """Points for a canonical entry/relay row: Ev_score if set, else the Scoring table by place."""
+        score = item["ev_score"] or 0.0
         if score > 0:
             return score
 
-        place = self._safe_int(item.get("Fin_place", item.get("Place", 0)))
+        place = item["place"]
         if place <= 0:
             return 0.0
 
-        div = item.get("Div_no", "0") or "0"
         sex_map = {"B": "M", "M": "M", "G": "F", "W": "F", "F": "F", "X": "M"}
         mapped_sex = sex_map.get(sex.upper(), "M")
 
         scoring_map = self._get_scoring_map()
-        div_map = scoring_map.get(div, scoring_map.get("0", {}))
+        div_map = scoring_map.get(item["div_no"], scoring_map.get(0, {}))
         sex_scores = div_map.get(mapped_sex, div_map.get("M", {}))
 
         score_data = sex_scores.get(place, {})
@@ -738,311 +694,330 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
 
     def GetEventScores(self, request, context):
         request = request or pb2.GetEventScoresRequest()
-        entries = self._get_table("Entry") or self._get_table("ENTRY")
-        relays = self._get_table("Relay") or self._get_table("RELAY")
-        athletes_map = {a.get("Ath_no"): a for a in self._get_table("Athlete")}
-        teams_map = {t.get("Team_no"): t.get("Team_name") for t in self._get_table("Team")}
-
-        events_map = {}
-        stroke_map = {"A": "Free", "B": "Back", "C": "Breast", "D": "Fly", "E": "IM"}
-        gender_map = {"B": "Boys", "G": "Girls", "X": "Mixed", "M": "Men", "W": "Women", "F": "Women"}
-
-        event_dict: dict[str, dict[str, Any]] = {}
-        event_raw_map = {}
-
-        for e in self._get_table("Event"):
-            e_no = e.get("Event_no") or e.get("Event_ptr")
-            if not e_no:
+        meet = self._canonical()
+        athletes_map = meet.lookup("athlete", "ath_no")
+        teams_map = self._team_names(meet)
+        events_map = self._event_names(meet, relay_suffix=True)
+
+        event_dict: dict[int, dict[str, Any]] = {}
+        for e in meet.records("event"):
+            if e["event_ptr"]:
+                event_dict[e["event_ptr"]] = {"id": e["event_no"], "sex": e["sex"], "entries": []}
+
+        for item in meet.records("entry"):
+            ev = event_dict.get(item["event_ptr"])
+            if ev is None:
                 continue
 
-            event_raw_map[e_no] = e
-            g = gender_map.get(e.get("Event_sex", "").strip(), e.get("Event_sex", ""))
-            d = e.get("Event_dist", "")
-            s_raw = e.get("Event_stroke", "").strip()
-            s = stroke_map.get(s_raw, s_raw)
-
-            is_relay = e.get("Ind_rel", "").upper().strip() == "R"
-            if s_raw == "E" and is_relay:
-                s = "Medley Relay"
-            elif is_relay and s != s_raw:
-                s += " Relay"
-
-            low = e.get("Low_age", "")
-            high = e.get("High_Age", "")
-            age_group = self._format_age(low, high)
-            name = f"{g} {age_group} {d} {s}"
-            events_map[e_no] = name
-            event_dict[e_no] = {"id": int(e_no), "name": name, "entries": []}
-
-        for item in entries:
-            e_id = item.get("Event_ptr")
-            if e_id not in event_dict:
+            place = item["place"]
+            if not item["final_time"] and place <= 0:
                 continue
 
-            ath_id = item.get("Ath_no")
-            ath = athletes_map.get(ath_id)
-            t_id = ath.get("Team_no", 0) if ath else 0
-            place = self._safe_int(item.get("Fin_place", item.get("Place", 0)))
-
-            ev_raw = event_raw_map.get(e_id, {})
-            points = self._calculate_points(item, ev_raw.get("Event_sex", "M"), False)
-
-            if not item.get("Fin_Time") and place <= 0:
-                continue
-
-            seed = item.get("ActualSeed_time") or item.get("ConvSeed_time") or item.get("Seed_Time") or "NT"
-            try:
-                if float(seed) == 0:
-                    seed = "NT"
-            except (ValueError, TypeError):
-                pass
-
-            entry_obj = pb2.Entry(
-                id=0,
-                event_id=int(e_id),
-                athlete_id=int(ath_id if ath else 0),
-                athlete_name=f"{ath.get('First_name', '')} {ath.get('Last_name', '')}" if ath else "Unknown",
-                team_id=int(t_id),
-                team_name=teams_map.get(t_id, "Unknown"),
-                seed_time=str(seed),
-                final_time=str(item.get("Fin_Time", "")),
-                place=place,
-                points=points,
-                event_name=events_map.get(e_id, ""),
+            ath = athletes_map.get(item["ath_no"])
+            t_id = ath["team_no"] if ath else 0
+            ev["entries"].append(
+                pb2.Entry(
+                    id=0,
+                    event_id=item["event_ptr"],
+                    athlete_id=item["ath_no"] if ath else 0,
+                    athlete_name=f"{ath['first_name']} {ath['last_name']}" if ath else "Unknown",
+                    team_id=t_id,
+                    team_name=teams_map.get(t_id, "Unknown"),
+                    seed_time=self._format_seed(item["seed_time"]),
+                    final_time=self._format_number(item["final_time"]),
+                    place=place,
+                    points=self._calculate_points(item, ev["sex"] or "M", False),
+                    event_name=events_map.get(item["event_ptr"], ""),
+                )
             )
-            event_dict[e_id]["entries"].append(entry_obj)
 
-        for item in relays:
-            e_id = item.get("Event_ptr")
-            if e_id not in event_dict:
+        for item in meet.records("relay"):
+            ev = event_dict.get(item["event_ptr"])
+            if ev is None:
                 continue
 
-            t_id = item.get("Team_ptr") or item.get("Team_no")
-            place = self._safe_int(item.get("Fin_place", item.get("Place", 0)))
-            rel_ltr = item.get("Team_ltr", "")
-
-            ev_raw = event_raw_map.get(e_id, {})
-            points = self._calculate_points(item, ev_raw.get("Event_sex", "X"), True)
-
-            if not item.get("Fin_Time") and place <= 0:
+            place = item["place"]
+            if not item["final_time"] and place <= 0:
                 continue
 
-            seed = item.get("ActualSeed_time") or item.get("ConvSeed_time") or item.get("Seed_Time") or "NT"
-            try:
-                if float(seed) == 0:
-                    seed = "NT"
-            except (ValueError, TypeError):
-                pass
-
-            entry_obj = pb2.Entry(
-                id=0,
-                event_id=int(e_id),
-                athlete_id=0,
-                athlete_name=f"Relay Team ({rel_ltr})" if rel_ltr else "Relay Team",
-                team_id=int(t_id if t_id else 0),
-                team_name=teams_map.get(t_id, "Unknown"),
-                seed_time=str(seed),
-                final_time=str(item.get("Fin_Time", "")),
-                place=place,
-                points=points,
-                heat=self._safe_int(item.get("Fin_heat", 0)),
-                lane=self._safe_int(item.get("Fin_lane", 0)),
-                event_name=events_map.get(e_id, ""),
+            t_id = item["team_no"]
+            rel_ltr = item["team_ltr"]
+            ev["entries"].append(
+                pb2.Entry(
+                    id=0,
+                    event_id=item["event_ptr"],
+                    athlete_id=0,
+                    athlete_name=f"Relay Team ({rel_ltr})" if rel_ltr else "Relay Team",
+                    team_id=t_id,
+                    team_name=teams_map.get(t_id, "Unknown"),
+                    seed_time=self._format_seed(item["seed_time"]),
+                    final_time=self._format_number(item["final_time"]),
+                    place=place,
+                    points=self._calculate_points(item, ev["sex"] or "X", True),
+                    heat=item["heat"],
+                    lane=item["lane"],
+                    event_name=events_map.get(item["event_ptr"], ""),
+                )
             )
-            event_dict[e_id]["entries"].append(entry_obj)
 
         resp_list = []
-        sorted_keys = sorted(event_dict.keys(), key=lambda k: int(k))
-        for k in sorted_keys:
-            ev = event_dict[k]
+        for e_ptr, ev in sorted(event_dict.items(), key=lambda kv: kv[1]["id"]):
             ev["entries"].sort(key=lambda x: x.place if x.place > 0 else 9999)
-
-            resp_list.append(pb2.EventScore(event_id=ev["id"], event_name=ev["name"], entries=ev["entries"]))
+            resp_list.append(pb2.EventScore(event_id=ev["id"], event_name=events_map[e_ptr], entries=ev["entries"]))
 
         return pb2.GetEventScoresResponse(event_scores=resp_list)
 
+    def _report_cache(self) -> ReportCache:
+        cache = getattr(self, "_rendered_reports", None)
+        if cache is None:
+            cache = self._rendered_reports = ReportCache()
+        return cache
+
+    def _report_jobs(self) -> report_jobs.ReportJobQueue:
+        jobs = getattr(self, "_report_job_queue", None)
+        if jobs is None:
+            jobs = self._report_job_queue = report_jobs.ReportJobQueue(cache=self._report_cache())
+        return jobs
+
+    def _report_spec(self, request) -> report_batch.ReportSpec:
+        return report_batch.ReportSpec(
+            REPORT_TYPE_NAMES.get(request.type, "psych"), request.team_filter or None, request.title or None
+        )
+
     def GenerateReport(self, request, context):
         if request is None:
             return pb2.GenerateReportResponse(success=False, message="Missing request")
         try:
-            converter = MmToJsonConverter(table_data=self._data_cache)
-
-            rtype_val = pb2.REPORT_TYPE_PSYCH_UNSPECIFIED
-            team_filter = None
-            title = None
-            if request:
-                rtype_val = request.type
-                team_filter = request.team_filter
-                title = request.title
-
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-                temp_path = tmp.name
-
-            rtype_map = {
-                pb2.REPORT_TYPE_PSYCH_UNSPECIFIED: "psych",
-                pb2.REPORT_TYPE_ENTRIES: "entries",
-                pb2.REPORT_TYPE_LINEUPS: "lineups",
-                pb2.REPORT_TYPE_RESULTS: "results",
-                pb2.REPORT_TYPE_MEET_PROGRAM: "program",
-                pb2.REPORT_TYPE_MEET_PROGRAM_HTML: "program_html",
-                pb2.REPORT_TYPE_ENTRIES_HYTEK: "entries_hytek",
-                pb2.REPORT_TYPE_ENTRIES_CLUB: "entries_club",
-            }
-
-            rtype = rtype_map.get(rtype_val, "psych")
-            pdf_content = b""
-            html_content = None
-
-            extractor = ReportDataExtractor(converter)
-            renderer = WeasyRenderer(temp_path)
-
-            if rtype == "psych":
-                report_data = extractor.extract_psych_sheet_data(team_filter=team_filter, report_title=title)
-                renderer.render_entries(report_data, "psych_sheet.html")
-            elif rtype == "entries":
-                # Default entries uses HY-TEK style
-                report_data = extractor.extract_meet_entries_data(team_filter=team_filter, report_title=title)
-                renderer.render_entries(report_data, "entries_hytek.html")
-            elif rtype == "lineups":
-                report_data = extractor.extract_timer_sheets_data(team_filter=team_filter, report_title=title)
-                renderer.render_entries(report_data, "lineups.html")
-            elif rtype == "results":
-                report_data = extractor.extract_results_data(team_filter=team_filter, report_title=title)
-                renderer.render_entries(report_data, "results.html")
-            elif rtype == "program":
-                # Use new WeasyRenderer for PDF
-                program_data = extractor.extract_meet_program_data(team_filter=team_filter, report_title=title)
-                renderer.render_meet_program(program_data)
-            elif rtype == "program_html":
-                # Use WeasyRenderer for HTML
-                program_data = extractor.extract_meet_program_data(team_filter=team_filter, report_title=title)
-                html_content = renderer.render_to_html(program_data)
-                # Create empty PDF just to satisfy downstream expectations if any
-                with open(temp_path, "wb") as f:
-                    f.write(b"")
-            elif rtype == "entries_hytek":
-                report_data = extractor.extract_meet_entries_data(team_filter=team_filter, report_title=title)
-                renderer.render_entries(report_data, "entries_hytek.html")
-            elif rtype == "entries_club":
-                report_data = extractor.extract_meet_entries_data(team_filter=team_filter, report_title=title)
-                renderer.render_entries(report_data, "entries_club.html")
-
-            if os.path.exists(temp_path):
-                with open(temp_path, "rb") as f:
-                    pdf_content = f.read()
-                os.remove(temp_path)
-
-            filename = f"report_{rtype}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            if rtype == "program_html":
-                filename = filename.replace(".pdf", ".html")
-
-            return pb2.GenerateReportResponse(
+            converter = self._converter()
+            report = report_batch.generate_reports(
+                converter, [self._report_spec(request)], jobs=1, cache=self._report_cache()
+            )[0]
+        except Exception as e:
+            print(f"Error generating report: {e}")
+            return pb2.GenerateReportResponse(success=False, message=str(e))
+        if report.error:
+            print(f"Error generating report: {report.error}")
+            return pb2.GenerateReportResponse(success=False, message=report.error)
+
+        return pb2.GenerateReportResponse(
+            success=True,
+            message="Report generated successfully",
+            pdf_content=b"" if report.html is not None else report.content,
+            filename=report.filename,
+            html_content=report.html,
+        )
+
+    def GenerateReportBatch(self, request, context):
+        """Every requested report from one conversion, streamed as each finishes.
+
+        With ``zip`` set, the per-report messages carry status only and a final
+        ``archive`` message carries all reports as one zip file.
+        """
+        request = request or pb2.GenerateReportBatchRequest()
+        specs = [self._report_spec(r) for r in request.reports]
+        try:
+            converter = self._converter()
+        except Exception as e:
+            print(f"Error generating reports: {e}")
+            yield pb2.GenerateReportBatchResponse(success=False, message=str(e))
+            return
+
+        reports: list[report_batch.RenderedReport | None] = [None] * len(specs)
+        for i, report in report_batch.iter_reports(converter, specs, cache=self._report_cache()):
+            reports[i] = report
+            if report.error:
+                print(f"Error generating report {report.filename}: {report.error}")
+            yield pb2.GenerateReportBatchResponse(
+                index=i,
+                success=report.error is None,
+                message=report.error or "Report generated successfully",
+                content=b"" if request.zip else report.content,
+                filename=report.filename,
+            )
+
+        if request.zip:
+            done = [r for r in reports if r is not None and r.error is None]
+            buf = io.BytesIO()
+            report_batch.write_zip(done, buf)
+            yield pb2.GenerateReportBatchResponse(
                 success=True,
-                message="Report generated successfully",
-                pdf_content=pdf_content,
-                filename=filename,
-                html_content=html_content,
+                message=f"{len(done)} of {len(specs)} reports generated",
+                content=buf.getvalue(),
+                filename=f"reports_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                archive=True,
             )
 
+    def StreamReport(self, request, context):
+        """One report as metadata, content chunks as they are rendered, then size and checksum.
+
+        Errors arrive in the trailer; chunks already sent are then to be discarded.
+        """
+        request = request or pb2.StreamReportRequest()
+        spec = self._report_spec(request.report)
+        try:
+            converter = self._converter()
         except Exception as e:
-            print(f"Error generating report: {e}")
-            return pb2.GenerateReportResponse(success=False, message=str(e))
+            print(f"Error streaming report: {e}")
+            yield pb2.StreamReportResponse(trailer=pb2.StreamReportTrailer(success=False, message=str(e)))
+            return
+
+        stream = report_batch.ReportStream(
+            converter, spec, request.chunk_size or report_batch.STREAM_CHUNK_SIZE, cache=self._report_cache()
+        )
+        yield pb2.StreamReportResponse(
+            metadata=pb2.StreamReportMetadata(filename=stream.filename, content_type=stream.content_type)
+        )
+        for chunk in stream:
+            yield pb2.StreamReportResponse(chunk=chunk)
+        if stream.error:
+            print(f"Error streaming report {stream.filename}: {stream.error}")
+        yield pb2.StreamReportResponse(
+            trailer=pb2.StreamReportTrailer(
+                success=stream.error is None,
+                message=stream.error or "Report generated successfully",
+                size=stream.size,
+                sha256=stream.sha256,
+            )
+        )
+
+    def SubmitReport(self, request, context):
+        """Queues a report and returns its job id without waiting for it to render."""
+        request = request or pb2.SubmitReportRequest()
+        spec = self._report_spec(request.report)
+        try:
+            # submit() snapshots the converter: the job renders, and is cached under, the
+            # dataset active now even if another is loaded or activated before it runs
+            converter = self._converter()
+            job = self._report_jobs().submit(converter, spec, REPORT_JOB_PRIORITY_NAMES.get(request.priority, "normal"))
+        except report_jobs.ReportJobQueueFullError as e:
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(str(e))
+            return pb2.SubmitReportResponse()
+        except Exception as e:
+            print(f"Error submitting report: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return pb2.SubmitReportResponse()
+        return pb2.SubmitReportResponse(job_id=job.id)
+
+    def GetReportJob(self, request, context):
+        request = request or pb2.GetReportJobRequest()
+        jobs = self._report_jobs()
+        job = jobs.get(request.job_id)
+        if job is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Report job {request.job_id} not found")
+            return pb2.GetReportJobResponse()
+        return pb2.GetReportJobResponse(
+            job=pb2.ReportJob(
+                job_id=job.id,
+                state=REPORT_JOB_STATES[job.state],
+                queue_position=jobs.position(job),
+                events_processed=job.events_processed,
+                events_total=job.events_total,
+                pages=job.pages,
+                filename=job.filename,
+                message=job.error or "",
+            )
+        )
+
+    def FetchReport(self, request, context):
+        """The file of a finished job, sent like StreamReport: metadata, chunks, then size and checksum."""
+        request = request or pb2.FetchReportRequest()
+        job = self._report_jobs().get(request.job_id)
+        if job is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Report job {request.job_id} not found")
+            return
+        if job.state not in (report_jobs.DONE, report_jobs.FAILED):
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(f"Report job {job.id} is {job.state}")
+            return
+        if job.error:
+            yield pb2.FetchReportResponse(trailer=pb2.StreamReportTrailer(success=False, message=job.error))
+            return
+
+        yield pb2.FetchReportResponse(
+            metadata=pb2.StreamReportMetadata(filename=job.filename, content_type=job.content_type)
+        )
+        for chunk in report_batch.chunked(job.content, request.chunk_size or report_batch.STREAM_CHUNK_SIZE):
+            yield pb2.FetchReportResponse(chunk=chunk)
+        yield pb2.FetchReportResponse(
+            trailer=pb2.StreamReportTrailer(
+                success=True,
+                message="Report generated successfully",
+                size=len(job.content),
+                sha256=hashlib.sha256(job.content).hexdigest(),
+            )
+        )
 
     def GetSessions(self, request, context):
         request = request or pb2.GetSessionsRequest()
-        data = self._get_table("Session")
-        meets = self._get_table("Meet")
-        meet_start = None
-        if meets:
-            m = meets[0]
-            date_str = m.get("Start") or m.get("Start_date") or ""
-            if date_str:
-                try:
-                    if " " in date_str:
-                        date_str = date_str.split(" ")[0]
-                    for fmt in ("%m/%d/%Y", "%Y-%m-%d", "%m/%d/%y", "%d-%b-%y"):
-                        try:
-                            meet_start = datetime.datetime.strptime(date_str, fmt)
-                            break
-                        except ValueError:
-                            continue
-                except Exception:
-                    pass
+        meet = self._canonical()
+        meet_start = meet.meet_start()
 
         # Count events per session from Sessitem for reliability
-        sess_item_table = self._get_table("Sessitem") or self._get_table("SESSITEM")
-        event_counts_map: dict[Any, int] = {}
-        for si in sess_item_table:
-            s_ptr = si.get("Sess_ptr")
-            if s_ptr:
-                event_counts_map[s_ptr] = event_counts_map.get(s_ptr, 0) + 1
+        event_counts_map = meet["session_item"]["sess_ptr"].value_counts().to_dict()
+        # Events without a session belong to session 1
+        event_sessions = meet["event"]["sess_no"].replace(0, 1)
+        events_per_session = event_sessions.value_counts().to_dict()
 
         sessions_to_process = []
-        if data:
-            for item in data:
-                s_ptr = item.get("Sess_ptr")
-                e_cnt = self._safe_int(item.get("Event_cnt"))
-                if not e_cnt and s_ptr:
-                    e_cnt = event_counts_map.get(s_ptr, 0)
+        if len(meet["session"]):
+            for item in meet.records("session"):
+                e_cnt = item["event_count"]
+                if not e_cnt and item["sess_ptr"]:
+                    e_cnt = event_counts_map.get(item["sess_ptr"], 0)
 
                 sessions_to_process.append(
                     {
-                        "id": str(item.get("Sess_no")),
-                        "name": item.get("Sess_name", f"Session {item.get('Sess_no')}"),
-                        "day": item.get("Sess_day", 1),
-                        "warmup": item.get("Sess_warmup", 0),
-                        "starttime": item.get("Sess_starttime", 0),
+                        "id": item["sess_no"],
+                        "name": item["name"] or f"Session {item['sess_no']}",
+                        "day": item["day"],
+                        "date": item["date"],
+                        "warmup": item["warmup_time"],
+                        "starttime": item["start_time"],
                         "event_cnt": e_cnt,
-                        "source_item": item,
                     }
                 )
         else:
-            event_table = self._get_table("Event") or self._get_table("MTEVENT")
-            sess_ids = sorted({self._safe_int(e.get("Sess_no", e.get("sess_no", 1))) for e in event_table})
-            if not sess_ids and not event_table:
-                sess_ids = [1]
-
-            for s_id in sess_ids:
+            has_events = not event_sessions.empty
+            for s_id in sorted(set(event_sessions)) or [1]:
                 sessions_to_process.append(
                     {
-                        "id": str(s_id),
-                        "name": "Session 1" if s_id == 1 and not event_table else f"Session {s_id}",
+                        "id": s_id,
+                        "name": f"Session {s_id}" if has_events else "Session 1",
                         "day": 1,
+                        "date": None,
                         "warmup": 0,
                         "starttime": 0,
                         "event_cnt": None,
-                        "source_item": {},
                     }
                 )
 
+        warm_up_times = times.format_clock([s["warmup"] for s in sessions_to_process])
+        start_times = times.format_clock([s["starttime"] for s in sessions_to_process])
+
         sessions = []
-        for s_info in sessions_to_process:
-            item = s_info["source_item"]
-            sess_date = ""
-            day_offset = self._safe_int(s_info["day"], 1) - 1
+        for s_info, warm_up, start in zip(sessions_to_process, warm_up_times, start_times, strict=True):
+            day_offset = s_info["day"] - 1
             if meet_start and day_offset >= 0:
-                s_date = meet_start + datetime.timedelta(days=day_offset)
-                sess_date = s_date.strftime("%Y-%m-%d")
+                sess_date = (meet_start + datetime.timedelta(days=day_offset)).strftime("%Y-%m-%d")
             else:
-                sess_date = self._format_date(item.get("Sess_date", ""))
+                sess_date = self._format_date(s_info["date"])
 
             s_no = s_info["id"]
-            events = self._get_table("Event") or self._get_table("MTEVENT")
-            ev_count = 0
-            if s_no:
-                ev_count = sum(1 for e in events if str(e.get("Sess_no", e.get("sess_no", 1))) == str(s_no))
-
             sessions.append(
                 pb2.Session(
                     id=str(s_no),
                     meet_id="1",
                     name=s_info["name"],
                     date=sess_date,
-                    warm_up_time=self._seconds_to_time(s_info["warmup"]),
-                    start_time=self._seconds_to_time(s_info["starttime"]),
-                    event_count=s_info.get("event_cnt") or ev_count,
-                    session_num=self._safe_int(s_no, 0),
-                    day=self._safe_int(s_info["day"], 1),
+                    warm_up_time=warm_up,
+                    start_time=start,
+                    event_count=s_info["event_cnt"] or events_per_session.get(s_no, 0),
+                    session_num=s_no,
+                    day=s_info["day"],
                 )
             )
         return pb2.GetSessionsResponse(sessions=sessions)
@@ -1068,28 +1043,6 @@ class MeetManagerService(pb2_grpc.MeetManagerServiceServicer):
         except (ValueError, TypeError):
             return default
 
-    def _safe_float(self, value, default=0.0):
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return default
-
-    def _seconds_to_time(self, seconds_val):
-        try:
-            val = int(seconds_val)
-            hours = val // 3600
-            minutes = (val % 3600) // 60
-            period = "AM"
-            if hours >= 12:
-                period = "PM"
-                if hours > 12:
-                    hours -= 12
-            if hours == 0:
-                hours = 12
-            return f"{hours}:{minutes:02d} {period}"
-        except (ValueError, TypeError):
-            return ""
-
 
 def serve():
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
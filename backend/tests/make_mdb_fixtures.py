@@ -0,0 +1,463 @@
+"""
+Builds the sample meets under tests/fixtures used by the native reader parity tests.
+
+    PYTHONPATH=src python tests/make_mdb_fixtures.py
+
+A slice of the exported meet in tests/fixtures/*.json (every team, event and
+session, the first athletes with their entries, the first relays with their
+swimmers) is written twice:
+
+* ``sample_meet_jet4.mdb`` (Access 2000) by Jackcess, through mdb_restorer;
+* ``sample_meet_jet3.mdb`` (Access 97) by the Jet3 page writer below, since
+  Jackcess only reads that format. The file is read back with Jackcess and
+  compared with the source rows before it is kept.
+
+Column types are inferred from the exported strings the way Meet Manager
+declares them: 0/1 flags as Yes/No, small whole numbers as Integer, times as
+Single, fees as Currency and dates as Date/Time. An empty string is a NULL.
+"""
+
+import datetime
+import json
+import os
+import re
+import struct
+import sys
+import tempfile
+from decimal import Decimal
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, "fixtures")
+JET3_PATH = os.path.join(FIXTURES, "sample_meet_jet3.mdb")
+JET4_PATH = os.path.join(FIXTURES, "sample_meet_jet4.mdb")
+
+ATHLETES = 40
+RELAYS = 12
+WHOLE_TABLES = ["Meet", "Team", "Session", "Sessitem", "Event", "Divisions", "Scoring"]
+
+_INT = re.compile(r"^-?\d+$")
+_MONEY = re.compile(r"^-?\d+\.\d{4}$")
+_FLOAT = re.compile(r"^-?\d*\.\d+$")
+_DATE = re.compile(r"^\d\d/\d\d/\d\d \d\d:\d\d:\d\d$")
+
+
+def _load(name):
+    with open(os.path.join(FIXTURES, f"{name}.json")) as f:
+        return json.load(f)
+
+
+def sample_tables() -> dict[str, list[dict[str, str]]]:
+    tables = {name: _load(name) for name in WHOLE_TABLES}
+    tables["Athlete"] = _load("Athlete")[:ATHLETES]
+    athletes = {row["Ath_no"] for row in tables["Athlete"]}
+    tables["Entry"] = [row for row in _load("Entry") if row["Ath_no"] in athletes]
+    tables["Relay"] = _load("Relay")[:RELAYS]
+    relays = {row["Relay_no"] for row in tables["Relay"]}
+    tables["RelayNames"] = [row for row in _load("RelayNames") if row["Relay_no"] in relays]
+    return tables
+
+
+def column_type(values: list[str]) -> tuple[str, int]:
+    """(Jackcess DataType name, length in bytes) for a column of exported strings."""
+    present = [v for v in values if v != ""]
+    if present and len(present) == len(values) and set(present) <= {"0", "1"}:
+        return "BOOLEAN", 1
+    if present and all(_INT.match(v) for v in present):
+        return ("INT", 2) if all(abs(int(v)) < 2**15 for v in present) else ("LONG", 4)
+    if present and all(_MONEY.match(v) for v in present):
+        return "MONEY", 8
+    if present and all(_FLOAT.match(v) or _INT.match(v) for v in present):
+        return "FLOAT", 4
+    if present and all(_DATE.match(v) for v in present):
+        return "SHORT_DATE_TIME", 8
+    # Jet4 text lengths are in bytes, two per character
+    return "TEXT", 2 * max([len(v) for v in present] or [50])
+
+
+def parse(value: str, data_type: str):
+    if value == "":
+        return False if data_type == "BOOLEAN" else None
+    if data_type == "BOOLEAN":
+        return value == "1"
+    if data_type in ("INT", "LONG"):
+        return int(value)
+    if data_type == "MONEY":
+        return Decimal(value)
+    if data_type == "FLOAT":
+        return float(struct.unpack("<f", struct.pack("<f", float(value)))[0])
+    if data_type == "SHORT_DATE_TIME":
+        return datetime.datetime.strptime(value, "%m/%d/%y %H:%M:%S")
+    return value
+
+
+def typed_tables(tables) -> dict[str, tuple[list[tuple[str, str, int]], list[list]]]:
+    """Table name -> ([(column, type, length)], rows of Python values)."""
+    out = {}
+    for name, rows in tables.items():
+        columns = [(col, *column_type([row[col] for row in rows])) for col in rows[0]]
+        values = [[parse(row[col], data_type) for col, data_type, _ in columns] for row in rows]
+        out[name] = (columns, values)
+    return out
+
+
+def _dump_value(value):
+    # mdb_restorer takes dates as epoch milliseconds and decimals as strings
+    if isinstance(value, datetime.datetime):
+        return int(value.timestamp() * 1000)
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def write_jet4(typed, path):
+    from mm_to_json.mdb_restorer import restore_db
+
+    dump = {
+        "tables": {
+            name: {
+                "columns": [{"name": c, "type": t, "length": length} for c, t, length in columns],
+                "indexes": [],
+                "rows": [{c: _dump_value(v) for (c, _, _), v in zip(columns, row, strict=True)} for row in rows],
+            }
+            for name, (columns, rows) in typed.items()
+        }
+    }
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(dump, f)
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+        restore_db(f.name, path)
+    finally:
+        os.remove(f.name)
+
+
+# --- Jet3 ---
+
+PAGE = 2048
+TABLES_CONTAINER = 0x0F000001
+DB_PARENT_ID = 0x0F000000
+# MSysObjects flags of a system table (0x80000002 as a signed Long)
+SYSTEM_FLAGS = 0x80000002 - 2**32
+CODE_PAGE = 1252
+SORT_ORDER = 0x0409
+
+_JET3_TYPES = {
+    "BOOLEAN": (0x01, 0),
+    "INT": (0x03, 2),
+    "LONG": (0x04, 4),
+    "MONEY": (0x05, 8),
+    "FLOAT": (0x06, 4),
+    "SHORT_DATE_TIME": (0x08, 8),
+    "TEXT": (0x0A, None),
+    "MEMO": (0x0C, None),
+}
+_ACCESS_EPOCH = datetime.datetime(1899, 12, 30)
+
+CATALOG_COLUMNS = [
+    ("Id", "LONG", 4),
+    ("ParentId", "LONG", 4),
+    ("Name", "TEXT", 128),
+    ("Type", "INT", 2),
+    ("DateCreate", "SHORT_DATE_TIME", 8),
+    ("DateUpdate", "SHORT_DATE_TIME", 8),
+    ("Flags", "LONG", 4),
+    ("ForeignName", "TEXT", 128),
+    ("Database", "MEMO", 0),
+    ("Connect", "MEMO", 0),
+]
+
+
+class _Column:
+    def __init__(self, num: int, name: str, data_type: str, length: int):
+        self.num = num
+        self.name = name
+        self.data_type = data_type
+        self.code, self.size = _JET3_TYPES[data_type]
+        if self.size is None:
+            # Jet3 text is one byte per character
+            self.size = min(255, max(1, length // 2)) if data_type == "TEXT" else 0
+            self.fixed = False
+        else:
+            self.fixed = data_type != "BOOLEAN"
+        self.var_index = 0
+        self.fixed_offset = 0
+
+
+class Jet3Writer:
+    """
+    Lays out a read-only Access 97 database: header, global usage map,
+    MSysObjects and one table definition (with continuation pages), usage
+    map and data pages per table. No indexes, no long values.
+
+    Jackcess expects the header past byte 24 XOR-ed with its HEADER_MASK;
+    without one the file is still readable by jet_reader.
+    """
+
+    def __init__(self, header_mask: bytes = b""):
+        self.header_mask = header_mask
+        self.pages: list[bytearray] = []
+
+    def _new_page(self) -> int:
+        self.pages.append(bytearray(PAGE))
+        return len(self.pages) - 1
+
+    def _header(self):
+        page = self.pages[0]
+        page[0:4] = b"\x00\x01\x00\x00"
+        page[4:20] = b"Standard Jet DB\x00"
+        page[0x14] = 0  # Jet3
+        struct.pack_into("<HHI", page, 0x3A, SORT_ORDER, CODE_PAGE, 0)
+        for i, b in enumerate(self.header_mask):
+            page[24 + i] ^= b
+
+    @staticmethod
+    def _layout(columns):
+        fixed_offset = var_index = 0
+        for col in columns:
+            if col.fixed:
+                col.fixed_offset = fixed_offset
+                fixed_offset += col.size
+            elif col.data_type != "BOOLEAN":
+                col.var_index = var_index
+                var_index += 1
+        return fixed_offset, var_index
+
+    @staticmethod
+    def _value_bytes(col, value) -> bytes:
+        if col.data_type == "INT":
+            return struct.pack("<h", value)
+        if col.data_type == "LONG":
+            return struct.pack("<i", value)
+        if col.data_type == "MONEY":
+            return struct.pack("<q", int(value * 10000))
+        if col.data_type == "FLOAT":
+            return struct.pack("<f", value)
+        if col.data_type == "SHORT_DATE_TIME":
+            return struct.pack("<d", (value - _ACCESS_EPOCH) / datetime.timedelta(days=1))
+        return value.encode("cp1252")
+
+    def row(self, columns, fixed_size: int, values) -> bytes:
+        fixed = bytearray(fixed_size)
+        var = []
+        mask = bytearray((len(columns) + 7) // 8)
+        for col, value in zip(columns, values, strict=True):
+            if col.data_type == "BOOLEAN":
+                if value:
+                    mask[col.num // 8] |= 1 << (col.num % 8)
+                continue
+            data = b"" if value is None else self._value_bytes(col, value)
+            if value is not None:
+                mask[col.num // 8] |= 1 << (col.num % 8)
+            if col.fixed:
+                fixed[col.fixed_offset : col.fixed_offset + col.size] = data
+            else:
+                var.append(data)
+        body = bytearray([len(columns)]) + fixed
+        offsets = []
+        for data in var:
+            offsets.append(len(body))
+            body += data
+        offsets.append(len(body))  # end of data
+        if not var:
+            return bytes(body + mask)
+        if any(o >= 256 * 256 for o in offsets):
+            raise ValueError("Row too long")
+
+        # Var offsets hold only the low byte; the jump table lists, for every
+        # 256-byte boundary, the first offset past it. Its size follows from
+        # the total row length, so it may carry one unused (dummy) entry.
+        count = len(var)
+        base = len(body) + count + 1 + 1 + len(mask)
+        size = 0
+        while (base + size - 1) // 256 != size:
+            size += 1
+        used = len(body) // 256
+        jumps = [next(i for i, o in enumerate(offsets) if o >= 256 * (j + 1)) for j in range(used)]
+        table = bytes(jumps[::-1]).rjust(size, bytes([count]))
+        trailer = bytes(o & 0xFF for o in reversed(offsets)) + table + bytes([count])
+        return bytes(body + trailer + mask)
+
+    def _data_pages(self, tdef_page: int, rows: list[bytes]) -> list[int]:
+        pages = []
+        page_rows: list[bytes] = []
+
+        def flush():
+            if not page_rows:
+                return
+            number = self._new_page()
+            page = self.pages[number]
+            page[0:2] = b"\x01\x01"
+            struct.pack_into("<I", page, 4, tdef_page)
+            struct.pack_into("<H", page, 8, len(page_rows))
+            end = PAGE
+            for i, data in enumerate(page_rows):
+                start = end - len(data)
+                page[start:end] = data
+                struct.pack_into("<H", page, 10 + 2 * i, start)
+                end = start
+            struct.pack_into("<H", page, 2, end - 10 - 2 * len(page_rows))
+            pages.append(number)
+            page_rows.clear()
+
+        for data in rows:
+            used = 10 + sum(len(r) + 2 for r in page_rows)
+            if page_rows and (used + len(data) + 2 > PAGE or len(page_rows) == 255):
+                flush()
+            page_rows.append(data)
+        flush()
+        return pages
+
+    def _tdef(self, number: int, columns, num_rows: int, num_var: int, usage: int, free: int, system: bool):
+        tdef = bytearray(43)
+        tdef[0:2] = b"\x02\x01"
+        struct.pack_into("<I", tdef, 12, num_rows)
+        tdef[20] = 0x53 if system else 0x4E
+        struct.pack_into("<HHH", tdef, 21, len(columns), num_var, len(columns))
+        struct.pack_into("<II", tdef, 35, usage, free)
+        for col in columns:
+            entry = bytearray(18)
+            entry[0] = col.code
+            struct.pack_into("<HHH", entry, 1, col.num, col.var_index, col.num)
+            if col.data_type in ("TEXT", "MEMO"):
+                struct.pack_into("<HH", entry, 9, SORT_ORDER, CODE_PAGE)
+            entry[13] = 0x03 if col.fixed else 0x02
+            struct.pack_into("<HH", entry, 14, col.fixed_offset, col.size)
+            tdef += entry
+        for col in columns:
+            name = col.name.encode("cp1252")
+            tdef += bytes([len(name)]) + name
+        tdef += b"\xff\xff"
+        struct.pack_into("<I", tdef, 8, len(tdef) - 8)
+
+        # The definition continues on further pages, each behind an 8-byte header
+        chunks = [tdef[:PAGE]]
+        rest = tdef[PAGE:]
+        while rest:
+            chunks.append(rest[: PAGE - 8])
+            rest = rest[PAGE - 8 :]
+        current = number
+        for i, chunk in enumerate(chunks):
+            page = self.pages[current]
+            if i:
+                page[0:2] = b"\x02\x01"
+                page[8 : 8 + len(chunk)] = chunk
+            else:
+                page[: len(chunk)] = chunk
+            if i + 1 < len(chunks):
+                following = self._new_page()
+                struct.pack_into("<I", page, 4, following)
+                current = following
+
+    def write(self, typed, path):
+        self._new_page()
+        self._header()
+        # Global usage map: one inline map on page 1
+        self._new_page()
+        globals_map = bytes([0]) + struct.pack("<I", 0) + bytes(16)
+        self._place(1, [globals_map], 0)
+
+        catalog = [_Column(i, *c) for i, c in enumerate(CATALOG_COLUMNS)]
+        catalog_fixed, catalog_var = self._layout(catalog)
+        catalog_tdef = self._new_page()  # page 2
+        created = datetime.datetime(2025, 7, 19)
+        catalog_rows = [
+            [TABLES_CONTAINER, DB_PARENT_ID, "Tables", 3, created, created, 0, None, None, None],
+            [catalog_tdef, TABLES_CONTAINER, "MSysObjects", 1, created, created, SYSTEM_FLAGS, None, None, None],
+        ]
+        definitions = []
+        for name, (columns, rows) in typed.items():
+            cols = [_Column(i, c, t, length) for i, (c, t, length) in enumerate(columns)]
+            fixed_size, num_var = self._layout(cols)
+            tdef_page = self._new_page()
+            catalog_rows.append([tdef_page, TABLES_CONTAINER, name, 1, created, created, 0, None, None, None])
+            definitions.append((tdef_page, cols, fixed_size, num_var, rows))
+
+        maps_page = self._new_page()
+        usage_rows = []
+        tables = [(catalog_tdef, catalog, catalog_fixed, catalog_var, catalog_rows), *definitions]
+        for tdef_page, cols, fixed_size, num_var, rows in tables:
+            data_pages = self._data_pages(tdef_page, [self.row(cols, fixed_size, r) for r in rows])
+            first = min(data_pages)
+            bitmap = bytearray((max(data_pages) - first) // 8 + 1)
+            for p in data_pages:
+                bitmap[(p - first) // 8] |= 1 << ((p - first) % 8)
+            owned = len(usage_rows)
+            usage_rows.append(bytes([0]) + struct.pack("<I", first) + bytes(bitmap))
+            usage_rows.append(bytes([0]) + struct.pack("<I", first) + bytes(len(bitmap)))
+            self._tdef(
+                tdef_page,
+                cols,
+                len(rows),
+                num_var,
+                (maps_page << 8) | owned,
+                (maps_page << 8) | (owned + 1),
+                tdef_page == catalog_tdef,
+            )
+        self._place(maps_page, usage_rows, 0)
+
+        with open(path, "wb") as f:
+            for page in self.pages:
+                f.write(page)
+
+    def _place(self, number: int, rows: list[bytes], tdef_page: int):
+        page = self.pages[number]
+        page[0:2] = b"\x01\x01"
+        struct.pack_into("<I", page, 4, tdef_page)
+        struct.pack_into("<H", page, 8, len(rows))
+        end = PAGE
+        for i, data in enumerate(rows):
+            start = end - len(data)
+            if start < 10 + 2 * len(rows):
+                raise ValueError(f"Rows do not fit on page {number}")
+            page[start:end] = data
+            struct.pack_into("<H", page, 10 + 2 * i, start)
+            end = start
+        struct.pack_into("<H", page, 2, end - 10 - 2 * len(rows))
+
+
+def header_mask() -> bytes:
+    """Jackcess' Jet3 header mask (the JVM must be running)."""
+    from java.lang import Class
+
+    field = Class.forName("com.healthmarketscience.jackcess.impl.JetFormat").getDeclaredField("VERSION_3")
+    field.setAccessible(True)
+    return bytes(b & 0xFF for b in field.get(None).HEADER_MASK)
+
+
+def check(path, typed):
+    """Reads ``path`` back with Jackcess and compares every table with the source rows."""
+    from mm_to_json import mdb_writer
+    from mm_to_json.jackcess_reader import read_table_columns
+
+    db = mdb_writer.open_db(path)
+    try:
+        assert sorted(str(n) for n in db.getTableNames()) == sorted(typed), path
+        for name, (columns, rows) in typed.items():
+            read = read_table_columns(db, name)
+            assert read is not None and list(read) == [c for c, _, _ in columns], (path, name)
+            for i, row in enumerate(rows):
+                for (col, data_type, _), expected in zip(columns, row, strict=True):
+                    actual = read[col][i]
+                    if data_type == "MONEY" and expected is not None:
+                        expected = float(expected)
+                    assert actual == expected, (path, name, i, col, actual, expected)
+    finally:
+        db.close()
+
+
+def main():
+    from mm_to_json import mdb_writer
+
+    mdb_writer.ensure_jvm_started()
+    typed = typed_tables(sample_tables())
+    write_jet4(typed, JET4_PATH)
+    check(JET4_PATH, typed)
+    Jet3Writer(header_mask()).write(typed, JET3_PATH)
+    check(JET3_PATH, typed)
+    for path in (JET3_PATH, JET4_PATH):
+        print(f"{os.path.relpath(path, HERE)}: {os.path.getsize(path) // 1024} KB")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
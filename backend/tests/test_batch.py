@@ -0,0 +1,75 @@
+import argparse
+import os
+import shutil
+
+import pytest
+
+from mm_to_json import batch
+from mm_to_json.mm_to_json import convert_file
+
+
+def test_expand_inputs(tmp_path):
+    for name in ["b.mdb", "a.MDB", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.mdb").write_bytes(b"")
+
+    assert batch.expand_inputs([str(tmp_path)]) == [str(tmp_path / "a.MDB"), str(tmp_path / "b.mdb")]
+    assert batch.expand_inputs([str(tmp_path / "**" / "*.mdb"), str(tmp_path / "b.mdb")]) == [
+        str(tmp_path / "b.mdb"),
+        str(tmp_path / "sub" / "c.mdb"),
+    ]
+
+
+def test_run_batch_records_results_and_failures(tmp_path):
+    paths = [str(tmp_path / f"meet{i}.mdb") for i in range(3)]
+    for path in paths[:2]:
+        with open(path, "wb") as f:
+            f.write(b"not an mdb")
+
+    # Any picklable job(path, options) returning the output path
+    results = batch.run_batch(paths, os.path.join, "out.json", jobs=2)
+    assert [r.output for r in results] == [os.path.join(p, "out.json") for p in paths]
+    assert not any(r.error for r in results)
+
+    args = argparse.Namespace(
+        password=None, backend="native", report=False, format="json", raw=True, compact=True, output_dir=str(tmp_path)
+    )
+    results = batch.run_batch(paths, convert_file, args, jobs=2)
+    assert [r.path for r in results] == paths
+    assert all(r.error and r.output is None for r in results)
+    assert "FileNotFoundError" in results[2].error
+
+    text = batch.summary(results, 1.0)
+    assert "Failures:" in text
+    assert text.endswith("0/3 converted in 1.0s")
+
+
+def test_output_names_keep_same_named_meets_apart(tmp_path):
+    a, b, c = str(tmp_path / "a.mdb"), str(tmp_path / "2024" / "meet.mdb"), str(tmp_path / "2025" / "meet.mdb")
+    assert batch.output_names([a]) == {a: "a"}
+    assert batch.output_names([a, b]) == {a: "a", b: "meet"}
+    assert batch.output_names([a, b, c]) == {a: "a", b: os.path.join("2024", "meet"), c: os.path.join("2025", "meet")}
+
+    with pytest.raises(ValueError, match="meet"):
+        batch.output_names([b, str(tmp_path / "2024" / "MEET.mdb")])
+
+
+def test_batch_mirrors_directories_of_same_named_meets(tmp_path):
+    fixture = os.path.join(os.path.dirname(__file__), "fixtures", "sample_meet_jet4.mdb")
+    paths = []
+    for season in ["2024", "2025"]:
+        (tmp_path / "in" / season).mkdir(parents=True)
+        paths.append(shutil.copy(fixture, tmp_path / "in" / season / "meet.mdb"))
+    paths = batch.expand_inputs([str(tmp_path / "in" / "**" / "*.mdb")])
+
+    out = tmp_path / "out"
+    out.mkdir()
+    args = argparse.Namespace(
+        password=None, backend="native", report=False, format="json", raw=True, compact=True, output_dir=str(out)
+    )
+    args.output_names = batch.output_names(paths)
+    results = batch.run_batch(paths, convert_file, args, jobs=2)
+    assert [r.error for r in results] == [None, None]
+    assert [r.output for r in results] == [str(out / "2024" / "meet.json"), str(out / "2025" / "meet.json")]
+    assert all(os.path.getsize(r.output) for r in results)
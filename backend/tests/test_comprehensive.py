@@ -2,6 +2,7 @@ import json
 import os
 import sys
 
+import pandas as pd
 import pytest
 
 # Add src to path
@@ -158,6 +159,21 @@ def test_event_scores(service):
     assert hasattr(ent, "points")
 
 
+def test_event_scores_skip_unswum_typed_rows(service):
+    """Typed datasets store no result as a 0.0 final time, not a missing one."""
+    before = sum(len(ev.entries) for ev in service.GetEventScores(None, None).event_scores)
+    entries = pd.DataFrame(service._data_cache["Entry"])
+    relays = pd.DataFrame(service._data_cache["Relay"])
+    entries.loc[entries.index[:5], ["Fin_Time", "Fin_place"]] = [0.0, 0]
+    relays.loc[relays.index[:3], ["Fin_Time", "Fin_place"]] = [0.0, 0]
+    service._data_cache = {**service._data_cache, "Entry": entries, "Relay": relays}
+
+    resp = service.GetEventScores(None, None)
+    scored = [e for ev in resp.event_scores for e in ev.entries]
+    assert len(scored) == before - 8
+    assert all(e.place > 0 or e.final_time not in ("", "0") for e in scored)
+
+
 def test_teams_athlete_count(service):
     """(6) Check athlete count is populated (Hyperlink verify is UI test, but backend data needed)."""
     resp = service.GetTeams(None, None)
@@ -169,3 +185,15 @@ def test_teams_athlete_count(service):
             has_count = True
             break
     assert has_count
+
+
+def test_canonical_view_follows_the_loaded_dataset(service):
+    first = service._canonical()
+    assert service._canonical() is first
+
+    # A reload replaces the dataset, even with tables of the same length
+    teams = [{**row, "Team_abbr": "X"} for row in service._data_cache["Team"]]
+    service._data_cache = {**service._data_cache, "Team": teams}
+    second = service._canonical()
+    assert second is not first
+    assert set(second["team"]["abbr"]) == {"X"}
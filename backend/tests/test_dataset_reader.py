@@ -0,0 +1,187 @@
+import datetime
+import os
+
+import pandas as pd
+import pytest
+
+from mm_to_json import dataset_reader
+from mm_to_json.dataset_reader import DatasetRead, DatasetReader, diff_tables, parity_check, read_dataset
+
+
+def _typed():
+    return pd.DataFrame(
+        {
+            "Ath_no": [1, 2],
+            "Last_name": ["Swim", None],
+            "Ath_age": [10.0, float("nan")],
+            "Birth_date": [datetime.datetime(2011, 1, 28), None],
+            "Active": [True, False],
+        }
+    )
+
+
+def _strings():
+    return pd.DataFrame(
+        {
+            "Ath_no": ["1", "2"],
+            "Last_name": ["Swim", ""],
+            "Ath_age": ["10", ""],
+            "Birth_date": ["01/28/11 00:00:00", ""],
+            "Active": ["1", "0"],
+        }
+    )
+
+
+class FakeReader(DatasetReader):
+    calls: list[str] = []
+    tables: dict = {}
+    fail = False
+
+    @classmethod
+    def available(cls):
+        return True
+
+    def _read(self, path, wanted, timings):
+        type(self).calls.append(self.name)
+        if self.fail:
+            raise RuntimeError("boom")
+        timings.update(dict.fromkeys(self.tables, 0.001))
+        return dict(self.tables)
+
+
+class BrokenReader(FakeReader):
+    name = "broken"
+    fail = True
+
+
+class TypedReader(FakeReader):
+    name = "typed"
+    tables = {"Athlete": _typed()}
+
+
+class StringReader(FakeReader):
+    name = "strings"
+    tables = {"Athlete": _strings()}
+
+
+@pytest.fixture
+def fake_backends(monkeypatch, tmp_path):
+    FakeReader.calls = []
+    monkeypatch.setattr(
+        dataset_reader,
+        "READERS",
+        {**dataset_reader.READERS, "broken": BrokenReader, "typed": TypedReader, "strings": StringReader},
+    )
+    monkeypatch.setattr(dataset_reader, "BACKEND_PREFERENCE", ["broken", "typed", "strings"])
+    monkeypatch.setenv(dataset_reader.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    monkeypatch.delenv(dataset_reader.BACKEND_ENV, raising=False)
+    mdb = tmp_path / "meet.mdb"
+    mdb.write_bytes(b"not really an mdb")
+    return str(mdb)
+
+
+def test_records_match_mdb_export_format():
+    records = DatasetRead(backend="typed", tables={"Athlete": _typed()}).to_records()
+    assert records["Athlete"] == _strings().to_dict("records")
+
+
+def test_preferred_falls_back_and_caches(fake_backends):
+    first = read_dataset(fake_backends)
+    assert first.backend == "typed"
+    assert FakeReader.calls == ["broken", "typed"]
+    assert first.timings == {"Athlete": 0.001}
+
+    second = read_dataset(fake_backends)
+    assert second.backend == "cache"
+    assert FakeReader.calls == ["broken", "typed"]
+    pd.testing.assert_frame_equal(second.tables["Athlete"], first.tables["Athlete"])
+
+
+def test_filtered_reads_fill_the_cache(fake_backends):
+    TypedReader.tables = {"Athlete": _typed(), "Team": pd.DataFrame({"Team_no": [1]})}
+    try:
+        first = read_dataset(fake_backends, ["athlete"])
+        assert (first.backend, list(first.tables)) == ("typed", ["Athlete"])
+
+        second = read_dataset(fake_backends, ["TEAM"])
+        assert (second.backend, list(second.tables)) == ("cache", ["Team"])
+        assert FakeReader.calls == ["broken", "typed"]
+    finally:
+        TypedReader.tables = {"Athlete": _typed()}
+
+
+def test_converter_loads_are_served_from_the_cache(monkeypatch, tmp_path):
+    from mm_to_json.mm_to_json import MmToJsonConverter
+
+    monkeypatch.setattr(dataset_reader, "BACKEND_PREFERENCE", ["native"])
+    monkeypatch.setenv(dataset_reader.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    monkeypatch.delenv(dataset_reader.BACKEND_ENV, raising=False)
+    backends = []
+    read = dataset_reader.read_dataset
+
+    def recording(*args, **kwargs):
+        result = read(*args, **kwargs)
+        backends.append(result.backend)
+        return result
+
+    monkeypatch.setattr(dataset_reader, "read_dataset", recording)
+    mdb = os.path.join(os.path.dirname(__file__), "fixtures", "sample_meet_jet4.mdb")
+    first = MmToJsonConverter(mdb)
+    second = MmToJsonConverter(mdb)
+
+    assert backends == ["native", "cache"]
+    assert second.convert() == first.convert()
+
+
+def test_explicit_backend(fake_backends, monkeypatch):
+    assert read_dataset(fake_backends, backend="strings").backend == "strings"
+    monkeypatch.setenv(dataset_reader.BACKEND_ENV, "strings")
+    assert read_dataset(fake_backends).backend == "strings"
+    with pytest.raises(ValueError):
+        read_dataset(fake_backends, backend="nope")
+
+
+def test_parity_normalizes_types(fake_backends):
+    reads, report = parity_check(fake_backends, ["typed", "strings"])
+    assert set(reads) == {"typed", "strings"}
+    assert report == {"strings": {}}
+
+    changed = _strings()
+    changed.loc[1, "Ath_no"] = "3"
+    assert diff_tables(_typed(), changed) == ["Ath_no[1]: 2.0 != 3.0"]
+
+
+def test_preferred_order_starts_with_jackcess():
+    assert dataset_reader.BACKEND_PREFERENCE[0] == "jackcess"
+
+
+def test_cache_directory_is_private(fake_backends, tmp_path):
+    read_dataset(fake_backends)
+    assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+
+
+def test_cache_ignores_a_shared_directory(fake_backends, tmp_path):
+    shared = tmp_path / "cache"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+    read_dataset(fake_backends)
+    assert list(shared.iterdir()) == []
+    assert read_dataset(fake_backends).backend == "typed"
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = dataset_reader.CachedColumnarReader(str(tmp_path / "cache"), max_bytes=10**6)
+    result = DatasetRead(backend="typed", tables={"Athlete": _typed()})
+    first, second = tmp_path / "a.mdb", tmp_path / "b.mdb"
+    first.write_bytes(b"a")
+    second.write_bytes(b"b")
+    cache.store(str(first), result)
+    cache.store(str(second), result)
+    assert cache.lookup(str(first)) is not None
+
+    size = os.path.getsize(cache._entry(str(first)))
+    os.utime(cache._entry(str(second)), (0, 0))
+    cache.max_bytes = size
+    cache.evict()
+    assert cache.lookup(str(second)) is None
+    assert cache.lookup(str(first)) is not None
@@ -0,0 +1,70 @@
+from mm_to_json import jackcess_pool, mdb_dumper
+from mm_to_json.mm_to_json import MmToJsonConverter
+
+
+class FakePool:
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = []
+
+    def read_tables(self, mdb_path, candidates=None):
+        self.calls.append((mdb_path, list(candidates or [])))
+        return {"catalog": list(self.tables), "tables": self.tables}
+
+
+def test_converter_reads_mdb_through_pool(tmp_path, monkeypatch):
+    mdb = tmp_path / "meet.mdb"
+    mdb.write_bytes(b"")
+    pool = FakePool(
+        {
+            "MTEVENT": {"MtEvent": [1, 2], "Distance": [25, 50], "Stroke": [1, 2], "Sex": ["M", "F"]},
+            "TEAM": {"Team": [1], "TCode": ["TST"], "Short": ["Test"]},
+        }
+    )
+    monkeypatch.setattr(jackcess_pool, "get_pool", lambda: pool)
+
+    converter = MmToJsonConverter(mdb_path=str(mdb), use_pool=True)
+
+    assert converter.db is None
+    assert converter.schema_type == "B"
+    assert len(converter.tables["Event"]) == 2
+    assert converter.get_team_name(1) == "Test"
+    # Only the aliased tables are requested from the worker
+    assert "MTEVENT" in pool.calls[0][1]
+
+
+def test_pool_disabled_by_env(monkeypatch):
+    monkeypatch.setenv(jackcess_pool.WORKERS_ENV, "0")
+    assert not jackcess_pool.enabled()
+    monkeypatch.setenv(jackcess_pool.WORKERS_ENV, "3")
+    assert jackcess_pool.configured_workers() == 3
+
+
+class FakeDate:
+    def getTime(self):
+        return 1234567890123
+
+
+def test_dump_keeps_dates_and_decimals_exact():
+    assert mdb_dumper.dump_converter("SHORT_DATE_TIME")(FakeDate()) == 1234567890123
+    assert mdb_dumper.dump_converter("MONEY")("12.3456") == "12.3456"
+    assert mdb_dumper.dump_converter("NUMERIC")("1234567890.123456") == "1234567890.123456"
+
+
+def test_dump_and_restore_run_in_the_pool(monkeypatch):
+    calls = []
+
+    class Pool:
+        def dump_db(self, mdb_path, output_json):
+            calls.append(("dump", mdb_path, output_json))
+            return output_json
+
+        def restore_db(self, json_path, target_mdb):
+            calls.append(("restore", json_path, target_mdb))
+            return target_mdb
+
+    monkeypatch.setenv(jackcess_pool.WORKERS_ENV, "1")
+    monkeypatch.setattr(jackcess_pool, "get_pool", Pool)
+    jackcess_pool.dump_db("meet.mdb", "meet.json")
+    jackcess_pool.restore_db("meet.json", "copy.mdb")
+    assert calls == [("dump", "meet.mdb", "meet.json"), ("restore", "meet.json", "copy.mdb")]
@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+
+from mm_to_json.jackcess_reader import converter_for, read_table_columns
+
+
+class FakeDate:
+    def __init__(self, millis):
+        self._millis = millis
+
+    def getTime(self):
+        return self._millis
+
+
+def test_converter_for_picks_type_once():
+    assert converter_for("LONG")("12") == 12
+    assert converter_for("DOUBLE")("1.5") == 1.5
+    assert converter_for("BOOLEAN")(1) is True
+    assert converter_for("TEXT")("abc") == "abc"
+    assert converter_for("BINARY")(b"\x01\x02") == "AQI="
+    assert converter_for("SHORT_DATE_TIME")(FakeDate(0)) == datetime.datetime.fromtimestamp(0)
+
+
+@pytest.fixture(scope="module")
+def jackcess():
+    pytest.importorskip("jpype")
+    from mm_to_json import mdb_writer
+
+    if not mdb_writer.jvm_available():
+        pytest.skip("No JVM or Jackcess jars")
+    mdb_writer.ensure_jvm_started()
+
+
+def _create_athletes(path):
+    import jpype
+    from com.healthmarketscience.jackcess import ColumnBuilder, Database, DatabaseBuilder, DataType, TableBuilder
+    from java.io import File
+    from java.math import BigDecimal
+    from java.util import Date
+
+    db = DatabaseBuilder.create(Database.FileFormat.V2000, File(str(path)))
+    table = (
+        TableBuilder("Athlete")
+        .addColumn(ColumnBuilder("Ath_no", DataType.LONG))
+        .addColumn(ColumnBuilder("Last_name", DataType.TEXT))
+        .addColumn(ColumnBuilder("Ath_age", DataType.INT))
+        .addColumn(ColumnBuilder("Birth_date", DataType.SHORT_DATE_TIME))
+        .addColumn(ColumnBuilder("Active", DataType.BOOLEAN))
+        .addColumn(ColumnBuilder("Fee", DataType.MONEY))
+        .addColumn(ColumnBuilder("Photo", DataType.OLE))
+        .toTable(db)
+    )
+    photo = jpype.JArray(jpype.JByte)(b"\x01\x02")
+    table.addRow(1, "Swim", jpype.JShort(10), Date(0), True, BigDecimal("12.50"), photo)
+    table.addRow(2, None, None, None, False, None, None)
+    table.addRow(3, "a\x00b", jpype.JShort(12), None, True, BigDecimal("0"), None)
+    db.close()
+
+
+def test_read_table_columns_is_columnar(jackcess, tmp_path):
+    from mm_to_json import mdb_writer
+
+    _create_athletes(tmp_path / "meet.mdb")
+    db = mdb_writer.open_db(str(tmp_path / "meet.mdb"))
+    try:
+        data = read_table_columns(db, "Athlete")
+        assert read_table_columns(db, "Missing") is None
+    finally:
+        db.close()
+
+    assert data == {
+        "Ath_no": [1, 2, 3],
+        # The separator inside a value sends the column down the cell-by-cell path
+        "Last_name": ["Swim", None, "a\x00b"],
+        "Ath_age": [10, None, 12],
+        "Birth_date": [datetime.datetime.fromtimestamp(0), None, None],
+        "Active": [True, False, True],
+        "Fee": [12.5, None, 0.0],
+        "Photo": ["AQI=", None, None],
+    }
@@ -0,0 +1,249 @@
+import datetime
+import glob
+import os
+import struct
+
+import pandas as pd
+import pytest
+
+from mm_to_json import jet_reader
+from mm_to_json.jet_reader import JetReader, decode_text
+
+PAGE = 4096
+
+# (name, type, fixed size or None for variable)
+CATALOG_COLS = [
+    ("Id", jet_reader.COL_LONG, 4),
+    ("Name", jet_reader.COL_TEXT, None),
+    ("Type", jet_reader.COL_INT, 2),
+    ("Flags", jet_reader.COL_LONG, 4),
+]
+ATHLETE_COLS = [
+    ("Ath_no", jet_reader.COL_LONG, 4),
+    ("Last_name", jet_reader.COL_TEXT, None),
+    ("Ath_age", jet_reader.COL_INT, 2),
+    ("Birth_date", jet_reader.COL_DATETIME, 8),
+    ("Active", jet_reader.COL_BOOL, 0),
+    ("Notes", jet_reader.COL_MEMO, None),
+]
+
+
+def _tdef(cols, usage_map=0):
+    buf = bytearray(63)
+    buf[0] = jet_reader.PAGE_TDEF
+    buf[1] = 0x01
+    struct.pack_into("<H", buf, 45, len(cols))
+    struct.pack_into("<I", buf, 55, usage_map)
+    fixed_offset = 0
+    var_index = 0
+    names = bytearray()
+    for num, (name, col_type, size) in enumerate(cols):
+        entry = bytearray(25)
+        entry[0] = col_type
+        struct.pack_into("<H", entry, 5, num)
+        struct.pack_into("<H", entry, 9, num)
+        if size is None:
+            struct.pack_into("<H", entry, 7, var_index)
+            var_index += 1
+        else:
+            entry[15] = jet_reader.COL_FLAG_FIXED
+            struct.pack_into("<H", entry, 21, fixed_offset)
+            struct.pack_into("<H", entry, 23, size)
+            fixed_offset += size
+        buf += entry
+        encoded = name.encode("utf-16-le")
+        names += struct.pack("<H", len(encoded)) + encoded
+    return bytes(buf + names)
+
+
+def _row(cols, values):
+    fixed = bytearray()
+    var = []
+    mask = bytearray((len(cols) + 7) // 8)
+    for num, ((_, col_type, size), value) in enumerate(zip(cols, values, strict=True)):
+        present = value is not None and value is not False
+        if col_type == jet_reader.COL_BOOL:
+            pass
+        elif size is None:
+            if col_type == jet_reader.COL_MEMO and value is not None:
+                data = value.encode("utf-16-le")
+                value = struct.pack("<II4x", 0x80000000 | len(data), 0) + data
+            elif value is not None:
+                value = b"\xff\xfe" + value.encode("latin-1")
+            var.append(value or b"")
+        else:
+            fmt = {4: "<i", 2: "<h", 8: "<d"}[size]
+            fixed += struct.pack(fmt, value if value is not None else 0)
+        if present:
+            mask[num // 8] |= 1 << (num % 8)
+    offsets = [2 + len(fixed)]
+    for v in var:
+        offsets.append(offsets[-1] + len(v))
+    tail = b"".join(struct.pack("<H", o) for o in reversed(offsets))
+    return struct.pack("<H", len(cols)) + bytes(fixed) + b"".join(var) + tail + struct.pack("<H", len(var)) + mask
+
+
+def _data_page(tdef_page, rows, deleted=()):
+    page = bytearray(PAGE)
+    page[0] = jet_reader.PAGE_DATA
+    struct.pack_into("<I", page, 4, tdef_page)
+    struct.pack_into("<H", page, 0x0C, len(rows))
+    end = PAGE
+    for i, row in enumerate(rows):
+        start = end - len(row)
+        page[start:end] = row
+        struct.pack_into("<H", page, 0x0E + 2 * i, start | (jet_reader.ROW_DELETED if i in deleted else 0))
+        end = start
+    return bytes(page)
+
+
+def _page(content):
+    return content + bytes(PAGE - len(content))
+
+
+def _build_mdb(path):
+    header = bytearray(PAGE)
+    header[0x14] = 0x01  # Jet4
+    catalog_rows = [
+        _row(CATALOG_COLS, [4, "Athlete", 1, 0]),
+        _row(CATALOG_COLS, [2, "MSysObjects", 1, -0x80000000]),
+    ]
+    # Inline usage map for Athlete: first page 0, bit 5 set
+    usage = bytearray(1 + 4 + 1)
+    usage[5] = 1 << 5
+    usage_page = _data_page(0, [bytes(usage)])
+    athlete_rows = [
+        _row(ATHLETE_COLS, [1, "Swim", 10, 40000.5, True, "Backstroke"]),
+        _row(ATHLETE_COLS, [2, None, None, None, False, None]),
+        _row(ATHLETE_COLS, [3, "Gone", 12, 0.0, True, None]),
+    ]
+    pages = [
+        bytes(header),
+        _page(b""),
+        _page(_tdef(CATALOG_COLS)),
+        _data_page(2, catalog_rows),
+        _page(_tdef(ATHLETE_COLS, usage_map=(6 << 8) | 0)),
+        _data_page(4, athlete_rows, deleted={2}),
+        usage_page,
+    ]
+    with open(path, "wb") as f:
+        f.write(b"".join(pages))
+
+
+def test_reads_synthetic_jet4_table(tmp_path):
+    mdb = tmp_path / "meet.mdb"
+    _build_mdb(mdb)
+
+    with JetReader(str(mdb)) as reader:
+        assert reader.fmt is jet_reader.JET4
+        assert reader.table_names() == ["Athlete"]
+        df = reader.read_table("athlete")
+
+    assert list(df.columns) == [c[0] for c in ATHLETE_COLS]
+    assert df["Ath_no"].tolist() == [1, 2]
+    assert df["Last_name"].tolist() == ["Swim", None]
+    assert df["Ath_age"].iloc[0] == 10 and pd.isna(df["Ath_age"].iloc[1])
+    assert df["Birth_date"].iloc[0] == pd.Timestamp(datetime.datetime(2009, 7, 6, 12, 0))
+    assert pd.isna(df["Birth_date"].iloc[1])
+    assert df["Active"].tolist() == [True, False]
+    assert df["Notes"].tolist() == ["Backstroke", None]
+
+
+def test_read_tables_filters_candidates(tmp_path):
+    mdb = tmp_path / "meet.mdb"
+    _build_mdb(mdb)
+    assert list(jet_reader.read_tables(str(mdb), ["ATHLETE"])) == ["Athlete"]
+    assert jet_reader.read_tables(str(mdb), ["Entry"]) == {}
+
+
+def test_decode_text_compressed_unicode():
+    assert decode_text(b"\xff\xfeabc", 4) == "abc"
+    # 0x00 switches to UCS-2 for a run and back
+    assert decode_text(b"\xff\xfeab\x00\xe9\x00\x00c", 4) == "abéc"
+    assert decode_text("Zoë".encode("utf-16-le"), 4) == "Zoë"
+    assert decode_text(b"Zo\xeb", 3) == "Zoë"
+
+
+# (name, Jackcess type, length in bytes)
+NOTES_COLS = [("Id", "INT", 2), ("A", "TEXT", 510), ("B", "TEXT", 510), ("C", "TEXT", 510)]
+NOTES_ROWS = [
+    [1, "a", None, "c"],
+    # Data ends just short of 256 bytes: the jump table holds only the unused entry
+    [2, "x" * 200, "y" * 44, None],
+    [3, "x" * 250, None, "z" * 10],
+    # Three boundaries, one of them at the end of the data
+    [4, "p" * 255, "q" * 255, "r" * 255],
+    [5, None, "m" * 255, "n" * 3],
+]
+
+
+def test_reads_jet3_rows_past_the_jump_table(tmp_path):
+    from make_mdb_fixtures import Jet3Writer
+
+    mdb = tmp_path / "notes.mdb"
+    Jet3Writer().write({"Notes": (NOTES_COLS, NOTES_ROWS)}, str(mdb))
+
+    with JetReader(str(mdb)) as reader:
+        assert reader.fmt is jet_reader.JET3
+        assert reader.table_names() == ["Notes"]
+        df = reader.read_table("Notes")
+
+    assert [list(row) for row in df.itertuples(index=False)] == NOTES_ROWS
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+SAMPLE_DIR = os.environ.get("MM_SAMPLE_MDB_DIR", os.path.join(os.path.dirname(__file__), "..", "data"))
+# The committed Access 97 and 2000 meets, plus any local samples
+SAMPLE_MDBS = sorted(glob.glob(os.path.join(FIXTURES, "*.mdb"))) + sorted(glob.glob(os.path.join(SAMPLE_DIR, "*.mdb")))
+
+
+def test_fixtures_cover_both_formats():
+    versions = set()
+    for path in glob.glob(os.path.join(FIXTURES, "*.mdb")):
+        with JetReader(path) as reader:
+            versions.add(reader.fmt.version)
+            if reader.fmt is jet_reader.JET3:
+                # The Meet row is long enough to carry a jump table
+                spans = reader._row_spans(reader.table("Meet"))
+                assert max(end - start for start, end in spans) > 256
+    assert versions == {3, 4}
+
+
+@pytest.fixture(scope="module")
+def jackcess():
+    pytest.importorskip("jpype")
+    from mm_to_json import mdb_writer
+
+    if not mdb_writer.jvm_available():
+        pytest.skip("No JVM or Jackcess jars")
+    mdb_writer.ensure_jvm_started()
+
+
+def _assert_parity(mdb_path, candidates=None):
+    from mm_to_json import mdb_writer
+    from mm_to_json.jackcess_reader import read_table_columns
+
+    db = mdb_writer.open_db(mdb_path)
+    try:
+        native = jet_reader.read_tables(mdb_path, candidates)
+        assert native
+        for name, df in native.items():
+            reference = pd.DataFrame(read_table_columns(db, name))
+            assert jet_reader.compare_frames(reference, df) == [], name
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("mdb_path", SAMPLE_MDBS, ids=os.path.basename)
+def test_parity_with_jackcess(jackcess, mdb_path):
+    from mm_to_json.mm_to_json import TABLE_ALIASES
+
+    _assert_parity(mdb_path, [name for names in TABLE_ALIASES.values() for name in names])
+
+
+def test_jet3_jump_table_parity_with_jackcess(jackcess, tmp_path):
+    from make_mdb_fixtures import Jet3Writer, header_mask
+
+    mdb = tmp_path / "notes.mdb"
+    Jet3Writer(header_mask()).write({"Notes": (NOTES_COLS, NOTES_ROWS)}, str(mdb))
+    _assert_parity(str(mdb))
@@ -0,0 +1,54 @@
+import datetime
+import glob
+import io
+import json
+import os
+
+import numpy as np
+
+from mm_to_json.json_writer import write_json
+from mm_to_json.mm_to_json import MmToJsonConverter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _converter():
+    table_data = {}
+    for path in glob.glob(os.path.join(FIXTURES_DIR, "*.json")):
+        with open(path) as f:
+            table_data[os.path.basename(path)[:-5]] = json.load(f)
+    return MmToJsonConverter(table_data=table_data)
+
+
+def test_streamed_output_matches_json_dump():
+    expected = json.dumps(_converter().convert(), indent=4)
+
+    out = io.StringIO()
+    write_json(_converter().stream(), out)
+    assert out.getvalue() == expected
+
+
+def test_compact_output():
+    out = io.StringIO()
+    write_json(_converter().stream(), out, indent=None)
+    text = out.getvalue()
+    assert "\n" not in text
+    assert json.loads(text) == _converter().convert()
+
+
+def test_nested_iterators_and_non_json_values():
+    for indent in (4, None):
+        doc = {
+            "when": datetime.date(2025, 7, 19),
+            "rows": iter([{"n": np.int64(3)}, {"n": 1.5}]),
+            "empty": iter([]),
+            "nested": {"inner": iter(["a"])},
+        }
+        out = io.StringIO()
+        write_json(doc, out, indent=indent)
+        assert json.loads(out.getvalue()) == {
+            "when": "2025-07-19",
+            "rows": [{"n": 3}, {"n": 1.5}],
+            "empty": [],
+            "nested": {"inner": ["a"]},
+        }
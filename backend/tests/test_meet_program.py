@@ -1,8 +1,14 @@
+import copy
+import glob
+import json
+import os
 import unittest
 
 import pandas as pd
 
-from mm_to_json.mm_to_json import Event, MmToJsonConverter
+from mm_to_json.mm_to_json import TABLE_ALIASES, Event, MmToJsonConverter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
 
 
 class TestMeetProgramData(unittest.TestCase):
@@ -85,16 +91,171 @@ class TestMeetProgramData(unittest.TestCase):
         # Verify
         self.assertEqual(len(event.entries), 1)
         entry = event.entries[0]
-        self.assertEqual(entry["team"], "Test Team")
-        self.assertEqual(entry["relayLtr"], "A")
+        self.assertEqual(entry.team, "Test Team")
+        self.assertEqual(entry.relay_ltr, "A")
 
         # Check relaySwimmers
-        self.assertIn("relaySwimmers", entry)
-        swimmers = entry["relaySwimmers"]
+        swimmers = entry.to_dict()["relaySwimmers"]
         self.assertEqual(len(swimmers), 2)
         self.assertEqual(swimmers[0], "J. Doe")
         self.assertEqual(swimmers[1], "J. Doe")
 
+    def test_individual_entries_grouped_per_event(self):
+        self.converter.tables["Entry"] = pd.DataFrame(
+            {
+                "Event_ptr": [2, 3, 2, 2],
+                "Ath_no": [101, 101, 102, 101],
+                "Pre_heat": [0, 0, 0, 0],
+                "Pre_lane": [0, 0, 0, 0],
+                "Fin_heat": [1, 1, 1, 0],
+                "Fin_lane": [5, 2, 3, 0],
+                "Fin_Time": [31.24, 0.0, None, 0.0],
+                "ConvSeed_time": [32.5, 0.0, 75.0, 40.0],
+                "Fin_place": [1, 0, 0, 0],
+            }
+        )
+
+        def event(ptr):
+            return Event(1, False, "M", "Boys", 0, 109, 50, "Freestyle", "", "F", ptr, 6)
+
+        first = event(2)
+        self.converter.add_individual_entries(first)
+        # Unseeded rows (heat/lane 0) are skipped, table order is kept
+        self.assertEqual([e.name for e in first.entries], ["John Doe", "Jane Doe"])
+        self.assertEqual([(e.heat, e.lane) for e in first.entries], [(1, 5), (1, 3)])
+        self.assertEqual([e.seed_time for e in first.entries], ["32.50", "1:15.00"])
+        self.assertEqual([e.final_time for e in first.entries], ["31.24", "NT"])
+        self.assertEqual(first.entries[0].place, 1)
+
+        other = event(3)
+        self.converter.add_individual_entries(other)
+        self.assertEqual([(e.lane, e.seed_time, e.final_time) for e in other.entries], [(2, "NT", "NT")])
+
+        # Replacing the table invalidates the grouped columns
+        self.converter.tables["Entry"] = self.converter.tables["Entry"].iloc[:1]
+        again = event(2)
+        self.converter.add_individual_entries(again)
+        self.assertEqual(len(again.entries), 1)
+
+    def test_relay_legs_index_keys_on_team_letter_and_round(self):
+        self.converter.tables["RelayNames"] = pd.DataFrame(
+            {
+                "Event_ptr": [1, 1, 1, 1, 1],
+                "Team_no": [10, 10, 10, 10, 10],
+                "Team_ltr": ["A", "B", "A", "A", None],
+                "Event_round": ["F", "F", "P", "F", "F"],
+                "Ath_no": [102, 101, 101, 101, 101],
+            }
+        )
+        legs = self.converter.relay_legs()
+        self.assertEqual(legs[(1, 10, "A", "F")], [102, 101])
+        self.assertEqual(legs[(1, 10, "A", "P")], [101])
+        self.assertIs(self.converter.relay_legs(), legs)
+
+        athletes = self.converter.get_relay_athletes(1, 10, "A", "F")
+        self.assertEqual([a["first"] for a in athletes], ["Jane", "John"])
+        self.assertEqual(self.converter.get_relay_athletes(1, 10, "C", "F"), [])
+
+    def test_replace_table_rebuilds_dependent_lookups(self):
+        self.assertEqual(self.converter.get_athlete_by_number(101)["team"], "Test Team")
+        divisions = self.converter.cache_division_map
+
+        self.converter.replace_table("Team", pd.DataFrame([{"Team_no": 10, "Team_abbr": "NEW", "Team_lsc": "TV"}]))
+        athlete = self.converter.get_athlete_by_number(101)
+        self.assertEqual((athlete["first"], athlete["age"], athlete["team"]), ("John", 14, "NEW-TV"))
+        self.assertIs(self.converter.cache_division_map, divisions)
+
+        self.converter.replace_table("Athlete", self.converter.tables["Athlete"].iloc[1:])
+        self.assertIsNone(self.converter.get_athlete_by_number(101))
+        self.assertEqual(self.converter.get_athlete_by_number(102)["team"], "NEW-TV")
+
+    def test_convert_is_cached_per_dataset_version(self):
+        for logical in TABLE_ALIASES:
+            self.converter.tables.setdefault(logical, pd.DataFrame())
+        first = self.converter.convert()
+        self.assertIs(self.converter.convert(), first)
+
+        version = self.converter.dataset_version()
+        self.converter.replace_table("Team", pd.DataFrame([{"Team_no": 10, "Team_abbr": "NEW"}]))
+        self.assertNotEqual(self.converter.dataset_version(), version)
+        second = self.converter.convert()
+        self.assertIsNot(second, first)
+        relay = second["sessions"][0]["events"][0]["entries"][0]
+        self.assertEqual(relay["team"], "NEW")
+
+    def test_meet_model_holds_slotted_records(self):
+        for logical in TABLE_ALIASES:
+            self.converter.tables.setdefault(logical, pd.DataFrame())
+        model = self.converter.meet_model()
+        self.assertIs(self.converter.meet_model(), model)
+
+        event = model["sessions"][0].events[0]
+        relay = event.entries[0]
+        self.assertFalse(hasattr(relay, "__dict__"))
+        self.assertEqual((relay.team, relay.relay_ltr, relay.name), ("Test Team", "A", "J. Doe, J. Doe"))
+        self.assertEqual(self.converter.convert()["sessions"][0]["events"][0], event.to_dict())
+
+    def test_meet_entries_relay_rows_show_letter_and_heat_lane(self):
+        from mm_to_json.reporting.extractor import ReportDataExtractor
+
+        for logical in TABLE_ALIASES:
+            self.converter.tables.setdefault(logical, pd.DataFrame())
+        data = ReportDataExtractor(self.converter).extract_meet_entries_data()
+
+        relay_rows = [item for item in data["groups"][0]["athletes"] if item.get("force_1col")]
+        first_line = relay_rows[0]["sub_items"][0]
+        self.assertTrue(first_line["desc"].startswith("Test Team - 'A' "))
+        self.assertEqual(first_line["heat_lane"], "1/4")
+
+    def test_updated_rebuilds_only_events_with_changed_rows(self):
+        tables = {}
+        for path in glob.glob(os.path.join(FIXTURES_DIR, "*.json")):
+            with open(path) as f:
+                tables[os.path.basename(path)[:-5]] = json.load(f)
+        converter = MmToJsonConverter(table_data=tables)
+        before = converter.convert()
+        before_model = converter.meet_model()
+        before_entries = [list(e.entries) for s in before_model["sessions"] for e in s.events]
+
+        # A new result for one swimmer; everything else re-read unchanged
+        entries = copy.deepcopy(tables["Entry"])
+        row = next(r for r in entries if r["Fin_heat"] and r["Fin_lane"])
+        row["Fin_Time"] = 12.34
+        updated, rebuilt_ptrs = converter.updated(dict(tables, Entry=entries))
+        self.assertIsNot(updated, converter)
+        self.assertEqual(rebuilt_ptrs, {row["Event_ptr"]})
+
+        # The original converter still serves the old dataset, untouched
+        self.assertIs(converter.convert(), before)
+        self.assertIs(converter.meet_model(), before_model)
+        self.assertEqual([e.entries for s in before_model["sessions"] for e in s.events], before_entries)
+
+        after = updated.convert()
+        self.assertEqual(after, MmToJsonConverter(table_data=dict(tables, Entry=entries)).convert())
+        pairs = [
+            (old, new)
+            for old_sess, new_sess in zip(before["sessions"], after["sessions"], strict=True)
+            for old, new in zip(old_sess["events"], new_sess["events"], strict=True)
+        ]
+        rebuilt = [new for old, new in pairs if new is not old]
+        # Only the changed event's output is rebuilt; every other event dict is reused
+        self.assertEqual(len(rebuilt), sum(old != new for old, new in pairs))
+        self.assertEqual(len(rebuilt), 1)
+        unchanged = [
+            new is old
+            for old_sess, new_sess in zip(before_model["sessions"], updated.meet_model()["sessions"], strict=True)
+            for old, new in zip(old_sess.events, new_sess.events, strict=True)
+        ]
+        self.assertEqual(unchanged.count(False), 1)
+
+        # Anything beyond entries and athletes rebuilds the whole model
+        meet = copy.deepcopy(tables["Meet"])
+        meet[0]["Meet_name1"] = "Renamed"
+        renamed, rebuilt_ptrs = updated.updated(dict(tables, Entry=entries, Meet=meet))
+        self.assertIsNone(rebuilt_ptrs)
+        self.assertEqual(renamed.convert()["meetName"], "Renamed")
+        self.assertIs(updated.convert(), after)
+
 
 if __name__ == "__main__":
     unittest.main()
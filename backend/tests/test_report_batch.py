@@ -0,0 +1,454 @@
+import hashlib
+import io
+import os
+import threading
+import time
+import zipfile
+
+import pytest
+
+from mm_to_json.mm_to_json import MmToJsonConverter
+from mm_to_json.report_generator import ReportGenerator
+
+pytest.importorskip("weasyprint")
+
+from mm_to_json.reporting import render_pool, report_batch, report_jobs  # noqa: E402
+from mm_to_json.reporting.extractor import ReportDataExtractor  # noqa: E402
+from mm_to_json.reporting.render_assets import STYLESHEET, RenderAssets  # noqa: E402
+from mm_to_json.reporting.report_cache import ReportCache  # noqa: E402
+from mm_to_json.reporting.weasy_renderer import WeasyRenderer, split_groups  # noqa: E402
+
+TABLES = {
+    "Meet": [{"Meet_name1": "Test Meet", "Meet_start": "2026-02-13", "Meet_end": "2026-02-13"}],
+    "Session": [{"Sess_ptr": 1, "Sess_no": 1, "Sess_name": "Session 1", "Sess_day": 1, "Sess_starttime": 32400}],
+    "Sessitem": [{"Sess_ptr": 1, "Event_ptr": 1, "Sess_order": 1, "Sess_rnd": "F"}],
+    "Event": [
+        {
+            "Event_no": 1,
+            "Event_ptr": 1,
+            "Ind_rel": "I",
+            "Event_gender": "M",
+            "Event_dist": 50,
+            "Event_stroke": "A",
+            "Low_age": 11,
+            "High_age": 12,
+            "Num_finlanes": 6,
+            "Event_rounds": 1,
+        }
+    ],
+    "Athlete": [{"Ath_no": 1, "First_name": "Alice", "Last_name": "Athlete", "Ath_age": 11, "Team_no": 1}],
+    "Team": [{"Team_no": 1, "Team_abbr": "TST", "Team_name": "Test Team"}],
+    "Entry": [{"Event_ptr": 1, "Ath_no": 1, "Fin_heat": 1, "Fin_lane": 1, "ConvSeed_time": 30.5, "Fin_place": 1}],
+    "Relay": [],
+    "RelayNames": [],
+}
+
+
+@pytest.fixture(autouse=True)
+def render_in_process(monkeypatch):
+    # Worker processes are covered by the RenderPool tests below
+    monkeypatch.setenv(render_pool.WORKERS_ENV, "0")
+
+
+def count_entries_extractions(monkeypatch):
+    calls = []
+    original = ReportDataExtractor.extract_meet_entries_data
+
+    def counting(self, *args, **kwargs):
+        calls.append(kwargs)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ReportDataExtractor, "extract_meet_entries_data", counting)
+    return calls
+
+
+def test_batch_shares_extraction_and_reports_failures(monkeypatch):
+    calls = count_entries_extractions(monkeypatch)
+    specs = [
+        report_batch.ReportSpec("entries"),
+        report_batch.ReportSpec("entries_club"),
+        report_batch.ReportSpec("entries", team_filter="TST"),
+        report_batch.ReportSpec("program_html"),
+        report_batch.ReportSpec("bogus"),
+    ]
+    reports = report_batch.generate_reports(MmToJsonConverter(table_data=TABLES), specs, jobs=2)
+
+    assert [r.spec for r in reports] == specs
+    # entries and entries_club read the same data; the team-filtered report is its own extraction
+    assert len(calls) == 2
+    assert all(r.content for r in reports[:4])
+    assert reports[3].filename.endswith(".html") and reports[3].html is not None
+    assert "_TST_" in reports[2].filename
+    assert reports[4].error.startswith("ValueError")
+
+    buf = io.BytesIO()
+    report_batch.write_zip(reports, buf)
+    with zipfile.ZipFile(buf) as zf:
+        names = zf.namelist()
+        assert len(names) == 4 and len(set(names)) == 4
+        assert zf.read(reports[3].filename) == reports[3].content
+
+
+def test_report_generator_batch_writes_zip(tmp_path):
+    generator = ReportGenerator(MmToJsonConverter(table_data=TABLES), title="Custom")
+    zip_path = tmp_path / "reports.zip"
+    reports = generator.generate_batch([("entries_club",), ("entries", None, "Finals")], zip_path=str(zip_path))
+
+    assert [r.spec.title for r in reports] == ["Custom", "Finals"]
+    with zipfile.ZipFile(zip_path) as zf:
+        assert sorted(zf.namelist()) == sorted(r.filename for r in reports)
+
+    # The caller's specs are left as they were
+    specs = [report_batch.ReportSpec("entries_club")]
+    generator.generate_batch(specs)
+    other = ReportGenerator(MmToJsonConverter(table_data=TABLES), title="Other")
+    assert specs[0].title is None
+    assert [r.spec.title for r in other.generate_batch(specs)] == ["Other"]
+
+
+def test_cache_serves_unchanged_reports_without_extracting(monkeypatch, tmp_path):
+    calls = count_entries_extractions(monkeypatch)
+    cache = ReportCache(str(tmp_path))
+    specs = [report_batch.ReportSpec("entries"), report_batch.ReportSpec("program_html")]
+    first = report_batch.generate_reports(MmToJsonConverter(table_data=TABLES), specs, cache=cache)
+    assert len(calls) == 1
+
+    # A reload of the same data hits the cache
+    again = report_batch.generate_reports(MmToJsonConverter(table_data=TABLES), specs, cache=cache)
+    assert len(calls) == 1
+    assert [r.content for r in again] == [r.content for r in first]
+    assert again[1].html == first[1].html
+
+    # Changed data, or another title, is rendered again
+    renamed = dict(TABLES, Team=[{"Team_no": 1, "Team_abbr": "NEW", "Team_name": "Test Team"}])
+    report_batch.generate_reports(MmToJsonConverter(table_data=renamed), specs[:1], cache=cache)
+    report_batch.generate_reports(
+        MmToJsonConverter(table_data=TABLES), [report_batch.ReportSpec("entries", title="X")], cache=cache
+    )
+    assert len(calls) == 3
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ReportCache(str(tmp_path), max_bytes=25)
+    cache.put("a", b"a" * 10)
+    cache.put("b", b"b" * 10)
+    # Older than anything written below, whatever the filesystem's timestamp resolution
+    for i, key in enumerate("ab"):
+        os.utime(tmp_path / f"{key}.bin", ns=(i, i))
+    assert cache.get("a") == b"a" * 10
+    cache.put("c", b"c" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    cache.put("huge", b"x" * 100)
+    assert cache.get("huge") is None
+
+
+def test_render_pool_renders_in_workers_and_recovers_from_timeouts():
+    pool = render_pool.RenderPool(max_workers=1, max_queue=0, warm=False)
+    try:
+        # A cold pool cannot spawn a worker this fast
+        with pytest.raises(render_pool.RenderTimeoutError):
+            pool.render_pdf("<p>slow</p>", timeout=0.001)
+        assert pool.render_pdf("<p>hello</p>").startswith(b"%PDF")
+
+        # One slot, taken: the next job waits, then gives up
+        pool.timeout = 0.01
+        assert pool._slots.acquire(timeout=0)
+        with pytest.raises(render_pool.RenderQueueFullError):
+            pool.render_pdf("<p>queued</p>")
+        pool._slots.release()
+    finally:
+        pool.shutdown()
+
+
+def test_render_pool_timeout_includes_the_queue_wait():
+    pool = render_pool.RenderPool(max_workers=1, max_queue=0, timeout=1.0)
+    try:
+        assert pool.render_pdf("<p>warm</p>").startswith(b"%PDF")
+        worker = pool._call(os.getpid)
+
+        # Most of the budget goes to waiting for the slot, so a hung job is stopped soon after
+        assert pool._slots.acquire(timeout=0)
+        threading.Timer(0.6, pool._slots.release).start()
+        started = time.monotonic()
+        with pytest.raises(render_pool.RenderTimeoutError):
+            pool._call(time.sleep, 30)
+        assert time.monotonic() - started < 1.4
+
+        # The hung worker was killed, and a fresh one takes over
+        if os.path.isdir("/proc"):
+            deadline = time.monotonic() + 10
+            while os.path.exists(f"/proc/{worker}") and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert not os.path.exists(f"/proc/{worker}")
+        assert pool._call(os.getpid, timeout=30) != worker
+    finally:
+        pool.shutdown()
+
+
+class TwoPagePool:
+    """Stands in for RenderPool: every chunk becomes a real two-page PDF."""
+
+    max_workers = 3
+
+    def __init__(self):
+        self.htmls = []
+
+    def render_pdf(self, html):
+        from reportlab.pdfgen import canvas
+
+        self.htmls.append(html)
+        buf = io.BytesIO()
+        pdf = canvas.Canvas(buf)
+        for _ in range(2):
+            pdf.drawString(72, 720, "chunk")
+            pdf.showPage()
+        pdf.save()
+        return buf.getvalue()
+
+
+def program_groups(count):
+    entry = {"lane": 1, "name": "Alice Athlete", "age": 11, "team": "TST", "time": "NT", "is_relay": False}
+    return [
+        {"header": f"Event {i}", "heats": [{"header": "Heat 1 of 1 Finals", "sub_items": [entry] * (i + 1)}]}
+        for i in range(count)
+    ]
+
+
+def test_split_groups_keeps_event_order_and_balances_rows():
+    groups = program_groups(6)
+    runs = split_groups(groups, 3)
+    assert [g for run in runs for g in run] == groups
+    assert [len(run) for run in runs] == [3, 2, 1]
+    assert split_groups(groups[:2], 5) == [[groups[0]], [groups[1]]]
+
+
+def test_chunked_meet_program_merges_with_continuous_page_numbers(tmp_path):
+    pdfplumber = pytest.importorskip("pdfplumber")
+    pytest.importorskip("pypdfium2")
+    pool = TwoPagePool()
+    out = tmp_path / "program.pdf"
+    data = {"meet_name": "Test Meet", "sub_title": "Program", "groups": program_groups(6)}
+    WeasyRenderer(str(out), pool).render_meet_program(data, chunks=3)
+
+    assert len(pool.htmls) == 3
+    # Only the first chunk opens with the meet header; every chunk leaves numbering to the merge
+    assert ['id="header"' in html for html in pool.htmls] == [True, False, False]
+    assert all("content: none" in html for html in pool.htmls)
+    with pdfplumber.open(out) as pdf:
+        assert [page.extract_text().splitlines()[-1] for page in pdf.pages] == [f"Page {n}" for n in range(1, 7)]
+
+
+def test_renderers_share_assets_that_reload_when_files_change(tmp_path):
+    first, second = WeasyRenderer(str(tmp_path / "a.pdf")), WeasyRenderer(str(tmp_path / "b.pdf"))
+    assert first.env is second.env
+    assert first.env.get_template("meet_program.html") is second.env.get_template("meet_program.html")
+
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / STYLESHEET).write_text("body {}")
+    (templates / "page.html").write_text("<style>{{ css_content }}</style>one")
+    assets = RenderAssets(str(templates), str(tmp_path / "bytecode"))
+    page = assets.env.get_template("page.html")
+    assert page.render(**assets.add_page_metadata({})) == "<style>body {}</style>one"
+    assert assets.env.get_template("page.html") is page
+
+    (templates / STYLESHEET).write_text("p { color: red }")
+    (templates / "page.html").write_text("<style>{{ css_content }}</style>two")
+    for path in templates.iterdir():
+        os.utime(path, ns=(10**18, 10**18))
+    rendered = assets.env.get_template("page.html").render(**assets.add_page_metadata({}))
+    assert rendered == "<style>p { color: red }</style>two"
+
+
+def test_renderer_writes_pdf_into_a_stream():
+    data = {"meet_name": "Test Meet", "sub_title": "Program", "groups": program_groups(2)}
+    in_process = io.BytesIO()
+    WeasyRenderer(in_process).render_meet_program(dict(data))
+    assert in_process.getvalue().startswith(b"%PDF")
+
+    pooled = io.BytesIO()
+    WeasyRenderer(pooled, TwoPagePool()).render_entries(dict(data), "meet_program.html")
+    assert pooled.getvalue().startswith(b"%PDF")
+
+
+def test_report_stream_sends_bounded_chunks_and_checksum(tmp_path):
+    cache = ReportCache(str(tmp_path))
+    converter = MmToJsonConverter(table_data=TABLES)
+    expected = report_batch.generate_reports(converter, [report_batch.ReportSpec("entries")])[0].content
+
+    stream = report_batch.ReportStream(converter, report_batch.ReportSpec("entries"), chunk_size=16, cache=cache)
+    chunks = list(stream)
+    assert b"".join(chunks) == expected
+    assert all(len(chunk) <= 16 for chunk in chunks) and len(chunks) > 1
+    assert (stream.error, stream.size, stream.content_type) == (None, len(expected), "application/pdf")
+    assert stream.sha256 == hashlib.sha256(expected).hexdigest()
+
+    # The streamed copy was cached, and is replayed in the same chunks
+    replay = report_batch.ReportStream(converter, report_batch.ReportSpec("entries"), chunk_size=16, cache=cache)
+    assert list(replay) == chunks
+
+    # A client that goes away stops the renderer and leaves nothing half-cached
+    partial = report_batch.ReportStream(converter, report_batch.ReportSpec("entries_club"), chunk_size=4, cache=cache)
+    chunk_iter = iter(partial)
+    next(chunk_iter)
+    chunk_iter.close()
+    assert os.listdir(tmp_path) == [
+        report_batch.cache_key(cache, converter, report_batch.ReportSpec("entries")) + ".bin"
+    ]
+
+    failed = report_batch.ReportStream(converter, report_batch.ReportSpec("bogus"))
+    assert list(failed) == [] and failed.error.startswith("ValueError")
+
+
+def wait_for(job, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while job.state not in (report_jobs.DONE, report_jobs.FAILED):
+        assert time.monotonic() < deadline, f"job still {job.state}"
+        time.sleep(0.01)
+    return job
+
+
+def test_report_jobs_run_by_priority_and_report_progress(monkeypatch):
+    release = threading.Event()
+    original = ReportDataExtractor.extract_meet_entries_data
+
+    def blocking(self, *args, **kwargs):
+        release.wait(10)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ReportDataExtractor, "extract_meet_entries_data", blocking)
+    converter = MmToJsonConverter(table_data=TABLES)
+    jobs = report_jobs.ReportJobQueue(workers=1, max_queue=3)
+    try:
+        first = jobs.submit(converter, report_batch.ReportSpec("entries"))
+        while first.state == report_jobs.QUEUED:
+            time.sleep(0.01)
+        low = jobs.submit(converter, report_batch.ReportSpec("entries_club"), "low")
+        normal = jobs.submit(converter, report_batch.ReportSpec("entries", team_filter="TST"))
+        high = jobs.submit(converter, report_batch.ReportSpec("bogus"), "high")
+        assert [jobs.position(j) for j in (first, high, normal, low)] == [0, 0, 1, 2]
+        with pytest.raises(report_jobs.ReportJobQueueFullError):
+            jobs.submit(converter, report_batch.ReportSpec("entries"))
+
+        release.set()
+        for job in (first, low, normal, high):
+            wait_for(job)
+        assert high.finished < normal.finished < low.finished
+        assert high.state == report_jobs.FAILED and high.error.startswith("ValueError")
+        assert first.state == report_jobs.DONE and first.content.startswith(b"%PDF")
+        # One team extracted, one page laid out
+        assert (first.events_processed, first.events_total, first.pages) == (1, 1, 1)
+        assert first.snapshot is None and jobs.get(first.id) is first
+    finally:
+        release.set()
+        jobs.shutdown()
+
+
+def test_report_jobs_render_and_cache_the_dataset_as_submitted(tmp_path):
+    converter = MmToJsonConverter(table_data=TABLES)
+    cache = ReportCache(str(tmp_path))
+    spec = report_batch.ReportSpec("program_html")
+    jobs = report_jobs.ReportJobQueue(workers=1, cache=cache)
+    # Holds the worker until the dataset has changed under the queued job
+    jobs._cond.acquire()
+    try:
+        job = jobs.submit(converter, spec)
+        converter.replace_table("Athlete", converter.tables["Athlete"].assign(First_name="Zed"))
+    finally:
+        jobs._cond.release()
+    try:
+        wait_for(job)
+        assert b"Alice" in job.content and b"Zed" not in job.content
+        assert cache.get(report_batch.cache_key(cache, MmToJsonConverter(table_data=TABLES), spec)) == job.content
+        assert cache.get(report_batch.cache_key(cache, converter, spec)) is None
+    finally:
+        jobs.shutdown()
+
+
+def test_finished_report_jobs_expire():
+    jobs = report_jobs.ReportJobQueue(workers=1, ttl=0)
+    try:
+        job = wait_for(jobs.submit(MmToJsonConverter(table_data=TABLES), report_batch.ReportSpec("program_html")))
+        assert job.content_type.startswith("text/html") and b"<html" in job.content
+        assert jobs.get(job.id) is None
+    finally:
+        jobs.shutdown()
+
+
+def test_browser_pool_reuses_browsers_and_relaunches_crashed_ones():
+    pytest.importorskip("playwright")
+    from mm_to_json.reporting import browser_pool
+    from mm_to_json.reporting.playwright_renderer import PlaywrightRenderer
+
+    pool = browser_pool.BrowserPool(size=1, timeout=60)
+    try:
+        pool.warm()
+        browser = pool._browsers[0].browser
+        data = ReportDataExtractor(MmToJsonConverter(table_data=TABLES)).extract_meet_program_data()
+        for _ in range(2):
+            output = io.BytesIO()
+            PlaywrightRenderer(output, pool).render_meet_program(dict(data))
+            assert output.getvalue().startswith(b"%PDF")
+        assert pool._browsers[0].browser is browser
+
+        pool._call(browser.close()).result(10)
+        assert pool.render_pdf("<p>after a crash</p>").startswith(b"%PDF")
+        assert pool._browsers[0].browser is not browser
+    finally:
+        pool.shutdown()
+
+
+def test_report_types_go_to_their_configured_backend(monkeypatch, tmp_path):
+    pdfplumber = pytest.importorskip("pdfplumber")
+    monkeypatch.setenv(
+        report_batch.BACKENDS_ENV, "psych=reportlab, entries=reportlab, program=nonsense, lineups=playwright"
+    )
+    assert report_batch.backend_for("psych") == "reportlab"
+    # Unknown backends and unsupported types fall back to the default
+    assert report_batch.backend_for("entries") == report_batch.DEFAULT_BACKEND
+    assert report_batch.backend_for("program") == report_batch.backend_for("lineups") == "weasyprint"
+
+    converter = MmToJsonConverter(table_data=TABLES)
+    cache = ReportCache(str(tmp_path))
+    psych, entries = report_batch.generate_reports(
+        converter, [report_batch.ReportSpec("psych"), report_batch.ReportSpec("entries")], cache=cache
+    )
+    assert b"ReportLab" in psych.content and b"ReportLab" not in entries.content
+    with pdfplumber.open(io.BytesIO(psych.content)) as pdf:
+        text = pdf.pages[0].extract_text()
+    assert "Event 1 Boys 11-12 50 Yard Freestyle" in text
+    assert "Alice Athlete 11 TST 30.50" in text
+    # Its output is cached under its own key
+    monkeypatch.setenv(report_batch.BACKENDS_ENV, "")
+    assert report_batch.cache_key(cache, converter, psych.spec) + ".bin" not in os.listdir(tmp_path)
+
+
+def test_benchmark_measures_backends_and_picks_the_fastest():
+    from mm_to_json.reporting import benchmark
+
+    tables = benchmark.synthetic_tables(athletes=40, events=6)
+    assert len(tables["Entry"]) == 40 * 3
+    assert {e["Fin_lane"] for e in tables["Entry"]} <= set(range(1, benchmark.LANES + 1))
+
+    (result,) = benchmark.run(["small"], ["reportlab"], ["psych"], repeat=1)
+    assert result.error is None
+    assert result.wall_s > 0 and result.peak_rss_mb > 0 and result.size_kb > 0
+    assert "reportlab" in benchmark.table([result])
+
+    def m(dataset, backend, wall, error=None, pages=3, report_type="program"):
+        return benchmark.Measurement(dataset, backend, report_type, wall_s=wall, pages=pages, error=error)
+
+    results = [m("small", "reportlab", 0.1), m("small", "weasyprint", 0.2)]
+    results += [m("large", "reportlab", 3.0), m("large", "weasyprint", 2.0), m("large", "playwright", 1.0, "boom")]
+    assert benchmark.fastest(results) == {"program": "weasyprint"}
+
+    # Fastest, but with fewer pages than WeasyPrint: it dropped content
+    results += [
+        m("large", "reportlab", 0.5, pages=1, report_type="psych"),
+        m("large", "weasyprint", 2.0, report_type="psych"),
+    ]
+    assert benchmark.fastest(results) == {"program": "weasyprint", "psych": "weasyprint"}
+    results.append(m("large", "playwright", 0.9, report_type="psych"))
+    assert benchmark.fastest(results)["psych"] == "playwright"
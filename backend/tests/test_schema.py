@@ -0,0 +1,157 @@
+import datetime
+
+import pandas as pd
+
+from mm_to_json.schema import normalize
+
+SCHEMA_A_STRINGS = {
+    "Meet": [{"Meet_name1": "Summer Champs", "Meet_start": "07/19/25 00:00:00", "Meet_end": "07/20/25 00:00:00"}],
+    "Team": [{"Team_no": "145", "Team_name": "Briarhill Swim Team   ", "Team_abbr": "BH   ", "team_lsc": "TV"}],
+    "Athlete": [
+        {
+            "Ath_no": "1",
+            "First_name": "Evan",
+            "Last_name": "Swim",
+            "Ath_Sex": "m",
+            "Ath_age": "14",
+            "Birth_date": "01/28/11 00:00:00",
+            "Team_no": "145",
+        },
+    ],
+    "Event": [
+        {
+            "Event_no": "5",
+            "Event_ptr": "7",
+            "Ind_rel": "R",
+            "Event_sex": "G",
+            "Event_stroke": "e",
+            "Event_dist": "100",
+            "Low_age": "9",
+            "High_Age": "10",
+        }
+    ],
+    "Entry": [
+        {
+            "Event_ptr": "7",
+            "Ath_no": "1",
+            "ActualSeed_time": "",
+            "ConvSeed_time": "31.24",
+            "Fin_Time": "",
+            "Fin_place": "3",
+            "Ev_score": "5",
+        }
+    ],
+    "Session": [{"Sess_no": "1", "Sess_ptr": "33", "Sess_day": "", "Sess_starttime": "32400"}],
+}
+
+SCHEMA_A_TYPED = {
+    "Meet": [{"Meet_name1": "Summer Champs", "Meet_start": datetime.datetime(2025, 7, 19), "Meet_end": "2025-07-20"}],
+    "Team": pd.DataFrame([{"Team_no": 145, "Team_name": "Briarhill Swim Team", "Team_abbr": "BH", "Team_lsc": "TV"}]),
+    "Athlete": [
+        {
+            "Ath_no": 1,
+            "First_name": "Evan",
+            "Last_name": "Swim",
+            "Ath_Sex": "M",
+            "Ath_age": 14.0,
+            "Birth_date": "2011-01-28T00:00:00",
+            "Team_no": 145,
+        },
+    ],
+    "Event": [
+        {
+            "Event_no": 5,
+            "Event_ptr": 7,
+            "Ind_rel": "R",
+            "Event_sex": "G",
+            "Event_stroke": "E",
+            "Event_dist": 100.0,
+            "Low_age": 9,
+            "High_Age": 10,
+        }
+    ],
+    "Entry": [
+        {
+            "Event_ptr": 7,
+            "Ath_no": 1,
+            "ActualSeed_time": None,
+            "ConvSeed_time": 31.24,
+            "Fin_Time": None,
+            "Fin_place": 3,
+            "Ev_score": 5.0,
+        }
+    ],
+    "Session": [{"Sess_no": 1, "Sess_ptr": 33, "Sess_day": None, "Sess_starttime": 32400}],
+}
+
+
+def test_string_and_typed_sources_normalize_identically():
+    a = normalize(SCHEMA_A_STRINGS)
+    b = normalize(SCHEMA_A_TYPED)
+    assert a.schema_type == b.schema_type == "A"
+    for name in a.tables:
+        pd.testing.assert_frame_equal(a[name], b[name], check_dtype=True, obj=name)
+
+    assert a.records("team") == [
+        {"team_no": 145, "name": "Briarhill Swim Team", "short": "", "abbr": "BH", "lsc": "TV", "city": "", "state": ""}
+    ]
+    athlete = a.records("athlete")[0]
+    assert athlete["sex"] == "M"
+    assert athlete["birth_date"] == pd.Timestamp(2011, 1, 28)
+    event = a.records("event")[0]
+    assert (event["event_no"], event["event_ptr"], event["stroke"], event["is_relay"]) == (5, 7, "E", True)
+    entry = a.records("entry")[0]
+    assert entry["seed_time"] == 31.24
+    assert entry["final_time"] is None
+    assert (entry["place"], entry["heat"], entry["ev_score"]) == (3, 0, 5.0)
+    session = a.records("session")[0]
+    assert (session["day"], session["start_time"]) == (1, 32400)
+    assert a.meet_start() == datetime.datetime(2025, 7, 19)
+
+
+def test_schema_b_maps_onto_canonical_columns():
+    meet = normalize(
+        {
+            "MTEVENT": [
+                {
+                    "MtEvent": "3",
+                    "Distance": "50",
+                    "Stroke": "2",
+                    "Sex": "F",
+                    "I_R": "I",
+                    "Session": "2",
+                    "Lo_Hi": "910",
+                },
+                {"MtEvent": "4", "Distance": "25", "Stroke": "1", "Sex": "M", "I_R": "R", "Session": "", "Lo_Hi": "8"},
+            ],
+            "ENTRY": [{"MtEvent": "3", "Athlete": "9", "Score": "3125", "HEAT": "1", "LANE": "4"}],
+            "ATHLETE": [{"Athlete": "9", "First": "Ana", "Last": "Lee", "Age": "10", "Class": "", "Team1": "2"}],
+            "TEAM": [{"Team": "2", "TCode": "DP", "Short": "", "LSC": "TV"}],
+            "SESSIONS": [{"SESSION": "2", "DAY": "1", "STARTTIME": "09:30"}],
+            # An empty Schema A table must not hide the Schema B one
+            "Entry": [],
+        }
+    )
+    assert meet.schema_type == "B"
+
+    events = meet["event"]
+    assert events["stroke"].tolist() == ["B", "A"]
+    assert events["is_relay"].tolist() == [False, True]
+    assert events[["low_age", "high_age"]].values.tolist() == [[9, 10], [0, 8]]
+    assert events["sess_no"].tolist() == [2, 0]
+
+    entry = meet.records("entry")[0]
+    assert (entry["event_ptr"], entry["ath_no"], entry["heat"], entry["lane"]) == (3, 9, 1, 4)
+    assert entry["seed_time"] == 31.25
+
+    assert meet.records("team")[0]["name"] == "DP-TV"
+    assert meet.lookup("athlete", "ath_no")[9]["team_no"] == 2
+    assert meet.records("session")[0]["start_time"] == 9.5 * 3600
+
+
+def test_missing_tables_are_empty_with_canonical_columns():
+    meet = normalize({})
+    assert meet["entry"].empty
+    assert "seed_time" in meet["entry"].columns
+    assert meet.meet_start() is None
+    assert meet.records("relay") == []
@@ -0,0 +1,77 @@
+import datetime
+import json
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from mm_to_json import table_export
+from mm_to_json.mm_to_json import RAW_TABLES, MmToJsonConverter
+
+ATHLETES = pd.DataFrame(
+    {
+        "Ath_no": [1, 2],
+        "Last_name": ["Swim", None],
+        "Ath_age": [10.0, float("nan")],
+        "Birth_date": [datetime.datetime(2011, 1, 28), None],
+        "Mixed": [7, "seven"],
+    }
+)
+
+
+def _converter():
+    return MmToJsonConverter(table_data={"Athlete": ATHLETES, "Team": [{"Team_no": 1, "Team_abbr": "BH"}]})
+
+
+def test_ndjson_export_streams_rows(tmp_path):
+    written = _converter().export_tables(str(tmp_path), "ndjson")
+    assert set(written) == set(RAW_TABLES)
+
+    with open(written["Athlete"]) as f:
+        rows = [json.loads(line) for line in f]
+    assert rows == [
+        {"Ath_no": 1, "Last_name": "Swim", "Ath_age": 10.0, "Birth_date": "2011-01-28T00:00:00", "Mixed": 7},
+        {"Ath_no": 2, "Last_name": None, "Ath_age": None, "Birth_date": None, "Mixed": "seven"},
+    ]
+    assert os.path.getsize(written["Entry"]) == 0
+
+    tables = table_export.read_tables(str(tmp_path), ["athlete", "team"])
+    assert list(tables) == ["Athlete", "Team"]
+    assert tables["Athlete"]["Ath_no"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_columnar_export_keeps_types(tmp_path, fmt):
+    pytest.importorskip("pyarrow")
+    _converter().export_tables(str(tmp_path), fmt)
+
+    df = table_export.read_tables(str(tmp_path), ["Athlete"])["Athlete"]
+    assert df["Ath_no"].dtype == "int64"
+    assert pd.api.types.is_datetime64_any_dtype(df["Birth_date"])
+    assert df["Last_name"].tolist() == ["Swim", None]
+    # Mixed-type columns fall back to text
+    assert df["Mixed"].tolist() == ["7", "seven"]
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        table_export.export_tables({}, str(tmp_path), "csv")
+
+
+def test_server_loads_exported_tables(tmp_path):
+    pytest.importorskip("meetmanager.v1.meet_manager_pb2")
+    import server
+
+    _converter().export_tables(str(tmp_path / "meet"), "ndjson")
+    with patch.object(server, "DATA_DIR", str(tmp_path)), patch.object(server, "SOURCE_FILE", "meet"):
+        service = server.MeetManagerService()
+        datasets = service.ListDatasets(None, None).datasets
+
+    assert [d.filename for d in datasets] == ["meet"]
+    # Cached typed, not as mdb-export strings
+    athletes = service._data_cache["Athlete"]
+    assert athletes["Ath_no"].tolist() == [1, 2]
+    assert athletes["Ath_age"].iloc[0] == 10.0
+    assert service._canonical().records("athlete")[0]["birth_date"] == datetime.datetime(2011, 1, 28)
+    assert service.GetDashboardStats(None, None).athlete_count == 2
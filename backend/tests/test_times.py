@@ -0,0 +1,43 @@
+import numpy as np
+
+from mm_to_json import times
+
+
+def test_to_hundredths_treats_missing_as_no_time():
+    assert times.to_hundredths([31.24, 65.3, 0.0, None, "", float("nan"), "59.99"]).tolist() == [
+        3124,
+        6530,
+        0,
+        0,
+        0,
+        0,
+        5999,
+    ]
+
+
+def test_format_times():
+    hundredths = np.array([3124, 6530, 505, 0, 7200])
+    assert times.format_times(hundredths).tolist() == ["31.24", "1:05.30", "05.05", "NT", "1:12.00"]
+    assert times.format_times(hundredths, min_sec=False).tolist() == ["31.24", "65.30", "5.05", "NT", "72.00"]
+
+    status = times.status_codes(["", "dq", None, "SCR", "late"])
+    assert status.tolist() == ["", "DQ", "", "SCR", ""]
+    assert times.format_times(hundredths, status).tolist() == ["31.24", "DQ", "05.05", "SCR", "1:12.00"]
+
+
+def test_parse_round_trips_and_sorts_no_time_last():
+    text = ["1:05.30", "31.24", "NT", "DQ", "05.05", "65.3", "junk"]
+    assert times.parse_times(text).tolist() == [6530, 3124, 0, 0, 505, 6530, 0]
+    assert times.format_times(times.parse_times(text[:2])).tolist() == text[:2]
+    assert times.sort_keys(text).argsort(kind="stable").tolist() == [4, 1, 0, 5, 2, 3, 6]
+
+
+def test_format_clock():
+    assert times.format_clock([0, 32400, 43200, 46800, None, "abc"]).tolist() == [
+        "12:00 AM",
+        "9:00 AM",
+        "12:00 PM",
+        "1:00 PM",
+        "",
+        "",
+    ]
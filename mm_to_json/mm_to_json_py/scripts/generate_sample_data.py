@@ -2,12 +2,12 @@ import os
 import random
 import sys
 
-# Add src to path
+# The backend package owns the restorer and the warm Jackcess worker pool
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-SRC_DIR = os.path.abspath(os.path.join(BASE_DIR, "../src"))
-sys.path.append(SRC_DIR)
+BACKEND_SRC = os.path.abspath(os.path.join(BASE_DIR, "../../../backend/src"))
+sys.path.insert(0, BACKEND_SRC)
 
-from mm_to_json import mdb_restorer, mdb_writer  # noqa: E402
+from mm_to_json import jackcess_pool, mdb_writer  # noqa: E402
 
 
 def generate(output_mdb, empty_schema_json):
@@ -15,7 +15,8 @@ def generate(output_mdb, empty_schema_json):
         os.remove(output_mdb)
 
     print(f"Creating empty DB from {empty_schema_json}...")
-    mdb_restorer.restore_db(empty_schema_json, output_mdb)
+    jackcess_pool.restore_db(empty_schema_json, output_mdb)
+    jackcess_pool.shutdown_pool()
 
     db = mdb_writer.open_db(output_mdb)
     try:
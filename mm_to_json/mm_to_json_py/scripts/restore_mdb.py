@@ -1,12 +1,12 @@
+import logging
 import os
 import sys
 
-# Add src to path
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-SRC_DIR = os.path.abspath(os.path.join(BASE_DIR, "../src"))
-sys.path.append(SRC_DIR)
+# The backend package owns the restorer and the warm Jackcess worker pool
+BACKEND_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../backend/src"))
+sys.path.insert(0, BACKEND_SRC)
 
-from mm_to_json import mdb_restorer  # noqa: E402
+from mm_to_json import jackcess_pool  # noqa: E402
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
@@ -19,4 +19,8 @@ if __name__ == "__main__":
     if os.path.exists(mdb_path):
         os.remove(mdb_path)
 
-    mdb_restorer.restore_db(json_path, mdb_path)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    try:
+        jackcess_pool.restore_db(json_path, mdb_path)
+    finally:
+        jackcess_pool.shutdown_pool()